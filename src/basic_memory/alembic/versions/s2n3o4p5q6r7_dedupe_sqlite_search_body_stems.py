@@ -0,0 +1,113 @@
+"""Stop storing note bodies twice in the SQLite FTS5 search index.
+
+Revision ID: s2n3o4p5q6r7
+Revises: 2d26b287813b
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+
+revision: str = "s2n3o4p5q6r7"
+down_revision: Union[str, None] = "2d26b287813b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH_SIZE = 500
+# Must match search_index_row._STEMS_BODY_PROBE_CHARS.
+_STEMS_BODY_PROBE_CHARS = 32
+
+
+def _table_exists(connection, table_name: str) -> bool:
+    """Return whether a runtime-managed table is present for this database."""
+    return table_name in inspect(connection).get_table_names()
+
+
+def _column_names(connection, table_name: str) -> set[str]:
+    """Return a table's column names, including those of FTS5 virtual tables."""
+    rows = connection.execute(text(f"PRAGMA table_info({table_name})")).fetchall()
+    return {row[1] for row in rows}
+
+
+def _dedupe_content_stems(content_stems: str, content_snippet: str) -> str:
+    """Frozen copy of search_index_row.sqlite_fts_content_stems for this migration."""
+    start = content_stems.find(content_snippet)
+    if start != -1:
+        end = start + len(content_snippet)
+    else:
+        probe = content_snippet[:_STEMS_BODY_PROBE_CHARS]
+        start = content_stems.find(probe)
+        while start != -1 and not content_snippet.startswith(content_stems[start:]):
+            start = content_stems.find(probe, start + 1)
+        if start == -1:
+            return content_stems
+        end = len(content_stems)
+
+    head = content_stems[:start].rstrip("\n")
+    tail = content_stems[end:].lstrip("\n")
+    return "\n".join(part for part in (head, tail) if part)
+
+
+def upgrade() -> None:
+    """Strip the body copy from existing SQLite content_stems values.
+
+    Trigger: SQLite rows written before this revision carry the note body in both
+    content_stems and content_snippet, and FTS5 tokenizes both columns.
+    Why: the runtime now writes stems without the body; rewriting old rows
+    reclaims the duplicate content and postings without a full reindex.
+    Outcome: rows are rewritten in rowid batches, then FTS5 merges its b-tree
+    segments. Postgres keeps capped stems for its tsvector and is untouched.
+    """
+    connection = op.get_bind()
+    if connection.dialect.name != "sqlite":
+        return
+    # SQLite creates search_index at runtime; a fresh database has nothing to rewrite.
+    if not _table_exists(connection, "search_index"):
+        return
+    # Older or partial search tables without the stems/snippet columns hold no
+    # duplicated body to strip.
+    if not {"content_stems", "content_snippet"} <= _column_names(connection, "search_index"):
+        return
+
+    last_rowid = 0
+    while True:
+        rows = connection.execute(
+            text(
+                """
+                SELECT rowid, content_stems, content_snippet
+                FROM search_index
+                WHERE rowid > :last_rowid
+                  AND type IN ('entity', 'observation')
+                ORDER BY rowid
+                LIMIT :limit
+                """
+            ),
+            {"last_rowid": last_rowid, "limit": _BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        last_rowid = rows[-1][0]
+
+        updates = []
+        for rowid, content_stems, content_snippet in rows:
+            if not content_stems or not content_snippet:
+                continue
+            deduped = _dedupe_content_stems(content_stems, content_snippet)
+            if deduped != content_stems:
+                updates.append({"rowid": rowid, "content_stems": deduped})
+        if updates:
+            connection.execute(
+                text("UPDATE search_index SET content_stems = :content_stems WHERE rowid = :rowid"),
+                updates,
+            )
+
+    connection.execute(text("INSERT INTO search_index(search_index) VALUES('optimize')"))
+
+
+def downgrade() -> None:
+    """No-op: older runtimes still match bodies via content_snippet; reindex to restore."""
+    pass
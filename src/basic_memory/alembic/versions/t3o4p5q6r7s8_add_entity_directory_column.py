@@ -0,0 +1,54 @@
+"""Add a generated directory column to entity for O(children) directory listings.
+
+Revision ID: t3o4p5q6r7s8
+Revises: s2n3o4p5q6r7
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "t3o4p5q6r7s8"
+down_revision: Union[str, None] = "s2n3o4p5q6r7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of models.knowledge.ENTITY_DIRECTORY_SQL for this migration.
+_ENTITY_DIRECTORY_SQL = "rtrim(file_path, replace(file_path, '/', ''))"
+
+
+def upgrade() -> None:
+    """Derive each entity's containing folder in the database and index it per project.
+
+    Trigger: directory listings loaded every entity under a prefix (or the whole
+    project at the root) and rebuilt the folder tree in Python per request.
+    Why: a generated column is maintained by the database on every insert, move,
+    and delete, so no indexing or move/delete runner can leave it stale.
+    Outcome: SQLite adds a virtual column (the only kind ALTER TABLE can add);
+    Postgres stores it with bytewise collation for range scans. Existing rows are
+    covered immediately, with no backfill.
+    """
+    connection = op.get_bind()
+    column_type = (
+        sa.String(collation="C") if connection.dialect.name == "postgresql" else sa.String()
+    )
+    op.add_column(
+        "entity",
+        sa.Column("directory", column_type, sa.Computed(_ENTITY_DIRECTORY_SQL), nullable=True),
+    )
+    op.create_index(
+        "ix_entity_project_directory",
+        "entity",
+        ["project_id", "directory"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the generated directory column and its index."""
+    op.drop_index("ix_entity_project_directory", table_name="entity")
+    op.drop_column("entity", "directory")
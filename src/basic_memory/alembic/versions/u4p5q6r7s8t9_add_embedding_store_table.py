@@ -0,0 +1,45 @@
+"""Add a content-addressed embedding store.
+
+Revision ID: u4p5q6r7s8t9
+Revises: t3o4p5q6r7s8
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "u4p5q6r7s8t9"
+down_revision: Union[str, None] = "t3o4p5q6r7s8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the embedding store keyed by provider identity and chunk text hash."""
+    op.create_table(
+        "embedding_store",
+        sa.Column("provider_identity", sa.String(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("byte_size", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("provider_identity", "content_hash"),
+    )
+    op.create_index(
+        "ix_embedding_store_last_used_at",
+        "embedding_store",
+        ["last_used_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the embedding store."""
+    op.drop_index("ix_embedding_store_last_used_at", table_name="embedding_store")
+    op.drop_table("embedding_store")
@@ -0,0 +1,206 @@
+"""Add trigger-maintained per-project statistics.
+
+Revision ID: v5q6r7s8t9u0
+Revises: u4p5q6r7s8t9
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "v5q6r7s8t9u0"
+down_revision: Union[str, None] = "u4p5q6r7s8t9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of models.project_stat.project_stat_trigger_statements() for this migration.
+_SQLITE_TRIGGERS = (
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_entity_insert AFTER INSERT ON entity\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'note_type', NEW.note_type, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_entity_delete AFTER DELETE ON entity\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'note_type', OLD.note_type, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_entity_update AFTER UPDATE OF project_id, note_type ON entity WHEN OLD.project_id IS NOT NEW.project_id OR OLD.note_type IS NOT NEW.note_type\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'note_type', OLD.note_type, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'note_type', NEW.note_type, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_observation_insert AFTER INSERT ON observation\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'observation_category', NEW.category, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_observation_delete AFTER DELETE ON observation\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'observation_category', OLD.category, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_observation_update AFTER UPDATE OF project_id, category ON observation WHEN OLD.project_id IS NOT NEW.project_id OR OLD.category IS NOT NEW.category\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'observation_category', OLD.category, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'observation_category', NEW.category, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_relation_insert AFTER INSERT ON relation\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'relation_type', NEW.relation_type, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'unresolved_relations', '', 1 WHERE NEW.to_id IS NULL AND EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_relation_delete AFTER DELETE ON relation\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'relation_type', OLD.relation_type, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'unresolved_relations', '', -1 WHERE OLD.to_id IS NULL AND EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS project_stat_relation_update AFTER UPDATE OF project_id, relation_type, to_id ON relation WHEN OLD.project_id IS NOT NEW.project_id OR OLD.relation_type IS NOT NEW.relation_type OR OLD.to_id IS NOT NEW.to_id\n"
+        "BEGIN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'relation_type', OLD.relation_type, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'unresolved_relations', '', -1 WHERE OLD.to_id IS NULL AND EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'relation_type', NEW.relation_type, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'unresolved_relations', '', 1 WHERE NEW.to_id IS NULL AND EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END"
+    ),
+)
+_POSTGRES_TRIGGERS = (
+    (
+        "CREATE OR REPLACE FUNCTION project_stat_entity() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+        "BEGIN\n"
+        "IF TG_OP <> 'INSERT' THEN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'note_type', OLD.note_type, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "END IF;\n"
+        "IF TG_OP <> 'DELETE' THEN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'note_type', NEW.note_type, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END IF;\n"
+        "RETURN NULL;\n"
+        "END\n"
+        "$$"
+    ),
+    ("DROP TRIGGER IF EXISTS project_stat_entity_write ON entity"),
+    (
+        "CREATE TRIGGER project_stat_entity_write AFTER INSERT OR DELETE ON entity FOR EACH ROW EXECUTE FUNCTION project_stat_entity()"
+    ),
+    ("DROP TRIGGER IF EXISTS project_stat_entity_update ON entity"),
+    (
+        "CREATE TRIGGER project_stat_entity_update AFTER UPDATE OF project_id, note_type ON entity FOR EACH ROW WHEN (OLD.project_id IS DISTINCT FROM NEW.project_id OR OLD.note_type IS DISTINCT FROM NEW.note_type) EXECUTE FUNCTION project_stat_entity()"
+    ),
+    (
+        "CREATE OR REPLACE FUNCTION project_stat_observation() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+        "BEGIN\n"
+        "IF TG_OP <> 'INSERT' THEN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'observation_category', OLD.category, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "END IF;\n"
+        "IF TG_OP <> 'DELETE' THEN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'observation_category', NEW.category, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END IF;\n"
+        "RETURN NULL;\n"
+        "END\n"
+        "$$"
+    ),
+    ("DROP TRIGGER IF EXISTS project_stat_observation_write ON observation"),
+    (
+        "CREATE TRIGGER project_stat_observation_write AFTER INSERT OR DELETE ON observation FOR EACH ROW EXECUTE FUNCTION project_stat_observation()"
+    ),
+    ("DROP TRIGGER IF EXISTS project_stat_observation_update ON observation"),
+    (
+        "CREATE TRIGGER project_stat_observation_update AFTER UPDATE OF project_id, category ON observation FOR EACH ROW WHEN (OLD.project_id IS DISTINCT FROM NEW.project_id OR OLD.category IS DISTINCT FROM NEW.category) EXECUTE FUNCTION project_stat_observation()"
+    ),
+    (
+        "CREATE OR REPLACE FUNCTION project_stat_relation() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+        "BEGIN\n"
+        "IF TG_OP <> 'INSERT' THEN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'relation_type', OLD.relation_type, -1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT OLD.project_id, 'unresolved_relations', '', -1 WHERE OLD.to_id IS NULL AND EXISTS (SELECT 1 FROM project WHERE project.id = OLD.project_id);\n"
+        "END IF;\n"
+        "IF TG_OP <> 'DELETE' THEN\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'relation_type', NEW.relation_type, 1 WHERE EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT NEW.project_id, 'unresolved_relations', '', 1 WHERE NEW.to_id IS NULL AND EXISTS (SELECT 1 FROM project WHERE project.id = NEW.project_id);\n"
+        "END IF;\n"
+        "RETURN NULL;\n"
+        "END\n"
+        "$$"
+    ),
+    ("DROP TRIGGER IF EXISTS project_stat_relation_write ON relation"),
+    (
+        "CREATE TRIGGER project_stat_relation_write AFTER INSERT OR DELETE ON relation FOR EACH ROW EXECUTE FUNCTION project_stat_relation()"
+    ),
+    ("DROP TRIGGER IF EXISTS project_stat_relation_update ON relation"),
+    (
+        "CREATE TRIGGER project_stat_relation_update AFTER UPDATE OF project_id, relation_type, to_id ON relation FOR EACH ROW WHEN (OLD.project_id IS DISTINCT FROM NEW.project_id OR OLD.relation_type IS DISTINCT FROM NEW.relation_type OR OLD.to_id IS DISTINCT FROM NEW.to_id) EXECUTE FUNCTION project_stat_relation()"
+    ),
+)
+_BACKFILL = (
+    "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT entity.project_id, 'note_type', entity.note_type, COUNT(*) FROM entity GROUP BY entity.project_id, entity.note_type",
+    "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT observation.project_id, 'observation_category', observation.category, COUNT(*) FROM observation GROUP BY observation.project_id, observation.category",
+    "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT relation.project_id, 'relation_type', relation.relation_type, COUNT(*) FROM relation GROUP BY relation.project_id, relation.relation_type",
+    "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) SELECT relation.project_id, 'unresolved_relations', '', COUNT(*) FROM relation WHERE relation.to_id IS NULL GROUP BY relation.project_id",
+)
+
+
+def upgrade() -> None:
+    """Create project_stat, install its triggers, and backfill existing projects.
+
+    Trigger: project info and server startup ran COUNT(*) joins over entity,
+    observation, and relation on every request.
+    Why: database triggers see every insert, move, and delete in the writing
+    transaction, so no indexing runner can forget to update a counter.
+    Outcome: triggers append signed delta rows that readers sum per key; the
+    backfill seeds one row per existing key.
+    """
+    op.create_table(
+        "project_stat",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("stat_kind", sa.String(), nullable=False),
+        sa.Column("stat_key", sa.String(), nullable=True),
+        sa.Column("stat_count", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["project.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_project_stat_project_kind_key",
+        "project_stat",
+        ["project_id", "stat_kind", "stat_key"],
+        unique=False,
+    )
+    triggers = (
+        _POSTGRES_TRIGGERS if op.get_bind().dialect.name == "postgresql" else _SQLITE_TRIGGERS
+    )
+    for statement in triggers:
+        op.execute(statement)
+    for statement in _BACKFILL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the project_stat triggers and table."""
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    for table in ("entity", "observation", "relation"):
+        if is_postgres:
+            op.execute(f"DROP TRIGGER IF EXISTS project_stat_{table}_write ON {table}")
+            op.execute(f"DROP TRIGGER IF EXISTS project_stat_{table}_update ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS project_stat_{table}()")
+        else:
+            for event in ("insert", "delete", "update"):
+                op.execute(f"DROP TRIGGER IF EXISTS project_stat_{table}_{event}")
+    op.drop_index("ix_project_stat_project_kind_key", table_name="project_stat")
+    op.drop_table("project_stat")
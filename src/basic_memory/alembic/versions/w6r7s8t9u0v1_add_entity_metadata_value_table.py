@@ -0,0 +1,153 @@
+"""Add trigger-maintained frontmatter value index.
+
+Revision ID: w6r7s8t9u0v1
+Revises: v5q6r7s8t9u0
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "w6r7s8t9u0v1"
+down_revision: Union[str, None] = "v5q6r7s8t9u0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of models.entity_metadata_value.entity_metadata_value_trigger_statements()
+# and entity_metadata_value_backfill_statement() for this migration.
+_SQLITE_TRIGGERS = (
+    (
+        "CREATE TRIGGER IF NOT EXISTS entity_metadata_value_insert AFTER INSERT ON entity\n"
+        "BEGIN\n"
+        "INSERT INTO entity_metadata_value (entity_id, project_id, path, is_element, value_text, value_num) SELECT NEW.id, NEW.project_id, replace(substr(CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END, 3), '\"', ''), typeof(j.key) = 'integer', CASE WHEN j.type IN ('text', 'object', 'array') THEN CASE WHEN j.type IN ('object', 'array') THEN j.value ELSE j.atom END END, CAST(CASE WHEN j.type IN ('object', 'array') THEN j.value ELSE j.atom END AS REAL) FROM json_tree(CASE WHEN json_valid(NEW.entity_metadata) THEN NEW.entity_metadata ELSE '{}' END) AS j WHERE j.type <> 'null' AND CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END GLOB '$.*' AND instr(CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END, '[') = 0;\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS entity_metadata_value_delete AFTER DELETE ON entity\n"
+        "BEGIN\n"
+        "DELETE FROM entity_metadata_value WHERE entity_id = OLD.id;\n"
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS entity_metadata_value_update AFTER UPDATE OF project_id, entity_metadata ON entity WHEN OLD.project_id IS NOT NEW.project_id OR OLD.entity_metadata IS NOT NEW.entity_metadata\n"
+        "BEGIN\n"
+        "DELETE FROM entity_metadata_value WHERE entity_id = OLD.id;\n"
+        "INSERT INTO entity_metadata_value (entity_id, project_id, path, is_element, value_text, value_num) SELECT NEW.id, NEW.project_id, replace(substr(CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END, 3), '\"', ''), typeof(j.key) = 'integer', CASE WHEN j.type IN ('text', 'object', 'array') THEN CASE WHEN j.type IN ('object', 'array') THEN j.value ELSE j.atom END END, CAST(CASE WHEN j.type IN ('object', 'array') THEN j.value ELSE j.atom END AS REAL) FROM json_tree(CASE WHEN json_valid(NEW.entity_metadata) THEN NEW.entity_metadata ELSE '{}' END) AS j WHERE j.type <> 'null' AND CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END GLOB '$.*' AND instr(CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END, '[') = 0;\n"
+        "END"
+    ),
+)
+_POSTGRES_TRIGGERS = (
+    (
+        "CREATE OR REPLACE FUNCTION entity_metadata_value_sync() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+        "BEGIN\n"
+        "IF TG_OP <> 'INSERT' THEN\n"
+        "DELETE FROM entity_metadata_value WHERE entity_id = OLD.id;\n"
+        "END IF;\n"
+        "IF TG_OP <> 'DELETE' THEN\n"
+        "WITH RECURSIVE walk(entity_id, project_id, path, value) AS (\n"
+        "SELECT NEW.id, NEW.project_id, member.key, member.value FROM jsonb_each(CASE WHEN jsonb_typeof(NEW.entity_metadata::jsonb) = 'object' THEN NEW.entity_metadata::jsonb ELSE '{}'::jsonb END) AS member\n"
+        "UNION ALL\n"
+        "SELECT walk.entity_id, walk.project_id, walk.path || '.' || member.key, member.value FROM walk, jsonb_each(CASE WHEN jsonb_typeof(walk.value) = 'object' THEN walk.value ELSE '{}'::jsonb END) AS member\n"
+        "), leaf(entity_id, project_id, path, is_element, value) AS (\n"
+        "SELECT entity_id, project_id, path, false, value FROM walk\n"
+        "UNION ALL\n"
+        "SELECT walk.entity_id, walk.project_id, walk.path, true, element.value FROM walk, jsonb_array_elements(CASE WHEN jsonb_typeof(walk.value) = 'array' THEN walk.value ELSE '[]'::jsonb END) AS element\n"
+        ")\n"
+        "INSERT INTO entity_metadata_value (entity_id, project_id, path, is_element, value_text, value_num)\n"
+        "SELECT leaf.entity_id, leaf.project_id, leaf.path, leaf.is_element, leaf.value #>> '{}', CASE WHEN jsonb_typeof(leaf.value) = 'number' OR (jsonb_typeof(leaf.value) = 'string' AND btrim(leaf.value #>> '{}') ~* '^[-+]?([0-9]+[.]?[0-9]*|[.][0-9]+)(e[-+]?[0-9]+)?$') THEN CASE WHEN abs(btrim(leaf.value #>> '{}')::numeric) < 1e300 AND (btrim(leaf.value #>> '{}')::numeric = 0 OR abs(btrim(leaf.value #>> '{}')::numeric) > 1e-300) THEN btrim(leaf.value #>> '{}')::numeric::double precision END WHEN jsonb_typeof(leaf.value) = 'string' AND btrim(leaf.value #>> '{}') ~* '^[-+]?(nan|inf|infinity)$' THEN btrim(leaf.value #>> '{}')::double precision END FROM leaf WHERE jsonb_typeof(leaf.value) <> 'null';\n"
+        "END IF;\n"
+        "RETURN NULL;\n"
+        "END\n"
+        "$$"
+    ),
+    ("DROP TRIGGER IF EXISTS entity_metadata_value_write ON entity"),
+    (
+        "CREATE TRIGGER entity_metadata_value_write AFTER INSERT OR DELETE ON entity FOR EACH ROW EXECUTE FUNCTION entity_metadata_value_sync()"
+    ),
+    ("DROP TRIGGER IF EXISTS entity_metadata_value_update ON entity"),
+    (
+        "CREATE TRIGGER entity_metadata_value_update AFTER UPDATE OF project_id, entity_metadata ON entity FOR EACH ROW WHEN (OLD.project_id IS DISTINCT FROM NEW.project_id OR OLD.entity_metadata::jsonb IS DISTINCT FROM NEW.entity_metadata::jsonb) EXECUTE FUNCTION entity_metadata_value_sync()"
+    ),
+)
+_SQLITE_BACKFILL = "INSERT INTO entity_metadata_value (entity_id, project_id, path, is_element, value_text, value_num) SELECT entity.id, entity.project_id, replace(substr(CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END, 3), '\"', ''), typeof(j.key) = 'integer', CASE WHEN j.type IN ('text', 'object', 'array') THEN CASE WHEN j.type IN ('object', 'array') THEN j.value ELSE j.atom END END, CAST(CASE WHEN j.type IN ('object', 'array') THEN j.value ELSE j.atom END AS REAL) FROM entity, json_tree(CASE WHEN json_valid(entity.entity_metadata) THEN entity.entity_metadata ELSE '{}' END) AS j WHERE j.type <> 'null' AND CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END GLOB '$.*' AND instr(CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END, '[') = 0"
+_POSTGRES_BACKFILL = (
+    "WITH RECURSIVE walk(entity_id, project_id, path, value) AS (\n"
+    "SELECT entity.id, entity.project_id, member.key, member.value FROM entity, jsonb_each(CASE WHEN jsonb_typeof(entity.entity_metadata::jsonb) = 'object' THEN entity.entity_metadata::jsonb ELSE '{}'::jsonb END) AS member\n"
+    "UNION ALL\n"
+    "SELECT walk.entity_id, walk.project_id, walk.path || '.' || member.key, member.value FROM walk, jsonb_each(CASE WHEN jsonb_typeof(walk.value) = 'object' THEN walk.value ELSE '{}'::jsonb END) AS member\n"
+    "), leaf(entity_id, project_id, path, is_element, value) AS (\n"
+    "SELECT entity_id, project_id, path, false, value FROM walk\n"
+    "UNION ALL\n"
+    "SELECT walk.entity_id, walk.project_id, walk.path, true, element.value FROM walk, jsonb_array_elements(CASE WHEN jsonb_typeof(walk.value) = 'array' THEN walk.value ELSE '[]'::jsonb END) AS element\n"
+    ")\n"
+    "INSERT INTO entity_metadata_value (entity_id, project_id, path, is_element, value_text, value_num)\n"
+    "SELECT leaf.entity_id, leaf.project_id, leaf.path, leaf.is_element, leaf.value #>> '{}', CASE WHEN jsonb_typeof(leaf.value) = 'number' OR (jsonb_typeof(leaf.value) = 'string' AND btrim(leaf.value #>> '{}') ~* '^[-+]?([0-9]+[.]?[0-9]*|[.][0-9]+)(e[-+]?[0-9]+)?$') THEN CASE WHEN abs(btrim(leaf.value #>> '{}')::numeric) < 1e300 AND (btrim(leaf.value #>> '{}')::numeric = 0 OR abs(btrim(leaf.value #>> '{}')::numeric) > 1e-300) THEN btrim(leaf.value #>> '{}')::numeric::double precision END WHEN jsonb_typeof(leaf.value) = 'string' AND btrim(leaf.value #>> '{}') ~* '^[-+]?(nan|inf|infinity)$' THEN btrim(leaf.value #>> '{}')::double precision END FROM leaf WHERE jsonb_typeof(leaf.value) <> 'null'"
+)
+
+
+def upgrade() -> None:
+    """Create entity_metadata_value, install its triggers, and backfill existing notes.
+
+    Trigger: structured metadata filters parsed entity_metadata JSON for every
+    candidate note in the project.
+    Why: database triggers see every entity insert, metadata update, and delete
+    in the writing transaction, so no write path can leave the index stale.
+    Outcome: one row per frontmatter value and array element, indexed by
+    (project_id, path, is_element, value) for text and numeric range scans.
+    """
+    op.create_table(
+        "entity_metadata_value",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("is_element", sa.Boolean(), nullable=False),
+        sa.Column("value_text", sa.String(), nullable=True),
+        sa.Column("value_num", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["entity_id"], ["entity.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_entity_metadata_value_text",
+        "entity_metadata_value",
+        ["project_id", "path", "is_element", "value_text"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_entity_metadata_value_num",
+        "entity_metadata_value",
+        ["project_id", "path", "is_element", "value_num"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_entity_metadata_value_entity",
+        "entity_metadata_value",
+        ["entity_id"],
+        unique=False,
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        triggers, backfill = _POSTGRES_TRIGGERS, _POSTGRES_BACKFILL
+    else:
+        triggers, backfill = _SQLITE_TRIGGERS, _SQLITE_BACKFILL
+    for statement in triggers:
+        op.execute(statement)
+    op.execute(backfill)
+
+
+def downgrade() -> None:
+    """Drop the entity_metadata_value triggers and table."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS entity_metadata_value_write ON entity")
+        op.execute("DROP TRIGGER IF EXISTS entity_metadata_value_update ON entity")
+        op.execute("DROP FUNCTION IF EXISTS entity_metadata_value_sync()")
+    else:
+        for event in ("insert", "delete", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS entity_metadata_value_{event}")
+    op.drop_index("ix_entity_metadata_value_entity", table_name="entity_metadata_value")
+    op.drop_index("ix_entity_metadata_value_num", table_name="entity_metadata_value")
+    op.drop_index("ix_entity_metadata_value_text", table_name="entity_metadata_value")
+    op.drop_table("entity_metadata_value")
@@ -6,6 +6,8 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.exception_handlers import http_exception_handler
 from fastapi.responses import JSONResponse
 from loguru import logger
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from basic_memory import __version__ as version
 from basic_memory.api.container import ApiContainer, set_container
@@ -13,6 +15,7 @@ from basic_memory.api.v2.routers import (
     knowledge_router as v2_knowledge,
     project_router as v2_project,
     memory_router as v2_memory,
+    memory_recent_router as v2_memory_recent,
     search_router as v2_search,
     resource_router as v2_resource,
     directory_router as v2_directory,
@@ -25,6 +28,7 @@ import logfire
 from basic_memory.index.note_content_materialization import drain_pending_materializations
 from basic_memory.config import init_api_logging
 from basic_memory.index.local_schedulers import drain_background_tasks
+from basic_memory.markdown.parse_stage import shutdown_markdown_parse_pool
 from basic_memory.services.exceptions import EntityAlreadyExistsError
 from basic_memory.services.initialization import initialize_app
 from basic_memory.workspace_context import (
@@ -86,6 +90,7 @@ async def lifespan(app: FastAPI):  # pragma: no cover
         # before the engine closes so an accepted write is never lost.
         await drain_pending_materializations()
         await drain_background_tasks()
+        shutdown_markdown_parse_pool()
         await container.shutdown_database()
 
 
@@ -98,29 +103,52 @@ app = FastAPI(
 )
 
 
-@app.middleware("http")
-async def workspace_permalink_context_middleware(request: Request, call_next):
-    """Populate workspace permalink context from request headers."""
-    workspace_slug = request.headers.get(WORKSPACE_SLUG_HEADER)
-    workspace_type = request.headers.get(WORKSPACE_TYPE_HEADER)
+class WorkspacePermalinkContextMiddleware:
+    """Populate workspace permalink context from request headers.
 
-    validation_error = workspace_permalink_context_validation_error(workspace_slug, workspace_type)
-    if validation_error is not None:
-        return JSONResponse(
-            status_code=400,
-            content={"detail": validation_error},
+    Written as plain ASGI rather than ``@app.middleware("http")``: the
+    BaseHTTPMiddleware wrapper runs every request through an extra task and
+    memory stream, which costs local MCP tool calls roughly half a millisecond
+    each for a middleware that only reads two headers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        workspace_slug = headers.get(WORKSPACE_SLUG_HEADER)
+        workspace_type = headers.get(WORKSPACE_TYPE_HEADER)
+
+        validation_error = workspace_permalink_context_validation_error(
+            workspace_slug, workspace_type
         )
+        if validation_error is not None:
+            response = JSONResponse(
+                status_code=400,
+                content={"detail": validation_error},
+            )
+            await response(scope, receive, send)
+            return
 
-    if not workspace_slug:
-        return await call_next(request)
+        if not workspace_slug:
+            await self.app(scope, receive, send)
+            return
 
-    # ContextVar state remains active across the awaited downstream handler while
-    # this context manager is open, so entity creation can see request metadata.
-    with workspace_permalink_context(
-        workspace_slug=workspace_slug,
-        workspace_type=workspace_type,
-    ):
-        return await call_next(request)
+        # ContextVar state remains active across the awaited downstream handler while
+        # this context manager is open, so entity creation can see request metadata.
+        with workspace_permalink_context(
+            workspace_slug=workspace_slug,
+            workspace_type=workspace_type,
+        ):
+            await self.app(scope, receive, send)
+
+
+app.add_middleware(WorkspacePermalinkContextMiddleware)
 
 
 # Include v2 routers FIRST (more specific paths must match before /{project} catch-all)
@@ -133,6 +161,7 @@ app.include_router(v2_prompt, prefix="/v2/projects/{project_id}")
 app.include_router(v2_importer, prefix="/v2/projects/{project_id}")
 app.include_router(v2_schema, prefix="/v2/projects/{project_id}")
 app.include_router(v2_inspect, prefix="/v2/projects/{project_id}")
+app.include_router(v2_memory_recent, prefix="/v2")
 app.include_router(v2_project, prefix="/v2")
 
 # Legacy web app proxy paths (compat with /proxy/projects/projects)
@@ -3,6 +3,7 @@
 from basic_memory.api.v2.routers.knowledge_router import router as knowledge_router
 from basic_memory.api.v2.routers.project_router import router as project_router
 from basic_memory.api.v2.routers.memory_router import router as memory_router
+from basic_memory.api.v2.routers.memory_router import recent_router as memory_recent_router
 from basic_memory.api.v2.routers.search_router import router as search_router
 from basic_memory.api.v2.routers.resource_router import router as resource_router
 from basic_memory.api.v2.routers.directory_router import router as directory_router
@@ -15,6 +16,7 @@ __all__ = [
     "knowledge_router",
     "project_router",
     "memory_router",
+    "memory_recent_router",
     "search_router",
     "resource_router",
     "directory_router",
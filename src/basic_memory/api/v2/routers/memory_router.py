@@ -4,7 +4,9 @@ This router uses external_id UUIDs for stable, API-friendly routing.
 V1 uses string-based project names which are less efficient and less stable.
 """
 
-from typing import Annotated, Optional
+from collections import defaultdict
+from datetime import datetime
+from typing import Annotated, Any, Optional
 
 from fastapi import APIRouter, Query, Path
 from loguru import logger
@@ -14,19 +16,115 @@ from basic_memory import db
 from basic_memory.deps import (
     ContextServiceV2ExternalDep,
     EntityRepositoryV2ExternalDep,
+    ProjectRepositoryDep,
     SessionMakerDep,
 )
 from basic_memory.schemas.base import TimeFrame, parse_timeframe
 from basic_memory.schemas.memory import (
+    ContextResult,
+    EntitySummary,
     GraphContext,
+    MemoryMetadata,
+    RecentActivityByProject,
     normalize_memory_url,
 )
 from basic_memory.schemas.search import SearchItemType
 from basic_memory.api.v2.utils import to_graph_context
+from basic_memory.utils import ensure_timezone_aware
 
 # Note: No prefix here - it's added during registration as /v2/{project_id}/memory
 router = APIRouter(tags=["memory"])
 
+# Cross-project routes, registered under /v2 without a project in the path
+recent_router = APIRouter(tags=["memory"])
+
+
+def _recent_entity_summary(row: Any) -> ContextResult:
+    """Shape one find_recent_entities row like a recent-activity primary result."""
+    return ContextResult(
+        primary_result=EntitySummary(
+            external_id=row.external_id,
+            entity_id=row.id,
+            permalink=row.permalink,
+            title=row.title,
+            file_path=row.file_path,
+            created_at=ensure_timezone_aware(row.created_at),
+        )
+    )
+
+
+@recent_router.get("/memory/recent", response_model=RecentActivityByProject)
+async def recent_across_projects(
+    project_repository: ProjectRepositoryDep,
+    session_maker: SessionMakerDep,
+    timeframe: TimeFrame = "7d",
+    page: int = 1,
+    page_size: int = 10,
+) -> RecentActivityByProject:
+    """Get recently updated entities for every project at once.
+
+    Answers the all-projects discovery view with one ranked query over the entity
+    updated_at index instead of one context build per project. Results carry
+    primary entity rows only: no observations, relations, or related results.
+
+    Args:
+        project_repository: Project repository (not project scoped)
+        timeframe: Time window for recent activity (e.g., "7d", "1 week")
+        page: Page number for pagination, applied within each project
+        page_size: Number of items per page, per project
+
+    Returns:
+        RecentActivityByProject keyed by project external_id, one entry per project
+    """
+    with logfire.span(
+        "api.request.memory.recent_across_projects",
+        entrypoint="api",
+        domain="memory",
+        action="recent_activity",
+        page=page,
+        page_size=page_size,
+    ):
+        since = parse_timeframe(timeframe)
+        offset = (page - 1) * page_size
+        logger.debug(
+            f"V2 Getting recent activity across projects: timeframe: `{timeframe}` page: `{page}` page_size: `{page_size}`"
+        )
+
+        async with db.scoped_session(session_maker) as session:
+            projects = await project_repository.find_all(session, use_load_options=False)
+            # Fetch one extra row per project so has_more needs no count query.
+            rows = await project_repository.find_recent_entities(
+                session, since, limit=page_size + 1, offset=offset
+            )
+
+        rows_by_project: dict[int, list[Any]] = defaultdict(list)
+        for row in rows:
+            rows_by_project[row.project_id].append(row)
+
+        generated_at = datetime.now().astimezone()
+        activity: dict[str, GraphContext] = {}
+        for project in projects:
+            project_rows = rows_by_project.get(project.id, [])
+            results = [_recent_entity_summary(row) for row in project_rows[:page_size]]
+            activity[project.external_id] = GraphContext(
+                results=results,
+                metadata=MemoryMetadata(
+                    types=[SearchItemType.ENTITY],
+                    depth=0,
+                    timeframe=since.isoformat(),
+                    generated_at=generated_at,
+                    primary_count=len(results),
+                    related_count=0,
+                    total_results=len(results),
+                    total_relations=0,
+                    total_observations=0,
+                ),
+                page=page,
+                page_size=page_size,
+                has_more=len(project_rows) > page_size,
+            )
+        return RecentActivityByProject(projects=activity)
+
 
 @router.get("/memory/recent", response_model=GraphContext)
 async def recent(
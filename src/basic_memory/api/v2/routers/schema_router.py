@@ -8,12 +8,14 @@ observations and relations.
 Flow: Entity loaded with eager observations/relations -> convert to tuples -> core functions.
 """
 
+from collections.abc import AsyncIterator
 from pathlib import Path as FilePath
 
 import frontmatter
 from fastapi import APIRouter, HTTPException, Path, Query, status
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from basic_memory.deps import (
     EntityRepositoryV2ExternalDep,
@@ -21,7 +23,7 @@ from basic_memory.deps import (
     LinkResolverV2ExternalDep,
     SessionDep,
 )
-from basic_memory.models.knowledge import Entity
+from basic_memory.models.knowledge import Entity, Relation
 from basic_memory.schemas.base import normalize_note_type
 from basic_memory.schemas.schema import (
     ValidationReport,
@@ -44,6 +46,10 @@ from typing import Any
 # Note: No prefix here -- it's added during registration as /v2/{project_id}/schema
 router = APIRouter(tags=["schema"])
 
+# Notes loaded per validation batch. Bounds how many notes, with their observations
+# and relations, a project-wide validation holds in memory at once.
+_VALIDATION_BATCH_SIZE = 500
+
 
 # --- ORM to core data conversion ---
 
@@ -167,6 +173,7 @@ async def validate_schema(
     latest settings (validation mode, field declarations) are always used,
     even when file changes haven't been synced to the database yet.
     """
+    schemas = _SchemaResolutionCache(session, entity_repository, file_service)
     results: list[NoteValidationResponse] = []
 
     # --- Single note validation ---
@@ -178,18 +185,7 @@ async def validate_schema(
             return ValidationReport(note_type=note_type, total_notes=0, total_entities=0)
 
         frontmatter = _entity_frontmatter(entity)
-        schema_ref = frontmatter.get("schema")
-
-        async def search_fn(query: str) -> list[dict[str, Any]]:
-            entities = await _find_schema_entities(
-                session,
-                entity_repository,
-                query,
-                allow_reference_match=isinstance(schema_ref, str) and query == schema_ref,
-            )
-            return [await _schema_frontmatter_from_file(file_service, e) for e in entities]
-
-        schema_def = await _resolve_schema_for_api(frontmatter, search_fn)
+        schema_def = await schemas.resolve(frontmatter)
         if schema_def:
             result = validate_note(
                 entity.title or entity.permalink or identifier,
@@ -213,12 +209,17 @@ async def validate_schema(
     # --- Batch validation by note type ---
     if note_type:
         canonical_note_type = normalize_note_type(note_type)
-        entities = await _find_by_note_type(session, entity_repository, canonical_note_type)
-        results = await _validate_note_entities(session, entity_repository, file_service, entities)
+        spellings = await _stored_note_type_spellings(session, entity_repository)
+        total_entities = 0
+        async for batch in _iter_validation_batches(
+            session, entity_repository, spellings.get(canonical_note_type, set())
+        ):
+            total_entities += len(batch)
+            results.extend(await _validate_note_entities(schemas, batch))
         return ValidationReport(
             note_type=canonical_note_type,
             total_notes=len(results),
-            total_entities=len(entities),
+            total_entities=total_entities,
             valid_count=sum(1 for r in results if r.passed),
             warning_count=sum(len(r.warnings) for r in results),
             error_count=sum(len(r.errors) for r in results),
@@ -232,30 +233,48 @@ async def validate_schema(
     # Outcome: aggregated report with a per-type breakdown in type_summaries
     covered_types = await _schema_covered_note_types(session, entity_repository)
 
+    # Trigger: a project can define schemas for many types
+    # Why: loading each type separately re-ran the type lookup and entity query per
+    #   type; one id-ordered pass over every covered spelling reads each note once
+    # Outcome: results are bucketed by target type, then reported in the same
+    #   type order as before
+    label_by_stored_type = {
+        stored_type: label
+        for label, stored_types in covered_types.items()
+        for stored_type in stored_types
+    }
+    results_by_type: dict[str, list[NoteValidationResponse]] = {
+        label: [] for label in covered_types
+    }
+    entities_by_type = dict.fromkeys(covered_types, 0)
+    async for batch in _iter_validation_batches(
+        session, entity_repository, set(label_by_stored_type)
+    ):
+        for entity in batch:
+            target_type = label_by_stored_type[entity.note_type]
+            entities_by_type[target_type] += 1
+            result = await _validate_note_entity(schemas, entity)
+            if result is not None:
+                results_by_type[target_type].append(result)
+
     type_summaries: list[TypeValidationSummary] = []
-    total_entities = 0
-    for target_type in covered_types:
-        entities = await _find_by_note_type(session, entity_repository, target_type)
-        type_results = await _validate_note_entities(
-            session, entity_repository, file_service, entities
-        )
+    for target_type, type_results in results_by_type.items():
         type_summaries.append(
             TypeValidationSummary(
                 note_type=target_type,
                 total_notes=len(type_results),
-                total_entities=len(entities),
+                total_entities=entities_by_type[target_type],
                 valid_count=sum(1 for r in type_results if r.passed),
                 warning_count=sum(len(r.warnings) for r in type_results),
                 error_count=sum(len(r.errors) for r in type_results),
             )
         )
         results.extend(type_results)
-        total_entities += len(entities)
 
     return ValidationReport(
         note_type=None,
         total_notes=len(results),
-        total_entities=total_entities,
+        total_entities=sum(entities_by_type.values()),
         valid_count=sum(1 for r in results if r.passed),
         warning_count=sum(len(r.warnings) for r in results),
         error_count=sum(len(r.errors) for r in results),
@@ -326,15 +345,10 @@ async def diff_schema_endpoint(
     of that type are actually structured. Identifies new fields, dropped
     fields, and cardinality changes.
     """
-
-    async def search_fn(query: str) -> list[dict[str, Any]]:
-        entities = await _find_schema_entities(session, entity_repository, query)
-        return [await _schema_frontmatter_from_file(file_service, e) for e in entities]
-
     # Resolve schema by note type
     canonical_note_type = normalize_note_type(note_type)
-    schema_frontmatter = {"type": canonical_note_type}
-    schema_def = await _resolve_schema_for_api(schema_frontmatter, search_fn)
+    schemas = _SchemaResolutionCache(session, entity_repository, file_service)
+    schema_def = await schemas.resolve({"type": canonical_note_type})
 
     if not schema_def:
         return DriftReport(note_type=canonical_note_type, schema_found=False)
@@ -374,46 +388,158 @@ async def diff_schema_endpoint(
 # --- Helpers ---
 
 
-async def _validate_note_entities(
-    session: AsyncSession,
-    entity_repository: EntityRepositoryV2ExternalDep,
-    file_service: FileServiceV2ExternalDep,
-    entities: list[Entity],
-) -> list[NoteValidationResponse]:
-    """Validate a batch of note entities against their resolved schemas.
+class _SchemaResolutionCache:
+    """Resolve schemas for every note in one request, doing each lookup once.
 
-    Entities whose frontmatter resolves to no schema are skipped, which is why
-    a report's total_notes can be lower than its total_entities.
+    Resolving a schema loads the project's schema notes, reads the matching
+    schema file, and parses its definition. None of that can change while a
+    single request runs, so validating N notes of one type should cost one
+    lookup rather than N. Schema notes are loaded once, each schema file is read
+    once, and resolved definitions are memoized by the two frontmatter values a
+    non-inline lookup depends on: the explicit schema reference and the type.
     """
-    results: list[NoteValidationResponse] = []
 
-    for entity in entities:
-        frontmatter = _entity_frontmatter(entity)
+    def __init__(
+        self,
+        session: AsyncSession,
+        entity_repository: EntityRepositoryV2ExternalDep,
+        file_service: FileServiceV2ExternalDep,
+    ) -> None:
+        self._session = session
+        self._entity_repository = entity_repository
+        self._file_service = file_service
+        self._schema_entities: list[Entity] | None = None
+        self._frontmatter_by_id: dict[int, dict[str, Any]] = {}
+        self._definitions: dict[tuple[str | None, Any], SchemaDefinition | None] = {}
+
+    async def resolve(self, frontmatter: dict[str, Any]) -> SchemaDefinition | None:
+        """Resolve the schema for one note's frontmatter."""
         schema_ref = frontmatter.get("schema")
+        search_fn = self._search_fn(schema_ref)
+
+        # Inline schemas are parsed from the note itself and need no lookup
+        if isinstance(schema_ref, dict):
+            return await _resolve_schema_for_api(frontmatter, search_fn)
+
+        key = (schema_ref if isinstance(schema_ref, str) else None, frontmatter.get("type"))
+        try:
+            if key in self._definitions:
+                return self._definitions[key]
+        except TypeError:
+            # Trigger: a hand-written frontmatter type that is a list or mapping
+            # Why: it cannot key the memo, and such notes are rare
+            # Outcome: resolve without caching
+            return await _resolve_schema_for_api(frontmatter, search_fn)
 
+        schema_def = await _resolve_schema_for_api(frontmatter, search_fn)
+        self._definitions[key] = schema_def
+        return schema_def
+
+    def _search_fn(self, schema_ref: Any) -> SchemaSearchFn:
         async def search_fn(query: str) -> list[dict[str, Any]]:
-            found = await _find_schema_entities(
-                session,
-                entity_repository,
+            entities = _match_schema_entities(
+                await self._load_schema_entities(),
                 query,
                 allow_reference_match=isinstance(schema_ref, str) and query == schema_ref,
             )
-            return [await _schema_frontmatter_from_file(file_service, e) for e in found]
+            return [await self._schema_frontmatter(entity) for entity in entities]
 
-        schema_def = await _resolve_schema_for_api(frontmatter, search_fn)
-        if schema_def:
-            result = validate_note(
-                entity.title or entity.permalink or entity.file_path,
-                schema_def,
-                _entity_observations(entity),
-                _entity_relations(entity),
-                frontmatter=frontmatter,
+        return search_fn
+
+    async def _load_schema_entities(self) -> list[Entity]:
+        if self._schema_entities is None:
+            # Matching reads columns only, and schema files are read from disk,
+            # so the relationship eager loads would be wasted work.
+            query = self._entity_repository.select().where(Entity.note_type == "schema")
+            result = await self._entity_repository.execute_query(
+                self._session, query, use_query_options=False
             )
-            results.append(_to_note_validation_response(result))
+            self._schema_entities = list(result.scalars().all())
+        return self._schema_entities
+
+    async def _schema_frontmatter(self, entity: Entity) -> dict[str, Any]:
+        if entity.id not in self._frontmatter_by_id:
+            self._frontmatter_by_id[entity.id] = await _schema_frontmatter_from_file(
+                self._file_service, entity
+            )
+        return self._frontmatter_by_id[entity.id]
+
+
+async def _validate_note_entity(
+    schemas: _SchemaResolutionCache,
+    entity: Entity,
+) -> NoteValidationResponse | None:
+    """Validate one note entity, or return None when no schema applies to it."""
+    frontmatter = _entity_frontmatter(entity)
+    schema_def = await schemas.resolve(frontmatter)
+    if not schema_def:
+        return None
+
+    result = validate_note(
+        entity.title or entity.permalink or entity.file_path,
+        schema_def,
+        _entity_observations(entity),
+        _entity_relations(entity),
+        frontmatter=frontmatter,
+    )
+    return _to_note_validation_response(result)
+
 
+async def _validate_note_entities(
+    schemas: _SchemaResolutionCache,
+    entities: list[Entity],
+) -> list[NoteValidationResponse]:
+    """Validate a batch of note entities against their resolved schemas.
+
+    Entities whose frontmatter resolves to no schema are skipped, which is why
+    a report's total_notes can be lower than its total_entities.
+    """
+    results: list[NoteValidationResponse] = []
+    for entity in entities:
+        result = await _validate_note_entity(schemas, entity)
+        if result is not None:
+            results.append(result)
     return results
 
 
+async def _iter_validation_batches(
+    session: AsyncSession,
+    entity_repository: EntityRepositoryV2ExternalDep,
+    stored_types: set[str],
+) -> AsyncIterator[list[Entity]]:
+    """Yield notes with the given stored note_type values in bounded batches.
+
+    Only the relationships validation reads are loaded: observations, and
+    outgoing relations with their targets (for target-type checks). Batching
+    keeps a project-wide validation from holding every note's observations and
+    relations in memory at once.
+    """
+    if not stored_types:
+        return
+
+    id_query = (
+        entity_repository.select(Entity.id)
+        .where(Entity.note_type.in_(stored_types))
+        .order_by(Entity.id)
+    )
+    id_result = await entity_repository.execute_query(session, id_query, use_query_options=False)
+    entity_ids = list(id_result.scalars().all())
+
+    for start in range(0, len(entity_ids), _VALIDATION_BATCH_SIZE):
+        batch_ids = entity_ids[start : start + _VALIDATION_BATCH_SIZE]
+        query = (
+            entity_repository.select()
+            .where(Entity.id.in_(batch_ids))
+            .order_by(Entity.id)
+            .options(
+                selectinload(Entity.observations),
+                selectinload(Entity.outgoing_relations).selectinload(Relation.to_entity),
+            )
+        )
+        result = await entity_repository.execute_query(session, query, use_query_options=False)
+        yield list(result.scalars().all())
+
+
 async def _schema_covered_note_types(
     session: AsyncSession,
     entity_repository: EntityRepositoryV2ExternalDep,
@@ -429,12 +555,12 @@ async def _schema_covered_note_types(
     schema_query = entity_repository.select().where(Entity.note_type == "schema")
     schema_result = await entity_repository.execute_query(session, schema_query)
 
-    # normalized target -> (display label, stored note types); first label wins
-    targets: dict[str, tuple[str, set[str]]] = {}
+    # normalized target -> display label; first label wins
+    targets: dict[str, str] = {}
     for schema_entity in schema_result.scalars().all():
         target = (schema_entity.entity_metadata or {}).get("entity")
         if isinstance(target, str) and target:
-            targets.setdefault(normalize_note_type(target), (target, set()))
+            targets.setdefault(normalize_note_type(target), target)
 
     # Column-only select: skip eager-load options, which apply only to full entities.
     # Reading metadata here also discovers inline schemas and explicit references;
@@ -445,36 +571,32 @@ async def _schema_covered_note_types(
     note_result = await entity_repository.execute_query(
         session, note_query, use_query_options=False
     )
+    spellings: dict[str, set[str]] = {}
     for stored_type, metadata in note_result.all():
         if not stored_type:
             continue
 
         normalized_type = normalize_note_type(stored_type)
-        if normalized_type in targets:
-            targets[normalized_type][1].add(stored_type)
+        spellings.setdefault(normalized_type, set()).add(stored_type)
 
         schema_value = (metadata or {}).get("schema")
         has_direct_schema = isinstance(schema_value, dict) or (
             isinstance(schema_value, str) and bool(schema_value)
         )
         if has_direct_schema:
-            _, stored_types = targets.setdefault(normalized_type, (stored_type, set()))
-            stored_types.add(stored_type)
+            targets.setdefault(normalized_type, stored_type)
 
     return {
-        display_label: sorted(stored_types)
-        for _, (display_label, stored_types) in sorted(targets.items())
+        display_label: sorted(spellings.get(normalized_type, ()))
+        for normalized_type, display_label in sorted(targets.items())
     }
 
 
-async def _find_by_note_type(
+async def _stored_note_type_spellings(
     session: AsyncSession,
     entity_repository: EntityRepositoryV2ExternalDep,
-    note_type: str,
-) -> list[Entity]:
-    """Find canonical and legacy spellings that represent one logical note type."""
-    canonical_note_type = normalize_note_type(note_type)
-
+) -> dict[str, set[str]]:
+    """Group the stored note_type values by the canonical type they represent."""
     # Legacy databases may contain values written before note types were canonicalized.
     # Resolve their exact stored spellings in Python, where the shared normalizer can
     # handle camel-case as well as case and punctuation without backend-specific SQL.
@@ -484,11 +606,21 @@ async def _find_by_note_type(
         stored_types_query,
         use_query_options=False,
     )
-    stored_types = {
-        stored_type
-        for stored_type in stored_types_result.scalars().all()
-        if stored_type and normalize_note_type(stored_type) == canonical_note_type
-    }
+    spellings: dict[str, set[str]] = {}
+    for stored_type in stored_types_result.scalars().all():
+        if stored_type:
+            spellings.setdefault(normalize_note_type(stored_type), set()).add(stored_type)
+    return spellings
+
+
+async def _find_by_note_type(
+    session: AsyncSession,
+    entity_repository: EntityRepositoryV2ExternalDep,
+    note_type: str,
+) -> list[Entity]:
+    """Find canonical and legacy spellings that represent one logical note type."""
+    spellings = await _stored_note_type_spellings(session, entity_repository)
+    stored_types = spellings.get(normalize_note_type(note_type))
     if not stored_types:
         return []
 
@@ -497,14 +629,13 @@ async def _find_by_note_type(
     return list(result.scalars().all())
 
 
-async def _find_schema_entities(
-    session: AsyncSession,
-    entity_repository: EntityRepositoryV2ExternalDep,
+def _match_schema_entities(
+    entities: list[Entity],
     target_note_type: str,
     *,
     allow_reference_match: bool = False,
 ) -> list[Entity]:
-    """Find schema entities for resolver lookups.
+    """Select the schema entities that answer one resolver lookup.
 
     Resolution strategy:
     1) Always try exact entity_metadata['entity'] match (for implicit type lookup
@@ -512,10 +643,6 @@ async def _find_schema_entities(
     2) Only when allow_reference_match=True and no entity match was found, try
        exact reference matching by title/permalink (explicit schema references)
     """
-    query = entity_repository.select().where(Entity.note_type == "schema")
-    result = await entity_repository.execute_query(session, query)
-    entities = list(result.scalars().all())
-
     normalized_target_type = normalize_note_type(target_note_type)
 
     entity_matches = [
@@ -10,6 +10,7 @@ import typer  # noqa: E402
 
 from basic_memory.cli.auto_update import maybe_run_periodic_auto_update  # noqa: E402
 from basic_memory.cli.container import CliContainer, set_container  # noqa: E402
+from basic_memory.cli.lazy_commands import LazyCommandGroup  # noqa: E402
 from basic_memory.cli.promo import maybe_show_cloud_promo, maybe_show_init_line  # noqa: E402
 from basic_memory.config import init_cli_logging  # noqa: E402
 import logfire  # noqa: E402
@@ -24,7 +25,8 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
-app = typer.Typer(name="basic-memory")
+# Subcommand modules are imported on demand; see cli/lazy_commands.py.
+app = typer.Typer(name="basic-memory", cls=LazyCommandGroup)
 
 
 @app.callback()
@@ -1,38 +1,6 @@
-"""CLI commands for basic-memory."""
+"""CLI commands for basic-memory.
 
-from . import ci, status, db, doctor, import_memory_json, mcp, import_claude_conversations, orphans
-from . import (
-    import_claude_projects,
-    import_chatgpt,
-    man,
-    tool,
-    inspect,
-    project,
-    config,
-    format,
-    schema,
-    update,
-    workspace,
-)
-
-__all__ = [
-    "status",
-    "ci",
-    "db",
-    "doctor",
-    "import_memory_json",
-    "mcp",
-    "import_claude_conversations",
-    "orphans",
-    "import_claude_projects",
-    "import_chatgpt",
-    "tool",
-    "inspect",
-    "project",
-    "config",
-    "format",
-    "schema",
-    "update",
-    "workspace",
-    "man",
-]
+Each module registers its commands on the shared app when imported. Modules are
+not imported here: LazyCommandGroup (cli/lazy_commands.py) imports only the
+module that owns the invoked subcommand.
+"""
@@ -0,0 +1,140 @@
+"""Persistent content-hash cache for WebDAV diff planning.
+
+Comparing a same-size file against the store's entity tag needs its MD5, and
+computing that reads the whole file. Without a cache every `bm cloud` check,
+pull, or push re-reads every such file in the project, even when nothing on
+this machine changed since the last run.
+
+The cache maps a project-relative path to the digest last computed for it,
+together with the stat fingerprint (size, mtime in nanoseconds, inode) the
+file had when it was read. A digest is reused only when all three still match,
+so an edit, a replace-by-rename, or a truncate-and-rewrite all force a fresh
+read. What remains is the ordinary stat-based change detection rsync and git
+rely on.
+
+The cache lives in the Basic Memory data directory, beside the per-project
+bisync state, rather than inside the project: anything written there would be
+one more file for the transfer itself to consider.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+
+from loguru import logger
+
+from basic_memory.config import resolve_data_dir
+
+_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """The stat fields that must all be unchanged for a cached digest to apply."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, stat: os.stat_result) -> "FileFingerprint":
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino)
+
+
+def hash_cache_path(local_root: Path) -> Path:
+    """Locate the cache file for one local project directory.
+
+    Keyed by the resolved directory rather than the project name, so two
+    checkouts of the same project never share digests.
+    """
+    root_key = sha256(os.path.realpath(local_root).encode("utf-8")).hexdigest()[:32]
+    return resolve_data_dir() / "webdav-hash-cache" / f"{root_key}.json"
+
+
+class LocalHashCache:
+    """Digests of local files keyed by path and validated by stat fingerprint."""
+
+    def __init__(
+        self,
+        path: Path,
+        entries: dict[str, tuple[FileFingerprint, str]] | None = None,
+    ) -> None:
+        self._path = path
+        self._entries = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, local_root: Path) -> "LocalHashCache":
+        """Read the cache for ``local_root``, starting empty when it is unusable.
+
+        A missing, unreadable, or malformed cache only costs re-hashing, so it is
+        never an error.
+        """
+        path = hash_cache_path(local_root)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("version") != _CACHE_VERSION:
+                return cls(path)
+            entries = {
+                rel_path: (FileFingerprint(size, mtime_ns, inode), digest)
+                for rel_path, (size, mtime_ns, inode, digest) in payload["files"].items()
+            }
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.debug(f"Ignoring unreadable WebDAV hash cache {path}: {exc}")
+            return cls(path)
+        return cls(path, entries)
+
+    def lookup(self, rel_path: str, fingerprint: FileFingerprint) -> str | None:
+        """Return the cached digest when the file is unchanged since it was hashed."""
+        entry = self._entries.get(rel_path)
+        if entry is None or entry[0] != fingerprint:
+            return None
+        return entry[1]
+
+    def record(self, rel_path: str, fingerprint: FileFingerprint, digest: str) -> None:
+        if self._entries.get(rel_path) == (fingerprint, digest):
+            return
+        self._entries[rel_path] = (fingerprint, digest)
+        self._dirty = True
+
+    def retain(self, rel_paths: set[str]) -> None:
+        """Forget files that no longer exist, so the cache tracks the project's size."""
+        stale = self._entries.keys() - rel_paths
+        for rel_path in stale:
+            del self._entries[rel_path]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically; a failure only means hashing again next time."""
+        if not self._dirty:
+            return
+
+        payload = {
+            "version": _CACHE_VERSION,
+            "files": {
+                rel_path: [fp.size, fp.mtime_ns, fp.inode, digest]
+                for rel_path, (fp, digest) in sorted(self._entries.items())
+            },
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(
+                dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".part"
+            )
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                    json.dump(payload, stream, separators=(",", ":"))
+                os.replace(temp_name, self._path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.debug(f"Could not write WebDAV hash cache {self._path}: {exc}")
+            return
+        self._dirty = False
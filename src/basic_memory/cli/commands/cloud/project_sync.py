@@ -36,6 +36,7 @@ from basic_memory.cli.commands.cloud.rclone_config import (
 from basic_memory.cli.commands.cloud.transfer import TransferDirection, TransferPlan
 from basic_memory.cli.commands.cloud.webdav import WebdavError
 from basic_memory.cli.commands.cloud.webdav_transfer import (
+    DEFAULT_TRANSFER_WORKERS,
     webdav_project_diff,
     webdav_project_transfer,
 )
@@ -529,6 +530,7 @@ def _run_webdav_directional_transfer(
     on_conflict: ConflictStrategy,
     dry_run: bool,
     verbose: bool,
+    workers: int = DEFAULT_TRANSFER_WORKERS,
 ) -> None:
     """Run a Team-workspace push/pull over the cloud WebDAV surface.
 
@@ -571,6 +573,7 @@ def _run_webdav_directional_transfer(
             conflict_suffix=datetime.now().strftime("%Y%m%d-%H%M%S"),
             dry_run=dry_run,
             verbose=verbose,
+            workers=workers,
         )
     )
 
@@ -585,6 +588,7 @@ def _run_directional_transfer(
     dry_run: bool,
     verbose: bool,
     workspace: str | None = None,
+    workers: int = DEFAULT_TRANSFER_WORKERS,
 ) -> None:
     """Shared orchestration for `bm cloud push` / `bm cloud pull`.
 
@@ -632,6 +636,7 @@ def _run_directional_transfer(
                 on_conflict=on_conflict,
                 dry_run=dry_run,
                 verbose=verbose,
+                workers=workers,
             )
             return
 
@@ -719,6 +724,12 @@ def pull_project_command(
     ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview changes without pulling"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
+    workers: int = typer.Option(
+        DEFAULT_TRANSFER_WORKERS,
+        "--workers",
+        min=1,
+        help="Files transferred concurrently on Team (WebDAV) workspaces",
+    ),
 ) -> None:
     """Fetch cloud changes into local (cloud -> local), git-pull style.
 
@@ -733,7 +744,13 @@ def pull_project_command(
       bm cloud pull --name research --workspace acme
     """
     _run_directional_transfer(
-        name, "pull", on_conflict=on_conflict, dry_run=dry_run, verbose=verbose, workspace=workspace
+        name,
+        "pull",
+        on_conflict=on_conflict,
+        dry_run=dry_run,
+        verbose=verbose,
+        workspace=workspace,
+        workers=workers,
     )
 
 
@@ -752,6 +769,12 @@ def push_project_command(
     ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview changes without pushing"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
+    workers: int = typer.Option(
+        DEFAULT_TRANSFER_WORKERS,
+        "--workers",
+        min=1,
+        help="Files transferred concurrently on Team (WebDAV) workspaces",
+    ),
 ) -> None:
     """Upload local changes to cloud (local -> cloud), additive and Team-safe.
 
@@ -767,7 +790,13 @@ def push_project_command(
       bm cloud push --name research --workspace acme
     """
     _run_directional_transfer(
-        name, "push", on_conflict=on_conflict, dry_run=dry_run, verbose=verbose, workspace=workspace
+        name,
+        "push",
+        on_conflict=on_conflict,
+        dry_run=dry_run,
+        verbose=verbose,
+        workspace=workspace,
+        workers=workers,
     )
 
 
@@ -9,7 +9,7 @@ import aiofiles
 import httpx
 
 from basic_memory.cli.commands.cloud.webdav import webdav_path
-from basic_memory.ignore_utils import load_gitignore_patterns, should_ignore_path
+from basic_memory.ignore_utils import ignore_matcher, load_gitignore_patterns
 from basic_memory.mcp.async_client import get_client
 
 # Archive file extensions that should be skipped during upload
@@ -222,6 +222,8 @@ def _get_files_to_upload(
             print(f"Patterns: {', '.join(sorted(ignore_patterns))}")
         print()
 
+    matcher = ignore_matcher(ignore_patterns)
+
     # Walk through directory
     for root, dirs, filenames in os.walk(directory):
         root_path = Path(root)
@@ -230,7 +232,7 @@ def _get_files_to_upload(
         filtered_dirs = []
         for d in dirs:
             dir_path = root_path / d
-            if should_ignore_path(dir_path, directory, ignore_patterns):
+            if matcher.matches(dir_path, directory):
                 if verbose:
                     rel_path = dir_path.relative_to(directory)
                     print(f"  [IGNORED DIR] {rel_path}/")
@@ -247,7 +249,7 @@ def _get_files_to_upload(
             remote_path = str(rel_path).replace("\\", "/")
 
             # Check if file should be ignored
-            if should_ignore_path(file_path, directory, ignore_patterns):
+            if matcher.matches(file_path, directory):
                 ignored_files.append(remote_path)
                 if verbose:
                     print(f"  [IGNORED] {remote_path}")
@@ -19,17 +19,26 @@ transfer engine over that transport, and it keeps the same contract:
   exclusive create on pull and a conditional create on push
 - deletions are not propagated (see #862)
 
+Files move concurrently over the one client, so its connection pool is shared
+by every worker. Each file still carries its own write-time precondition, so
+running them side by side changes how long a transfer takes, not what it is
+allowed to replace.
+
 Comparison is by entity tag plus size, falling back to last-modified plus size
-when the service reports no entity tag we can treat as a content hash. See
+when the service reports no entity tag we can treat as a content hash. Local
+digests are remembered between runs (see ``local_hash_cache``), so a file that
+has not changed since it was last hashed is never read again. See
 ``_compare`` for why that fallback errs toward reporting a conflict, and
 ``_drop_appeared_on_cloud`` for how a stale plan is kept from overwriting a note
 nobody compared.
 """
 
+import asyncio
 import hashlib
 import os
 import tempfile
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from functools import partial
@@ -38,7 +47,9 @@ from typing import Literal
 
 import httpx
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
 
+from basic_memory.cli.commands.cloud.local_hash_cache import FileFingerprint, LocalHashCache
 from basic_memory.cli.commands.cloud.transfer import (
     ConflictStrategy,
     TransferDirection,
@@ -55,7 +66,7 @@ from basic_memory.cli.commands.cloud.webdav import (
     list_project_files,
     upload_file,
 )
-from basic_memory.ignore_utils import load_gitignore_patterns, should_ignore_path
+from basic_memory.ignore_utils import ignore_matcher, load_gitignore_patterns
 from basic_memory.mcp.async_client import get_cloud_proxy_client
 
 console = Console()
@@ -71,6 +82,18 @@ MODIFY_WINDOW_SECONDS = 1.0
 
 _HASH_CHUNK_BYTES = 1024 * 1024
 
+# How many files move at once. Each worker holds at most one request open on the
+# shared client, so this also bounds the connections a transfer asks the pool for.
+DEFAULT_TRANSFER_WORKERS = 8
+
+# Extra attempts per file after a transient failure, with exponential backoff.
+DEFAULT_TRANSFER_RETRIES = 2
+_RETRY_BACKOFF_SECONDS = 0.5
+
+# Responses that say "try again", as opposed to "this request is wrong". A plain
+# 500 is not here: it is as likely to be a bug as a blip, and retrying hides it.
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 502, 503, 504})
+
 # Whether two copies of a path hold the same bytes. "unknown" means the question
 # could not be answered at all — never a silent "same".
 Comparison = Literal["same", "differ", "unknown"]
@@ -83,6 +106,9 @@ class LocalFile:
     path: str  # project-relative POSIX path
     size: int
     mtime: float
+    fingerprint: FileFingerprint
+    # The digest remembered for this exact fingerprint, when there is one.
+    cached_hash: str | None = None
 
 
 @dataclass(frozen=True)
@@ -145,6 +171,8 @@ async def webdav_project_transfer(
     conflict_suffix: str = "",
     dry_run: bool = False,
     verbose: bool = False,
+    workers: int = DEFAULT_TRANSFER_WORKERS,
+    retries: int = DEFAULT_TRANSFER_RETRIES,
     client_cm_factory: ClientFactory | None = None,
 ) -> None:
     """Execute a directional transfer for the chosen conflict strategy.
@@ -153,10 +181,18 @@ async def webdav_project_transfer(
     ``strategy == "fail"`` and conflicts exist; this function assumes that gate
     has already passed and applies the resolution.
 
+    Up to ``workers`` files are in flight at once, and each is retried up to
+    ``retries`` more times when the failure is transient.
+
     Raises:
         WebdavError: If any transfer fails, or if the cloud names a file that
             would be written outside the project directory.
     """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if retries < 0:
+        raise ValueError("retries must not be negative")
+
     # keep-both: preserve the destination's version and drop the incoming one
     # beside it as a conflict copy, then do an additive (new-only) pass.
     renames = (
@@ -195,21 +231,84 @@ async def webdav_project_transfer(
         else:
             appeared = []
 
-        transferred = 0
-        for transfer in transfers:
-            if verbose:
-                console.print(f"  {transfer.describe()}")
-            if direction == "pull":
-                written = await _pull_file(client, project, local_root, transfer)
-            else:
-                written = await _push_file(client, project, local_root, transfer)
-            if not written:
-                appeared.append(transfer.dest_rel)
-                continue
-            transferred += 1
+        transferred, refused = await _run_transfers(
+            client,
+            project,
+            local_root,
+            direction,
+            transfers,
+            workers=workers,
+            retries=retries,
+            verbose=verbose,
+        )
 
     console.print(f"[dim]Transferred {transferred} file(s).[/dim]")
-    _report_appeared(appeared)
+    _report_appeared(sorted(appeared + refused))
+
+
+async def _run_transfers(
+    client: httpx.AsyncClient,
+    project: str,
+    local_root: Path,
+    direction: TransferDirection,
+    transfers: list[_Transfer],
+    *,
+    workers: int,
+    retries: int,
+    verbose: bool,
+) -> tuple[int, list[str]]:
+    """Move every file with a bounded pool of workers sharing one client.
+
+    Returns how many files were written and which destination paths were
+    refused because something appeared there first.
+
+    The first failure stops the transfer, as the sequential loop did: the
+    remaining workers are cancelled and the error propagates. A pull cancelled
+    mid-download has not claimed its name yet, so nothing half-written is left.
+    """
+    pending = deque(transfers)
+    refused: list[str] = []
+    transferred = 0
+
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task_id = progress.add_task(f"{direction.capitalize()}ing", total=len(transfers))
+
+        async def worker() -> None:
+            nonlocal transferred
+            while pending:
+                transfer = pending.popleft()
+                if verbose:
+                    progress.console.print(f"  {transfer.describe()}")
+                if direction == "pull":
+                    written = await _pull_file(
+                        client, project, local_root, transfer, retries=retries
+                    )
+                else:
+                    written = await _push_file(
+                        client, project, local_root, transfer, retries=retries
+                    )
+                if written:
+                    transferred += 1
+                else:
+                    refused.append(transfer.dest_rel)
+                progress.advance(task_id)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(min(workers, len(transfers)))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    return transferred, refused
 
 
 # --- Planning ---
@@ -228,7 +327,9 @@ def build_transfer_plan(
     ``--filter-from`` does for the Personal path.
     """
     ignore_patterns = load_gitignore_patterns(local_root, use_gitignore=False)
-    local_files = scan_local_files(local_root, ignore_patterns)
+    matcher = ignore_matcher(ignore_patterns)
+    hash_cache = LocalHashCache.load(local_root)
+    local_files = scan_local_files(local_root, ignore_patterns, hash_cache)
 
     remote_by_path: dict[str, RemoteFile] = {}
     for remote in remote_files:
@@ -236,7 +337,7 @@ def build_transfer_plan(
         # outside the project is a broken or hostile response, and the user
         # should see that before a plan is presented, not mid-transfer.
         local_equivalent = _safe_local_path(local_root, remote.path)
-        if should_ignore_path(local_equivalent, local_root, ignore_patterns):
+        if matcher.matches(local_equivalent, local_root):
             continue
         remote_by_path[remote.path] = remote
 
@@ -252,16 +353,22 @@ def build_transfer_plan(
     )
 
     for path in sorted(source_paths & dest_paths):
-        comparison = _compare(local_files[path], remote_by_path[path], local_root)
+        comparison = _compare(local_files[path], remote_by_path[path], local_root, hash_cache)
         if comparison == "differ":
             plan.conflicts.append(path)
         elif comparison == "unknown":
             plan.errors.append(path)
 
+    hash_cache.retain(set(local_files))
+    hash_cache.save()
     return plan
 
 
-def scan_local_files(local_root: Path, ignore_patterns: set[str]) -> dict[str, LocalFile]:
+def scan_local_files(
+    local_root: Path,
+    ignore_patterns: set[str],
+    hash_cache: LocalHashCache | None = None,
+) -> dict[str, LocalFile]:
     """Walk the project directory, skipping anything the ignore patterns match.
 
     Only ``.bmignore`` patterns apply, matching the filter the rclone path builds
@@ -272,32 +379,49 @@ def scan_local_files(local_root: Path, ignore_patterns: set[str]) -> dict[str, L
     Links are not followed and symlinked files are skipped, so push can never
     read bytes from outside the project boundary — the same rule the local
     project scanner applies for the same reason.
+
+    With a ``hash_cache``, each file whose stat fingerprint is unchanged comes
+    back carrying its remembered digest, so the comparison never has to read it.
     """
     files: dict[str, LocalFile] = {}
+    matcher = ignore_matcher(ignore_patterns)
 
     for root, dirs, filenames in os.walk(local_root, followlinks=False):
         root_path = Path(root)
+        rel_root = root_path.relative_to(local_root).as_posix()
+        prefix = "" if rel_root == "." else f"{rel_root}/"
         dirs[:] = [
             name
             for name in dirs
-            if not (root_path / name).is_symlink()
-            and not should_ignore_path(root_path / name, local_root, ignore_patterns)
+            if not (root_path / name).is_symlink() and not matcher.match_dir(f"{prefix}{name}")
         ]
 
         for filename in filenames:
             file_path = root_path / filename
             if file_path.is_symlink():
                 continue
-            if should_ignore_path(file_path, local_root, ignore_patterns):
+            rel_path = f"{prefix}{filename}"
+            if matcher.match_file(rel_path):
                 continue
             stat = file_path.stat()
-            rel_path = file_path.relative_to(local_root).as_posix()
-            files[rel_path] = LocalFile(path=rel_path, size=stat.st_size, mtime=stat.st_mtime)
+            fingerprint = FileFingerprint.from_stat(stat)
+            files[rel_path] = LocalFile(
+                path=rel_path,
+                size=stat.st_size,
+                mtime=stat.st_mtime,
+                fingerprint=fingerprint,
+                cached_hash=hash_cache.lookup(rel_path, fingerprint) if hash_cache else None,
+            )
 
     return files
 
 
-def _compare(local: LocalFile, remote: RemoteFile, local_root: Path) -> Comparison:
+def _compare(
+    local: LocalFile,
+    remote: RemoteFile,
+    local_root: Path,
+    hash_cache: LocalHashCache | None = None,
+) -> Comparison:
     """Decide whether two copies of a path hold the same bytes.
 
     Size settles it whenever it differs, and is checked first so a large file is
@@ -322,7 +446,12 @@ def _compare(local: LocalFile, remote: RemoteFile, local_root: Path) -> Comparis
 
     content_hash = etag_content_hash(remote.etag)
     if content_hash is not None:
-        return "same" if _file_content_hash(local_root / local.path) == content_hash else "differ"
+        local_hash = local.cached_hash
+        if local_hash is None:
+            local_hash = _file_content_hash(local_root / local.path)
+            if hash_cache is not None:
+                hash_cache.record(local.path, local.fingerprint, local_hash)
+        return "same" if local_hash == content_hash else "differ"
 
     if remote.modified is None:
         return "unknown"
@@ -411,11 +540,34 @@ def _report_appeared(appeared: list[str]) -> None:
 # --- Single-file transfers ---
 
 
+def _is_retryable(error: WebdavError) -> bool:
+    """Whether a failed request is worth sending again unchanged."""
+    cause = error.__cause__
+    if isinstance(cause, httpx.HTTPStatusError):
+        return cause.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(cause, httpx.TransportError)
+
+
+async def _with_retries[T](operation: Callable[[], Awaitable[T]], *, retries: int) -> T:
+    """Run one request, retrying transient failures with exponential backoff."""
+    attempt = 0
+    while True:
+        try:
+            return await operation()
+        except WebdavError as error:
+            if attempt >= retries or not _is_retryable(error):
+                raise
+            await asyncio.sleep(_RETRY_BACKOFF_SECONDS * 2**attempt)
+            attempt += 1
+
+
 async def _pull_file(
     client: httpx.AsyncClient,
     project: str,
     local_root: Path,
     transfer: _Transfer,
+    *,
+    retries: int = 0,
 ) -> bool:
     """Download one cloud file and land it under the destination path.
 
@@ -428,7 +580,9 @@ async def _pull_file(
     if not transfer.create_only:
         _refuse_symlink(target, transfer.dest_rel)
 
-    downloaded = await download_file(client, project, transfer.source_rel)
+    downloaded = await _with_retries(
+        partial(download_file, client, project, transfer.source_rel), retries=retries
+    )
 
     target.parent.mkdir(parents=True, exist_ok=True)
     temp_path = _write_temp_file(target, downloaded)
@@ -526,22 +680,32 @@ async def _push_file(
     project: str,
     local_root: Path,
     transfer: _Transfer,
+    *,
+    retries: int = 0,
 ) -> bool:
     """Upload one local file to the destination path in the cloud project.
 
     Returns False when a create-only upload was refused because the path now
     exists in the cloud, mirroring the pull side.
+
+    A retried create-only upload keeps its ``If-None-Match: *``. If an earlier
+    attempt landed but its response was lost, the retry is refused and the file
+    is reported as having appeared — a spurious report, never an overwrite.
     """
     source = _safe_local_path(local_root, transfer.source_rel)
     _refuse_symlink(source, transfer.source_rel)
     stat = source.stat()
-    return await upload_file(
-        client,
-        project,
-        transfer.dest_rel,
-        content=source.read_bytes(),
-        mtime=int(stat.st_mtime),
-        create_only=transfer.create_only,
+    return await _with_retries(
+        partial(
+            upload_file,
+            client,
+            project,
+            transfer.dest_rel,
+            content=source.read_bytes(),
+            mtime=int(stat.st_mtime),
+            create_only=transfer.create_only,
+        ),
+        retries=retries,
     )
 
 
@@ -1,7 +1,9 @@
 """utility functions for commands"""
 
 import asyncio
-from typing import Optional, TypeVar, Coroutine, Any
+import io
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TypeVar, Coroutine, Any
 
 import typer
 
@@ -12,6 +14,10 @@ from basic_memory.mcp.async_client import get_client
 from basic_memory.mcp.clients import ProjectClient
 from basic_memory.mcp.project_context import get_active_project
 
+if TYPE_CHECKING:  # pragma: no cover
+    from basic_memory.importers.streaming import StreamingChatImporter
+    from basic_memory.schemas.importer import ChatImportResult
+
 console = Console()
 
 T = TypeVar("T")
@@ -34,6 +40,7 @@ def run_with_cleanup(coro: Coroutine[Any, Any, T]) -> T:
     from basic_memory import db
     from basic_memory.index.note_content_materialization import drain_pending_materializations
     from basic_memory.index.local_schedulers import drain_background_tasks
+    from basic_memory.markdown.parse_stage import shutdown_markdown_parse_pool
 
     async def _with_cleanup() -> T:
         try:
@@ -48,11 +55,74 @@ def run_with_cleanup(coro: Coroutine[Any, Any, T]) -> T:
             # relation resolution): cancelling it at loop close would leave
             # semantic search and inbound wikilinks stale until a later reindex.
             await drain_background_tasks()
+            # Indexing may have started parse worker processes; stop them with the loop.
+            shutdown_markdown_parse_pool()
             await db.shutdown_db()
 
     return asyncio.run(_with_cleanup())
 
 
+def run_streaming_chat_import(
+    importer: "StreamingChatImporter",
+    conversations_json: Path,
+    folder: str,
+    *,
+    resume: bool,
+    workers: int,
+) -> "ChatImportResult":
+    """Stream a conversations.json export through ``importer`` with progress and resume.
+
+    The export is parsed one conversation at a time, so memory stays bounded by the
+    largest conversation rather than the file. Progress is reported against bytes
+    read; an interrupted import of the same file picks up where it stopped unless
+    ``resume`` is False.
+    """
+    from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn
+
+    # Deferred: importer stack loads at import-command run time only (#886).
+    from basic_memory.importers.streaming import ImportCheckpoint, iter_json_array
+
+    checkpoint = ImportCheckpoint.open(
+        conversations_json,
+        destination_folder=folder,
+        project_name=importer.project_name,
+        resume=resume,
+    )
+    if checkpoint.completed:
+        console.print(
+            f"Resuming after {checkpoint.completed} conversations imported by an earlier run"
+        )
+
+    with (
+        io.TextIOWrapper(conversations_json.open("rb"), encoding="utf-8") as stream,
+        Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            DownloadColumn(),
+            console=console,
+            transient=True,
+        ) as progress,
+    ):
+        task_id = progress.add_task("Importing conversations", total=checkpoint.source_size)
+
+        def on_progress(conversations: int) -> None:
+            progress.update(
+                task_id,
+                completed=stream.buffer.tell(),
+                description=f"Imported {conversations} conversations",
+            )
+
+        return run_with_cleanup(
+            importer.import_stream(
+                iter_json_array(stream),
+                folder,
+                max_concurrent=workers,
+                checkpoint=checkpoint,
+                on_progress=on_progress,
+            )
+        )
+
+
 async def run_project_index(
     project: Optional[str] = None,
     force_full: bool = False,
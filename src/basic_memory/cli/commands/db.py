@@ -506,3 +506,148 @@ async def _reindex(
         console.print("\n[green]Reindex complete![/green]")
     finally:
         await db.shutdown_db()
+
+
+embedding_store_app = typer.Typer(
+    help="Report on and prune the content-addressed embedding store shared across projects."
+)
+app.add_typer(embedding_store_app, name="embedding-store")
+
+
+def _format_megabytes(byte_count: int) -> str:
+    return f"{byte_count / (1024 * 1024):.1f} MB"
+
+
+@embedding_store_app.command("stats")
+def embedding_store_stats():  # pragma: no cover
+    """Show how many embeddings the store holds, per provider identity."""
+    run_with_cleanup(_embedding_store_stats(ConfigManager().config))
+
+
+@embedding_store_app.command("prune")
+def embedding_store_prune(
+    max_mb: int = typer.Option(
+        None,
+        "--max-mb",
+        min=0,
+        help="Evict least recently used embeddings until the store fits this size "
+        "(default: semantic_embedding_store_max_bytes)",
+    ),
+    unused_days: int = typer.Option(
+        None, "--unused-days", min=0, help="Drop embeddings not reused in this many days"
+    ),
+    provider: str = typer.Option(
+        None, "--provider", help="Drop every embedding stored for this provider identity"
+    ),
+    all_entries: bool = typer.Option(False, "--all", help="Empty the store"),
+):  # pragma: no cover
+    """Evict embeddings from the store.
+
+    Stored vectors are never wrong for their provider identity, so pruning only
+    trades disk space for future embedding calls.
+
+    Examples:
+        bm embedding-store prune                 # Enforce the configured size budget
+        bm embedding-store prune --max-mb 100    # Shrink to 100 MB, least recently used first
+        bm embedding-store prune --unused-days 30
+        bm embedding-store prune --all
+    """
+    run_with_cleanup(
+        _embedding_store_prune(
+            ConfigManager().config,
+            max_mb=max_mb,
+            unused_days=unused_days,
+            provider=provider,
+            all_entries=all_entries,
+        )
+    )
+
+
+async def _embedding_store_session_maker(app_config):
+    # Deferred: only store commands pay for SQLAlchemy and migrations (#886).
+    from basic_memory import db
+
+    _, session_maker = await db.get_or_create_db(
+        db_path=app_config.database_path,
+        db_type=db.DatabaseType.FILESYSTEM,
+    )
+    return session_maker
+
+
+async def _embedding_store_stats(app_config):
+    from rich.table import Table
+
+    from basic_memory import db
+    from basic_memory.repository.embedding_store_repository import EmbeddingStoreRepository
+
+    try:
+        store = EmbeddingStoreRepository(await _embedding_store_session_maker(app_config))
+        stats = await store.stats()
+    finally:
+        await db.shutdown_db()
+
+    state = "enabled" if app_config.semantic_embedding_store_enabled else "disabled"
+    console.print(
+        f"Embedding store ([cyan]{state}[/cyan]): {stats.entries} embeddings, "
+        f"{_format_megabytes(stats.bytes)} of "
+        f"{_format_megabytes(app_config.semantic_embedding_store_max_bytes)}"
+    )
+    if not stats.providers:
+        return
+
+    table = Table()
+    table.add_column("Provider identity")
+    table.add_column("Embeddings", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Last used")
+    for provider_stats in stats.providers:
+        last_used = provider_stats.last_used_at
+        table.add_row(
+            escape(provider_stats.provider_identity),
+            str(provider_stats.entries),
+            _format_megabytes(provider_stats.bytes),
+            last_used.strftime("%Y-%m-%d %H:%M") if last_used is not None else "-",
+        )
+    console.print(table)
+
+
+async def _embedding_store_prune(
+    app_config,
+    *,
+    max_mb: int | None,
+    unused_days: int | None,
+    provider: str | None,
+    all_entries: bool,
+):
+    from datetime import datetime, timedelta, timezone
+
+    from basic_memory import db
+    from basic_memory.repository.embedding_store_repository import EmbeddingStoreRepository
+
+    unused_since = (
+        datetime.now(timezone.utc) - timedelta(days=unused_days)
+        if unused_days is not None
+        else None
+    )
+    max_bytes = max_mb * 1024 * 1024 if max_mb is not None else None
+    if not all_entries and max_bytes is None and unused_since is None and provider is None:
+        max_bytes = app_config.semantic_embedding_store_max_bytes
+
+    try:
+        store = EmbeddingStoreRepository(await _embedding_store_session_maker(app_config))
+        if all_entries:
+            removed = await store.prune()
+        else:
+            removed = await store.prune(
+                max_bytes=max_bytes,
+                unused_since=unused_since,
+                provider_identity=provider,
+            )
+        stats = await store.stats()
+    finally:
+        await db.shutdown_db()
+
+    console.print(
+        f"[green]Pruned {removed} embeddings[/green]; "
+        f"{stats.entries} remain ({_format_megabytes(stats.bytes)})"
+    )
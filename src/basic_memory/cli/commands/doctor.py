@@ -81,6 +81,37 @@ async def _delete_doctor_project(
         await _delete_doctor_project_locally(project_name, project_id)
 
 
+async def repair_project_stats(project_name: str | None = None) -> list[str]:
+    """Rebuild trigger-maintained project counters from the local database.
+
+    Returns the names of the repaired projects.
+    """
+    from basic_memory import db
+    from basic_memory.config import ConfigManager
+    from basic_memory.repository import ProjectRepository
+    from basic_memory.repository.project_stat_repository import ProjectStatRepository
+
+    config_manager = ConfigManager()
+    repository = ProjectRepository()
+    stat_repository = ProjectStatRepository()
+    _, session_maker = await db.get_or_create_db(
+        db_path=config_manager.config.database_path,
+        db_type=db.DatabaseType.FILESYSTEM,
+    )
+
+    async with db.scoped_session(session_maker) as session:
+        if project_name is None:
+            projects = list(await repository.get_active_projects(session))
+        else:
+            project = await repository.get_by_name_case_insensitive(session, project_name)
+            if project is None:
+                raise ValueError(f"Project '{project_name}' not found")
+            projects = [project]
+        for project in projects:
+            await stat_repository.recompute(session, project.id)
+    return [project.name for project in projects]
+
+
 async def run_doctor() -> None:
     """Run local consistency checks for file <-> database flows."""
     # Deferred: the markdown parsing stack is only needed while the checks run,
@@ -201,6 +232,14 @@ def doctor(
         False, "--local", help="Force local API routing (ignore cloud mode)"
     ),
     cloud: bool = typer.Option(False, "--cloud", help="Force cloud API routing"),
+    repair_stats: bool = typer.Option(
+        False,
+        "--repair-stats",
+        help="Rebuild the cached project statistics from the local database and exit",
+    ),
+    project: str | None = typer.Option(
+        None, "--project", help="Limit --repair-stats to one project (default: all active)"
+    ),
 ) -> None:
     """Run local consistency checks to verify file/database indexing."""
     # Deferred: ToolError lives in FastMCP's runtime, which must not load at CLI startup (#886).
@@ -208,6 +247,13 @@ def doctor(
 
     try:
         validate_routing_flags(local, cloud)
+        if repair_stats:
+            repaired = run_with_cleanup(repair_project_stats(project))
+            console.print(
+                f"[green]Repaired statistics for {len(repaired)} project(s): "
+                f"{', '.join(repaired) or 'none'}[/green]"
+            )
+            return
         # Doctor runs local filesystem checks — always default to local routing
         if not local and not cloud:
             local = True
@@ -3,8 +3,8 @@
 Harness plugins reduce to manifests plus one-line shims that exec
 ``bm hook <event> --harness claude|codex`` with the hook JSON on stdin. All
 logic lives here: per-harness stdin adapters, the session-start context brief,
-checkpoint prompting, lifecycle-event capture into the inbox WAL, and the
-flush/status operator surface.
+checkpoint prompting, lifecycle-event capture into the inbox WAL, the opt-in
+warm query daemon, and the flush/status operator surface.
 
 Contracts:
   - Active harness verbs (session-start, pre-compact) are fail-open: any error logs
@@ -43,7 +43,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
 import typer
 from loguru import logger
@@ -52,6 +52,7 @@ import basic_memory
 from basic_memory.cli.app import app
 from basic_memory.cli.commands.command_utils import run_with_cleanup
 from basic_memory.hooks.adapters import NormalizedHookEvent, for_harness
+from basic_memory.hooks.transcript_cursor import TranscriptSummary, read_transcript_summary
 
 # Envelope event names, duplicated as literals would invite drift; the
 # envelope module itself is imported lazily to keep CLI import time lean.
@@ -72,6 +73,7 @@ class Harness(str, Enum):
 MAX_BRIEF_CHARS = 10_000
 # Per-query budget, mirroring the hook scripts' subprocess timeout.
 QUERY_TIMEOUT_SECONDS = 10.0
+DAEMON_TIMEOUT_MARGIN = 2.0
 # Cap how many shared projects we read per session — bounds latency and output.
 MAX_SHARED = 6
 CODING_SESSION_PROFILE = "coding"
@@ -485,41 +487,63 @@ class _BriefContext:
     shared: dict[str, dict[str, Any] | None]
 
 
-async def _gather_context(
+type _BriefQuery = tuple[str | None, dict[str, Any]]
+
+
+def _brief_queries(
     profile: HarnessProfile,
     primary: str,
     timeframe: str,
     shared_refs: list[str],
     repository: str | None = None,
-) -> _BriefContext:
-    # Cloud reads cost a round-trip each; asyncio.gather keeps total wall-clock
-    # at ~one query instead of the sum (ports the hook scripts' thread pool).
+) -> tuple[list[_BriefQuery], int]:
+    """Plan the brief's searches as (project, filters) pairs plus the session-query count.
+
+    Order is tasks, decisions, session queries (highest priority first), then
+    one open-decisions query per shared project; _brief_context relies on it.
+    """
     project = primary or None
-    session_queries = []
+    session_queries: list[_BriefQuery] = []
     if repository is not None:
         # A Basic Memory project can serve several repositories. Repository
         # metadata is therefore the isolation boundary for coding checkpoints;
         # never recall another checkout's branch or pull request as this one's.
         session_queries.append(
-            _query(
+            (
                 project,
-                note_types=[profile.coding_session_note_type],
-                metadata_filters={"repository": repository},
-                after_date=timeframe,
+                {
+                    "note_types": [profile.coding_session_note_type],
+                    "metadata_filters": {"repository": repository},
+                    "after_date": timeframe,
+                },
             )
         )
     # General checkpoints are a lower-priority path because coding_session
     # results carry repository identity and are therefore merged first.
     session_queries.append(
-        _query(project, note_types=list(profile.recall_session_types), after_date=timeframe)
+        (project, {"note_types": list(profile.recall_session_types), "after_date": timeframe})
     )
-    results = await asyncio.gather(
-        _query(project, note_types=["task"], status="active"),
-        _query(project, note_types=["decision"], status="open"),
+    queries: list[_BriefQuery] = [
+        (project, {"note_types": ["task"], "status": "active"}),
+        (project, {"note_types": ["decision"], "status": "open"}),
         *session_queries,
-        *[_query(ref, note_types=["decision"], status="open") for ref in shared_refs],
-    )
-    session_end = 2 + len(session_queries)
+        *[(ref, {"note_types": ["decision"], "status": "open"}) for ref in shared_refs],
+    ]
+    return queries, len(session_queries)
+
+
+async def _run_queries(queries: Sequence[_BriefQuery]) -> list[dict[str, Any] | None]:
+    # Cloud reads cost a round-trip each; asyncio.gather keeps total wall-clock
+    # at ~one query instead of the sum (ports the hook scripts' thread pool).
+    return list(await asyncio.gather(*[_query(ref, **filters) for ref, filters in queries]))
+
+
+def _brief_context(
+    results: list[dict[str, Any] | None],
+    session_query_count: int,
+    shared_refs: list[str],
+) -> _BriefContext:
+    session_end = 2 + session_query_count
     return _BriefContext(
         tasks=results[0],
         decisions=results[1],
@@ -528,6 +552,46 @@ async def _gather_context(
     )
 
 
+async def _gather_context(
+    profile: HarnessProfile,
+    primary: str,
+    timeframe: str,
+    shared_refs: list[str],
+    repository: str | None = None,
+) -> _BriefContext:
+    queries, session_query_count = _brief_queries(
+        profile, primary, timeframe, shared_refs, repository
+    )
+    return _brief_context(await _run_queries(queries), session_query_count, shared_refs)
+
+
+def _gather_context_via_daemon(
+    profile: HarnessProfile,
+    primary: str,
+    timeframe: str,
+    shared_refs: list[str],
+    repository: str | None = None,
+) -> _BriefContext | None:
+    """Ask a running `bm hook daemon` for the brief's searches; None when there is none.
+
+    Trigger: a warm daemon is listening on the data-dir socket.
+    Why: a hook process otherwise pays for the MCP tool stack, database setup,
+         and model loading before its first search runs.
+    Outcome: the daemon's results, or None so the caller searches in-process.
+    """
+    from basic_memory.hooks.daemon import run_daemon_queries
+
+    queries, session_query_count = _brief_queries(
+        profile, primary, timeframe, shared_refs, repository
+    )
+    # Each daemon-side search has QUERY_TIMEOUT_SECONDS; the margin covers the
+    # socket round-trip so a slow-but-healthy daemon isn't abandoned early.
+    results = run_daemon_queries(queries, timeout=QUERY_TIMEOUT_SECONDS + DAEMON_TIMEOUT_MARGIN)
+    if results is None:
+        return None
+    return _brief_context(results, session_query_count, shared_refs)
+
+
 def _rows(result: dict[str, Any] | None) -> list[dict[str, Any]]:
     return (result or {}).get("results") or []
 
@@ -615,7 +679,9 @@ def _build_brief(
             )
         repository = configured_repository.strip()
 
-    context = run_with_cleanup(
+    context = _gather_context_via_daemon(
+        profile, primary, timeframe, shared_refs, repository=repository
+    ) or run_with_cleanup(
         _gather_context(profile, primary, timeframe, shared_refs, repository=repository)
     )
 
@@ -750,8 +816,8 @@ def _text_of(content: Any) -> str:
     return ""
 
 
-def _transcript_turns(path: str, harness: Harness = Harness.claude) -> list[tuple[str, str]]:
-    """Extract (role, text) turns from a JSONL transcript.
+def _transcript_turn(obj: dict[str, Any], harness: Harness) -> tuple[str, str] | None:
+    """Extract the (role, text) turn from one decoded transcript line, if it is one.
 
     Skips injected/meta frames and tool results — only real human input and
     assistant prose count. Claude Code stores a top-level ``message``; Codex
@@ -759,41 +825,30 @@ def _transcript_turns(path: str, harness: Harness = Harness.claude) -> list[tupl
     ``output_text`` content blocks. Codex transcripts are not a stable public
     API, so this host-specific branch is intentionally narrow and fixture-backed.
     """
-    if not path:
-        return []
-    collected: list[tuple[str, str]] = []
-    try:
-        with open(path, encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if harness is Harness.codex:
-                    payload = obj.get("payload")
-                    if (
-                        obj.get("type") != "response_item"
-                        or not isinstance(payload, dict)
-                        or payload.get("type") != "message"
-                    ):
-                        continue
-                    msg = payload
-                else:
-                    if obj.get("isMeta") or obj.get("toolUseResult") is not None:
-                        continue
-                    msg = obj.get("message") if isinstance(obj.get("message"), dict) else obj
-                role = msg.get("role") or obj.get("type")
-                if role not in ("user", "assistant"):
-                    continue
-                text = _text_of(msg.get("content")).strip()
-                if text:
-                    collected.append((role, text))
-    except OSError:
-        return []
-    return collected
+    if harness is Harness.codex:
+        payload = obj.get("payload")
+        if (
+            obj.get("type") != "response_item"
+            or not isinstance(payload, dict)
+            or payload.get("type") != "message"
+        ):
+            return None
+        msg = payload
+    else:
+        if obj.get("isMeta") or obj.get("toolUseResult") is not None:
+            return None
+        message = obj.get("message")
+        msg = message if isinstance(message, dict) else obj
+    role = msg.get("role") or obj.get("type")
+    if not isinstance(role, str) or role not in ("user", "assistant"):
+        return None
+    text = _text_of(msg.get("content")).strip()
+    return (role, text) if text else None
+
+
+def _transcript_summary(path: str, harness: Harness, session_id: str | None) -> TranscriptSummary:
+    """Rolling checkpoint summary of a transcript, parsing only its unread tail."""
+    return read_transcript_summary(path, session_id, lambda obj: _transcript_turn(obj, harness))
 
 
 def _clip(value: str, limit: int) -> str:
@@ -893,7 +948,7 @@ def _coding_context(cfg: dict[str, Any], directory: str) -> CodingContext:
 def _checkpoint_note(
     profile: HarnessProfile,
     event: NormalizedHookEvent,
-    conversation: list[tuple[str, str]],
+    summary: TranscriptSummary,
     primary: str,
     working_directory: str,
     coding_context: CodingContext | None,
@@ -908,9 +963,10 @@ def _checkpoint_note(
     a hand-built frontmatter block and, via fail-open, silently drop the
     checkpoint. ``type`` is supplied to write_note separately (``note_type``).
     """
-    user_messages = [text for role, text in conversation if role == "user"]
-    opening = user_messages[0]
-    recent_user = user_messages[-3:]
+    opening = summary.opening
+    if opening is None:
+        raise ValueError("checkpoint needs an opening user turn")
+    recent_user = summary.recent_user
 
     now = datetime.now(timezone.utc)
     iso = now.isoformat(timespec="seconds")
@@ -1076,10 +1132,10 @@ def _pre_compact(harness: Harness, project_dir: Optional[Path]) -> None:
         # the checkpoint from its summarized working context.
         return
 
-    conversation = _transcript_turns(event.transcript_path, harness)
+    summary = _transcript_summary(event.transcript_path, harness, event.session_id)
     # Trigger: nothing usable in the transcript, or no real human turn in it.
     # Why: an empty or human-less checkpoint is worse than none. Outcome: no-op.
-    if not conversation or not any(role == "user" for role, _ in conversation):
+    if summary.opening is None:
         return
 
     working_directory = event.cwd or str(mapping_dir)
@@ -1090,7 +1146,7 @@ def _pre_compact(harness: Harness, project_dir: Optional[Path]) -> None:
     title, content, metadata = _checkpoint_note(
         profile,
         event,
-        conversation,
+        summary,
         primary,
         working_directory,
         coding_context,
@@ -1181,6 +1237,46 @@ def flush(
     )
 
 
+@hook_app.command("daemon")
+def daemon(
+    idle_timeout_minutes: float = typer.Option(
+        30,
+        "--idle-timeout-minutes",
+        min=1,
+        help="Exit after this long without a request",
+    ),
+    stop_running: bool = typer.Option(
+        False, "--stop", help="Stop the running hook daemon instead of starting one"
+    ),
+) -> None:
+    """Keep hook searches warm in a long-lived process (opt-in).
+
+    session-start sends its searches to this daemon over a Unix socket in the
+    Basic Memory data dir and runs them in-process whenever it is not running.
+    """
+    from basic_memory.hooks.daemon import (
+        HookDaemonRunningError,
+        daemon_socket_path,
+        daemon_supported,
+        serve_hook_daemon,
+        stop_daemon,
+    )
+
+    if not daemon_supported():
+        typer.echo("hook daemon requires Unix domain sockets (not available on Windows)", err=True)
+        raise typer.Exit(1)
+    if stop_running:
+        typer.echo("hook daemon stopped" if stop_daemon() else "hook daemon not running")
+        return
+
+    typer.echo(f"hook daemon listening on {daemon_socket_path()}")
+    try:
+        run_with_cleanup(serve_hook_daemon(_run_queries, idle_timeout=idle_timeout_minutes * 60))
+    except HookDaemonRunningError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(1)
+
+
 # --- install / remove (standalone users, no plugin marketplace) ---
 
 # Ownership tag: entries we write are recognized by their command shape — the
@@ -1480,6 +1576,7 @@ def status(
     """Show inbox depth, last flush, settings summary, and tool versions."""
     import basic_memory
     from basic_memory.hooks import inbox
+    from basic_memory.hooks.daemon import ping_daemon
 
     pending = len(inbox.list_envelopes())
     processed = len(list(inbox.processed_dir().glob("*.json")))
@@ -1506,3 +1603,5 @@ def status(
     )
     typer.echo(f"basic-memory version: {basic_memory.__version__}")
     typer.echo(f"uv: {_uv_version() or '(not found)'}")
+    daemon_pid = ping_daemon()
+    typer.echo(f"hook daemon: {f'running (pid {daemon_pid})' if daemon_pid else 'not running'}")
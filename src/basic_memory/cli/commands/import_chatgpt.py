@@ -3,13 +3,16 @@
 # PEP 563 lazy annotations keep heavy importer types out of module import (#886).
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Tuple
 
 import typer
 from basic_memory.cli.app import import_app
-from basic_memory.cli.commands.command_utils import run_with_cleanup
+from basic_memory.cli.commands.command_utils import (
+    run_project_index,
+    run_streaming_chat_import,
+    run_with_cleanup,
+)
 from basic_memory.config import ConfigManager, get_project_config
 from loguru import logger
 from rich.console import Console
@@ -45,6 +48,20 @@ def import_chatgpt(
     folder: Annotated[
         str, typer.Option(help="The folder to place the files in.")
     ] = "conversations",
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume/--no-resume",
+            help="Continue an interrupted import of the same file instead of starting over.",
+        ),
+    ] = True,
+    workers: Annotated[
+        int, typer.Option("--workers", min=1, help="Number of notes to write concurrently.")
+    ] = 8,
+    index: Annotated[
+        bool,
+        typer.Option("--index/--no-index", help="Index the project once the import finishes."),
+    ] = False,
 ):
     """Import chat conversations from ChatGPT JSON format.
 
@@ -53,7 +70,9 @@ def import_chatgpt(
     2. Convert them to linear markdown conversations
     3. Save as clean, readable markdown files
 
-    After importing, run 'bm reindex --search' to index the new files.
+    The export is read incrementally, so very large files import in bounded
+    memory. Pass --index to index the new files in one pass afterwards;
+    otherwise run 'bm reindex --search'.
     """
 
     try:
@@ -75,9 +94,9 @@ def import_chatgpt(
         importer = ChatGPTImporter(
             config.home, markdown_processor, file_service, project_name=config.name
         )
-        with conversations_json.open("r", encoding="utf-8") as file:
-            json_data = json.load(file)
-            result = run_with_cleanup(importer.import_data(json_data, folder))
+        result = run_streaming_chat_import(
+            importer, conversations_json, folder, resume=resume, workers=workers
+        )
 
         if not result.success:  # pragma: no cover
             typer.echo(f"Error during import: {result.error_message}", err=True)
@@ -93,7 +112,10 @@ def import_chatgpt(
             )
         )
 
-        console.print("\nRun 'bm reindex --search' to index the new files.")
+        if index:
+            run_with_cleanup(run_project_index(config.name, run_in_background=False))
+        else:
+            console.print("\nRun 'bm reindex --search' to index the new files.")
 
     except Exception as e:
         logger.error("Import failed")
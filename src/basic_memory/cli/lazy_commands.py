@@ -0,0 +1,91 @@
+"""On-demand loading of bm subcommand modules.
+
+Every command module registers itself on the shared Typer app when imported.
+Importing all of them up front made each invocation pay for every command's
+import graph, including `bm hook session-start` / `pre-compact`, which agent
+harnesses run on every turn. LazyCommandGroup imports only the module(s) that
+own the requested subcommand, and falls back to importing everything when it
+needs the full list (help output, shell completion, unknown names).
+"""
+
+from __future__ import annotations
+
+from typing import Any, override
+
+import typer
+from typer.core import TyperGroup
+
+# Top-level command name -> modules that register it (or its subcommands).
+# `import` and `cloud` are declared in cli/app.py; their subcommands live in
+# these modules.
+LAZY_COMMAND_MODULES: dict[str, tuple[str, ...]] = {
+    "ci": ("basic_memory.cli.commands.ci",),
+    "cloud": ("basic_memory.cli.commands.cloud",),
+    "config": ("basic_memory.cli.commands.config",),
+    "doctor": ("basic_memory.cli.commands.doctor",),
+    "embedding-store": ("basic_memory.cli.commands.db",),
+    "format": ("basic_memory.cli.commands.format",),
+    "hook": ("basic_memory.cli.commands.hook",),
+    "import": (
+        "basic_memory.cli.commands.import_chatgpt",
+        "basic_memory.cli.commands.import_claude_conversations",
+        "basic_memory.cli.commands.import_claude_projects",
+        "basic_memory.cli.commands.import_memory_json",
+    ),
+    "inspect": ("basic_memory.cli.commands.inspect",),
+    "man": ("basic_memory.cli.commands.man",),
+    "mcp": ("basic_memory.cli.commands.mcp",),
+    "orphans": ("basic_memory.cli.commands.orphans",),
+    "project": ("basic_memory.cli.commands.project",),
+    "reindex": ("basic_memory.cli.commands.db",),
+    "reset": ("basic_memory.cli.commands.db",),
+    "schema": ("basic_memory.cli.commands.schema",),
+    "status": ("basic_memory.cli.commands.status",),
+    "tool": ("basic_memory.cli.commands.tool",),
+    "update": ("basic_memory.cli.commands.update",),
+    "workspace": ("basic_memory.cli.commands.workspace",),
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Root bm group that imports a subcommand's module the first time it is resolved."""
+
+    def __init__(self, **attrs) -> None:
+        super().__init__(**attrs)
+        self._loaded_commands: set[str] = set()
+
+    def _load(self, names: list[str]) -> None:
+        pending = [name for name in names if name not in self._loaded_commands]
+        if not pending:
+            return
+        for name in pending:
+            for module_name in LAZY_COMMAND_MODULES[name]:
+                # __import__ rather than importlib.import_module: only the
+                # former goes through the C import path that `python -X
+                # importtime` instruments, which the CLI import budgets read.
+                __import__(module_name)
+            self._loaded_commands.add(name)
+
+        # Typer builds click commands from the app's registrations when the root
+        # group is created, so rebuild it to pick up what the imports registered.
+        from basic_memory.cli.app import app
+
+        rebuilt = typer.main.get_command(app)
+        assert isinstance(rebuilt, TyperGroup)
+        self.commands.update(rebuilt.commands)
+
+    # ctx is Any: the base group takes click's Context, which newer Typer releases
+    # vendor privately, so it has no import path that works across versions.
+    @override
+    def get_command(self, ctx: Any, cmd_name: str):
+        if cmd_name in LAZY_COMMAND_MODULES:
+            self._load([cmd_name])
+        elif cmd_name not in self.commands:
+            # Unknown name: load everything so "did you mean" suggestions see all commands.
+            self._load(list(LAZY_COMMAND_MODULES))
+        return super().get_command(ctx, cmd_name)
+
+    @override
+    def list_commands(self, ctx: Any) -> list[str]:
+        self._load(list(LAZY_COMMAND_MODULES))
+        return super().list_commands(ctx)
@@ -247,6 +247,27 @@ class BasicMemoryConfig(BaseSettings):
         description="Maximum Redis connections used by standalone MCP read caching.",
         gt=0,
     )
+    read_cache_memory_max_entries: int = Field(
+        default=0,
+        description=(
+            "Maximum responses kept in the in-process MCP read cache. 0 disables it. "
+            "With redis_url set, it serves as an L1 tier in front of Redis."
+        ),
+        ge=0,
+    )
+    read_cache_memory_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum payload bytes held by the in-process MCP read cache.",
+        gt=0,
+    )
+    read_cache_memory_layered_ttl_seconds: float = Field(
+        default=5.0,
+        description=(
+            "Longest time an in-process entry layered over Redis is served before Redis "
+            "is consulted again. Bounds staleness after another node invalidates a project."
+        ),
+        gt=0,
+    )
 
     # Semantic search configuration
     semantic_search_enabled: bool = Field(
@@ -403,6 +424,34 @@ class BasicMemoryConfig(BaseSettings):
         description="Optional FastEmbed embed() parallelism override.",
         gt=0,
     )
+    semantic_query_embedding_cache_size: int = Field(
+        default=1024,
+        description=(
+            "Maximum number of query embeddings kept in the in-process LRU cache in front "
+            "of the embedding provider. 0 disables query-embedding caching."
+        ),
+        ge=0,
+    )
+    semantic_query_embedding_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="Memory cap in bytes for the in-process query-embedding cache.",
+        gt=0,
+    )
+    semantic_embedding_store_enabled: bool = Field(
+        default=True,
+        description=(
+            "Reuse document embeddings by chunk text hash across entities and projects, "
+            "so moved, copied, or re-imported notes skip the embedding provider."
+        ),
+    )
+    semantic_embedding_store_max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        description=(
+            "Vector byte budget for the content-addressed embedding store; least recently "
+            "used entries are evicted beyond it."
+        ),
+        gt=0,
+    )
     import_upload_max_bytes: int = Field(
         default=100 * 1024 * 1024,
         description="Maximum uploaded JSON export size accepted by API import endpoints.",
@@ -475,6 +524,13 @@ class BasicMemoryConfig(BaseSettings):
         "returning the requested page. Larger widens recall at the cost of latency.",
         gt=0,
     )
+    reranker_score_cache_size: int = Field(
+        default=4096,
+        description="Max cross-encoder scores kept in memory, keyed by reranker model, query, "
+        "and document text hash. Paging through one query and repeating queries reuse them "
+        "instead of re-running the reranker. 0 disables the cache.",
+        ge=0,
+    )
 
     # Database connection pool configuration (Postgres only)
     db_pool_size: int = Field(
@@ -574,6 +630,11 @@ class BasicMemoryConfig(BaseSettings):
         description="Maximum number of markdown parse tasks to run concurrently inside one indexing batch.",
         gt=0,
     )
+    index_parse_workers: int = Field(
+        default=1,
+        description="Worker processes for parsing markdown during bulk indexing. 1 (default) parses in a thread without extra processes; 0 picks one per spare CPU core (up to 8).",
+        ge=0,
+    )
     index_entity_max_concurrent: int = Field(
         default=4,
         description="Maximum number of entity create/update tasks to run concurrently inside one indexing batch.",
@@ -0,0 +1,211 @@
+"""Opt-in warm daemon for hook queries.
+
+Every ``bm hook session-start`` is a fresh process: it imports the MCP tool
+stack, opens the database, and may load an embedding model before the brief's
+first search runs. ``bm hook daemon`` keeps one process alive with all of that
+warm, listening on a Unix socket under the Basic Memory data dir. Hook verbs
+send their search batch over the socket and fall back to running it in-process
+whenever the daemon is absent, slow, or answers with anything unexpected.
+
+Wire format: one JSON object per line in each direction.
+
+- ``{"op": "query", "queries": [{"project": ..., "filters": {...}}, ...]}``
+  answers ``{"results": [...]}``, one entry per query (``null`` for no data).
+- ``{"op": "ping"}`` answers ``{"ok": true, "pid": ...}``.
+- ``{"op": "stop"}`` answers ``{"ok": true}`` and shuts the daemon down.
+
+The client side deliberately uses only the stdlib socket module so calling it
+adds nothing to hook import time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from basic_memory.config import resolve_data_dir
+
+DAEMON_SOCKET_NAME = "hook-daemon.sock"
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30 * 60
+# Requests are one small JSON line; anything larger is not ours.
+MAX_REQUEST_BYTES = 1024 * 1024
+
+type HookQuery = tuple[str | None, dict[str, Any]]
+type HookQueryRunner = Callable[[Sequence[HookQuery]], Awaitable[list[dict[str, Any] | None]]]
+
+
+class HookDaemonRunningError(RuntimeError):
+    """Another hook daemon already answers on the socket."""
+
+
+def daemon_socket_path() -> Path:
+    return resolve_data_dir() / DAEMON_SOCKET_NAME
+
+
+def daemon_supported() -> bool:
+    return sys.platform != "win32"
+
+
+# --- Client ---
+
+
+def _request(message: dict[str, Any], *, timeout: float, path: Path | None = None) -> Any:
+    """Send one request line and return the decoded response, or None if unreachable."""
+    socket_path = path or daemon_socket_path()
+    if not daemon_supported() or not socket_path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            chunks: list[bytes] = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        return json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+
+
+def run_daemon_queries(
+    queries: Sequence[HookQuery],
+    *,
+    timeout: float,
+    path: Path | None = None,
+) -> list[dict[str, Any] | None] | None:
+    """Run a query batch in the daemon; None means "run it in-process instead"."""
+    response = _request(
+        {
+            "op": "query",
+            "queries": [{"project": project, "filters": filters} for project, filters in queries],
+        },
+        timeout=timeout,
+        path=path,
+    )
+    results = response.get("results") if isinstance(response, dict) else None
+    if not isinstance(results, list) or len(results) != len(queries):
+        return None
+    return [result if isinstance(result, dict) else None for result in results]
+
+
+def ping_daemon(*, timeout: float = 1.0, path: Path | None = None) -> int | None:
+    """Return the daemon's pid when one is answering."""
+    response = _request({"op": "ping"}, timeout=timeout, path=path)
+    if isinstance(response, dict) and response.get("ok") is True:
+        return response.get("pid")
+    return None
+
+
+def stop_daemon(*, timeout: float = 5.0, path: Path | None = None) -> bool:
+    response = _request({"op": "stop"}, timeout=timeout, path=path)
+    return isinstance(response, dict) and response.get("ok") is True
+
+
+# --- Server ---
+
+
+async def serve_hook_daemon(
+    run_queries: HookQueryRunner,
+    *,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    path: Path | None = None,
+) -> None:
+    """Answer hook query batches until stopped or idle for ``idle_timeout`` seconds.
+
+    Raises:
+        HookDaemonRunningError: another daemon already owns the socket.
+    """
+    socket_path = path or daemon_socket_path()
+    if await asyncio.to_thread(ping_daemon, path=socket_path) is not None:
+        raise HookDaemonRunningError(f"hook daemon already running on {socket_path}")
+    # Anything still at the path is a socket left by a daemon that died.
+    socket_path.unlink(missing_ok=True)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    stopped = asyncio.Event()
+    last_activity = time.monotonic()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal last_activity
+        last_activity = time.monotonic()
+        try:
+            line = await reader.readline()
+            request = json.loads(line) if line and len(line) <= MAX_REQUEST_BYTES else None
+            response = await _dispatch(request, run_queries, stopped)
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+        except Exception as exc:
+            # One bad request must not take the warm process down; the client
+            # reads the dropped connection as "run in-process".
+            logger.warning(f"hook daemon request failed: {exc}")
+        finally:
+            last_activity = time.monotonic()
+            writer.close()
+
+    # The data dir is private to the user; 0600 keeps the socket that way
+    # regardless of the process umask.
+    previous_umask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(handle, path=str(socket_path))
+    finally:
+        os.umask(previous_umask)
+
+    logger.info(f"hook daemon listening on {socket_path}")
+    try:
+        async with server:
+            while not stopped.is_set():
+                try:
+                    await asyncio.wait_for(stopped.wait(), timeout=min(idle_timeout, 30.0))
+                except TimeoutError:
+                    if time.monotonic() - last_activity >= idle_timeout:
+                        logger.info("hook daemon idle timeout reached")
+                        break
+    finally:
+        socket_path.unlink(missing_ok=True)
+
+
+async def _dispatch(
+    request: Any,
+    run_queries: HookQueryRunner,
+    stopped: asyncio.Event,
+) -> dict[str, Any]:
+    op = request.get("op") if isinstance(request, dict) else None
+    if op == "ping":
+        return {"ok": True, "pid": os.getpid()}
+    if op == "stop":
+        stopped.set()
+        return {"ok": True}
+    if op == "query":
+        queries = _parse_queries(request.get("queries"))
+        if queries is None:
+            return {"error": "malformed queries"}
+        return {"results": await run_queries(queries)}
+    return {"error": f"unknown op: {op!r}"}
+
+
+def _parse_queries(raw: Any) -> list[HookQuery] | None:
+    if not isinstance(raw, list):
+        return None
+    queries: list[HookQuery] = []
+    for item in raw:
+        if not isinstance(item, dict) or not isinstance(item.get("filters"), dict):
+            return None
+        project = item.get("project")
+        if project is not None and not isinstance(project, str):
+            return None
+        queries.append((project, item["filters"]))
+    return queries
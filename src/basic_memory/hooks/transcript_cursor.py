@@ -0,0 +1,207 @@
+"""Incremental transcript reading for pre-compact checkpoints.
+
+Harness transcripts are append-only JSONL that grow to hundreds of MB over a
+long session, and pre-compact fires repeatedly within one session. Re-parsing
+the whole file each time made the hook's cost grow with session length. The
+checkpoint only needs a small rolling summary (the opening request and the
+latest user turns), so we persist that summary together with the byte offset
+it covers and parse only the appended tail on the next run.
+
+Cursors are keyed by (session id, transcript path, inode): a rotated or
+replaced transcript has a new inode and starts a fresh cursor. Truncation or an
+in-place rewrite is caught by re-checking the file size and a hash of the bytes
+just before the stored offset; either mismatch discards the cursor and the file
+is parsed from the start. Cursor files hold user prompt text, so they are
+owner-only like the inbox, and stale ones are pruned on write.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from basic_memory.config import CONFIG_DIR_MODE, CONFIG_FILE_MODE, resolve_data_dir
+
+CURSOR_DIR_NAME = "transcript-cursors"
+RECENT_USER_TURNS = 3
+# Bytes hashed just before the stored offset to detect an in-place rewrite.
+FINGERPRINT_BYTES = 256
+CURSOR_RETENTION_SECONDS = 30 * 24 * 60 * 60
+
+type TurnParser = Callable[[Any], tuple[str, str] | None]
+
+
+@dataclass(slots=True)
+class TranscriptSummary:
+    """The rolling state a checkpoint needs: opening request plus latest user turns."""
+
+    opening: str | None = None
+    recent_user: list[str] = field(default_factory=list)
+
+    def add(self, role: str, text: str) -> None:
+        if role != "user":
+            return
+        if self.opening is None:
+            self.opening = text
+        self.recent_user = [*self.recent_user, text][-RECENT_USER_TURNS:]
+
+    def copy(self) -> TranscriptSummary:
+        return TranscriptSummary(opening=self.opening, recent_user=list(self.recent_user))
+
+
+@dataclass(slots=True)
+class TranscriptCursor:
+    offset: int = 0
+    fingerprint: str = ""
+    summary: TranscriptSummary = field(default_factory=TranscriptSummary)
+
+
+def cursor_dir() -> Path:
+    return resolve_data_dir() / CURSOR_DIR_NAME
+
+
+def read_transcript_summary(
+    path: str,
+    session_id: str | None,
+    parse_turn: TurnParser,
+) -> TranscriptSummary:
+    """Summarize a JSONL transcript, parsing only what was appended since the last call.
+
+    ``parse_turn`` maps one decoded JSON line to ``(role, text)`` or None. A
+    missing or unreadable transcript summarizes as empty.
+    """
+    if not path:
+        return TranscriptSummary()
+    try:
+        handle = open(path, "rb")
+    except OSError:
+        return TranscriptSummary()
+
+    with handle:
+        stat = os.fstat(handle.fileno())
+        cursor_path = _cursor_path(session_id, path, stat)
+        stored = _load_cursor(cursor_path)
+        cursor = (
+            stored
+            if stored is not None and _cursor_is_valid(handle, stored, stat.st_size)
+            else TranscriptCursor()
+        )
+
+        summary = cursor.summary.copy()
+        offset = cursor.offset
+        partial: bytes | None = None
+        handle.seek(offset)
+        for line in handle:
+            # Trigger: the harness is mid-write, or the file lacks a final newline.
+            # Why: committing past a partial line would skip its completed form.
+            # Outcome: it counts toward this summary but the cursor stops before it.
+            if not line.endswith(b"\n"):
+                partial = line
+                break
+            offset += len(line)
+            _apply_line(summary, line, parse_turn)
+
+        committed = TranscriptCursor(
+            offset=offset,
+            fingerprint=_fingerprint(handle, offset),
+            summary=summary.copy(),
+        )
+
+    if partial is not None:
+        _apply_line(summary, partial, parse_turn)
+    # Nothing appended to a still-valid cursor: skip the rewrite.
+    if cursor is not stored or committed.offset != cursor.offset:
+        _save_cursor(cursor_path, committed)
+    return summary
+
+
+def _apply_line(summary: TranscriptSummary, line: bytes, parse_turn: TurnParser) -> None:
+    line = line.strip()
+    if not line:
+        return
+    try:
+        obj = json.loads(line)
+    except ValueError:
+        return
+    turn = parse_turn(obj) if isinstance(obj, dict) else None
+    if turn is not None:
+        summary.add(*turn)
+
+
+def _cursor_path(session_id: str | None, path: str, stat: os.stat_result) -> Path:
+    key = "\0".join([session_id or "", os.path.abspath(path), f"{stat.st_dev}:{stat.st_ino}"])
+    return cursor_dir() / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _fingerprint(handle: BinaryIO, offset: int) -> str:
+    start = max(0, offset - FINGERPRINT_BYTES)
+    handle.seek(start)
+    return hashlib.sha256(handle.read(offset - start)).hexdigest()
+
+
+def _cursor_is_valid(handle: BinaryIO, cursor: TranscriptCursor, size: int) -> bool:
+    # A file shorter than the offset was truncated; a different hash before the
+    # offset means the covered bytes were rewritten in place.
+    return cursor.offset <= size and _fingerprint(handle, cursor.offset) == cursor.fingerprint
+
+
+def _load_cursor(path: Path) -> TranscriptCursor | None:
+    """Read a stored cursor; any unreadable or malformed file reads as 'no cursor'."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        opening = data["opening"]
+        recent_user = data["recent_user"]
+        cursor = TranscriptCursor(
+            offset=int(data["offset"]),
+            fingerprint=str(data["fingerprint"]),
+            summary=TranscriptSummary(
+                opening=opening if isinstance(opening, str) else None,
+                recent_user=[text for text in recent_user if isinstance(text, str)],
+            ),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return cursor if cursor.offset >= 0 else None
+
+
+def _save_cursor(path: Path, cursor: TranscriptCursor) -> None:
+    """Persist a cursor atomically; a failed write only costs a full re-parse later."""
+    directory = path.parent
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        if os.name != "nt":  # Windows has no comparable owner-only mode
+            directory.chmod(CONFIG_DIR_MODE)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "offset": cursor.offset,
+                    "fingerprint": cursor.fingerprint,
+                    "opening": cursor.summary.opening,
+                    "recent_user": cursor.summary.recent_user,
+                }
+            ),
+            encoding="utf-8",
+        )
+        if os.name != "nt":
+            tmp.chmod(CONFIG_FILE_MODE)
+        os.replace(tmp, path)
+        _prune_stale_cursors(directory)
+    except OSError:
+        return
+
+
+def _prune_stale_cursors(directory: Path) -> None:
+    cutoff = time.time() - CURSOR_RETENTION_SECONDS
+    for candidate in directory.glob("*.json"):
+        try:
+            if candidate.stat().st_mtime < cutoff:
+                candidate.unlink()
+        except OSError:
+            continue
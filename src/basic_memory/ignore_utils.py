@@ -1,6 +1,10 @@
 """Utilities for handling .gitignore patterns and file filtering."""
 
 import fnmatch
+import os
+import re
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Set
 
@@ -220,67 +224,166 @@ def load_gitignore_patterns(base_path: Path, use_gitignore: bool = True) -> Set[
     return patterns
 
 
-def should_ignore_path(file_path: Path, base_path: Path, ignore_patterns: Set[str]) -> bool:
-    """Check if a file path should be ignored based on gitignore patterns.
+class IgnoreMatcher:
+    """Ignore patterns compiled once for matching many paths.
 
-    Args:
-        file_path: The file path to check
-        base_path: The base directory for relative path calculation
-        ignore_patterns: Set of patterns to match against
+    Applies exactly the rules of ``should_ignore_path`` but without looping over
+    the patterns per path. Patterns are sorted into literal-name sets (checked
+    against each path part) and one combined regex each for part globs,
+    root-relative globs, and whole-path globs. Decisions for directories are
+    cached, so a file only pays for its own name and its full path: every part
+    above it was already decided when its directory was.
 
-    Returns:
-        True if the path should be ignored, False otherwise
+    Paths are project-relative POSIX strings, as the scanners already build them.
     """
-    # Get the relative path from base
-    try:
-        relative_path = file_path.relative_to(base_path)
-        relative_str = str(relative_path)
-        relative_posix = relative_path.as_posix()  # Use forward slashes for matching
 
-        # Check each pattern
-        for pattern in ignore_patterns:
-            # Handle patterns starting with / (root relative)
-            if pattern.startswith("/"):
-                root_pattern = pattern[1:]  # Remove leading /
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = frozenset(patterns)
 
-                # For directory patterns ending with /
+        root_dir_names: set[str] = set()
+        root_globs: list[str] = []
+        part_names: set[str] = set()
+        folded_part_names: set[str] = set()
+        part_globs: list[str] = []
+        path_globs: list[str] = []
+        for pattern in self.patterns:
+            if pattern.startswith("/"):
+                root_pattern = pattern[1:]
                 if root_pattern.endswith("/"):
-                    dir_name = root_pattern[:-1]  # Remove trailing /
-                    # Check if the first part of the path matches the directory name
-                    if len(relative_path.parts) > 0 and relative_path.parts[0] == dir_name:
-                        return True
+                    root_dir_names.add(root_pattern[:-1])
+                else:
+                    root_globs.append(root_pattern)
+            elif pattern.endswith("/"):
+                part_names.add(pattern[:-1])
+            else:
+                part_names.add(pattern)
+                # fnmatch.fnmatch compares case-normalized names, so a glob with
+                # no wildcards is a set lookup on the normalized part.
+                if _has_glob_magic(pattern):
+                    part_globs.append(pattern)
                 else:
-                    # Regular root-relative pattern
-                    if fnmatch.fnmatch(relative_posix, root_pattern):
-                        return True
-                continue
-
-            # Handle directory patterns (ending with /)
-            if pattern.endswith("/"):
-                dir_name = pattern[:-1]  # Remove trailing /
-                # Check if any path part matches the directory name
-                if dir_name in relative_path.parts:
-                    return True
-                continue
-
-            # Direct name match (e.g., ".git", "node_modules")
-            if pattern in relative_path.parts:
+                    folded_part_names.add(os.path.normcase(pattern))
+                path_globs.append(pattern)
+
+        self._root_dir_names = frozenset(root_dir_names)
+        self._part_names = frozenset(part_names)
+        self._folded_part_names = frozenset(folded_part_names)
+        self._part_regex = _compile_globs(part_globs)
+        self._root_regex = _compile_globs(root_globs)
+        self._path_regex = _compile_globs(path_globs)
+        self._dir_parts_ignored: dict[str, bool] = {"": False}
+        self._dir_decisions: dict[str, bool] = {}
+
+    def match_dir(self, relative_dir: str) -> bool:
+        """Return whether a project-relative directory is ignored (cached)."""
+        decision = self._dir_decisions.get(relative_dir)
+        if decision is None:
+            decision = self._match(relative_dir)
+            self._dir_decisions[relative_dir] = decision
+        return decision
+
+    def match_file(self, relative_path: str) -> bool:
+        """Return whether a project-relative file is ignored."""
+        return self._match(relative_path)
+
+    def matches(self, file_path: Path, base_path: Path) -> bool:
+        """Path-based form of the check, with ``should_ignore_path``'s semantics."""
+        try:
+            relative_path = file_path.relative_to(base_path)
+        except ValueError:
+            # If we can't get relative path, don't ignore
+            return False
+        return self._match(relative_path.as_posix())
+
+    def _match(self, relative_posix: str) -> bool:
+        # The base directory itself (".") has no parts, so only the globs apply.
+        if relative_posix != ".":
+            parent, _, name = relative_posix.rpartition("/")
+            if self._parts_ignored(parent) or self._part_matches(name):
+                return True
+            if not parent and name in self._root_dir_names:
                 return True
+        if self._root_regex is not None and self._root_regex.match(
+            os.path.normcase(relative_posix)
+        ):
+            return True
+        return self._path_matches(relative_posix)
+
+    def _parts_ignored(self, relative_dir: str) -> bool:
+        """Return whether any part of a directory matches a per-part rule (cached)."""
+        ignored = self._dir_parts_ignored.get(relative_dir)
+        if ignored is None:
+            parent, _, name = relative_dir.rpartition("/")
+            ignored = (
+                self._parts_ignored(parent)
+                or self._part_matches(name)
+                or (not parent and name in self._root_dir_names)
+            )
+            self._dir_parts_ignored[relative_dir] = ignored
+        return ignored
+
+    def _part_matches(self, name: str) -> bool:
+        if name in self._part_names:
+            return True
+        folded = os.path.normcase(name)
+        if folded in self._folded_part_names:
+            return True
+        return self._part_regex is not None and self._part_regex.match(folded) is not None
+
+    def _path_matches(self, relative_posix: str) -> bool:
+        if self._path_regex is None:
+            return False
+        if self._path_regex.match(os.path.normcase(relative_posix)):
+            return True
+        # The legacy check also matched the native-separator spelling.
+        native = relative_posix.replace("/", os.sep)
+        return native != relative_posix and (
+            self._path_regex.match(os.path.normcase(native)) is not None
+        )
+
+
+def _has_glob_magic(pattern: str) -> bool:
+    return any(char in pattern for char in "*?[")
+
+
+def _compile_globs(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Combine fnmatch globs into one regex, normalizing case as fnmatch does."""
+    translated = [fnmatch.translate(os.path.normcase(pattern)) for pattern in sorted(patterns)]
+    if not translated:
+        return None
+    return re.compile("|".join(f"(?:{regex})" for regex in translated))
+
+
+@lru_cache(maxsize=32)
+def _cached_ignore_matcher(patterns: frozenset[str]) -> IgnoreMatcher:
+    return IgnoreMatcher(patterns)
+
+
+def ignore_matcher(ignore_patterns: Iterable[str]) -> IgnoreMatcher:
+    """Return a compiled matcher for a pattern set, reusing one built for the same set.
+
+    Scanners that check many paths should hold the matcher for the whole walk so
+    its directory cache applies.
+    """
+    return _cached_ignore_matcher(frozenset(ignore_patterns))
+
+
+def should_ignore_path(file_path: Path, base_path: Path, ignore_patterns: Set[str]) -> bool:
+    """Check if a file path should be ignored based on gitignore patterns.
 
-            # Check if any individual path part matches the glob pattern
-            # This handles cases like ".*" matching ".hidden.md" in "concept/.hidden.md"
-            for part in relative_path.parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
+    Patterns starting with ``/`` match from the base directory, patterns ending
+    with ``/`` match a directory name anywhere in the path, and any other
+    pattern is an fnmatch glob tried against each path part and the whole path.
 
-            # Glob pattern match on full path
-            if fnmatch.fnmatch(relative_posix, pattern) or fnmatch.fnmatch(relative_str, pattern):
-                return True  # pragma: no cover
+    Args:
+        file_path: The file path to check
+        base_path: The base directory for relative path calculation
+        ignore_patterns: Set of patterns to match against
 
-        return False
-    except ValueError:
-        # If we can't get relative path, don't ignore
-        return False
+    Returns:
+        True if the path should be ignored, False otherwise
+    """
+    return ignore_matcher(ignore_patterns).matches(file_path, base_path)
 
 
 def filter_files(
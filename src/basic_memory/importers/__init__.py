@@ -13,6 +13,7 @@ from basic_memory.importers.project_zip_import import (
     ProjectZipImportPlan,
     build_project_zip_import_plan,
 )
+from basic_memory.importers.streaming import ImportCheckpoint, StreamingChatImporter
 from basic_memory.schemas.importer import (
     ChatImportResult,
     EntityImportResult,
@@ -23,6 +24,8 @@ from basic_memory.schemas.importer import (
 __all__ = [
     "Importer",
     "ImportReadCache",
+    "ImportCheckpoint",
+    "StreamingChatImporter",
     "ChatGPTImporter",
     "ClaudeConversationsImporter",
     "ClaudeProjectsImporter",
@@ -5,8 +5,7 @@ from datetime import datetime
 from typing import override, Any, Dict, List, Optional, Set
 
 from basic_memory.markdown.schemas import EntityFrontmatter, EntityMarkdown
-from basic_memory.importers.base import Importer
-from basic_memory.schemas.importer import ChatImportResult
+from basic_memory.importers.streaming import PreparedConversation, StreamingChatImporter
 from basic_memory.importers.utils import clean_filename, format_timestamp
 
 logger = logging.getLogger(__name__)
@@ -17,86 +16,44 @@ logger = logging.getLogger(__name__)
 UNKNOWN_DATE_SENTINEL = 86400.0
 
 
-class ChatGPTImporter(Importer[ChatImportResult]):
+class ChatGPTImporter(StreamingChatImporter):
     """Service for importing ChatGPT conversations."""
 
-    @override
-    def handle_error(  # pragma: no cover
-        self, message: str, error: Optional[Exception] = None
-    ) -> ChatImportResult:
-        """Return a failed ChatImportResult with an error message."""
-        error_msg = f"{message}: {error}" if error else message
-        return ChatImportResult(
-            import_count={},
-            success=False,
-            error_message=error_msg,
-            conversations=0,
-            messages=0,
-        )
+    failure_message = "Failed to import ChatGPT conversations"
 
     @override
-    async def import_data(
-        self, source_data, destination_folder: str, **kwargs: Any
-    ) -> ChatImportResult:
-        """Import conversations from ChatGPT JSON export.
+    def prepare_conversation(
+        self, conversation: Dict[str, Any], destination_folder: str
+    ) -> PreparedConversation:
+        """Format one ChatGPT conversation as a note.
 
         Args:
-            source_path: Path to the ChatGPT conversations.json file.
+            conversation: ChatGPT conversation data.
             destination_folder: Destination folder within the project.
-            **kwargs: Additional keyword arguments.
 
         Returns:
-            ChatImportResult containing statistics and status of the import.
+            PreparedConversation with the entity, its file path, and message count.
         """
-        try:  # pragma: no cover
-            # Ensure the destination folder exists
-            await self.ensure_folder_exists(destination_folder)
-            conversations = source_data
-
-            # Process each conversation
-            messages_imported = 0
-            chats_imported = 0
-
-            for chat in conversations:
-                created_at, modified_at = self._resolve_timestamps(chat)
-                date_prefix = datetime.fromtimestamp(created_at).astimezone().strftime("%Y%m%d")
-                clean_title = clean_filename(chat["title"])
-                relative_path = (
-                    f"{destination_folder}/{date_prefix}-{clean_title}"
-                    if destination_folder
-                    else f"{date_prefix}-{clean_title}"
-                )
-                permalink, file_path = self.build_import_paths(relative_path)
-
-                # Convert to entity
-                entity = self._format_chat_content(chat, permalink, created_at, modified_at)
-
-                # Write file using relative path - FileService handles base_path
-                await self.write_entity(entity, file_path)
-
-                # Count messages
-                msg_count = sum(
-                    1
-                    for node in chat["mapping"].values()
-                    if node.get("message")
-                    and not node.get("message", {})
-                    .get("metadata", {})
-                    .get("is_visually_hidden_from_conversation")
-                )
-
-                chats_imported += 1
-                messages_imported += msg_count
-
-            return ChatImportResult(
-                import_count={"conversations": chats_imported, "messages": messages_imported},
-                success=True,
-                conversations=chats_imported,
-                messages=messages_imported,
-            )
-
-        except Exception as e:  # pragma: no cover
-            logger.exception("Failed to import ChatGPT conversations")
-            return self.handle_error("Failed to import ChatGPT conversations", e)
+        created_at, modified_at = self._resolve_timestamps(conversation)
+        date_prefix = datetime.fromtimestamp(created_at).astimezone().strftime("%Y%m%d")
+        relative_path = self.conversation_path(
+            destination_folder, date_prefix, clean_filename(conversation["title"])
+        )
+        permalink, file_path = self.build_import_paths(relative_path)
+
+        # Convert to entity
+        entity = self._format_chat_content(conversation, permalink, created_at, modified_at)
+
+        # Count messages
+        msg_count = sum(
+            1
+            for node in conversation["mapping"].values()
+            if node.get("message")
+            and not node.get("message", {})
+            .get("metadata", {})
+            .get("is_visually_hidden_from_conversation")
+        )
+        return PreparedConversation(entity=entity, file_path=file_path, messages=msg_count)
 
     def _resolve_timestamps(self, conversation: Dict[str, Any]) -> tuple[float, float]:
         """Resolve conversation timestamps, tolerating absent fields.
@@ -2,96 +2,58 @@
 
 import logging
 from datetime import datetime
-from typing import override, Any, Dict, List, Optional
+from typing import override, Any, Dict, List
 
 from basic_memory.markdown.schemas import EntityFrontmatter, EntityMarkdown
-from basic_memory.importers.base import Importer
-from basic_memory.schemas.importer import ChatImportResult
+from basic_memory.importers.streaming import PreparedConversation, StreamingChatImporter
 from basic_memory.importers.utils import clean_filename, format_timestamp
 
 logger = logging.getLogger(__name__)
 
 
-class ClaudeConversationsImporter(Importer[ChatImportResult]):
+class ClaudeConversationsImporter(StreamingChatImporter):
     """Service for importing Claude conversations."""
 
-    @override
-    def handle_error(  # pragma: no cover
-        self, message: str, error: Optional[Exception] = None
-    ) -> ChatImportResult:
-        """Return a failed ChatImportResult with an error message."""
-        error_msg = f"{message}: {error}" if error else message
-        return ChatImportResult(
-            import_count={},
-            success=False,
-            error_message=error_msg,
-            conversations=0,
-            messages=0,
-        )
+    failure_message = "Failed to import Claude conversations"
 
     @override
-    async def import_data(
-        self, source_data, destination_folder: str, **kwargs: Any
-    ) -> ChatImportResult:
-        """Import conversations from Claude JSON export.
+    def prepare_conversation(
+        self, conversation: Dict[str, Any], destination_folder: str
+    ) -> PreparedConversation:
+        """Format one Claude conversation as a note.
 
         Args:
-            source_data: Path to the Claude conversations.json file.
+            conversation: Claude conversation data.
             destination_folder: Destination folder within the project.
-            **kwargs: Additional keyword arguments.
 
         Returns:
-            ChatImportResult containing statistics and status of the import.
+            PreparedConversation with the entity, its file path, and message count.
         """
-        try:
-            # Ensure the destination folder exists
-            await self.ensure_folder_exists(destination_folder)
-
-            conversations = source_data
-
-            # Process each conversation
-            messages_imported = 0
-            chats_imported = 0
-
-            for chat in conversations:
-                # Get name, providing default for unnamed conversations
-                chat_name = chat.get("name") or f"Conversation {chat.get('uuid', 'untitled')}"
-                date_prefix = datetime.fromisoformat(
-                    chat["created_at"].replace("Z", "+00:00")
-                ).strftime("%Y%m%d")
-                clean_title = clean_filename(chat_name)
-                relative_path = (
-                    f"{destination_folder}/{date_prefix}-{clean_title}"
-                    if destination_folder
-                    else f"{date_prefix}-{clean_title}"
-                )
-                permalink, file_path = self.build_import_paths(relative_path)
-
-                # Convert to entity
-                entity = self._format_chat_content(
-                    name=chat_name,
-                    messages=chat["chat_messages"],
-                    created_at=chat["created_at"],
-                    modified_at=chat["updated_at"],
-                    permalink=permalink,
-                )
-
-                # Write file using relative path - FileService handles base_path
-                await self.write_entity(entity, file_path)
-
-                chats_imported += 1
-                messages_imported += len(chat["chat_messages"])
-
-            return ChatImportResult(
-                import_count={"conversations": chats_imported, "messages": messages_imported},
-                success=True,
-                conversations=chats_imported,
-                messages=messages_imported,
-            )
-
-        except Exception as e:  # pragma: no cover
-            logger.exception("Failed to import Claude conversations")
-            return self.handle_error("Failed to import Claude conversations", e)
+        # Get name, providing default for unnamed conversations
+        chat_name = (
+            conversation.get("name") or f"Conversation {conversation.get('uuid', 'untitled')}"
+        )
+        date_prefix = datetime.fromisoformat(
+            conversation["created_at"].replace("Z", "+00:00")
+        ).strftime("%Y%m%d")
+        relative_path = self.conversation_path(
+            destination_folder, date_prefix, clean_filename(chat_name)
+        )
+        permalink, file_path = self.build_import_paths(relative_path)
+
+        # Convert to entity
+        entity = self._format_chat_content(
+            name=chat_name,
+            messages=conversation["chat_messages"],
+            created_at=conversation["created_at"],
+            modified_at=conversation["updated_at"],
+            permalink=permalink,
+        )
+        return PreparedConversation(
+            entity=entity,
+            file_path=file_path,
+            messages=len(conversation["chat_messages"]),
+        )
 
     def _format_chat_content(
         self,
@@ -0,0 +1,393 @@
+"""Streaming pipeline for conversation exports.
+
+ChatGPT and Claude both export every conversation as one top-level JSON array,
+and long-lived accounts produce files of several gigabytes. Loading that with
+``json.load`` holds the whole export (and its parsed objects) in memory before
+the first note is written.
+
+This module parses the array one element at a time, formats each conversation
+as it arrives, and writes notes with bounded concurrency. A checkpoint records
+how many leading conversations are safely on disk, so an interrupted import of
+the same file resumes after them instead of starting over.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from abc import abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, ClassVar, Optional, TextIO, override
+
+from basic_memory.config import resolve_data_dir
+from basic_memory.importers.base import Importer
+from basic_memory.markdown.schemas import EntityMarkdown
+from basic_memory.schemas.importer import ChatImportResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMPORT_CONCURRENCY = 8
+
+_READ_CHUNK_CHARS = 1024 * 1024
+_JSON_WHITESPACE = frozenset(" \t\n\r")
+_ELEMENT_END = _JSON_WHITESPACE | {",", "]"}
+_CHECKPOINT_VERSION = 1
+_CHECKPOINT_INTERVAL_SECONDS = 1.0
+
+
+def iter_json_array(stream: TextIO, *, chunk_size: int = _READ_CHUNK_CHARS) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array without loading the whole document.
+
+    Only the unconsumed tail of the input is buffered, so memory is bounded by the
+    largest single element rather than the file. Malformed input raises
+    ``json.JSONDecodeError`` just as ``json.load`` would, after yielding every
+    element that preceded the error.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    at_eof = False
+
+    def read_more(min_chars: int = chunk_size) -> bool:
+        nonlocal buffer, position, at_eof
+        chunk = stream.read(max(chunk_size, min_chars))
+        if not chunk:
+            at_eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def next_char() -> str:
+        """Skip whitespace and return the next significant character, or "" at EOF."""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _JSON_WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not read_more():
+                return ""
+
+    if next_char() != "[":
+        raise json.JSONDecodeError("Expected a JSON array", buffer, position)
+    position += 1
+
+    if next_char() == "]":
+        position += 1
+    else:
+        while True:
+            if not next_char():
+                raise json.JSONDecodeError("Unterminated JSON array", buffer, position)
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # Trigger: the element continues past the buffered input.
+                    # Why: re-decoding from the element start after every small read
+                    #      would be quadratic in the element size.
+                    # Outcome: at least double the pending text before retrying.
+                    if at_eof or not read_more(len(buffer) - position):
+                        raise
+                    continue
+                # Trigger: a bare number cut off by the buffer ("1.5" of "1.5e3") decodes.
+                # Outcome: accept a value only once the character after it can follow
+                #          an array element, reading on until it can or the input ends.
+                if end < len(buffer) and buffer[end] in _ELEMENT_END:
+                    break
+                if at_eof or not read_more(len(buffer) - position):
+                    break
+            position = end
+            yield value
+
+            separator = next_char()
+            if separator == ",":
+                position += 1
+                continue
+            if separator == "]":
+                position += 1
+                break
+            raise json.JSONDecodeError("Expected ',' or ']' in JSON array", buffer, position)
+
+    if next_char():
+        raise json.JSONDecodeError("Extra data", buffer, position)
+
+
+def _checkpoint_path(source: Path, destination_folder: str, project_name: str | None) -> Path:
+    identity = "\0".join([os.path.realpath(source), project_name or "", destination_folder])
+    checkpoint_key = sha256(identity.encode("utf-8")).hexdigest()[:32]
+    return resolve_data_dir() / "import-checkpoints" / f"{checkpoint_key}.json"
+
+
+@dataclass(slots=True)
+class ImportCheckpoint:
+    """How far an import of one export file into one project folder has progressed.
+
+    ``completed`` counts the leading conversations of the export whose notes are
+    written; everything after it is re-imported on resume. Notes are written by
+    overwriting, so repeating a conversation that was in flight during a crash is
+    harmless. The checkpoint only applies to the same export file unchanged.
+    """
+
+    path: Path
+    source_size: int
+    source_mtime_ns: int
+    completed: int = 0
+    conversations: int = 0
+    messages: int = 0
+
+    @classmethod
+    def open(
+        cls,
+        source: Path,
+        *,
+        destination_folder: str,
+        project_name: str | None,
+        resume: bool = True,
+    ) -> "ImportCheckpoint":
+        """Load the checkpoint for this import, starting fresh when it does not apply."""
+        stat = source.stat()
+        checkpoint = cls(
+            path=_checkpoint_path(source, destination_folder, project_name),
+            source_size=stat.st_size,
+            source_mtime_ns=stat.st_mtime_ns,
+        )
+        if not resume:
+            checkpoint.clear()
+            return checkpoint
+
+        try:
+            payload = json.loads(checkpoint.path.read_text(encoding="utf-8"))
+            if payload.get("version") != _CHECKPOINT_VERSION or payload["source"] != [
+                stat.st_size,
+                stat.st_mtime_ns,
+            ]:
+                return checkpoint
+            checkpoint.completed = int(payload["completed"])
+            checkpoint.conversations = int(payload["conversations"])
+            checkpoint.messages = int(payload["messages"])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.debug(f"Ignoring unreadable import checkpoint {checkpoint.path}: {exc}")
+        return checkpoint
+
+    def record(self, *, completed: int, conversations: int, messages: int) -> None:
+        """Persist progress atomically; a failed write only means redoing more work."""
+        self.completed = completed
+        self.conversations = conversations
+        self.messages = messages
+        payload = {
+            "version": _CHECKPOINT_VERSION,
+            "source": [self.source_size, self.source_mtime_ns],
+            "completed": completed,
+            "conversations": conversations,
+            "messages": messages,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".part"
+            )
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                    json.dump(payload, stream)
+                os.replace(temp_name, self.path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.warning(f"Could not write import checkpoint {self.path}: {exc}")
+
+    def clear(self) -> None:
+        self.completed = self.conversations = self.messages = 0
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedConversation:
+    """One conversation formatted and ready to write."""
+
+    entity: EntityMarkdown
+    file_path: str
+    messages: int
+
+
+class StreamingChatImporter(Importer[ChatImportResult]):
+    """Shared import pipeline for exports that are a JSON array of conversations.
+
+    Subclasses turn one conversation into a note in ``prepare_conversation``;
+    this class owns iteration, concurrent writes, counting, and checkpoints.
+    """
+
+    failure_message: ClassVar[str] = "Failed to import conversations"
+
+    @abstractmethod
+    def prepare_conversation(
+        self, conversation: dict[str, Any], destination_folder: str
+    ) -> PreparedConversation:
+        """Format one exported conversation as a note and its project-relative path."""
+
+    def conversation_path(self, destination_folder: str, date_prefix: str, title: str) -> str:
+        """Return the note path shared by every conversation importer."""
+        name = f"{date_prefix}-{title}"
+        return f"{destination_folder}/{name}" if destination_folder else name
+
+    @override
+    def handle_error(  # pragma: no cover
+        self, message: str, error: Optional[Exception] = None
+    ) -> ChatImportResult:
+        """Return a failed ChatImportResult with an error message."""
+        error_msg = f"{message}: {error}" if error else message
+        return ChatImportResult(
+            import_count={},
+            success=False,
+            error_message=error_msg,
+            conversations=0,
+            messages=0,
+        )
+
+    @override
+    async def import_data(
+        self, source_data, destination_folder: str, **kwargs: Any
+    ) -> ChatImportResult:
+        """Import an already-parsed list of conversations.
+
+        Args:
+            source_data: Parsed conversations from the export file.
+            destination_folder: Destination folder within the project.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            ChatImportResult containing statistics and status of the import.
+        """
+        return await self.import_stream(source_data, destination_folder)
+
+    async def import_stream(
+        self,
+        conversations: Iterable[dict[str, Any]],
+        destination_folder: str,
+        *,
+        max_concurrent: int = DEFAULT_IMPORT_CONCURRENCY,
+        checkpoint: ImportCheckpoint | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> ChatImportResult:
+        """Import conversations as they are produced, writing up to ``max_concurrent`` at once.
+
+        Args:
+            conversations: Conversations in export order, e.g. from ``iter_json_array``.
+            destination_folder: Destination folder within the project.
+            max_concurrent: Upper bound on note writes in flight.
+            checkpoint: Progress from an earlier attempt; updated as notes land and
+                cleared once the whole export is imported.
+            on_progress: Called with the running conversation count as it advances.
+
+        Returns:
+            ChatImportResult containing statistics and status of the import.
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        resume_from = checkpoint.completed if checkpoint is not None else 0
+        chats_imported = checkpoint.conversations if checkpoint is not None else 0
+        messages_imported = checkpoint.messages if checkpoint is not None else 0
+        # Conversations before `watermark` are all written; `finished` holds ones
+        # that completed out of order and are waiting for an earlier write.
+        watermark = resume_from
+        finished: dict[int, int] = {}
+        in_flight: dict[asyncio.Task[str], tuple[int, PreparedConversation]] = {}
+        writes_by_path: dict[str, asyncio.Task[str]] = {}
+        last_saved = time.monotonic()
+
+        def save_checkpoint() -> None:
+            nonlocal last_saved
+            if checkpoint is not None and watermark > checkpoint.completed:
+                checkpoint.record(
+                    completed=watermark,
+                    conversations=chats_imported,
+                    messages=messages_imported,
+                )
+            last_saved = time.monotonic()
+
+        async def settle() -> None:
+            nonlocal watermark, chats_imported, messages_imported
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, prepared = in_flight.pop(task)
+                if writes_by_path.get(prepared.file_path) is task:
+                    del writes_by_path[prepared.file_path]
+                task.result()
+                finished[index] = prepared.messages
+
+            advanced = False
+            while watermark in finished:
+                messages_imported += finished.pop(watermark)
+                chats_imported += 1
+                watermark += 1
+                advanced = True
+            if advanced:
+                if on_progress is not None:
+                    on_progress(chats_imported)
+                if time.monotonic() - last_saved >= _CHECKPOINT_INTERVAL_SECONDS:
+                    save_checkpoint()
+
+        try:
+            await self.ensure_folder_exists(destination_folder)
+            try:
+                for index, conversation in enumerate(conversations):
+                    if index < resume_from:
+                        continue
+                    prepared = self.prepare_conversation(conversation, destination_folder)
+
+                    # Trigger: two conversations resolve to the same note (same date and title).
+                    # Why: imported serially the later one wins; concurrent writes would race.
+                    # Outcome: start the later write only after the earlier one finishes.
+                    earlier_write = writes_by_path.get(prepared.file_path)
+                    if earlier_write is not None:
+                        await asyncio.wait({earlier_write})
+                    while len(in_flight) >= max_concurrent:
+                        await settle()
+
+                    task = asyncio.create_task(
+                        self.write_entity(prepared.entity, prepared.file_path)
+                    )
+                    in_flight[task] = (index, prepared)
+                    writes_by_path[prepared.file_path] = task
+
+                while in_flight:
+                    await settle()
+            except Exception:
+                # Trigger: the export could not be read or formatted, or a write failed.
+                # Why: writes already in flight are good work a resume should not redo.
+                # Outcome: let them land, then checkpoint the contiguous prefix written.
+                while in_flight:
+                    try:
+                        await settle()
+                    except Exception:
+                        pass
+                save_checkpoint()
+                raise
+            except BaseException:
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.gather(*in_flight, return_exceptions=True)
+                save_checkpoint()
+                raise
+
+            if checkpoint is not None:
+                checkpoint.clear()
+            return ChatImportResult(
+                import_count={"conversations": chats_imported, "messages": messages_imported},
+                success=True,
+                conversations=chats_imported,
+                messages=messages_imported,
+            )
+
+        except Exception as e:
+            logger.exception(self.failure_message)
+            return self.handle_error(self.failure_message, e)
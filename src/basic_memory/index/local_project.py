@@ -6,7 +6,7 @@ import asyncio
 import os
 from collections.abc import Mapping, Sequence
 from contextlib import nullcontext
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, override, Protocol
 
@@ -15,8 +15,8 @@ from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from basic_memory import db
-from basic_memory.file_utils import FileError, FileMetadata, compute_checksum
-from basic_memory.ignore_utils import load_gitignore_patterns, should_ignore_path
+from basic_memory.file_utils import FileError, compute_checksum
+from basic_memory.ignore_utils import IgnoreMatcher, load_gitignore_patterns
 from basic_memory.index.filesystem import local_relative_path_is_filtered
 from basic_memory.index.local_dependencies import (
     DefaultLocalIndexProjectDependencyProvider,
@@ -87,6 +87,7 @@ from basic_memory.read_cache import (
     invalidate_cache,
 )
 from basic_memory.repository import NoteContentRepository
+from basic_memory.repository.project_stat_repository import ProjectStatRepository
 from basic_memory.runtime.jobs import (
     RuntimeIndexFileBatchJobRequest,
     RuntimeJobId,
@@ -165,6 +166,14 @@ class RepositoryLocalProjectIndexedFileStatSource(LocalProjectIndexedFileStatSou
         }
 
 
+@dataclass(frozen=True, slots=True)
+class LocalProjectFileStat:
+    """Size and modification time captured for one file during the scan."""
+
+    size: int
+    mtime_ns: int
+
+
 @dataclass(frozen=True, slots=True)
 class LocalProjectIndexScan:
     """Walk result for one local project scan.
@@ -173,10 +182,14 @@ class LocalProjectIndexScan:
     failed mid-walk; their contents are absent from ``file_paths`` even though
     the files may still exist, so callers must never treat that absence as a
     delete signal.
+
+    ``file_stats`` carries the stat taken from each file's directory entry in
+    the same pass. A listed path without a stat is observed the slow way.
     """
 
     file_paths: tuple[str, ...]
     unreadable_directories: tuple[str, ...]
+    file_stats: Mapping[str, LocalProjectFileStat] = field(default_factory=dict)
 
 
 def record_local_project_scan_walk_error(
@@ -185,13 +198,12 @@ def record_local_project_scan_walk_error(
     project_root: Path,
     unreadable_directories: list[str],
 ) -> None:
-    """Classify one os.walk error raised during a local project scan."""
+    """Classify one directory-listing error raised during a local project scan."""
     # Trigger: the walk error carries no directory attribution.
     # Why: without a directory we cannot carry its indexed rows through the
     # snapshot, so finishing the scan could still plan a mass delete for an
     # unknown subtree.
-    # Outcome: fail the whole scan (RuntimeError bypasses the walk loop's
-    # partial-snapshot OSError handling); the next scan retries.
+    # Outcome: fail the whole scan; the next scan retries.
     if error.filename is None:
         raise RuntimeError("Local project scan failed without a directory attribution") from error
     # Trigger: the project root itself is unreadable (missing/unmounted).
@@ -223,69 +235,95 @@ def scan_local_project_index_files(
     *,
     ignore_patterns: LocalProjectIndexIgnorePatterns | None = None,
 ) -> LocalProjectIndexScan:
-    """Walk one local project and report eligible files plus unreadable subtrees."""
+    """Walk one local project and report eligible files, their stats, and unreadable subtrees."""
     project_root = project_root.expanduser().resolve()
     active_ignore_patterns = (
         ignore_patterns if ignore_patterns is not None else load_gitignore_patterns(project_root)
     )
-    file_paths: list[str] = []
+    ignore_matcher = IgnoreMatcher(active_ignore_patterns)
+    file_stats: dict[str, LocalProjectFileStat] = {}
     unreadable_directories: list[str] = []
 
-    # os.walk lets us prune ignored/hidden directories *before* descending —
-    # rglob("*") would stat every file inside node_modules/.venv/.git first — and
-    # does not follow symlinked directories (followlinks=False). Symlinked files
-    # are skipped explicitly so the batch reader never reads outside the project
-    # boundary. This restores the pre-refactor scanner's no-follow + dir-pruning.
-    def _scan_error(error: OSError) -> None:
-        record_local_project_scan_walk_error(
-            error,
-            project_root=project_root,
-            unreadable_directories=unreadable_directories,
-        )
-
-    walker = os.walk(project_root, followlinks=False, onerror=_scan_error)
-    while True:
+    # os.scandir yields each entry's type from the directory listing itself, so
+    # classifying an entry costs no stat, and the one lstat taken per eligible
+    # file supplies the size and mtime observation needs. Ignored/hidden
+    # directories are pruned before descending, and symlinks are never followed
+    # or indexed, so the batch reader never reads outside the project boundary.
+    # Each directory travels with its relative prefix so no entry needs relative_to().
+    pending_directories: list[tuple[Path, str]] = [(project_root, "")]
+    while pending_directories:
+        directory, relative_directory = pending_directories.pop()
         try:
-            dirpath, dirnames, filenames = next(walker)
-        except StopIteration:
-            break
-        except OSError:
-            # The root scan failed (onerror re-raised). Never return an empty,
-            # delete-everything snapshot; files discovered before a deeper traversal
-            # error are kept.
-            if not file_paths:
-                raise
-            break
-
-        root_path = Path(dirpath)
-        # Prune in place so os.walk never descends into ignored/hidden directories.
-        dirnames[:] = [
-            name
-            for name in dirnames
-            if not name.startswith(".")
-            and not should_ignore_path(root_path / name, project_root, active_ignore_patterns)
-        ]
-
-        for name in filenames:
-            path = root_path / name
+            with os.scandir(directory) as scanned_entries:
+                entries = list(scanned_entries)
+        except OSError as error:
+            # A listing that fails partway is discarded whole, so the
+            # directory's indexed rows are carried rather than half-observed.
+            record_local_project_scan_walk_error(
+                error,
+                project_root=project_root,
+                unreadable_directories=unreadable_directories,
+            )
+            continue
+
+        for entry in entries:
+            relative_path = f"{relative_directory}{entry.name}"
             try:
-                if path.is_symlink() or not path.is_file():
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and not ignore_matcher.match_dir(
+                        relative_path
+                    ):
+                        pending_directories.append((directory / entry.name, f"{relative_path}/"))
                     continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if local_relative_path_is_filtered(relative_path):
+                    continue
+                if ignore_matcher.match_file(relative_path):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
             except OSError:
                 continue
-            relative_path = path.relative_to(project_root).as_posix()
-            if local_relative_path_is_filtered(relative_path):
-                continue
-            if should_ignore_path(path, project_root, active_ignore_patterns):
-                continue
-            file_paths.append(relative_path)
+            file_stats[relative_path] = LocalProjectFileStat(
+                size=stat.st_size, mtime_ns=stat.st_mtime_ns
+            )
 
     return LocalProjectIndexScan(
-        file_paths=tuple(sorted(file_paths)),
+        file_paths=tuple(sorted(file_stats)),
         unreadable_directories=tuple(unreadable_directories),
+        file_stats=file_stats,
     )
 
 
+def reuse_indexed_checksums(
+    file_stats: Mapping[str, LocalProjectFileStat],
+    indexed_stats: Mapping[str, IndexedFileStat],
+) -> dict[str, str]:
+    """Return the stored checksum of every scanned file whose stat proves it unchanged.
+
+    A file is left out — forcing a fresh hash — whenever the answer is
+    ambiguous: no indexed row (a new file, still needed for move detection), a
+    null stat column, or a size/mtime mismatch. Only an exact size match plus an
+    mtime within the float epsilon reuses the stored checksum, which then
+    equals the indexed checksum and lands the file in the unchanged set.
+    """
+    reused: dict[str, str] = {}
+    for file_path, scanned in file_stats.items():
+        indexed = indexed_stats.get(file_path)
+        if indexed is None:
+            continue
+        if indexed.checksum is None or indexed.mtime is None or indexed.size is None:
+            continue
+        if scanned.size != indexed.size:
+            continue
+        if abs(scanned.mtime_ns / 1_000_000_000 - indexed.mtime) > (
+            _INDEXED_MTIME_MATCH_EPSILON_SECONDS
+        ):
+            continue
+        reused[file_path] = indexed.checksum
+    return reused
+
+
 @dataclass(frozen=True, slots=True)
 class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
     """Observe local project files as project-index fanout targets."""
@@ -301,7 +339,6 @@ class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
             self.file_service.base_path,
             ignore_patterns=self.ignore_patterns,
         )
-        file_paths = scan.file_paths
         # Trigger: a stat source is wired (local runtime); it is absent in
         # cloud/tests that observe without a database.
         # Why: hashing every file on every startup is O(project bytes) and
@@ -316,13 +353,26 @@ class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
             if self.indexed_stat_source is not None
             else {}
         )
+        # The scan already stat'd every file, so the unchanged set is decided in
+        # one pass here instead of one awaited stat per file.
+        reused_checksums = reuse_indexed_checksums(scan.file_stats, indexed_stats)
+
         observed_files: list[RuntimeObservedIndexFile] = []
-        for file_path in file_paths:
+        for file_path in scan.file_paths:
+            scanned = scan.file_stats.get(file_path)
+            checksum = reused_checksums.get(file_path)
+            if scanned is not None and checksum is not None:
+                observed_files.append(
+                    RuntimeObservedIndexFile(path=file_path, checksum=checksum, size=scanned.size)
+                )
+                continue
             try:
-                metadata = await self.file_service.get_file_metadata(file_path)
-                checksum = self._reuse_indexed_checksum(file_path, metadata, indexed_stats)
-                if checksum is None:
-                    checksum = await self.file_service.compute_checksum(file_path)
+                size = (
+                    scanned.size
+                    if scanned is not None
+                    else (await self.file_service.get_file_metadata(file_path)).size
+                )
+                checksum = await self.file_service.compute_checksum(file_path)
             except (OSError, FileError, FileOperationError) as exc:
                 # Trigger: a path the walk just listed fails stat/checksum
                 # (transient permission or mount error, or deleted mid-scan).
@@ -345,7 +395,7 @@ class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
                 RuntimeObservedIndexFile(
                     path=file_path,
                     checksum=checksum,
-                    size=metadata.size,
+                    size=size,
                 )
             )
 
@@ -388,33 +438,6 @@ class LocalProjectIndexObservedFileSource(ProjectIndexObservedFileSource):
             # a read error can never escalate into destructive reconciliation.
             return False
 
-    @staticmethod
-    def _reuse_indexed_checksum(
-        file_path: str,
-        metadata: FileMetadata,
-        indexed_stats: Mapping[str, IndexedFileStat],
-    ) -> str | None:
-        """Return the stored checksum when stat proves the file is unchanged.
-
-        Returns None — forcing a fresh hash — whenever the answer is ambiguous:
-        no indexed row (a new file, still needed for move detection), a null
-        stat column, or a size/mtime mismatch. Only an exact size match plus an
-        mtime within the float epsilon reuses the stored checksum, which then
-        equals the indexed checksum and lands the file in the unchanged set.
-        """
-        indexed = indexed_stats.get(file_path)
-        if indexed is None:
-            return None
-        if indexed.checksum is None or indexed.mtime is None or indexed.size is None:
-            return None
-        if metadata.size != indexed.size:
-            return None
-        if abs(metadata.modified_at.timestamp() - indexed.mtime) > (
-            _INDEXED_MTIME_MATCH_EPSILON_SECONDS
-        ):
-            return None
-        return indexed.checksum
-
 
 @dataclass(frozen=True, slots=True)
 class LocalProjectIndexDeletePathVerifier(ProjectIndexDeletePathVerifier):
@@ -749,11 +772,16 @@ class LocalProjectIndexRunner:
         force_full: bool = False,
     ) -> ProjectIndexCoordinatorResult:
         project = await self._get_project(project_id)
-        return await run_local_project_index_for_project(
+        result = await run_local_project_index_for_project(
             project,
             runtime_factory=self.runtime_factory,
             force_full=force_full,
         )
+        # Single-note writes between runs append project_stat deltas that no
+        # index batch folds; a run with nothing to index still compacts them.
+        async with db.scoped_session(self.session_maker) as session:
+            await ProjectStatRepository().compact(session, project_id)
+        return result
 
 
 @dataclass(frozen=True, slots=True)
@@ -9,19 +9,21 @@ behind the same protocols.
 """
 
 import asyncio
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, field
 from typing import Any, Coroutine
 
+import logfire
 from loguru import logger
 
 from basic_memory.index.project_indexing import ProjectIndexRunner
 from basic_memory.index.schedulers import SearchReindexService
+from basic_memory.indexing.embedding_index_planning import EmbeddingBatchVectorSync
 from basic_memory.indexing.relation_resolution import (
     RelationResolutionRuntime,
     resolve_project_relations,
 )
 from basic_memory.read_cache import ReadCacheInvalidator, invalidate_cache
-from basic_memory.runtime.vector_sync import EntityVectorSync
 
 # --- Background Task Machinery ---
 
@@ -85,30 +87,151 @@ async def drain_background_tasks() -> None:
 # --- Local Schedulers ---
 
 
+@dataclass(slots=True)
+class _EntityVectorSyncQueue:
+    """Entity ids waiting for vector sync in one project on one event loop.
+
+    ``pending`` is a dict used as an insertion-ordered set, so repeated writes
+    to one note dedupe. ``scheduler`` is the most recent enqueuer: scheduler
+    instances are built per request, so each batch runs with the services of
+    the latest write rather than whichever request happened to arm the flush.
+    ``batch_full`` wakes a debouncing flush early once a full batch is waiting.
+    """
+
+    project_id: int
+    scheduler: "LocalEntityVectorSyncScheduler"
+    pending: dict[int, None] = field(default_factory=dict)
+    flushing: bool = False
+    batch_full: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+# Process-lifetime micro-batch state for entity vector sync, keyed by event loop
+# and then project id. A flush task and its services belong to one loop; keying
+# by loop keeps a queue armed on a loop that has since closed (a one-shot CLI
+# command, a test) from swallowing writes made on the next loop. Weak keys let a
+# closed loop's leftover queues go with it.
+_entity_vector_sync_queues: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[int, _EntityVectorSyncQueue]
+] = weakref.WeakKeyDictionary()
+
+
+def entity_vector_sync_queue_depth(project_id: int | None = None) -> int:
+    """Return entity ids waiting for vector sync in one project, or in all projects."""
+    return sum(
+        len(queue.pending)
+        for loop_queues in list(_entity_vector_sync_queues.values())
+        for queue in loop_queues.values()
+        if project_id is None or queue.project_id == project_id
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class LocalEntityVectorSyncScheduler:
-    search_service: EntityVectorSync
+    """Coalesce per-note vector sync requests into debounced batches.
+
+    A burst of agent writes used to start one background sync (one embedding
+    call, one read-cache invalidation) per note. Instead each write only
+    enqueues its entity id: the first write of a burst schedules a flush that
+    waits ``debounce_seconds`` (or until ``max_batch_size`` ids are waiting),
+    then syncs the deduplicated ids through ``sync_entity_vectors_batch`` under
+    a single invalidation. Ids queued while a batch runs go into the next one.
+    No-op in test mode, consistent with the other local schedulers.
+    """
+
+    search_service: EmbeddingBatchVectorSync
     project_external_id: str
     read_cache: ReadCacheInvalidator | None
     test_mode: bool
+    debounce_seconds: float = 0.05
+    max_batch_size: int = 64
 
     def schedule_entity_vector_sync(self, *, entity_id: int, project_id: int) -> None:
-        _ = project_id
-        _schedule_background_coroutine(
-            self._run_entity_vector_sync(entity_id),
-            test_mode=self.test_mode,
-        )
+        # Early-return in test mode BEFORE touching the queue: the flush that
+        # drains it never runs under test mode, so the id would leak forever.
+        if self.test_mode:
+            return
+        loop_queues = _entity_vector_sync_queues.setdefault(asyncio.get_running_loop(), {})
+        queue = loop_queues.get(project_id)
+        if queue is None:
+            queue = loop_queues[project_id] = _EntityVectorSyncQueue(project_id, self)
+        queue.scheduler = self
+        queue.pending[entity_id] = None
+        _record_entity_vector_sync_queue_depth(project_id)
+        if queue.flushing:
+            if len(queue.pending) >= self.max_batch_size:
+                queue.batch_full.set()
+            return
+        _arm_entity_vector_sync(queue)
 
-    async def _run_entity_vector_sync(self, entity_id: int) -> None:
+    async def _run_entity_vector_sync_batch(self, entity_ids: list[int]) -> None:
+        logfire.metric_histogram("entity_vector_sync_batch_size").record(len(entity_ids))
         if self.read_cache is None:
-            await self.search_service.sync_entity_vectors(entity_id)
-            return
+            result = await self.search_service.sync_entity_vectors_batch(entity_ids)
+        else:
+            # Vector publication happens after the mutation/index generation bump and can
+            # change VECTOR/HYBRID results. Advance the generation once per batch, after
+            # success or partial failure, so a result cached while vectors were stale
+            # cannot survive this derived-state update.
+            async with invalidate_cache(self.read_cache, self.project_external_id):
+                result = await self.search_service.sync_entity_vectors_batch(entity_ids)
+        if result.entities_failed:
+            logger.warning(
+                "Entity vector sync batch had failures",
+                entities_total=result.entities_total,
+                entities_failed=result.entities_failed,
+                failed_entity_ids=list(result.failed_entity_ids),
+                sample_errors=list(result.sample_errors),
+            )
 
-        # Vector publication happens after the mutation/index generation bump and can change
-        # VECTOR/HYBRID results. Advance the generation after success or partial failure so a
-        # result cached while vectors were stale cannot survive this derived-state update.
-        async with invalidate_cache(self.read_cache, self.project_external_id):
-            await self.search_service.sync_entity_vectors(entity_id)
+
+def _arm_entity_vector_sync(queue: _EntityVectorSyncQueue) -> None:
+    queue.flushing = True
+    queue.batch_full = asyncio.Event()
+    _schedule_background_coroutine(
+        _flush_entity_vector_sync(queue),
+        test_mode=queue.scheduler.test_mode,
+    )
+
+
+async def _flush_entity_vector_sync(queue: _EntityVectorSyncQueue) -> None:
+    try:
+        # Debounce: let the burst settle, unless a full batch is already waiting.
+        if len(queue.pending) < queue.scheduler.max_batch_size:
+            try:
+                await asyncio.wait_for(queue.batch_full.wait(), queue.scheduler.debounce_seconds)
+            except TimeoutError:
+                pass
+        while queue.pending:
+            scheduler = queue.scheduler
+            batch = list(queue.pending)[: scheduler.max_batch_size]
+            for entity_id in batch:
+                del queue.pending[entity_id]
+            queue.batch_full.clear()
+            _record_entity_vector_sync_queue_depth(queue.project_id)
+            await scheduler._run_entity_vector_sync_batch(batch)
+    finally:
+        queue.flushing = False
+        current_task = asyncio.current_task()
+        if not queue.pending:
+            loop_queues = _entity_vector_sync_queues.get(asyncio.get_running_loop(), {})
+            if loop_queues.get(queue.project_id) is queue:
+                del loop_queues[queue.project_id]
+        # Trigger: the flush was cancelled, normally because its loop is closing.
+        # Why: re-arming would schedule a new task on that closing loop.
+        # Outcome: the queue is left idle; ids still pending go out with the
+        # next write on this loop, or are dropped along with the loop.
+        elif current_task is None or not current_task.cancelling():
+            # Re-arm after clearing the in-flight marker so ids queued behind a
+            # batch that raised still get their own flush instead of waiting for
+            # an unrelated later write.
+            _arm_entity_vector_sync(queue)
+
+
+def _record_entity_vector_sync_queue_depth(project_id: int) -> None:
+    logfire.metric_gauge("entity_vector_sync_queue_depth").set(
+        entity_vector_sync_queue_depth(project_id),
+        attributes={"project_id": project_id},
+    )
 
 
 # Process-lifetime single-flight state: project ids with an index run already
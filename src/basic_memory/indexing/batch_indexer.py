@@ -21,6 +21,12 @@ from basic_memory.file_utils import (
     has_frontmatter,
     remove_frontmatter,
 )
+from basic_memory.markdown.parse_stage import (
+    MarkdownParseFailure,
+    MarkdownParseRequest,
+    MarkdownParseStage,
+    resolve_parse_workers,
+)
 from basic_memory.markdown.schemas import EntityMarkdown
 from basic_memory.indexing.models import (
     IndexEntitySearchWriter,
@@ -38,6 +44,7 @@ from basic_memory.indexing.relation_persistence import RelationGenerationPublish
 from basic_memory.models import Entity
 from basic_memory.repository import EntityRepository, ObservationRepository, RelationRepository
 from basic_memory.repository.note_content_repository import NoteContentRepository
+from basic_memory.repository.project_stat_repository import ProjectStatRepository
 from basic_memory.repository.semantic_errors import SemanticDependenciesMissingError
 from basic_memory.runtime.storage import (
     ProjectId,
@@ -127,8 +134,11 @@ class BatchIndexer:
         search_service: IndexEntitySearchWriter,
         file_writer: IndexFileWriter,
         session_maker: async_sessionmaker[AsyncSession],
+        markdown_parse_stage: MarkdownParseStage | None = None,
     ) -> None:
+        self.project_id = project_id
         self.app_config = app_config
+        self.markdown_parse_stage = markdown_parse_stage
         self.entity_service = entity_service
         self.entity_repository = entity_repository
         self.observation_repository = observation_repository
@@ -153,6 +163,14 @@ class BatchIndexer:
             entity_indexer=RelationResolutionSearchWriter(search_service),
         )
 
+    def _get_markdown_parse_stage(self) -> MarkdownParseStage:
+        # Built on first parse so composing an indexer never reads parse settings.
+        if self.markdown_parse_stage is None:
+            self.markdown_parse_stage = MarkdownParseStage(
+                workers=resolve_parse_workers(self.app_config.index_parse_workers)
+            )
+        return self.markdown_parse_stage
+
     async def index_files(
         self,
         files: Mapping[str, IndexInputFile],
@@ -175,13 +193,20 @@ class BatchIndexer:
         markdown_paths = [path for path in ordered_paths if self._is_markdown(files[path])]
         regular_paths = [path for path in ordered_paths if path not in markdown_paths]
 
-        prepared_markdown, parse_errors = await self._run_bounded(
-            markdown_paths,
-            limit=parse_limit,
-            worker=lambda path: self._prepare_markdown_file(files[path]),
+        parsed_markdown, parse_errors = await self._parse_markdown_batch(
+            [files[path] for path in markdown_paths]
         )
         error_by_path.update(parse_errors)
 
+        prepared_markdown, prepare_errors = await self._run_bounded(
+            [path for path in markdown_paths if path in parsed_markdown],
+            limit=parse_limit,
+            worker=lambda path: self._prepare_markdown_file(
+                files[path], markdown=parsed_markdown[path]
+            ),
+        )
+        error_by_path.update(prepare_errors)
+
         prepared_markdown, normalization_errors = await self._normalize_markdown_batch(
             prepared_markdown,
             existing_permalink_by_path=existing_permalink_by_path,
@@ -235,6 +260,14 @@ class BatchIndexer:
 
         search_indexed = len(indexed_entities)
 
+        if prepared_entities:
+            # Trigger: every entity, observation, and relation write above appended
+            # project_stat delta rows through the triggers.
+            # Why: reads sum those rows, so leaving them unfolded slows project info.
+            # Outcome: fold them once per batch, off the read path.
+            async with db.scoped_session(self.session_maker) as session:
+                await ProjectStatRepository().compact(session, self.project_id)
+
         return IndexingBatchResult(
             indexed=indexed_entities,
             errors=[(path, error_by_path[path]) for path in ordered_paths if path in error_by_path],
@@ -325,19 +358,63 @@ class BatchIndexer:
 
     # --- Preparation ---
 
-    async def _prepare_markdown_file(self, file: IndexInputFile) -> _PreparedMarkdownFile:
+    async def _parse_markdown_batch(
+        self,
+        files: Sequence[IndexInputFile],
+    ) -> tuple[dict[str, EntityMarkdown], dict[str, str]]:
+        """Parse a batch's markdown through the parse stage (worker processes for large batches)."""
+        requests: list[MarkdownParseRequest] = []
+        errors: dict[str, str] = {}
+        for file in files:
+            try:
+                requests.append(self._markdown_parse_request(file))
+            except (ValueError, UnicodeDecodeError) as exc:
+                errors[file.path] = str(exc)
+                logger.warning("Batch indexing failed", path=file.path, error=str(exc))
+
+        parsed: dict[str, EntityMarkdown] = {}
+        for request, result in zip(
+            requests, await self._get_markdown_parse_stage().parse(requests)
+        ):
+            if isinstance(result, MarkdownParseFailure):
+                errors[request.path] = result.message
+                logger.warning("Batch indexing failed", path=request.path, error=result.message)
+            else:
+                parsed[request.path] = result
+        return parsed, errors
+
+    @staticmethod
+    def _markdown_parse_request(file: IndexInputFile) -> MarkdownParseRequest:
+        if file.content is None:
+            raise ValueError(f"Missing content for markdown file: {file.path}")
+        return MarkdownParseRequest(
+            path=file.path,
+            content=file.content.decode("utf-8"),
+            mtime=file.last_modified.timestamp() if file.last_modified else None,
+            ctime=file.created_at.timestamp() if file.created_at else None,
+        )
+
+    async def _prepare_markdown_file(
+        self,
+        file: IndexInputFile,
+        *,
+        markdown: EntityMarkdown | None = None,
+    ) -> _PreparedMarkdownFile:
+        """Combine a file with its parsed markdown, parsing it in-loop when not given."""
         if file.content is None:
             raise ValueError(f"Missing content for markdown file: {file.path}")
 
         content = file.content.decode("utf-8")
         file_contains_frontmatter = has_frontmatter(content)
         final_checksum = await self._resolve_checksum(file)
-        entity_markdown = await self.entity_service.entity_parser.parse_markdown_content(
-            file_path=Path(file.path),
-            content=content,
-            mtime=file.last_modified.timestamp() if file.last_modified else None,
-            ctime=file.created_at.timestamp() if file.created_at else None,
-        )
+        entity_markdown = markdown
+        if entity_markdown is None:
+            entity_markdown = await self.entity_service.entity_parser.parse_markdown_content(
+                file_path=Path(file.path),
+                content=content,
+                mtime=file.last_modified.timestamp() if file.last_modified else None,
+                ctime=file.created_at.timestamp() if file.created_at else None,
+            )
 
         return _PreparedMarkdownFile(
             file=file,
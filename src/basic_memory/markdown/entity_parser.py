@@ -179,6 +179,104 @@ def parse(content: str) -> EntityContent:
     )
 
 
+def parse_markdown_text(
+    file_path: Path,
+    content: str,
+    *,
+    mtime: Optional[float] = None,
+    ctime: Optional[float] = None,
+) -> EntityMarkdown:
+    """Parse markdown content into EntityMarkdown synchronously.
+
+    This is the CPU-bound core of EntityParser.parse_markdown_content(). It has
+    no parser state, so bulk indexing can run it in worker processes.
+    """
+    # Strip BOM before parsing (can be present in files from Windows or certain sources)
+    # See issue #452
+    from basic_memory.file_utils import strip_bom
+
+    content = strip_bom(content)
+
+    # PostgreSQL rejects null bytes (0x00) in text columns.
+    # Some markdown files (e.g. Claude agent definitions) contain embedded nulls.
+    content = content.replace("\x00", "")
+
+    # Parse frontmatter with proper error handling for malformed YAML.
+    # We use frontmatter.parse() instead of frontmatter.loads() because
+    # loads() does Post(content, handler, **metadata), which crashes when
+    # the YAML contains reserved keys like 'content' or 'handler'.
+    # See basic-memory-cloud#375.
+    try:
+        fm_metadata, fm_content = frontmatter.parse(content)
+        post = frontmatter.Post(fm_content)
+        post.metadata.update(fm_metadata)
+    except yaml.YAMLError as e:
+        logger.warning(
+            f"Failed to parse YAML frontmatter in {file_path}: {e}. "
+            f"Treating file as plain markdown without frontmatter."
+        )
+        # Use Post(content) not Post(content, metadata={})
+        # The latter creates {"metadata": {}} in the metadata dict (issue #528)
+        post = frontmatter.Post(content)
+
+    # Normalize frontmatter values
+    metadata = normalize_frontmatter_metadata(post.metadata)
+
+    # Ensure required string fields are always strings.
+    # YAML can parse these as lists when authors use block sequence syntax
+    # (e.g. "title:\n  - My Title"), causing 'list' has no attribute 'strip'
+    # downstream.  See basic-memory-cloud#376.
+    title = metadata.get("title")
+    if title is not None:
+        title = _coerce_to_string(title)
+    if not title or title == "None":
+        metadata["title"] = file_path.stem
+    else:
+        metadata["title"] = title
+
+    note_type = metadata.get("type")
+    if note_type is not None:
+        note_type = _coerce_to_string(note_type)
+    metadata["type"] = note_type if note_type is not None else "note"
+
+    tags = parse_tags(metadata.get("tags", []))  # pyright: ignore
+    if tags:
+        metadata["tags"] = tags
+
+    # Parse content for observations and relations
+    entity_frontmatter = EntityFrontmatter(metadata=metadata)
+    entity_content = parse(post.content)
+
+    # Canonical frontmatter timestamps describe note semantics. File times are
+    # only compatibility fallbacks for notes that do not declare them.
+    now = datetime.now().astimezone()
+    created_fallback = (
+        datetime.fromtimestamp(ctime, tz=UTC).astimezone() if ctime is not None else now
+    )
+    modified_fallback = (
+        datetime.fromtimestamp(mtime, tz=UTC).astimezone() if mtime is not None else now
+    )
+    created = _parse_frontmatter_timestamp(
+        metadata,
+        "created",
+        fallback=created_fallback,
+    )
+    modified = _parse_frontmatter_timestamp(
+        metadata,
+        "modified",
+        fallback=modified_fallback,
+    )
+
+    return EntityMarkdown(
+        frontmatter=entity_frontmatter,
+        content=post.content,
+        observations=entity_content.observations,
+        relations=entity_content.relations,
+        created=created,
+        modified=modified,
+    )
+
+
 # def parse_tags(tags: Any) -> list[str]:
 #     """Parse tags into list of strings."""
 #     if isinstance(tags, (list, tuple)):
@@ -270,87 +368,4 @@ class EntityParser:
         Returns:
             EntityMarkdown with parsed content
         """
-        # Strip BOM before parsing (can be present in files from Windows or certain sources)
-        # See issue #452
-        from basic_memory.file_utils import strip_bom
-
-        content = strip_bom(content)
-
-        # PostgreSQL rejects null bytes (0x00) in text columns.
-        # Some markdown files (e.g. Claude agent definitions) contain embedded nulls.
-        content = content.replace("\x00", "")
-
-        # Parse frontmatter with proper error handling for malformed YAML.
-        # We use frontmatter.parse() instead of frontmatter.loads() because
-        # loads() does Post(content, handler, **metadata), which crashes when
-        # the YAML contains reserved keys like 'content' or 'handler'.
-        # See basic-memory-cloud#375.
-        try:
-            fm_metadata, fm_content = frontmatter.parse(content)
-            post = frontmatter.Post(fm_content)
-            post.metadata.update(fm_metadata)
-        except yaml.YAMLError as e:
-            logger.warning(
-                f"Failed to parse YAML frontmatter in {file_path}: {e}. "
-                f"Treating file as plain markdown without frontmatter."
-            )
-            # Use Post(content) not Post(content, metadata={})
-            # The latter creates {"metadata": {}} in the metadata dict (issue #528)
-            post = frontmatter.Post(content)
-
-        # Normalize frontmatter values
-        metadata = normalize_frontmatter_metadata(post.metadata)
-
-        # Ensure required string fields are always strings.
-        # YAML can parse these as lists when authors use block sequence syntax
-        # (e.g. "title:\n  - My Title"), causing 'list' has no attribute 'strip'
-        # downstream.  See basic-memory-cloud#376.
-        title = metadata.get("title")
-        if title is not None:
-            title = _coerce_to_string(title)
-        if not title or title == "None":
-            metadata["title"] = file_path.stem
-        else:
-            metadata["title"] = title
-
-        note_type = metadata.get("type")
-        if note_type is not None:
-            note_type = _coerce_to_string(note_type)
-        metadata["type"] = note_type if note_type is not None else "note"
-
-        tags = parse_tags(metadata.get("tags", []))  # pyright: ignore
-        if tags:
-            metadata["tags"] = tags
-
-        # Parse content for observations and relations
-        entity_frontmatter = EntityFrontmatter(metadata=metadata)
-        entity_content = parse(post.content)
-
-        # Canonical frontmatter timestamps describe note semantics. File times are
-        # only compatibility fallbacks for notes that do not declare them.
-        now = datetime.now().astimezone()
-        created_fallback = (
-            datetime.fromtimestamp(ctime, tz=UTC).astimezone() if ctime is not None else now
-        )
-        modified_fallback = (
-            datetime.fromtimestamp(mtime, tz=UTC).astimezone() if mtime is not None else now
-        )
-        created = _parse_frontmatter_timestamp(
-            metadata,
-            "created",
-            fallback=created_fallback,
-        )
-        modified = _parse_frontmatter_timestamp(
-            metadata,
-            "modified",
-            fallback=modified_fallback,
-        )
-
-        return EntityMarkdown(
-            frontmatter=entity_frontmatter,
-            content=post.content,
-            observations=entity_content.observations,
-            relations=entity_content.relations,
-            created=created,
-            modified=modified,
-        )
+        return parse_markdown_text(file_path, content, mtime=mtime, ctime=ctime)
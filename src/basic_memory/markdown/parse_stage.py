@@ -0,0 +1,184 @@
+"""Process-pool stage for parsing many markdown notes at once.
+
+Parsing a note (frontmatter YAML, value normalization, and the markdown-it
+token walk with the observation/relation plugins) is pure CPU work. Done on
+the event loop it makes cold indexing single-core and stalls every concurrent
+API/MCP request while a batch parses.
+
+This stage hands a batch to a shared ProcessPoolExecutor and gets back plain
+picklable results: the parsed EntityMarkdown, or a MarkdownParseFailure
+carrying the error message. Small batches, and configurations with a single
+worker, parse in a worker thread instead, because shipping a handful of notes
+to another process costs more than parsing them. The pool is opt-in
+(``index_parse_workers``) and is stopped by the MCP/API lifespans and CLI
+teardown through shutdown_markdown_parse_pool().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from basic_memory.markdown.entity_parser import parse_markdown_text
+from basic_memory.markdown.schemas import EntityMarkdown
+
+# Upper bound for the automatic worker count; parse throughput flattens out well
+# before this on typical notes, and each worker holds its own interpreter.
+_MAX_AUTO_WORKERS = 8
+
+
+@dataclass(frozen=True, slots=True)
+class MarkdownParseRequest:
+    """One note to parse: its project-relative path, decoded text, and file times."""
+
+    path: str
+    content: str
+    mtime: float | None = None
+    ctime: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class MarkdownParseFailure:
+    """A note that failed to parse, reduced to its message so it always pickles."""
+
+    message: str
+
+
+type MarkdownParseResult = EntityMarkdown | MarkdownParseFailure
+
+
+def parse_markdown_requests(
+    requests: Sequence[MarkdownParseRequest],
+) -> list[MarkdownParseResult]:
+    """Parse a chunk of notes; the worker-process entry point.
+
+    Failures are returned rather than raised so one bad note never discards the
+    rest of its chunk.
+    """
+    results: list[MarkdownParseResult] = []
+    for request in requests:
+        try:
+            results.append(
+                parse_markdown_text(
+                    Path(request.path),
+                    request.content,
+                    mtime=request.mtime,
+                    ctime=request.ctime,
+                )
+            )
+        except Exception as exc:
+            results.append(MarkdownParseFailure(message=str(exc)))
+    return results
+
+
+def resolve_parse_workers(configured: int) -> int:
+    """Return the worker count for a configured value, where 0 means automatic."""
+    if configured > 0:
+        return configured
+    return max(1, min(_MAX_AUTO_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+_pool_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+
+
+def _shared_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process-wide parse pool, creating it on first use.
+
+    One pool serves every project and batch, so worker start-up (a fresh
+    interpreter importing the parser) is paid once per process. Workers are
+    spawned rather than forked: the parent runs an event loop and worker
+    threads, which fork would copy mid-flight.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_markdown_parse_pool() -> None:
+    """Stop the shared parse pool; the next pooled batch starts a new one."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+            _pool_workers = 0
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass(frozen=True, slots=True)
+class MarkdownParseStage:
+    """Parse batches of markdown notes across worker processes.
+
+    Args:
+        workers: Worker processes to use. 1 always parses in a worker thread.
+        min_batch_size: Smallest batch worth sending to the pool.
+    """
+
+    workers: int
+    min_batch_size: int = 16
+
+    def uses_pool(self, batch_size: int) -> bool:
+        return self.workers > 1 and batch_size >= self.min_batch_size
+
+    async def parse(
+        self,
+        requests: Sequence[MarkdownParseRequest],
+    ) -> list[MarkdownParseResult]:
+        """Parse every request, returning results in request order."""
+        if not requests:
+            return []
+        if not self.uses_pool(len(requests)):
+            # Off the event loop, so API/MCP requests keep flowing while a batch parses.
+            return await asyncio.to_thread(parse_markdown_requests, requests)
+
+        pool = _shared_pool(self.workers)
+        loop = asyncio.get_running_loop()
+        # A few chunks per worker keeps every core busy when note sizes vary,
+        # while pickling each chunk once instead of once per note.
+        chunk_size = max(1, -(-len(requests) // (self.workers * 4)))
+        chunks = [requests[i : i + chunk_size] for i in range(0, len(requests), chunk_size)]
+        try:
+            chunk_results = await asyncio.gather(
+                *(loop.run_in_executor(pool, parse_markdown_requests, chunk) for chunk in chunks)
+            )
+        except BrokenProcessPool as exc:
+            # Trigger: a worker died (killed, out of memory) or could not start.
+            # Why: parsing must not fail just because the pool did; the threaded
+            #   path produces the same results, only without the parallelism.
+            # Outcome: drop the broken pool so the next batch starts a fresh one,
+            #   and parse this batch in a worker thread.
+            logger.warning(
+                "Markdown parse pool failed; parsing batch in a thread",
+                batch_size=len(requests),
+                error=str(exc),
+            )
+            _discard_broken_pool(pool)
+            return await asyncio.to_thread(parse_markdown_requests, requests)
+        return [result for chunk in chunk_results for result in chunk]
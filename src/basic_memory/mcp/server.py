@@ -16,11 +16,13 @@ from basic_memory.cli.auth import CLIAuth
 from basic_memory.index.note_content_materialization import drain_pending_materializations
 from basic_memory.db import scoped_session
 from basic_memory.index.local_schedulers import drain_background_tasks
+from basic_memory.markdown.parse_stage import shutdown_markdown_parse_pool
 from basic_memory.mcp.client_info import MCPClientInfoMiddleware
 from basic_memory.mcp.container import McpContainer, set_container
 from basic_memory.read_cache import ReadCache, ReadCacheUnavailable
-from basic_memory.read_cache.lifecycle import open_redis_read_cache
+from basic_memory.read_cache.lifecycle import layer_memory_read_cache, open_redis_read_cache
 from basic_memory.repository import ProjectRepository
+from basic_memory.repository.project_stat_repository import ProjectStatRepository
 from basic_memory.services.initialization import initialize_app
 import logfire
 
@@ -29,9 +31,7 @@ async def _log_embedding_status(session_maker: async_sessionmaker[AsyncSession])
     """Log a clear summary of semantic embedding status at startup."""
     try:
         async with scoped_session(session_maker) as session:
-            entity_count = (
-                await session.execute(text("SELECT COUNT(*) FROM entity"))
-            ).scalar() or 0
+            entity_count = await ProjectStatRepository().total_entities(session)
             chunk_count = (
                 await session.execute(text("SELECT COUNT(*) FROM search_vector_chunks"))
             ).scalar() or 0
@@ -98,12 +98,18 @@ async def lifespan(app: FastMCP):
     async with open_redis_read_cache(
         standalone_redis_url,
         max_connections=config.redis_max_connections,
-    ) as read_cache:
+    ) as redis_read_cache:
+        read_cache = layer_memory_read_cache(
+            redis_read_cache,
+            max_entries=0 if container.mode.is_cloud else config.read_cache_memory_max_entries,
+            max_bytes=config.read_cache_memory_max_bytes,
+            layered_ttl_seconds=config.read_cache_memory_layered_ttl_seconds,
+        )
         container.read_cache = read_cache
         set_container(container)
         api_container = ApiContainer(config=config, mode=container.mode, read_cache=read_cache)
 
-        # Local MCP requests use FastAPI through ASGITransport without entering its lifespan.
+        # Local MCP requests call FastAPI in-process without entering its lifespan.
         # Installing the same container keeps request reads and watcher invalidation on one cache.
         with installed_container(api_container):
             with logfire.span(
@@ -198,6 +204,7 @@ async def lifespan(app: FastMCP):
                     # write is never lost — mirrors the API lifespan shutdown.
                     await drain_pending_materializations()
                     await drain_background_tasks()
+                    shutdown_markdown_parse_pool()
 
                     # Only shutdown DB if we created it (not if test fixture provided it)
                     if engine_was_none:
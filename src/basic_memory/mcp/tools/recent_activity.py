@@ -1,11 +1,14 @@
 """Recent activity tool for Basic Memory MCP server."""
 
+import asyncio
 from datetime import timezone
 from pathlib import PurePosixPath
 from typing import Any, Annotated, List, Union, Optional, Literal
 
 from loguru import logger
 from fastmcp import Context
+from fastmcp.exceptions import ToolError
+from httpx import HTTPStatusError
 from pydantic import AliasChoices, Field
 
 from basic_memory.mcp.async_client import get_client
@@ -18,12 +21,20 @@ from basic_memory.mcp.tools.utils import call_get
 from basic_memory.schemas.base import TimeFrame
 from basic_memory.schemas.memory import (
     GraphContext,
+    MemoryMetadata,
     ProjectActivity,
     ActivityStats,
+    RecentActivityByProject,
 )
 from basic_memory.schemas.project_info import ProjectList, ProjectItem
 from basic_memory.schemas.search import SearchItemType
 
+# Discovery mode fans out one /memory/recent request per project. Bound how many
+# run at once so a large project list cannot flood the API, and cap how long
+# any one project may take so a slow project cannot stall the whole summary.
+_DISCOVERY_CONCURRENCY = 8
+_DISCOVERY_PROJECT_TIMEOUT = 15.0
+
 
 @mcp.tool(
     title="Recent Activity",
@@ -219,9 +230,10 @@ async def recent_activity(
             most_active_count = 0
             active_projects = 0
 
-            # Query each project's activity
-            for project_info in project_list.projects:
-                project_activity = await _get_project_activity(client, project_info, params, depth)
+            collected = await _collect_projects_activity(
+                client, project_list.projects, params, depth
+            )
+            for project_info, project_activity in zip(project_list.projects, collected):
                 projects_activity[project_info.name] = project_activity
 
                 # Aggregate stats
@@ -343,6 +355,69 @@ async def recent_activity(
             )
 
 
+async def _collect_projects_activity(
+    client, projects: List[ProjectItem], params: dict[str, Any], depth: int
+) -> list[ProjectActivity]:
+    """Collect activity for every project, in the order given.
+
+    Entity-only requests (the default) are answered by the server's
+    cross-project /v2/memory/recent endpoint in one round trip; discovery output
+    reads only primary results, which that endpoint returns. Other type filters,
+    and servers that predate the endpoint, fall back to concurrent per-project
+    requests.
+    """
+    if params.get("type") == [SearchItemType.ENTITY.value]:
+        by_project = await _get_recent_across_projects(client, params)
+        if by_project is not None:
+            return [
+                _project_activity(
+                    project_info,
+                    by_project.projects.get(project_info.external_id)
+                    or _empty_activity(params, depth),
+                )
+                for project_info in projects
+            ]
+
+    semaphore = asyncio.Semaphore(_DISCOVERY_CONCURRENCY)
+
+    async def collect(project_info: ProjectItem) -> ProjectActivity:
+        async with semaphore:
+            return await _get_project_activity(client, project_info, params, depth)
+
+    return list(await asyncio.gather(*(collect(project_info) for project_info in projects)))
+
+
+async def _get_recent_across_projects(
+    client, params: dict[str, Any]
+) -> RecentActivityByProject | None:
+    """Fetch entity activity for all projects at once, or None if the server lacks the route."""
+    cross_project_params = {
+        key: params[key] for key in ("timeframe", "page", "page_size") if key in params
+    }
+    try:
+        response = await call_get(client, "/v2/memory/recent", params=cross_project_params)
+    except ToolError as error:
+        # Trigger: the server answered 404 for the cross-project route.
+        # Why: servers older than this endpoint only expose per-project /memory/recent.
+        # Outcome: the caller falls back to concurrent per-project requests; any
+        #          other failure is a real error and propagates.
+        cause = error.__cause__
+        if isinstance(cause, HTTPStatusError) and cause.response.status_code == 404:
+            logger.debug("Cross-project /v2/memory/recent unavailable; querying per project")
+            return None
+        raise
+    return RecentActivityByProject.model_validate(response.json())
+
+
+def _empty_activity(params: dict[str, Any], depth: int) -> GraphContext:
+    """Activity for a project that returned nothing or could not be queried in time."""
+    return GraphContext(
+        metadata=MemoryMetadata(depth=depth, timeframe=params.get("timeframe")),
+        page=params.get("page"),
+        page_size=params.get("page_size"),
+    )
+
+
 async def _get_project_activity(
     client, project_info: ProjectItem, params: dict[str, Any], depth: int
 ) -> ProjectActivity:
@@ -355,15 +430,31 @@ async def _get_project_activity(
         depth: Graph traversal depth
 
     Returns:
-        ProjectActivity with activity data or empty activity on error
+        ProjectActivity with activity data, or empty activity on timeout or error
     """
-    activity_response = await call_get(
-        client,
-        f"/v2/projects/{project_info.external_id}/memory/recent",
-        params=params,
-    )
-    activity = GraphContext.model_validate(activity_response.json())
+    try:
+        activity_response = await asyncio.wait_for(
+            call_get(
+                client,
+                f"/v2/projects/{project_info.external_id}/memory/recent",
+                params=params,
+            ),
+            timeout=_DISCOVERY_PROJECT_TIMEOUT,
+        )
+        activity = GraphContext.model_validate(activity_response.json())
+    except (TimeoutError, ToolError) as error:
+        # Trigger: one project's activity request timed out or failed.
+        # Why: discovery summarizes many projects; one unreachable project should
+        #      not hide the activity of all the others.
+        # Outcome: the project is reported with no recent activity.
+        logger.warning(f"Recent activity unavailable for project {project_info.name}: {error!r}")
+        activity = _empty_activity(params, depth)
+
+    return _project_activity(project_info, activity)
+
 
+def _project_activity(project_info: ProjectItem, activity: GraphContext) -> ProjectActivity:
+    """Summarize one project's recent activity for discovery output."""
     # Extract last activity timestamp and active folders
     last_activity = None
     active_folders = set()
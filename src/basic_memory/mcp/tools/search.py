@@ -1,5 +1,10 @@
 """Search tools for Basic Memory MCP server."""
 
+import asyncio
+import base64
+import hashlib
+import heapq
+import json
 import re
 from textwrap import dedent
 from typing import Annotated, List, Optional, Dict, Any, Literal, cast
@@ -42,6 +47,10 @@ from basic_memory.schemas.search import (
 
 _SERVICE_UNAVAILABLE_HEADING = "# Search Failed - Service Temporarily Unavailable"
 
+# Per-project searches in flight at once for search_all_projects. Each one holds an
+# API client (and, locally, a database session), so the fan-out stays bounded.
+_ALL_PROJECTS_SEARCH_CONCURRENCY = 8
+
 
 def _default_search_type() -> str:
     """Pick default search mode from config, falling back to auto-detection.
@@ -405,6 +414,8 @@ def _format_search_markdown(
         f" | page {result.current_page}, page_size {result.page_size}"
         f"{' | more available' if result.has_more else ''}*"
     )
+    if result.next_cursor:
+        parts.append(f"*next page: cursor={result.next_cursor}*")
 
     return "\n".join(parts)
 
@@ -560,11 +571,63 @@ def _project_ref_label(project_ref: dict[str, str | None]) -> str:
     return project_ref.get("project") or project_ref.get("project_id") or "<unknown project>"
 
 
+def _project_cursor_key(project_ref: dict[str, str | None]) -> str:
+    """Return the key a project's offset is stored under in an all-projects cursor."""
+    return project_ref.get("project_id") or project_ref.get("project") or ""
+
+
+def _search_cursor_digest(search_args: dict[str, Any]) -> str:
+    """Fingerprint the search a cursor was issued for."""
+    encoded = json.dumps(search_args, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_search_cursor(page: int, offsets: dict[str, int], digest: str) -> str:
+    """Pack the next page number and per-project offsets into an opaque token."""
+    payload = json.dumps({"page": page, "offsets": offsets, "search": digest})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_search_cursor(cursor: str, digest: str) -> tuple[int, dict[str, int]]:
+    """Unpack a cursor from _encode_search_cursor, rejecting one from another search."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        page = payload["page"]
+        offsets = payload["offsets"]
+        search = payload["search"]
+    except (ValueError, TypeError, KeyError) as exc:
+        raise ValueError("cursor is not a valid search_notes cursor") from exc
+    if (
+        not isinstance(page, int)
+        or not isinstance(offsets, dict)
+        or not all(isinstance(offset, int) and offset >= 0 for offset in offsets.values())
+    ):
+        raise ValueError("cursor is not a valid search_notes cursor")
+    if search != digest:
+        raise ValueError("cursor belongs to a different search; repeat the original arguments")
+    return page, offsets
+
+
+def _covering_page(offset: int, count: int) -> tuple[int, int]:
+    """Return the (page, page_size) of the smallest page that holds rows [offset, offset + count).
+
+    The per-project API pages by number, not offset. Growing the page size from
+    ``count`` finds a window that starts at or before ``offset`` and reaches its
+    last row; ``offset + count`` on page 1 always qualifies.
+    """
+    page_size = count
+    while offset // page_size != (offset + count - 1) // page_size:
+        page_size += 1
+    return offset // page_size + 1, page_size
+
+
 async def _search_all_projects(
     *,
     query: str | None,
     page: int,
     page_size: int,
+    cursor: str | None,
     search_type: str | None,
     output_format: Literal["text", "json"],
     note_types: list[str],
@@ -577,9 +640,36 @@ async def _search_all_projects(
     min_similarity: float | None,
     context: Context | None,
 ) -> dict[str, Any] | str:
-    """Search every accessible project when the caller explicitly opts in."""
-    requested_page = max(page, 1)
+    """Search every accessible project when the caller explicitly opts in.
+
+    Projects are searched concurrently, and their score-ordered pages are merged
+    with a k-way heap merge. The response's ``next_cursor`` records how many rows
+    the caller has consumed from each project, so the next page asks each project
+    only for the rows it can still contribute instead of ``page * page_size``.
+    """
+    search_args = {
+        "query": query,
+        "page_size": page_size,
+        "search_type": search_type,
+        "note_types": note_types,
+        "entity_types": entity_types,
+        "categories": categories,
+        "after_date": after_date,
+        "metadata_filters": metadata_filters,
+        "tags": tags,
+        "status": status,
+        "min_similarity": min_similarity,
+    }
+    digest = _search_cursor_digest(search_args)
     requested_page_size = max(page_size, 1)
+    if cursor:
+        requested_page, cursor_offsets = _decode_search_cursor(cursor, digest)
+        skip = 0
+    else:
+        requested_page, cursor_offsets = max(page, 1), {}
+        # Without a cursor, page N can only be found by merging from the top.
+        skip = (requested_page - 1) * requested_page_size
+
     project_refs = await _load_search_project_refs(context=context)
     if not project_refs:
         response = SearchResponse(
@@ -594,12 +684,6 @@ async def _search_all_projects(
             return response.model_dump(mode="json", exclude_none=True)
         return _format_search_markdown(response, "all projects", query)
 
-    per_project_page_size = requested_page * requested_page_size
-    merged_results: list[dict[str, Any]] = []
-    total = 0
-    total_is_exact = True
-    any_project_has_more = False
-
     # Trigger: caller asked for an account-wide search.
     # Why: project_id (external UUID) routes through the cloud v2 API path,
     #      which 401s on local installs because there's no JWT to present.
@@ -617,31 +701,64 @@ async def _search_all_projects(
         or has_cloud_credentials(config)
     )
 
-    for project_ref in project_refs:
+    # Any one project can supply at most skip + page_size rows of the merged page.
+    rows_needed = skip + requested_page_size
+    project_offsets = [
+        cursor_offsets.get(_project_cursor_key(project_ref), 0) for project_ref in project_refs
+    ]
+    project_pages = [_covering_page(offset, rows_needed) for offset in project_offsets]
+    semaphore = asyncio.Semaphore(_ALL_PROJECTS_SEARCH_CONCURRENCY)
+
+    async def search_project(
+        project_ref: dict[str, str | None], project_page: int, project_page_size: int
+    ) -> dict[str, Any] | str | Exception:
         recursive_project_id = project_ref["project_id"] if use_cloud_routing else None
-        try:
-            results = await search_notes(
-                query=query,
-                project=project_ref["project"],
-                project_id=recursive_project_id,
-                page=1,
-                page_size=per_project_page_size,
-                search_type=search_type,
-                output_format="json",
-                note_types=note_types or None,
-                entity_types=entity_types or None,
-                categories=categories or None,
-                after_date=after_date,
-                metadata_filters=metadata_filters,
-                tags=tags,
-                status=status,
-                min_similarity=min_similarity,
-                search_all_projects=False,
-                context=context,
-            )
-        except Exception as exc:
+        async with semaphore:
+            try:
+                return await search_notes(
+                    query=query,
+                    project=project_ref["project"],
+                    project_id=recursive_project_id,
+                    page=project_page,
+                    page_size=project_page_size,
+                    search_type=search_type,
+                    output_format="json",
+                    note_types=note_types or None,
+                    entity_types=entity_types or None,
+                    categories=categories or None,
+                    after_date=after_date,
+                    metadata_filters=metadata_filters,
+                    tags=tags,
+                    status=status,
+                    min_similarity=min_similarity,
+                    search_all_projects=False,
+                    context=context,
+                )
+            except Exception as exc:
+                return exc
+
+    # Trigger: one search per project used to run back to back.
+    # Why: each project is an independent API round trip (or local index query).
+    # Outcome: wall-clock time approaches the slowest project, not the sum.
+    project_payloads = await asyncio.gather(
+        *(
+            search_project(project_ref, *project_page)
+            for project_ref, project_page in zip(project_refs, project_pages)
+        )
+    )
+
+    project_results: list[list[dict[str, Any]]] = []
+    total = 0
+    total_is_exact = True
+    any_project_has_more = False
+    for project_ref, offset, (project_page, project_page_size), results in zip(
+        project_refs, project_offsets, project_pages, project_payloads
+    ):
+        project_results.append([])
+        if isinstance(results, Exception):
             logger.warning(
-                f"Multi-project search failed for project {_project_ref_label(project_ref)}: {exc}"
+                f"Multi-project search failed for project {_project_ref_label(project_ref)}: "
+                f"{results}"
             )
             total_is_exact = False
             continue
@@ -658,19 +775,44 @@ async def _search_all_projects(
             total_is_exact = False
             continue
 
+        window_start = offset - (project_page - 1) * project_page_size
         raw_results = _raw_results_from_search_payload(results)
         total += _result_total(results, raw_results)
         total_is_exact = total_is_exact and _result_total_is_exact(results)
         any_project_has_more = any_project_has_more or results.get("has_more") is True
-        merged_results.extend(_qualify_results_for_project(raw_results, project_ref))
+        project_results[-1] = _qualify_results_for_project(
+            raw_results[window_start : window_start + rows_needed], project_ref
+        )
 
     # Each project owns retrieval and optional reranking behind its typed API client.
     # The MCP process only merges returned scores; it must not instantiate repository
     # providers with local credentials for content fetched through another route.
-    sorted_results = sorted(merged_results, key=_result_score, reverse=True)
-    start = (requested_page - 1) * requested_page_size
-    end = start + requested_page_size
-    paged_results = sorted_results[start:end]
+    # heapq.merge keeps every project's own order, so the rows taken from a project
+    # are always a prefix of what it returned and its cursor offset stays exact.
+    merged = heapq.merge(
+        *([(index, result) for result in results] for index, results in enumerate(project_results)),
+        key=lambda item: _result_score(item[1]),
+        reverse=True,
+    )
+    consumed = [0] * len(project_refs)
+    paged_results: list[dict[str, Any]] = []
+    for position, (index, result) in enumerate(merged):
+        if position >= rows_needed:
+            break
+        consumed[index] += 1
+        if position >= skip:
+            paged_results.append(result)
+
+    next_offsets = dict(cursor_offsets)
+    for project_ref, taken in zip(project_refs, consumed):
+        key = _project_cursor_key(project_ref)
+        next_offsets[key] = next_offsets.get(key, 0) + taken
+    consumed_total = sum(next_offsets.values())
+    has_more = (
+        any_project_has_more
+        or total > consumed_total
+        or any(taken < len(results) for taken, results in zip(consumed, project_results))
+    )
     response = SearchResponse.model_validate(
         {
             "results": paged_results,
@@ -678,7 +820,12 @@ async def _search_all_projects(
             "page_size": requested_page_size,
             "total": total,
             "total_is_exact": total_is_exact,
-            "has_more": any_project_has_more or total > end or len(sorted_results) > end,
+            "has_more": has_more,
+            "next_cursor": (
+                _encode_search_cursor(requested_page + 1, next_offsets, digest)
+                if has_more
+                else None
+            ),
         }
     )
 
@@ -789,6 +936,7 @@ async def search_notes(
             validation_alias=AliasChoices("min_similarity", "threshold", "similarity_threshold"),
         ),
     ] = None,
+    cursor: Optional[str] = None,
     context: Context | None = None,
 ) -> dict[str, Any] | str:
     """Search across all content in the knowledge base with comprehensive syntax support.
@@ -903,6 +1051,9 @@ async def search_notes(
         min_similarity: Optional float to override the global semantic_min_similarity threshold
                        for this query. E.g., 0.0 to see all vector results, or 0.8 for high precision.
                        Only applies to vector and hybrid search types.
+        cursor: Optional `next_cursor` from a previous search_all_projects response. Fetches
+                the following page without re-reading earlier ones; takes precedence over
+                `page`. Pass the same query and filters as the search that issued it.
         context: Optional FastMCP context for performance caching.
 
     Returns:
@@ -913,6 +1064,7 @@ async def search_notes(
         Vector and hybrid searches skip the count query (it would cost a second
         semantic retrieval pass), report `total: 0` with `total_is_exact: false`,
         and use `has_more` for pagination.
+        With search_all_projects, pass `next_cursor` back as `cursor` to page on.
 
     Examples:
         # Basic text search
@@ -1052,6 +1204,7 @@ async def search_notes(
             query=query,
             page=page,
             page_size=page_size,
+            cursor=cursor,
             search_type=search_type,
             output_format=output_format,
             note_types=note_types,
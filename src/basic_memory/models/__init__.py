@@ -2,6 +2,8 @@
 
 import basic_memory
 from basic_memory.models.base import Base
+from basic_memory.models.embedding_store import EmbeddingStoreEntry
+from basic_memory.models.entity_metadata_value import EntityMetadataValue
 from basic_memory.models.knowledge import (
     Entity,
     NoteContent,
@@ -10,16 +12,20 @@ from basic_memory.models.knowledge import (
     Relation,
 )
 from basic_memory.models.project import Project
+from basic_memory.models.project_stat import ProjectStat
 from basic_memory.models.relation_search_refresh import RelationSearchRefresh
 
 __all__ = [
     "Base",
+    "EmbeddingStoreEntry",
     "Entity",
+    "EntityMetadataValue",
     "NoteContent",
     "NoteFileVacate",
     "Observation",
     "Relation",
     "RelationSearchRefresh",
     "Project",
+    "ProjectStat",
     "basic_memory",
 ]
@@ -1,7 +1,8 @@
 """Base model class for SQLAlchemy models."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
+from sqlalchemy import DDL, event
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase
 
@@ -11,3 +12,19 @@ class Base(AsyncAttrs, DeclarativeBase):
 
     if TYPE_CHECKING:
         id: int
+
+
+def install_on_create_all(statements_for: Callable[[str], list[str]]) -> None:
+    """Run migration-installed DDL (triggers, functions) after Base.metadata.create_all.
+
+    Schemas built with create_all (tests, fresh scratch databases) would otherwise
+    miss the triggers the migrations install. ``statements_for`` takes a dialect
+    name and returns that dialect's statements.
+    """
+    for dialect_name in ("sqlite", "postgresql"):
+        for statement in statements_for(dialect_name):
+            event.listen(
+                Base.metadata,
+                "after_create",
+                DDL(statement).execute_if(dialect=dialect_name),
+            )
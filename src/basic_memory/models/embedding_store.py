@@ -0,0 +1,34 @@
+"""Content-addressed store of document embeddings shared across entities and projects."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Index, Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from basic_memory.models.base import Base
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class EmbeddingStoreEntry(Base):
+    """One embedded chunk text, keyed by provider identity and text hash.
+
+    Rows carry no entity or project reference: identical chunk text embedded by
+    the same provider yields the same vector wherever the note lives, so moves,
+    copies, re-imports, and full reindexes can reuse it instead of calling the
+    embedding model again.
+    """
+
+    __tablename__ = "embedding_store"
+    __table_args__ = (Index("ix_embedding_store_last_used_at", "last_used_at"),)
+
+    provider_identity: Mapped[str] = mapped_column(String, primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Packed float64 values, bit-identical to the provider output.
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    byte_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utc_now)
+    last_used_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utc_now)
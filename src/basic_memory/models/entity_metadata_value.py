@@ -0,0 +1,182 @@
+"""Normalized frontmatter values maintained by database triggers.
+
+Structured ``metadata_filters`` compile to JSON extraction over
+``entity.entity_metadata``, which parses JSON on every candidate row and can
+use no ordinary index. Triggers on ``entity`` explode each note's metadata into
+one ``entity_metadata_value`` row per value (keyed by its dotted path) plus one
+row per array element, so ``$in``, comparisons, ``$between``, and
+array-contains filters become B-tree range scans on both backends. Like
+``project_stat``, the rows commit with the entity write that produced them, no
+matter which indexing, move, or delete path issued it.
+
+Search builders use these rows only to pick candidate entities and keep their
+JSON predicates as the exact check, so the two can never disagree on a result.
+"""
+
+from typing import Optional
+
+from sqlalchemy import Boolean, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from basic_memory.models.base import Base, install_on_create_all
+
+# Strings that Postgres reads as double precision. Finite ones are cast through
+# numeric and range-checked first so an extreme value cannot fail the write.
+_POSTGRES_FINITE_TEXT = "^[-+]?([0-9]+[.]?[0-9]*|[.][0-9]+)(e[-+]?[0-9]+)?$"
+_POSTGRES_SPECIAL_TEXT = "^[-+]?(nan|inf|infinity)$"
+
+
+class EntityMetadataValue(Base):
+    """One frontmatter value (or array element) of one entity.
+
+    ``path`` is the dotted key path (``schema.confidence``); array elements share
+    their array's path and have ``is_element`` set. Objects and arrays get a row
+    too, holding their JSON text. ``value_text`` is the value as the backend's
+    JSON text predicates compare it, except that SQLite stores NULL for numbers
+    and booleans (json_extract returns those as SQL numbers, which never equal a
+    text value). ``value_num`` is the value as the numeric predicates cast it.
+    """
+
+    __tablename__ = "entity_metadata_value"
+    __table_args__ = (
+        Index(
+            "ix_entity_metadata_value_text",
+            "project_id",
+            "path",
+            "is_element",
+            "value_text",
+        ),
+        Index(
+            "ix_entity_metadata_value_num",
+            "project_id",
+            "path",
+            "is_element",
+            "value_num",
+        ),
+        Index("ix_entity_metadata_value_entity", "entity_id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    entity_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("entity.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    project_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    path: Mapped[str] = mapped_column(String, nullable=False)
+    is_element: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    value_text: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    value_num: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+
+_INSERT = (
+    "INSERT INTO entity_metadata_value "
+    "(entity_id, project_id, path, is_element, value_text, value_num)"
+)
+
+
+def _sqlite_select(row: str, source: str) -> str:
+    """Explode ``{row}.entity_metadata`` with json_tree.
+
+    json_tree reports element rows under their array's ``path`` and member rows
+    under their own ``fullkey``; either is kept only when no array lies above it.
+    Values read as json_extract and json_each return them. Invalid JSON explodes
+    as an empty object rather than failing the entity write.
+    """
+    key_path = "CASE WHEN typeof(j.key) = 'integer' THEN j.path ELSE j.fullkey END"
+    extracted = "CASE WHEN j.type IN ('object', 'array') THEN j.value ELSE j.atom END"
+    metadata = f"{row}.entity_metadata"
+    return (
+        f"SELECT {row}.id, {row}.project_id, "
+        f"replace(substr({key_path}, 3), '\"', ''), typeof(j.key) = 'integer', "
+        f"CASE WHEN j.type IN ('text', 'object', 'array') THEN {extracted} END, "
+        f"CAST({extracted} AS REAL) "
+        f"FROM {source}json_tree(CASE WHEN json_valid({metadata}) THEN {metadata} "
+        "ELSE '{}' END) AS j "
+        f"WHERE j.type <> 'null' AND {key_path} GLOB '$.*' AND instr({key_path}, '[') = 0"
+    )
+
+
+def _postgres_insert(row: str, source: str) -> str:
+    """Walk ``{row}.entity_metadata`` with a recursive CTE over nested objects."""
+    metadata = f"{row}.entity_metadata::jsonb"
+    text_value = "leaf.value #>> '{}'"
+    number = f"btrim({text_value})::numeric"
+    return (
+        "WITH RECURSIVE walk(entity_id, project_id, path, value) AS (\n"
+        f"SELECT {row}.id, {row}.project_id, member.key, member.value "
+        f"FROM {source}jsonb_each(CASE WHEN jsonb_typeof({metadata}) = 'object' "
+        f"THEN {metadata} ELSE '{{}}'::jsonb END) AS member\n"
+        "UNION ALL\n"
+        "SELECT walk.entity_id, walk.project_id, walk.path || '.' || member.key, member.value "
+        "FROM walk, jsonb_each(CASE WHEN jsonb_typeof(walk.value) = 'object' "
+        "THEN walk.value ELSE '{}'::jsonb END) AS member\n"
+        "), leaf(entity_id, project_id, path, is_element, value) AS (\n"
+        "SELECT entity_id, project_id, path, false, value FROM walk\n"
+        "UNION ALL\n"
+        "SELECT walk.entity_id, walk.project_id, walk.path, true, element.value "
+        "FROM walk, jsonb_array_elements(CASE WHEN jsonb_typeof(walk.value) = 'array' "
+        "THEN walk.value ELSE '[]'::jsonb END) AS element\n"
+        ")\n"
+        f"{_INSERT}\n"
+        f"SELECT leaf.entity_id, leaf.project_id, leaf.path, leaf.is_element, {text_value}, "
+        "CASE WHEN jsonb_typeof(leaf.value) = 'number' OR (jsonb_typeof(leaf.value) = 'string' "
+        f"AND btrim({text_value}) ~* '{_POSTGRES_FINITE_TEXT}') "
+        f"THEN CASE WHEN abs({number}) < 1e300 AND ({number} = 0 OR abs({number}) > 1e-300) "
+        f"THEN {number}::double precision END "
+        "WHEN jsonb_typeof(leaf.value) = 'string' "
+        f"AND btrim({text_value}) ~* '{_POSTGRES_SPECIAL_TEXT}' "
+        f"THEN btrim({text_value})::double precision END "
+        "FROM leaf WHERE jsonb_typeof(leaf.value) <> 'null'"
+    )
+
+
+def entity_metadata_value_trigger_statements(dialect_name: str) -> list[str]:
+    """Return the DDL statements that install the entity_metadata_value triggers."""
+    remove = "DELETE FROM entity_metadata_value WHERE entity_id = OLD.id;"
+    columns = "project_id, entity_metadata"
+
+    if dialect_name == "postgresql":
+        # json has no equality operator; compare as jsonb so either column type works.
+        changed = (
+            "OLD.project_id IS DISTINCT FROM NEW.project_id "
+            "OR OLD.entity_metadata::jsonb IS DISTINCT FROM NEW.entity_metadata::jsonb"
+        )
+        return [
+            "CREATE OR REPLACE FUNCTION entity_metadata_value_sync() RETURNS trigger "
+            "LANGUAGE plpgsql AS $$\nBEGIN\n"
+            f"IF TG_OP <> 'INSERT' THEN\n{remove}\nEND IF;\n"
+            f"IF TG_OP <> 'DELETE' THEN\n{_postgres_insert('NEW', '')};\nEND IF;\n"
+            "RETURN NULL;\nEND\n$$",
+            "DROP TRIGGER IF EXISTS entity_metadata_value_write ON entity",
+            "CREATE TRIGGER entity_metadata_value_write AFTER INSERT OR DELETE ON entity "
+            "FOR EACH ROW EXECUTE FUNCTION entity_metadata_value_sync()",
+            "DROP TRIGGER IF EXISTS entity_metadata_value_update ON entity",
+            "CREATE TRIGGER entity_metadata_value_update "
+            f"AFTER UPDATE OF {columns} ON entity "
+            f"FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION entity_metadata_value_sync()",
+        ]
+
+    added = f"{_INSERT} {_sqlite_select('NEW', '')};"
+    changed = (
+        "OLD.project_id IS NOT NEW.project_id OR OLD.entity_metadata IS NOT NEW.entity_metadata"
+    )
+    return [
+        "CREATE TRIGGER IF NOT EXISTS entity_metadata_value_insert "
+        f"AFTER INSERT ON entity\nBEGIN\n{added}\nEND",
+        "CREATE TRIGGER IF NOT EXISTS entity_metadata_value_delete "
+        f"AFTER DELETE ON entity\nBEGIN\n{remove}\nEND",
+        "CREATE TRIGGER IF NOT EXISTS entity_metadata_value_update "
+        f"AFTER UPDATE OF {columns} ON entity WHEN {changed}\n"
+        f"BEGIN\n{remove}\n{added}\nEND",
+    ]
+
+
+def entity_metadata_value_backfill_statement(dialect_name: str) -> str:
+    """Return the statement that explodes every existing entity's metadata."""
+    if dialect_name == "postgresql":
+        return _postgres_insert("entity", "entity, ")
+    return f"{_INSERT} {_sqlite_select('entity', 'entity, ')}"
+
+
+install_on_create_all(entity_metadata_value_trigger_statements)
@@ -9,6 +9,7 @@ from typing import Any, override, Optional
 from sqlalchemy import (
     BigInteger,
     CheckConstraint,
+    Computed,
     Integer,
     String,
     Text,
@@ -27,6 +28,11 @@ from basic_memory.runtime.storage import RUNTIME_MARKDOWN_CONTENT_TYPE
 from basic_memory.utils import generate_permalink
 
 
+# rtrim strips every trailing character that occurs in the path with its slashes
+# removed, i.e. everything after the last "/". Identical on SQLite and Postgres.
+ENTITY_DIRECTORY_SQL = "rtrim(file_path, replace(file_path, '/', ''))"
+
+
 class Entity(Base):
     """Core entity in the knowledge graph.
 
@@ -47,6 +53,7 @@ class Entity(Base):
         Index("ix_entity_created_at", "created_at"),  # For timeline queries
         Index("ix_entity_updated_at", "updated_at"),  # For timeline queries
         Index("ix_entity_project_id", "project_id"),  # For project filtering
+        Index("ix_entity_project_directory", "project_id", "directory"),  # Directory listings
         # Project-specific uniqueness constraints
         Index(
             "uix_entity_permalink_project",
@@ -79,6 +86,15 @@ class Entity(Base):
     permalink: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
     # Actual filesystem relative path
     file_path: Mapped[str] = mapped_column(String, index=True)
+    # Containing folder of file_path with a trailing slash ("notes/daily/"; "" at the
+    # project root). The database derives it on every write, so directory listings can
+    # seek an index instead of scanning the project, and no writer has to maintain it.
+    # Bytewise collation keeps "/"-delimited range scans correct on Postgres.
+    directory: Mapped[str] = mapped_column(
+        String().with_variant(String(collation="C"), "postgresql"),
+        Computed(ENTITY_DIRECTORY_SQL),
+        deferred=True,
+    )
     # checksum of file
     checksum: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
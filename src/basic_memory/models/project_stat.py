@@ -0,0 +1,127 @@
+"""Per-project counters maintained by database triggers.
+
+Project info used to answer every request with COUNT(*) joins over entity,
+observation, and relation. Triggers on those tables instead append a signed
+delta row to ``project_stat`` for every insert, delete, and counted-column
+update, so the counters commit (or roll back) with the write that changed them
+no matter which indexing, move, or delete path issued it.
+
+Triggers only ever append: concurrent writers on Postgres never contend on a
+shared counter row, which an in-place ``count = count + 1`` would turn into lock
+waits and cross-transaction deadlocks. Readers sum the deltas per key; ProjectStatRepository compacts them back to one row per key
+after each indexer batch, each project index run, and every few hundred
+accepted API writes to a project.
+"""
+
+from typing import Optional
+
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from basic_memory.models.base import Base, install_on_create_all
+
+# (source table, stat kind, key expression, count-only-when condition).
+# {row} is NEW or OLD inside the trigger body.
+PROJECT_STAT_SOURCES: tuple[tuple[str, str, str, str | None], ...] = (
+    ("entity", "note_type", "{row}.note_type", None),
+    ("observation", "observation_category", "{row}.category", None),
+    ("relation", "relation_type", "{row}.relation_type", None),
+    ("relation", "unresolved_relations", "''", "{row}.to_id IS NULL"),
+)
+# Columns whose change moves a row between counters.
+PROJECT_STAT_TRACKED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "entity": ("project_id", "note_type"),
+    "observation": ("project_id", "category"),
+    "relation": ("project_id", "relation_type", "to_id"),
+}
+
+
+class ProjectStat(Base):
+    """One signed counter delta for a (project, kind, key) statistic.
+
+    The statistic's value is the sum of its rows. Kinds are ``note_type``,
+    ``observation_category``, ``relation_type`` (keyed by the type), and
+    ``unresolved_relations`` (keyed by the empty string).
+    """
+
+    __tablename__ = "project_stat"
+    __table_args__ = (
+        Index("ix_project_stat_project_kind_key", "project_id", "stat_kind", "stat_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("project.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    stat_kind: Mapped[str] = mapped_column(String, nullable=False)
+    # Nullable: legacy schemas allow NULL note types and categories, and a
+    # counter must never reject the write it is counting.
+    stat_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    stat_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+def _delta_insert(kind: str, key: str, condition: str | None, row: str, delta: int) -> str:
+    key_sql = key.format(row=row)
+    values = f"{row}.project_id, '{kind}', {key_sql}, {delta}"
+    insert = "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count)"
+    # A project delete cascades to its rows after the project row is gone; a
+    # delta for it would violate project_stat's foreign key and abort the delete.
+    guard = f"EXISTS (SELECT 1 FROM project WHERE project.id = {row}.project_id)"
+    if condition is not None:
+        guard = f"{condition.format(row=row)} AND {guard}"
+    return f"{insert} SELECT {values} WHERE {guard};"
+
+
+def _table_sources(table: str) -> list[tuple[str, str, str | None]]:
+    return [
+        (kind, key, cond) for source, kind, key, cond in PROJECT_STAT_SOURCES if source == table
+    ]
+
+
+def project_stat_trigger_statements(dialect_name: str) -> list[str]:
+    """Return the DDL statements that install the project_stat triggers."""
+    statements: list[str] = []
+    for table, columns in PROJECT_STAT_TRACKED_COLUMNS.items():
+        sources = _table_sources(table)
+        added = "\n".join(_delta_insert(k, key, c, "NEW", 1) for k, key, c in sources)
+        removed = "\n".join(_delta_insert(k, key, c, "OLD", -1) for k, key, c in sources)
+        changed = " OR ".join(f"OLD.{column} IS DISTINCT FROM NEW.{column}" for column in columns)
+
+        if dialect_name == "postgresql":
+            statements.extend(
+                [
+                    f"CREATE OR REPLACE FUNCTION project_stat_{table}() RETURNS trigger "
+                    f"LANGUAGE plpgsql AS $$\nBEGIN\n"
+                    f"IF TG_OP <> 'INSERT' THEN\n{removed}\nEND IF;\n"
+                    f"IF TG_OP <> 'DELETE' THEN\n{added}\nEND IF;\n"
+                    f"RETURN NULL;\nEND\n$$",
+                    f"DROP TRIGGER IF EXISTS project_stat_{table}_write ON {table}",
+                    f"CREATE TRIGGER project_stat_{table}_write AFTER INSERT OR DELETE ON {table} "
+                    f"FOR EACH ROW EXECUTE FUNCTION project_stat_{table}()",
+                    f"DROP TRIGGER IF EXISTS project_stat_{table}_update ON {table}",
+                    f"CREATE TRIGGER project_stat_{table}_update "
+                    f"AFTER UPDATE OF {', '.join(columns)} ON {table} "
+                    f"FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION project_stat_{table}()",
+                ]
+            )
+            continue
+
+        # SQLite has no IS DISTINCT FROM; IS NOT is its null-safe inequality.
+        changed = changed.replace("IS DISTINCT FROM", "IS NOT")
+        statements.extend(
+            [
+                f"CREATE TRIGGER IF NOT EXISTS project_stat_{table}_insert "
+                f"AFTER INSERT ON {table}\nBEGIN\n{added}\nEND",
+                f"CREATE TRIGGER IF NOT EXISTS project_stat_{table}_delete "
+                f"AFTER DELETE ON {table}\nBEGIN\n{removed}\nEND",
+                f"CREATE TRIGGER IF NOT EXISTS project_stat_{table}_update "
+                f"AFTER UPDATE OF {', '.join(columns)} ON {table} WHEN {changed}\n"
+                f"BEGIN\n{removed}\n{added}\nEND",
+            ]
+        )
+    return statements
+
+
+install_on_create_all(project_stat_trigger_statements)
@@ -93,6 +93,49 @@ CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
 );
 """)
 
+# Regular-table companion to the SQLite FTS5 search_index, keyed by its rowid.
+# FTS5 can only index MATCH terms, so exact filters on permalink, type,
+# entity_id, note_type, or dates scan every FTS row; these B-tree indexes answer
+# them instead. note_type is stored lowercased and timestamps normalized with
+# datetime() so the query builder can compare them without per-row functions.
+# SQLiteSearchRepository keeps it in step with every search_index write.
+CREATE_SEARCH_INDEX_LOOKUP = DDL("""
+CREATE TABLE IF NOT EXISTS search_index_lookup (
+    rowid INTEGER PRIMARY KEY,
+    project_id INTEGER NOT NULL,
+    type TEXT,
+    id INTEGER,
+    entity_id INTEGER,
+    permalink TEXT,
+    note_type TEXT,
+    created_at TEXT,
+    updated_at TEXT
+)
+""")
+
+CREATE_SEARCH_INDEX_LOOKUP_INDEXES = (
+    DDL("""
+CREATE INDEX IF NOT EXISTS idx_search_index_lookup_permalink
+ON search_index_lookup (project_id, permalink)
+"""),
+    DDL("""
+CREATE INDEX IF NOT EXISTS idx_search_index_lookup_entity
+ON search_index_lookup (project_id, entity_id)
+"""),
+    DDL("""
+CREATE INDEX IF NOT EXISTS idx_search_index_lookup_type
+ON search_index_lookup (project_id, type, id)
+"""),
+    DDL("""
+CREATE INDEX IF NOT EXISTS idx_search_index_lookup_note_type
+ON search_index_lookup (project_id, note_type)
+"""),
+    DDL("""
+CREATE INDEX IF NOT EXISTS idx_search_index_lookup_updated_at
+ON search_index_lookup (project_id, updated_at)
+"""),
+)
+
 # Postgres semantic chunk metadata table.
 # Matches the Alembic migration (h1b2c3d4e5f6) schema.
 # Used by tests to create the table without running full migrations.
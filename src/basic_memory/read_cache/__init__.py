@@ -17,9 +17,11 @@ from basic_memory.read_cache.invalidation import (
     invalidate_project_read_cache,
 )
 from basic_memory.read_cache.keys import read_cache_request_digest
+from basic_memory.read_cache.memory import InMemoryReadCache
 from basic_memory.read_cache.read_through import ModelReadCache, ReadCacheScope
 
 __all__ = [
+    "InMemoryReadCache",
     "ModelReadCache",
     "ReadCache",
     "ReadCacheDataError",
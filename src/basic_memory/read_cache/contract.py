@@ -1,8 +1,8 @@
 """Portable contract for best-effort semantic read caching."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 from uuid import UUID
 
 
@@ -74,6 +74,8 @@ class ReadCacheLookup:
     generation: str
     payload: bytes | None = None
     remaining_ttl_seconds: float | None = None
+    # Model an in-process backend already validated from ``payload``; shared, never mutated.
+    decoded: object | None = field(default=None, compare=False, repr=False)
 
     def __post_init__(self) -> None:
         if not self.generation:
@@ -116,3 +118,11 @@ class ReadCache(ReadCacheInvalidator, Protocol):
         ttl_seconds: int,
     ) -> ReadCacheStoreStatus:
         """Store a payload under the generation observed by ``lookup``."""
+
+
+@runtime_checkable
+class DecodedReadCache(Protocol):
+    """In-process backend that can keep validated models beside their payloads."""
+
+    def remember_decoded(self, key: ReadCacheKey, generation: str, value: object) -> None:
+        """Attach ``value`` to the entry stored under ``generation``, if still present."""
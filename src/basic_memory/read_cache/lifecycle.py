@@ -1,4 +1,4 @@
-"""Lifecycle helpers for the optional standalone Redis read cache."""
+"""Lifecycle helpers for the optional standalone read caches."""
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 from loguru import logger
 
 from basic_memory.read_cache.contract import ReadCache
+from basic_memory.read_cache.memory import InMemoryReadCache
 
 
 STANDALONE_CACHE_NAMESPACE = "standalone"
@@ -44,3 +45,27 @@ async def open_redis_read_cache(
         yield RedisReadCache(client=client, namespace=STANDALONE_CACHE_NAMESPACE)
     finally:
         await client.aclose()
+
+
+def layer_memory_read_cache(
+    read_cache: ReadCache | None,
+    *,
+    max_entries: int,
+    max_bytes: int,
+    layered_ttl_seconds: float,
+) -> ReadCache | None:
+    """Put an in-process cache in front of ``read_cache``, or use it standalone."""
+    if max_entries <= 0:
+        return read_cache
+
+    logger.info(
+        "In-process read cache enabled",
+        max_entries=max_entries,
+        layered=read_cache is not None,
+    )
+    return InMemoryReadCache(
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        upstream=read_cache,
+        max_ttl_seconds=None if read_cache is None else layered_ttl_seconds,
+    )
@@ -0,0 +1,210 @@
+"""In-process implementation of Basic Memory semantic read caching.
+
+The cache runs standalone for local and single-node deployments, or layered in
+front of another ``ReadCache`` (normally Redis) as a per-process L1 tier.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from uuid import uuid4
+
+from basic_memory.read_cache.contract import (
+    ReadCache,
+    ReadCacheDataError,
+    ReadCacheInvalidationStatus,
+    ReadCacheKey,
+    ReadCacheLookup,
+    ReadCacheStoreStatus,
+    canonical_read_cache_project_id,
+)
+from basic_memory.read_cache.read_through import record_read_cache_event
+
+_DEFAULT_MAX_ENTRIES = 1024
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_LAYERED_GENERATION_SEPARATOR = ":"
+
+
+@dataclass(frozen=True, slots=True)
+class _MemoryEntry:
+    generation: str
+    payload: bytes
+    expires_at: float
+    decoded: object | None = None
+
+
+def _split_generation(generation: str) -> tuple[str, str | None]:
+    """Split a lookup generation into its local and optional upstream tokens."""
+    local_generation, separator, upstream_generation = generation.partition(
+        _LAYERED_GENERATION_SEPARATOR
+    )
+    if not separator:
+        return local_generation, None
+    return local_generation, upstream_generation
+
+
+class InMemoryReadCache:
+    """Size-bounded LRU cache with process-local project generations.
+
+    Standalone, this cache owns every project generation, so ``invalidate_project``
+    is authoritative for the process. Layered over an ``upstream`` cache, hits are
+    answered without a round trip and misses fall through to the upstream lookup.
+    Other nodes can only invalidate through the upstream cache, so layered entries
+    live at most ``max_ttl_seconds`` before the upstream generation is re-checked.
+
+    Entries also keep the model ``ModelReadCache`` validated from their payload, so
+    repeat hits skip JSON parsing and validation. Byte bounds count payloads only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        upstream: ReadCache | None = None,
+        max_ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("read-cache max_entries must be positive")
+        if max_bytes <= 0:
+            raise ValueError("read-cache max_bytes must be positive")
+        if max_ttl_seconds is not None and max_ttl_seconds <= 0:
+            raise ValueError("read-cache max_ttl_seconds must be positive")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._upstream = upstream
+        self._max_ttl_seconds = max_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[ReadCacheKey, _MemoryEntry] = OrderedDict()
+        self._entry_bytes = 0
+        self._generations: dict[str, str] = {}
+
+    def _project_generation(self, project_id: str) -> str:
+        return self._generations.setdefault(project_id, uuid4().hex)
+
+    def _discard(self, key: ReadCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._entry_bytes -= len(entry.payload)
+
+    def _remember(
+        self,
+        key: ReadCacheKey,
+        generation: str,
+        payload: bytes,
+        ttl_seconds: float | None,
+    ) -> None:
+        local_generation, _ = _split_generation(generation)
+        if local_generation != self._generations.get(key.project_id):
+            # Trigger: this process invalidated the project while the read was in flight.
+            # Outcome: drop the value so a stale payload never lands under the new generation.
+            return
+        if self._max_ttl_seconds is not None:
+            ttl_seconds = (
+                self._max_ttl_seconds
+                if ttl_seconds is None
+                else min(ttl_seconds, self._max_ttl_seconds)
+            )
+        if ttl_seconds is None or ttl_seconds <= 0 or len(payload) > self._max_bytes:
+            return
+
+        self._discard(key)
+        self._entries[key] = _MemoryEntry(
+            generation=generation,
+            payload=payload,
+            expires_at=self._clock() + ttl_seconds,
+        )
+        self._entry_bytes += len(payload)
+        while len(self._entries) > self._max_entries or self._entry_bytes > self._max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._entry_bytes -= len(evicted.payload)
+            record_read_cache_event(evicted_key, "l1_evict")
+
+    async def lookup(self, key: ReadCacheKey) -> ReadCacheLookup:
+        local_generation = self._project_generation(key.project_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            remaining_ttl_seconds = entry.expires_at - self._clock()
+            entry_generation, _ = _split_generation(entry.generation)
+            if remaining_ttl_seconds > 0 and entry_generation == local_generation:
+                self._entries.move_to_end(key)
+                record_read_cache_event(key, "l1_hit")
+                return ReadCacheLookup(
+                    generation=entry.generation,
+                    payload=entry.payload,
+                    remaining_ttl_seconds=remaining_ttl_seconds,
+                    decoded=entry.decoded,
+                )
+            self._discard(key)
+
+        record_read_cache_event(key, "l1_miss")
+        if self._upstream is None:
+            return ReadCacheLookup(generation=local_generation)
+
+        upstream_lookup = await self._upstream.lookup(key)
+        generation = (
+            f"{local_generation}{_LAYERED_GENERATION_SEPARATOR}{upstream_lookup.generation}"
+        )
+        if upstream_lookup.payload is not None:
+            self._remember(
+                key,
+                generation,
+                upstream_lookup.payload,
+                upstream_lookup.remaining_ttl_seconds,
+            )
+        return ReadCacheLookup(
+            generation=generation,
+            payload=upstream_lookup.payload,
+            remaining_ttl_seconds=upstream_lookup.remaining_ttl_seconds,
+        )
+
+    def remember_decoded(self, key: ReadCacheKey, generation: str, value: object) -> None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.generation == generation:
+            # Reassigning an existing key keeps its LRU position.
+            self._entries[key] = replace(entry, decoded=value)
+
+    async def store(
+        self,
+        key: ReadCacheKey,
+        lookup: ReadCacheLookup,
+        payload: bytes,
+        *,
+        ttl_seconds: int,
+    ) -> ReadCacheStoreStatus:
+        if ttl_seconds <= 0:
+            raise ValueError("read-cache ttl_seconds must be positive")
+
+        local_generation, upstream_generation = _split_generation(lookup.generation)
+        if self._upstream is not None:
+            if upstream_generation is None:
+                raise ReadCacheDataError("In-memory cache lookup has no upstream generation")
+            status = await self._upstream.store(
+                key,
+                ReadCacheLookup(generation=upstream_generation),
+                payload,
+                ttl_seconds=ttl_seconds,
+            )
+            if status is not ReadCacheStoreStatus.stored:
+                return status
+        elif upstream_generation is not None:
+            raise ReadCacheDataError("In-memory cache lookup has an unexpected generation")
+
+        if local_generation != self._generations.get(key.project_id):
+            return ReadCacheStoreStatus.superseded
+        self._remember(key, lookup.generation, payload, ttl_seconds)
+        return ReadCacheStoreStatus.stored
+
+    async def invalidate_project(self, project_id: str) -> ReadCacheInvalidationStatus:
+        project_id = canonical_read_cache_project_id(project_id)
+        # Bump the local generation first so this process stops serving the project
+        # even when the upstream invalidation below is unavailable.
+        self._generations[project_id] = uuid4().hex
+        for key in [key for key in self._entries if key.project_id == project_id]:
+            self._discard(key)
+
+        if self._upstream is None:
+            return ReadCacheInvalidationStatus.invalidated
+        return await self._upstream.invalidate_project(project_id)
@@ -9,15 +9,18 @@ import logfire
 from pydantic import BaseModel, ValidationError
 
 from basic_memory.read_cache.contract import (
+    DecodedReadCache,
     ReadCache,
     ReadCacheDataError,
     ReadCacheInvalidationStatus,
     ReadCacheKey,
+    ReadCacheStoreStatus,
     ReadCacheUnavailable,
 )
 
 
-def _record_event(key: ReadCacheKey, event: str) -> None:
+def record_read_cache_event(key: ReadCacheKey, event: str) -> None:
+    """Count one cache event on the shared read-cache metric."""
     logfire.metric_counter("basic_memory_read_cache_events_total").add(
         1,
         attributes={
@@ -65,6 +68,15 @@ class ModelReadCache[ModelT: BaseModel]:
         """Delegate invalidation without exposing the backend to API routes."""
         return await self.backend.invalidate_project(project_id)
 
+    def _remember_decoded(self, key: ReadCacheKey, generation: str, value: ModelT) -> None:
+        """Let an in-process backend serve later hits without re-validating JSON.
+
+        Routes return cached values without mutating them, so hits can share one
+        validated instance.
+        """
+        if isinstance(self.backend, DecodedReadCache):
+            self.backend.remember_decoded(key, generation, value)
+
     @asynccontextmanager
     async def read(
         self,
@@ -90,7 +102,7 @@ class ModelReadCache[ModelT: BaseModel]:
                 # Trigger: Redis is unreachable or timed out.
                 # Why: the database or storage path remains authoritative.
                 # Outcome: return fresh data without attempting another cache operation.
-                _record_event(key, "bypass")
+                record_read_cache_event(key, "bypass")
                 span.set_attribute("cache.lookup.outcome", "unavailable")
                 result = ReadCacheScope[ModelT]()
                 yield result
@@ -101,7 +113,7 @@ class ModelReadCache[ModelT: BaseModel]:
                 # Why: corruption must remain fail-fast, but the span still needs a bounded
                 # terminal outcome instead of retaining its initialization sentinel.
                 # Outcome: report corruption and preserve the original exception for the caller.
-                _record_event(key, "corrupt")
+                record_read_cache_event(key, "corrupt")
                 span.set_attribute("cache.lookup.outcome", "corrupt")
                 raise
 
@@ -113,19 +125,25 @@ class ModelReadCache[ModelT: BaseModel]:
                 lookup_attributes["cache.payload_bytes"] = len(lookup.payload)
                 if lookup.remaining_ttl_seconds is not None:
                     lookup_attributes["cache.remaining_ttl_seconds"] = lookup.remaining_ttl_seconds
-                try:
-                    cached_value = self.model_type.model_validate_json(lookup.payload)
-                except ValidationError:
-                    # Trigger: the cache envelope is valid but its typed response payload is not.
-                    # Why: treating invalid data as a hit hides corruption and leaves misleading
-                    # telemetry, while falling back would weaken the fail-fast contract.
-                    # Outcome: mark the lookup corrupt and re-raise the validation error unchanged.
-                    lookup_attributes["cache.lookup.outcome"] = "corrupt"
-                    _record_event(key, "corrupt")
-                    span.set_attributes(lookup_attributes)
-                    raise
-
-                _record_event(key, "hit")
+                cached_value = lookup.decoded
+                if not isinstance(cached_value, self.model_type):
+                    try:
+                        cached_value = self.model_type.model_validate_json(lookup.payload)
+                    except ValidationError:
+                        # Trigger: the cache envelope is valid but its typed response payload
+                        # is not.
+                        # Why: treating invalid data as a hit hides corruption and leaves
+                        # misleading telemetry, while falling back would weaken the fail-fast
+                        # contract.
+                        # Outcome: mark the lookup corrupt and re-raise the validation error
+                        # unchanged.
+                        lookup_attributes["cache.lookup.outcome"] = "corrupt"
+                        record_read_cache_event(key, "corrupt")
+                        span.set_attributes(lookup_attributes)
+                        raise
+                    self._remember_decoded(key, lookup.generation, cached_value)
+
+                record_read_cache_event(key, "hit")
                 span.set_attributes(lookup_attributes)
                 yield ReadCacheScope(
                     value=cached_value,
@@ -133,19 +151,19 @@ class ModelReadCache[ModelT: BaseModel]:
                 )
                 return
 
-            _record_event(key, "miss")
+            record_read_cache_event(key, "miss")
             span.set_attributes(lookup_attributes)
             result = ReadCacheScope[ModelT]()
             yield result
             value = result.require_value()
             if not result.cacheable:
-                _record_event(key, "ineligible")
+                record_read_cache_event(key, "ineligible")
                 span.set_attribute("cache.store.outcome", "ineligible")
                 return
 
             payload = value.model_dump_json().encode("utf-8")
             if len(payload) > self.max_payload_bytes:
-                _record_event(key, "oversize")
+                record_read_cache_event(key, "oversize")
                 span.set_attributes(
                     {
                         "cache.store.outcome": "oversize",
@@ -162,7 +180,7 @@ class ModelReadCache[ModelT: BaseModel]:
                     ttl_seconds=self.ttl_seconds,
                 )
             except ReadCacheUnavailable:
-                _record_event(key, "store_unavailable")
+                record_read_cache_event(key, "store_unavailable")
                 span.set_attribute("cache.store.outcome", "unavailable")
                 return
             except ReadCacheDataError:
@@ -170,7 +188,7 @@ class ModelReadCache[ModelT: BaseModel]:
                 # Why: a Lua contract violation is corruption, not an availability failure;
                 # swallowing it would conceal a broken cache implementation contract.
                 # Outcome: preserve the miss, terminate the store outcome, and fail fast.
-                _record_event(key, "store_corrupt")
+                record_read_cache_event(key, "store_corrupt")
                 span.set_attributes(
                     {
                         "cache.store.outcome": "corrupt",
@@ -179,7 +197,9 @@ class ModelReadCache[ModelT: BaseModel]:
                 )
                 raise
 
-            _record_event(key, store_status.value)
+            if store_status is ReadCacheStoreStatus.stored:
+                self._remember_decoded(key, lookup.generation, value)
+            record_read_cache_event(key, store_status.value)
             span.set_attributes(
                 {
                     "cache.store.outcome": store_status.value,
@@ -13,6 +13,8 @@ from basic_memory.repository.accepted_note_vector_cleanup import (
     ProjectIndexExternalVectorCleaner,
     delete_project_index_vector_rows,
 )
+from basic_memory.repository.search_index_lookup import mirror_search_index_inserts
+from basic_memory.repository.search_index_row import sqlite_fts_content_stems
 
 type SearchIndexSqlValue = str | int | datetime | None
 type SearchIndexSqlParams = dict[str, SearchIndexSqlValue]
@@ -25,6 +27,13 @@ DELETE_ACCEPTED_NOTE_SEARCH_SQL = text(
     """
 )
 
+DELETE_ACCEPTED_NOTE_SEARCH_LOOKUP_SQL = text(
+    """
+    DELETE FROM search_index_lookup
+    WHERE entity_id = :entity_id AND project_id = :project_id
+    """
+)
+
 INSERT_ACCEPTED_NOTE_SEARCH_SQL = text(
     """
     INSERT INTO search_index (
@@ -130,14 +139,16 @@ class AcceptedNoteSearchRepository:
                 f"does not match repository project_id {self.project_id}"
             )
 
-        await session.execute(
-            DELETE_ACCEPTED_NOTE_SEARCH_SQL,
-            {"entity_id": row.entity_id, "project_id": row.project_id},
-        )
-        await session.execute(
-            accepted_note_search_insert_statement(session),
-            accepted_note_search_insert_params(row),
-        )
+        await self.delete_entity(session, row.entity_id)
+        params = accepted_note_search_insert_params(row)
+        if session.get_bind().dialect.name != "sqlite":
+            await session.execute(UPSERT_ACCEPTED_NOTE_SEARCH_SQL, params)
+            return
+
+        # SQLite FTS5 already indexes the body via content_snippet.
+        params["content_stems"] = sqlite_fts_content_stems(row.content_stems, row.content_snippet)
+        await session.execute(INSERT_ACCEPTED_NOTE_SEARCH_SQL, params)
+        await mirror_search_index_inserts(session, 1)
 
     async def delete_entity(
         self,
@@ -145,10 +156,10 @@ class AcceptedNoteSearchRepository:
         entity_id: int,
     ) -> None:
         """Delete all accepted-note search rows for one entity."""
-        await session.execute(
-            DELETE_ACCEPTED_NOTE_SEARCH_SQL,
-            {"entity_id": entity_id, "project_id": self.project_id},
-        )
+        params = {"entity_id": entity_id, "project_id": self.project_id}
+        await session.execute(DELETE_ACCEPTED_NOTE_SEARCH_SQL, params)
+        if session.get_bind().dialect.name == "sqlite":
+            await session.execute(DELETE_ACCEPTED_NOTE_SEARCH_LOOKUP_SQL, params)
 
     async def delete_entity_vectors(
         self,
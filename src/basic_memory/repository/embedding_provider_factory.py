@@ -14,6 +14,7 @@ from basic_memory.repository.prefixing_provider import (
     normalize_embedding_prefix,
     prefixing_embedding_identity,
 )
+from basic_memory.repository.query_caching_provider import QueryCachingEmbeddingProvider
 from typing import Any
 
 # Cache key fields are limited to values that change the *identity* of the loaded
@@ -23,7 +24,8 @@ from typing import Any
 # they change ONNX *execution* only, not the loaded weights. Including them caused #872: in a
 # container/cgroup the CPU-derived thread count can drift between calls, producing
 # a fresh cache key and reloading the ~2.3GB model into a CPU arena that never
-# returns memory to the OS.
+# returns memory to the OS. Query-embedding cache sizing is excluded for the same
+# reason: resizing a memo must not reload the model; the first configured size wins.
 type ProviderCacheKey = tuple[
     str,
     str,
@@ -308,6 +310,19 @@ def create_embedding_provider(app_config: BasicMemoryConfig) -> EmbeddingProvide
             query_prefix=query_prefix,
         )
 
+    # Trigger: agents repeat the same searches across search_notes, build_context
+    # and reranked hybrid retrieval.
+    # Why: every repeat re-ran the model (or a paid API request) for a vector we
+    # already computed in this process.
+    # Outcome: the outermost layer memoizes query vectors; it is identity-transparent,
+    # so toggling it never invalidates stored document vectors.
+    if app_config.semantic_query_embedding_cache_size > 0:
+        provider = QueryCachingEmbeddingProvider(
+            provider,
+            max_entries=app_config.semantic_query_embedding_cache_size,
+            max_bytes=app_config.semantic_query_embedding_cache_max_bytes,
+        )
+
     with _EMBEDDING_PROVIDER_CACHE_LOCK:
         if cached_provider := _EMBEDDING_PROVIDER_CACHE.get(cache_key):
             return cached_provider
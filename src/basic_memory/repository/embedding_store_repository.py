@@ -0,0 +1,375 @@
+"""Repository for the content-addressed embedding store.
+
+The store maps ``(provider identity, sha256 of chunk text)`` to the vector the
+provider returned for that text. It is deliberately global rather than
+project-scoped: the same chunk embedded by the same provider is the same vector
+in every project sharing the database.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from array import array
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from basic_memory import db
+from basic_memory.config import BasicMemoryConfig
+from basic_memory.models.embedding_store import EmbeddingStoreEntry
+
+# Keeps IN (...) lists and multi-row inserts under SQLite's historical limit of
+# 999 bound parameters (a store row binds seven, a composite key two).
+_KEY_CHUNK_SIZE = 400
+_ROW_CHUNK_SIZE = 100
+
+# Recency is kept to this resolution: a hit rewrites last_used_at only when the
+# stored value is older, so repeated reads of a warm store issue no writes.
+_RECENCY_RESOLUTION = timedelta(hours=1)
+
+# The running byte total is re-read from the table after this share of the
+# budget has been written, bounding drift from other writers of the same store.
+_TOTAL_RESYNC_FRACTION = 16
+
+
+def embedding_content_hash(text: str) -> str:
+    """Return the content address for one chunk text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _pack_vector(vector: list[float]) -> bytes:
+    # array('d') keeps float64 values bit-identical to the provider output, so a
+    # stored vector persists exactly like a freshly embedded one.
+    return array("d", vector).tobytes()
+
+
+def _unpack_vector(blob: bytes) -> list[float]:
+    packed = array("d")
+    packed.frombytes(blob)
+    return packed.tolist()
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingStoreProviderStats:
+    """Occupancy of the store for one provider identity."""
+
+    provider_identity: str
+    entries: int
+    bytes: int
+    last_used_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingStoreStats:
+    """Point-in-time occupancy of the whole embedding store."""
+
+    entries: int
+    bytes: int
+    providers: list[EmbeddingStoreProviderStats]
+
+
+class EmbeddingStoreRepository:
+    """Read, write, and evict content-addressed document embeddings.
+
+    Args:
+        session_maker: Session factory for the database holding the store.
+        max_bytes: Vector-byte budget enforced after each write by evicting the
+            least recently used entries. None leaves the store unbounded.
+
+    The budget check uses a running byte total instead of summing the table on
+    every write. The exact total is read when the running one is unknown, looks
+    over budget, or has absorbed 1/16 of the budget in writes since the last
+    read, which also picks up writes from other processes and projects.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        max_bytes: int | None = None,
+    ) -> None:
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.session_maker = session_maker
+        self.max_bytes = max_bytes
+        self._stored_bytes: int | None = None
+        self._bytes_since_sync = 0
+
+    async def get_many(
+        self,
+        provider_identity: str,
+        content_hashes: Collection[str],
+        *,
+        dimensions: int,
+    ) -> dict[str, list[float]]:
+        """Return stored vectors by content hash and mark them recently used.
+
+        Entries whose dimensions no longer match the provider are treated as
+        missing; the next write for that hash replaces them. Only entries whose
+        last use is older than an hour are re-stamped.
+        """
+        hashes = list(dict.fromkeys(content_hashes))
+        if not hashes:
+            return {}
+
+        now = datetime.now(timezone.utc)
+        stale_before = now - _RECENCY_RESOLUTION
+        found: dict[str, list[float]] = {}
+        stale_hashes: list[str] = []
+        async with db.scoped_session(self.session_maker) as session:
+            for start in range(0, len(hashes), _KEY_CHUNK_SIZE):
+                chunk = hashes[start : start + _KEY_CHUNK_SIZE]
+                result = await session.execute(
+                    select(
+                        EmbeddingStoreEntry.content_hash,
+                        EmbeddingStoreEntry.vector,
+                        EmbeddingStoreEntry.last_used_at,
+                    ).where(
+                        EmbeddingStoreEntry.provider_identity == provider_identity,
+                        EmbeddingStoreEntry.content_hash.in_(chunk),
+                        EmbeddingStoreEntry.dimensions == dimensions,
+                    )
+                )
+                for content_hash, blob, last_used_at in result.all():
+                    found[content_hash] = _unpack_vector(blob)
+                    if _as_utc(last_used_at) < stale_before:
+                        stale_hashes.append(content_hash)
+
+            for start in range(0, len(stale_hashes), _KEY_CHUNK_SIZE):
+                await session.execute(
+                    update(EmbeddingStoreEntry)
+                    .where(
+                        EmbeddingStoreEntry.provider_identity == provider_identity,
+                        EmbeddingStoreEntry.content_hash.in_(
+                            stale_hashes[start : start + _KEY_CHUNK_SIZE]
+                        ),
+                    )
+                    .values(last_used_at=now)
+                )
+        return found
+
+    async def put_many(
+        self,
+        provider_identity: str,
+        vectors: Mapping[str, list[float]],
+    ) -> None:
+        """Store freshly embedded vectors by content hash, then enforce the budget."""
+        if not vectors:
+            return
+
+        now = datetime.now(timezone.utc)
+        rows = []
+        for content_hash, vector in vectors.items():
+            blob = _pack_vector(vector)
+            rows.append(
+                {
+                    "provider_identity": provider_identity,
+                    "content_hash": content_hash,
+                    "dimensions": len(vector),
+                    "vector": blob,
+                    "byte_size": len(blob),
+                    "created_at": now,
+                    "last_used_at": now,
+                }
+            )
+
+        added_bytes = 0
+        async with db.scoped_session(self.session_maker) as session:
+            insert = _dialect_insert(session)
+            for start in range(0, len(rows), _ROW_CHUNK_SIZE):
+                chunk = rows[start : start + _ROW_CHUNK_SIZE]
+                # Bytes of rows this chunk replaces, so the running total stays exact.
+                replaced = await session.scalar(
+                    select(func.coalesce(func.sum(EmbeddingStoreEntry.byte_size), 0)).where(
+                        EmbeddingStoreEntry.provider_identity == provider_identity,
+                        EmbeddingStoreEntry.content_hash.in_(
+                            [row["content_hash"] for row in chunk]
+                        ),
+                    )
+                )
+                chunk_bytes = sum(cast(int, row["byte_size"]) for row in chunk)
+                added_bytes += chunk_bytes - int(replaced or 0)
+                statement = insert(EmbeddingStoreEntry).values(chunk)
+                # Trigger: two projects (or a retry) can embed the same text at once.
+                # Why: the vectors are interchangeable, but a stale-dimension row
+                #   must not keep shadowing the new provider output.
+                # Outcome: the latest write wins and the key stays unique.
+                await session.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=[
+                            EmbeddingStoreEntry.provider_identity,
+                            EmbeddingStoreEntry.content_hash,
+                        ],
+                        set_={
+                            "dimensions": statement.excluded.dimensions,
+                            "vector": statement.excluded.vector,
+                            "byte_size": statement.excluded.byte_size,
+                            "last_used_at": statement.excluded.last_used_at,
+                        },
+                    )
+                )
+            if self._stored_bytes is not None:
+                self._stored_bytes += added_bytes
+            self._bytes_since_sync += max(added_bytes, 0)
+            if self.max_bytes is not None:
+                await self._evict_to_budget(session, self.max_bytes)
+
+    async def stats(self) -> EmbeddingStoreStats:
+        """Return entry and byte totals, overall and per provider identity."""
+        async with db.scoped_session(self.session_maker) as session:
+            result = await session.execute(
+                select(
+                    EmbeddingStoreEntry.provider_identity,
+                    func.count(),
+                    func.coalesce(func.sum(EmbeddingStoreEntry.byte_size), 0),
+                    func.max(EmbeddingStoreEntry.last_used_at),
+                )
+                .group_by(EmbeddingStoreEntry.provider_identity)
+                .order_by(EmbeddingStoreEntry.provider_identity)
+            )
+            providers = [
+                EmbeddingStoreProviderStats(
+                    provider_identity=identity,
+                    entries=int(entries),
+                    bytes=int(total_bytes),
+                    last_used_at=last_used_at,
+                )
+                for identity, entries, total_bytes, last_used_at in result.all()
+            ]
+        return EmbeddingStoreStats(
+            entries=sum(provider.entries for provider in providers),
+            bytes=sum(provider.bytes for provider in providers),
+            providers=providers,
+        )
+
+    async def prune(
+        self,
+        *,
+        max_bytes: int | None = None,
+        unused_since: datetime | None = None,
+        provider_identity: str | None = None,
+    ) -> int:
+        """Delete entries and return how many were removed.
+
+        Args:
+            max_bytes: Evict least recently used entries until the store fits.
+            unused_since: Delete entries not used at or after this time.
+            provider_identity: Delete every entry for this provider identity.
+
+        With no arguments every entry is removed.
+        """
+        # Deletes below bypass the running total; the next budget check re-reads it.
+        self._stored_bytes = None
+        async with db.scoped_session(self.session_maker) as session:
+            if max_bytes is None and unused_since is None and provider_identity is None:
+                result = cast(CursorResult[Any], await session.execute(delete(EmbeddingStoreEntry)))
+                return result.rowcount or 0
+
+            removed = 0
+            if provider_identity is not None:
+                result = cast(
+                    CursorResult[Any],
+                    await session.execute(
+                        delete(EmbeddingStoreEntry).where(
+                            EmbeddingStoreEntry.provider_identity == provider_identity
+                        )
+                    ),
+                )
+                removed += result.rowcount or 0
+            if unused_since is not None:
+                result = cast(
+                    CursorResult[Any],
+                    await session.execute(
+                        delete(EmbeddingStoreEntry).where(
+                            EmbeddingStoreEntry.last_used_at < unused_since
+                        )
+                    ),
+                )
+                removed += result.rowcount or 0
+            if max_bytes is not None:
+                removed += await self._evict_to_budget(session, max_bytes)
+            return removed
+
+    async def _evict_to_budget(self, session: AsyncSession, max_bytes: int) -> int:
+        """Delete least recently used entries until stored vectors fit max_bytes."""
+        total = self._stored_bytes
+        if (
+            total is None
+            or total > max_bytes
+            or self._bytes_since_sync * _TOTAL_RESYNC_FRACTION >= max_bytes
+        ):
+            total = int(
+                await session.scalar(
+                    select(func.coalesce(func.sum(EmbeddingStoreEntry.byte_size), 0))
+                )
+                or 0
+            )
+            self._bytes_since_sync = 0
+        self._stored_bytes = total
+        excess = total - max_bytes
+        if excess <= 0:
+            return 0
+
+        victims: list[tuple[str, str]] = []
+        result = await session.stream(
+            select(
+                EmbeddingStoreEntry.provider_identity,
+                EmbeddingStoreEntry.content_hash,
+                EmbeddingStoreEntry.byte_size,
+            ).order_by(EmbeddingStoreEntry.last_used_at, EmbeddingStoreEntry.content_hash)
+        )
+        freed = 0
+        async for identity, content_hash, byte_size in result:
+            victims.append((identity, content_hash))
+            freed += byte_size
+            if freed >= excess:
+                break
+        await result.close()
+        self._stored_bytes = total - freed
+
+        for start in range(0, len(victims), _KEY_CHUNK_SIZE):
+            await session.execute(
+                delete(EmbeddingStoreEntry).where(
+                    tuple_(
+                        EmbeddingStoreEntry.provider_identity,
+                        EmbeddingStoreEntry.content_hash,
+                    ).in_(victims[start : start + _KEY_CHUNK_SIZE])
+                )
+            )
+        return len(victims)
+
+
+def create_embedding_store(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_config: BasicMemoryConfig,
+) -> EmbeddingStoreRepository | None:
+    """Return the configured embedding store, or None when reuse is disabled."""
+    if not app_config.semantic_embedding_store_enabled:
+        return None
+    return EmbeddingStoreRepository(
+        session_maker,
+        max_bytes=app_config.semantic_embedding_store_max_bytes,
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for timezone-aware columns; they were stored as UTC.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _dialect_insert(session: AsyncSession):
+    dialect_name = session.bind.dialect.name if session.bind is not None else None
+    match dialect_name:
+        case "postgresql":
+            return pg_insert
+        case "sqlite":
+            return sqlite_insert
+        case _:
+            raise ValueError(f"Unsupported database dialect for embedding store: {dialect_name}")
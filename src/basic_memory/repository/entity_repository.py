@@ -620,33 +620,75 @@ class EntityRepository(Repository[Entity]):
         return list(result.scalars().all())
 
     async def get_distinct_directories(self, session: AsyncSession) -> List[str]:
-        """Extract unique directory paths from file_path column.
+        """Extract unique directory paths from the generated directory column.
 
-        Optimized method for getting directory structure without loading full entities
-        or relationships. Returns a sorted list of unique directory paths.
+        Reads one index entry per note from (project_id, directory) instead of loading
+        and splitting every file path. Returns a sorted list of unique directory paths,
+        including folders that only contain other folders.
 
         Returns:
             List of unique directory paths (e.g., ["notes", "notes/meetings", "specs"])
         """
-        # Query only file_path column, no entity objects or relationships
-        query = select(Entity.file_path).distinct()
-        query = self._add_project_filter(query)
-
-        # Execute with use_query_options=False to skip eager loading
+        query = self.select(Entity.directory).distinct()
         result = await self.execute_query(session, query, use_query_options=False)
-        file_paths = [row for row in result.scalars().all()]
 
-        # Parse file paths to extract unique directories
         directories = set()
-        for file_path in file_paths:
-            parts = [p for p in file_path.split("/") if p]
-            # Add all parent directories (exclude filename which is the last part)
-            for i in range(len(parts) - 1):
-                dir_path = "/".join(parts[: i + 1])
-                directories.add(dir_path)
+        for directory in result.scalars().all():
+            parts = [p for p in directory.split("/") if p]
+            # Add the directory and every ancestor of it
+            for i in range(len(parts)):
+                directories.add("/".join(parts[: i + 1]))
 
         return sorted(directories)
 
+    async def find_by_directory(self, session: AsyncSession, directory: str) -> Sequence[Entity]:
+        """Find entities whose file sits directly in ``directory``, not in a subfolder.
+
+        Args:
+            directory: Directory key with a trailing slash (e.g., "docs/guides/"),
+                or "" for the project root
+
+        Returns:
+            Sequence of entities in exactly that directory
+        """
+        query = self.select().where(Entity.directory == directory)
+        result = await self.execute_query(session, query, use_query_options=False)
+        return list(result.scalars().all())
+
+    async def find_child_directories(self, session: AsyncSession, directory: str) -> List[str]:
+        """Return the immediate subdirectories of ``directory`` as directory keys.
+
+        Skip-scans the (project_id, directory) index: each query seeks to the first
+        directory past the previous child's subtree, so the cost is one index seek per
+        child no matter how many notes live below it.
+
+        Args:
+            directory: Directory key with a trailing slash, or "" for the project root
+
+        Returns:
+            Sorted child directory keys (e.g., ["docs/api/", "docs/guides/"])
+        """
+        children: List[str] = []
+        # "0" is the character after "/", so "<dir>0" bounds every key under "<dir>/".
+        subtree_end = f"{directory[:-1]}0" if directory else None
+        after = directory
+        while True:
+            query = (
+                self.select(Entity.directory)
+                .where(Entity.directory > after)
+                .order_by(Entity.directory)
+                .limit(1)
+            )
+            if subtree_end is not None:
+                query = query.where(Entity.directory < subtree_end)
+            result = await self.execute_query(session, query, use_query_options=False)
+            found = result.scalar_one_or_none()
+            if found is None:
+                return children
+            name = found[len(directory) :].split("/", 1)[0]
+            children.append(f"{directory}{name}/")
+            after = f"{directory}{name}0"
+
     async def find_by_directory_prefix(
         self, session: AsyncSession, directory_prefix: str
     ) -> Sequence[Entity]:
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import math
 import shutil
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
@@ -294,30 +293,38 @@ class FastEmbedEmbeddingProvider:
         )
 
         def _embed_batch() -> list[list[float]]:
+            # Deferred import: numpy ships with fastembed, which is itself optional.
+            import numpy as np
+
             embed_kwargs: dict[str, int] = {"batch_size": self.batch_size}
             if effective_parallel is not None:
                 embed_kwargs["parallel"] = effective_parallel
-            vectors = list(model.embed(texts, **embed_kwargs))
+            rows = [
+                np.asarray(vector, dtype=np.float32)
+                for vector in model.embed(texts, **embed_kwargs)
+            ]
+            if not rows:
+                return []
+            for row in rows:
+                if row.shape != (self.dimensions,):
+                    raise RuntimeError(
+                        f"Embedding model returned {row.size}-dimensional vectors "
+                        f"but provider was configured for {self.dimensions} dimensions."
+                    )
             # sqlite_search_repository.py uses a distance-to-similarity formula that assumes
             # unit-normalized vectors (see the comment on line 65-67 of that file).
             # Some models (e.g. multilingual ones) return vectors with norm > 1, so we
             # L2-normalize here to satisfy that contract regardless of the chosen model.
-            normalized: list[list[float]] = []
-            for vector in vectors:
-                values = vector.tolist() if hasattr(vector, "tolist") else list(vector)
-                norm = math.sqrt(sum(x * x for x in values))
-                if norm > 0:
-                    values = [x / norm for x in values]
-                normalized.append([float(v) for v in values])
-            return normalized
-
-        vectors = await asyncio.to_thread(_embed_batch)
-        if vectors and len(vectors[0]) != self.dimensions:
-            raise RuntimeError(
-                f"Embedding model returned {len(vectors[0])}-dimensional vectors "
-                f"but provider was configured for {self.dimensions} dimensions."
-            )
-        return vectors
+            # Trigger: full reindexes embed tens of thousands of chunks.
+            # Why: a per-element Python loop per vector dominated CPU time and built
+            # several intermediate lists per chunk.
+            # Outcome: one float32 matrix, one batched in-place normalize, one tolist().
+            matrix = np.stack(rows)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+            return matrix.tolist()
+
+        return await asyncio.to_thread(_embed_batch)
 
     async def embed_query(self, text: str) -> list[float]:
         vectors = await self.embed_documents([text])
@@ -158,3 +158,76 @@ def build_sqlite_json_path(parts: List[str]) -> str:
 def build_postgres_json_path(parts: List[str]) -> str:
     """Build a Postgres JSON path for #>>/#> operators."""
     return "{" + ",".join(parts) + "}"
+
+
+def build_metadata_value_condition(
+    filt: ParsedMetadataFilter,
+    idx: int,
+    params: dict[str, Any],
+    entity_id_column: str = "entity.id",
+) -> str:
+    """Build an entity_metadata_value candidate predicate for one parsed filter.
+
+    The returned SQL restricts ``entity_id_column`` to entities whose indexed
+    values can satisfy the filter, using the (project_id, path, is_element,
+    value) indexes on either backend. It selects a superset of what the JSON
+    predicate for the same filter matches, so callers keep that predicate as
+    the exact check. Expects ``:project_id`` to be bound by the caller.
+    """
+    path_param = f"meta_index_path_{idx}"
+    params[path_param] = ".".join(filt.path_parts)
+
+    def candidates(predicate: str, *, element: bool = False) -> str:
+        element_param = f"meta_index_element_{idx}_{int(element)}"
+        params[element_param] = element
+        return (
+            f"{entity_id_column} IN (SELECT entity_id FROM entity_metadata_value "
+            f"WHERE project_id = :project_id AND path = :{path_param} "
+            f"AND is_element = :{element_param} AND {predicate})"
+        )
+
+    if filt.op in {"eq", "in"}:
+        values = [filt.value] if filt.op == "eq" else filt.value
+        placeholders = []
+        for j, value in enumerate(values):
+            value_param = f"meta_index_val_{idx}_{j}"
+            params[value_param] = value
+            placeholders.append(f":{value_param}")
+        return candidates(f"value_text IN ({', '.join(placeholders)})")
+
+    if filt.op == "contains":
+        value_conditions = []
+        for j, value in enumerate(filt.value):
+            value_param = f"meta_index_val_{idx}_{j}"
+            params[value_param] = value
+            params[f"{value_param}_like"] = f'%"{value}"%'
+            params[f"{value_param}_like_single"] = f"%'{value}'%"
+            # Trigger: the JSON predicate also LIKE-matches the whole value, which
+            # catches legacy string lists ("['a', 'b']") and nested members.
+            # Why: an element lookup alone would drop those notes.
+            # Outcome: seek matching elements, and scan the path's non-element
+            #          rows (a covering index range) for the same patterns.
+            element_match = candidates(f"value_text = :{value_param}", element=True)
+            value_match = candidates(
+                f"(value_text = :{value_param} OR value_text LIKE :{value_param}_like "
+                f"OR value_text LIKE :{value_param}_like_single)"
+            )
+            value_conditions.append(f"({element_match} OR {value_match})")
+        return " AND ".join(value_conditions)
+
+    column = "value_num" if filt.comparison == "numeric" else "value_text"
+    if filt.op == "between":
+        params[f"meta_index_val_{idx}_min"] = filt.value[0]
+        params[f"meta_index_val_{idx}_max"] = filt.value[1]
+        return candidates(
+            f"{column} BETWEEN :meta_index_val_{idx}_min AND :meta_index_val_{idx}_max"
+        )
+
+    operator = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}[filt.op]
+    params[f"meta_index_val_{idx}"] = filt.value
+    predicate = f"{column} {operator} :meta_index_val_{idx}"
+    if column == "value_text" and filt.op in {"lt", "lte"}:
+        # SQLite's json_extract returns numbers as SQL numbers, which sort below
+        # every text value; those rows store value_text NULL.
+        predicate = f"(value_text IS NULL OR {predicate})"
+    return candidates(predicate)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from array import array
 from collections.abc import Sequence
 
 from loguru import logger
@@ -37,7 +38,9 @@ class PgVectorIndex:
 
     @staticmethod
     def _format_vector(vector: Sequence[float]) -> str:
-        values = ",".join(f"{float(value):.12g}" for value in vector)
+        # pgvector stores float4, so round through float32 first: nine significant
+        # digits then round-trip exactly and the literal is a quarter shorter.
+        values = ",".join(f"{value:.9g}" for value in array("f", vector))
         return f"[{values}]"
 
     async def initialize(self) -> None:
@@ -17,8 +17,12 @@ from basic_memory import db
 from basic_memory.config import BasicMemoryConfig, ConfigManager, DatabaseBackend
 from basic_memory.repository.embedding_provider import EmbeddingProvider
 from basic_memory.repository.embedding_provider_factory import create_embedding_provider
+from basic_memory.repository.embedding_store_repository import create_embedding_store
 from basic_memory.repository.rerank_provider import RerankProvider
-from basic_memory.repository.rerank_provider_factory import create_rerank_provider
+from basic_memory.repository.rerank_provider_factory import (
+    create_rerank_provider,
+    get_rerank_score_cache,
+)
 from basic_memory.repository.search_index_row import SearchIndexRow
 from basic_memory.repository.search_query import relaxed_query_words
 from basic_memory.repository.semantic_chunking import VectorChunkRecord
@@ -30,7 +34,10 @@ from basic_memory.repository.search_trace import (
     SearchTraceCollector,
     build_fts_page_stage,
 )
-from basic_memory.repository.metadata_filters import parse_metadata_filters
+from basic_memory.repository.metadata_filters import (
+    build_metadata_value_condition,
+    parse_metadata_filters,
+)
 from basic_memory.repository.semantic_errors import SemanticDependenciesMissingError
 from basic_memory.repository.semantic_vector_index import SemanticVectorIndex
 from basic_memory.repository.semantic_vector_sync import (
@@ -105,8 +112,13 @@ class PostgresSearchRepository(SearchRepositoryBase):
         # create_rerank_provider returns None unless reranking is enabled.
         if self._semantic_enabled and self._rerank_provider is None:
             self._rerank_provider = create_rerank_provider(self._app_config)
+        if self._rerank_provider is not None:
+            self._rerank_score_cache = get_rerank_score_cache(
+                self._rerank_provider, self._app_config
+            )
         if self._embedding_provider is not None:
             self._vector_dimensions = self._embedding_provider.dimensions
+            self._embedding_store = create_embedding_store(session_maker, self._app_config)
             effective_name = vector_index_name or resolve_semantic_vector_index_name(
                 self._app_config,
                 DatabaseBackend.POSTGRES,
@@ -799,6 +811,10 @@ class PostgresSearchRepository(SearchRepositoryBase):
                 text_expr = f"jsonb_extract_path_text({metadata_expr}, {path_args})"
                 json_expr = f"jsonb_extract_path({metadata_expr}, {path_args})"
 
+                # entity_metadata_value picks candidate entities through B-tree
+                # indexes; the JSON predicate below stays the exact check.
+                conditions.append(build_metadata_value_condition(filt, idx, params))
+
                 if filt.op == "eq":
                     value_param = f"meta_val_{idx}"
                     params[value_param] = filt.value
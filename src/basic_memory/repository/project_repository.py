@@ -1,14 +1,16 @@
 """Repository for managing projects in Basic Memory."""
 
+from datetime import datetime
 from pathlib import Path
 from typing import Any, override, Optional, Sequence, Union
 
 
 from loguru import logger
-from sqlalchemy import Executable, inspect as sa_inspect, select, text
+from sqlalchemy import Executable, Row, func, inspect as sa_inspect, select, text
 from sqlalchemy.exc import NoResultFound, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from basic_memory.models.knowledge import Entity
 from basic_memory.models.project import Project
 from basic_memory.repository.repository import Repository
 
@@ -159,6 +161,45 @@ class ProjectRepository(Repository[Project]):
         result = await self.execute_query(session, query)
         return list(result.scalars().all())
 
+    async def find_recent_entities(
+        self, session: AsyncSession, since: datetime, *, limit: int, offset: int = 0
+    ) -> Sequence[Row[Any]]:
+        """Return every project's most recently updated entities in one query.
+
+        The ``updated_at > since`` range is answered by ``ix_entity_updated_at``
+        and a window function ranks the hits per project, newest first, so an
+        all-projects activity summary costs one scan instead of one context
+        build per project. Each project contributes the rows ranked after
+        ``offset``, at most ``limit`` of them, ordered by project and rank.
+        """
+        ranked = (
+            select(
+                Entity.project_id,
+                Entity.id,
+                Entity.external_id,
+                Entity.title,
+                Entity.permalink,
+                Entity.file_path,
+                Entity.created_at,
+                func.row_number()
+                .over(
+                    partition_by=Entity.project_id,
+                    order_by=(Entity.updated_at.desc(), Entity.id.desc()),
+                )
+                .label("activity_rank"),
+            )
+            # Entity timestamps are stored as local time; compare in the same zone.
+            .where(Entity.updated_at > since.astimezone())
+            .subquery()
+        )
+        query = (
+            select(ranked)
+            .where(ranked.c.activity_rank > offset, ranked.c.activity_rank <= offset + limit)
+            .order_by(ranked.c.project_id, ranked.c.activity_rank)
+        )
+        result = await session.execute(query)
+        return list(result.all())
+
     async def set_as_default(self, session: AsyncSession, project_id: int) -> Optional[Project]:
         """Set a project as the default and unset previous default.
 
@@ -225,13 +266,19 @@ class ProjectRepository(Repository[Project]):
             lambda sync_session: set(sa_inspect(sync_session.connection()).get_table_names())
         )
 
-        # search_index: SQLite has no FK on the FTS5 virtual table; Postgres
-        # cascades from the project FK, so the explicit DELETE is redundant.
+        # search_index: SQLite has no FK on the FTS5 virtual table or its
+        # search_index_lookup companion; Postgres cascades from the project FK,
+        # so the explicit DELETEs are redundant there.
         if is_sqlite and "search_index" in existing_tables:
             await session.execute(
                 text("DELETE FROM search_index WHERE project_id = :project_id"),
                 {"project_id": entity_id},
             )
+        if is_sqlite and "search_index_lookup" in existing_tables:
+            await session.execute(
+                text("DELETE FROM search_index_lookup WHERE project_id = :project_id"),
+                {"project_id": entity_id},
+            )
 
         # search_vector_chunks: no FK to project on either backend, so both
         # backends need this. SQLite must purge vec0 embeddings first
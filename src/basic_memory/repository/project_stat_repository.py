@@ -0,0 +1,150 @@
+"""Repository for the trigger-maintained per-project counters."""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from basic_memory.models.project_stat import PROJECT_STAT_SOURCES, ProjectStat
+
+# Accepted API writes to one project between compactions of its delta rows.
+COMPACT_EVERY_WRITES = 256
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectStatCounts:
+    """Counter values for one project, keyed by stat kind and then stat key."""
+
+    counts: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def by_key(self, kind: str) -> dict[str, int]:
+        return dict(self.counts.get(kind, {}))
+
+    def total(self, kind: str) -> int:
+        return sum(self.counts.get(kind, {}).values())
+
+
+class ProjectStatCompactionSchedule:
+    """Count accepted writes per project and say when its deltas are due a compaction.
+
+    API-only deployments never run the indexer, so without this their delta rows
+    would grow with every write. Counts live in one process; several processes
+    each compacting on their own schedule is harmless because compaction folds
+    whatever deltas exist at the time.
+    """
+
+    def __init__(self, every: int = COMPACT_EVERY_WRITES) -> None:
+        self.every = every
+        self._writes: dict[str, int] = {}
+
+    def record_write(self, project_external_id: str) -> bool:
+        """Count one write and return True when the project is due a compaction."""
+        writes = self._writes.pop(project_external_id, 0) + 1
+        if writes >= self.every:
+            return True
+        self._writes[project_external_id] = writes
+        return False
+
+
+class ProjectStatRepository:
+    """Read, compact, and rebuild project_stat counters.
+
+    Triggers write the deltas; this repository only folds them together and
+    rebuilds them from the source tables when repairing drift. Reads never
+    write: the indexer compacts after each batch and each project index run, and
+    the note-content mutation service after every COMPACT_EVERY_WRITES writes.
+    """
+
+    async def get_counts(self, session: AsyncSession, project_id: int) -> ProjectStatCounts:
+        """Return a project's counters by summing its delta rows per key."""
+        result = await session.execute(
+            select(ProjectStat.stat_kind, ProjectStat.stat_key, func.sum(ProjectStat.stat_count))
+            .where(ProjectStat.project_id == project_id)
+            .group_by(ProjectStat.stat_kind, ProjectStat.stat_key)
+        )
+        counts: dict[str, dict[str, int]] = defaultdict(dict)
+        for kind, key, value in result.all():
+            if key is not None and value:
+                counts[kind][key] = int(value)
+        return ProjectStatCounts(counts=dict(counts))
+
+    async def total_entities(self, session: AsyncSession) -> int:
+        """Return the entity count across every project."""
+        result = await session.execute(
+            select(func.coalesce(func.sum(ProjectStat.stat_count), 0)).where(
+                ProjectStat.stat_kind == "note_type"
+            )
+        )
+        return int(result.scalar_one())
+
+    async def compact(self, session: AsyncSession, project_id: int) -> None:
+        """Fold a project's delta rows into one row per non-zero key.
+
+        The fold runs as SQL in the caller's transaction; no delta rows pass through Python.
+        Deltas committed concurrently survive untouched and are folded next time.
+        """
+        params = {"project_id": project_id}
+        if session.get_bind().dialect.name == "postgresql":
+            # Trigger: Postgres runs each READ COMMITTED statement on a fresh snapshot.
+            # Why: a separate DELETE after the INSERT ... SELECT could remove deltas
+            # committed in between without having summed them.
+            # Outcome: one data-modifying CTE re-inserts exactly the rows it deleted.
+            await session.execute(
+                text(
+                    "WITH folded AS ("
+                    "DELETE FROM project_stat WHERE project_id = :project_id "
+                    "RETURNING project_id, stat_kind, stat_key, stat_count) "
+                    "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) "
+                    "SELECT project_id, stat_kind, stat_key, SUM(stat_count) FROM folded "
+                    "GROUP BY project_id, stat_kind, stat_key HAVING SUM(stat_count) <> 0"
+                ),
+                params,
+            )
+            return
+
+        # SQLite cannot DELETE inside a CTE. Its writers are serialized, so folding
+        # and then deleting rows up to a watermark sees the same rows both times;
+        # the folded rows get ids above the watermark and survive the delete.
+        watermark = (
+            await session.execute(
+                select(func.max(ProjectStat.id)).where(ProjectStat.project_id == project_id)
+            )
+        ).scalar_one_or_none()
+        if watermark is None:
+            return
+        params["watermark"] = watermark
+        await session.execute(
+            text(
+                "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) "
+                "SELECT project_id, stat_kind, stat_key, SUM(stat_count) FROM project_stat "
+                "WHERE project_id = :project_id AND id <= :watermark "
+                "GROUP BY project_id, stat_kind, stat_key HAVING SUM(stat_count) <> 0"
+            ),
+            params,
+        )
+        await session.execute(
+            delete(ProjectStat).where(
+                ProjectStat.project_id == project_id, ProjectStat.id <= watermark
+            )
+        )
+
+    async def recompute(self, session: AsyncSession, project_id: int) -> None:
+        """Rebuild a project's counters from entity, observation, and relation rows."""
+        await session.execute(delete(ProjectStat).where(ProjectStat.project_id == project_id))
+        for table, kind, key, condition in PROJECT_STAT_SOURCES:
+            key_sql = key.format(row=table)
+            where = f"{table}.project_id = :project_id"
+            if condition is not None:
+                where += f" AND {condition.format(row=table)}"
+            # Postgres rejects a string literal in GROUP BY; constant keys need none.
+            group_by = f"{table}.project_id" if key_sql == key else f"{table}.project_id, {key_sql}"
+            await session.execute(
+                text(
+                    "INSERT INTO project_stat (project_id, stat_kind, stat_key, stat_count) "
+                    f"SELECT {table}.project_id, '{kind}', {key_sql}, COUNT(*) "
+                    f"FROM {table} WHERE {where} "
+                    f"GROUP BY {group_by}"
+                ),
+                {"project_id": project_id},
+            )
@@ -0,0 +1,177 @@
+"""Embedding provider wrapper that memoizes query vectors with LRU eviction."""
+
+from __future__ import annotations
+
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+import logfire
+
+from basic_memory.repository.embedding_provider import (
+    EmbeddingProvider,
+    embedding_provider_identity,
+)
+
+# Fixed per-entry bookkeeping (OrderedDict slot, key tuple, array header) charged
+# against the byte budget so tiny vectors cannot grow the cache without bound.
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+def normalize_query_text(text: str) -> str:
+    """Canonicalize query text so equivalent spellings share one cached vector."""
+    return unicodedata.normalize("NFC", text).strip()
+
+
+@dataclass(frozen=True, slots=True)
+class QueryEmbeddingCacheStats:
+    """Point-in-time counters for one query-embedding cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+def _record_event(event: str) -> None:
+    logfire.metric_counter("basic_memory_query_embedding_cache_events_total").add(
+        1,
+        attributes={"event": event},
+    )
+
+
+class QueryCachingEmbeddingProvider:
+    """Serve repeated ``embed_query`` calls from a bounded in-process LRU.
+
+    The wrapper is semantically transparent: document embedding passes straight
+    through, and identity/type reporting resolves to the wrapped provider so
+    persisted vectors are never invalidated by turning the cache on or off.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        *,
+        max_entries: int,
+        max_bytes: int,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.provider = provider
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], array[float]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Constraint: factory providers are process-wide singletons shared by
+        # threads running their own event loops (CLI, MCP, sync workers).
+        self._lock = Lock()
+
+    @property
+    def model_name(self) -> str:
+        return self.provider.model_name
+
+    @property
+    def dimensions(self) -> int:
+        return self.provider.dimensions
+
+    async def embed_query(self, text: str) -> list[float]:
+        normalized = normalize_query_text(text)
+        key = (embedding_provider_identity(self.provider), normalized)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if cached is not None:
+            _record_event("hit")
+            # Callers may mutate the returned list; hand out a fresh copy.
+            return cached.tolist()
+
+        _record_event("miss")
+        vector = await self.provider.embed_query(normalized)
+        self._store(key, vector)
+        return vector
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.provider.embed_documents(texts)
+
+    def _store(self, key: tuple[str, str], vector: list[float]) -> None:
+        # array('d') keeps float64 values bit-identical to the provider output
+        # at 8 bytes per dimension instead of a boxed float per element.
+        packed = array("d", vector)
+        entry_bytes = _entry_bytes(key, packed)
+        if entry_bytes > self.max_bytes:
+            return
+
+        evicted = 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= _entry_bytes(key, previous)
+            self._entries[key] = packed
+            self._bytes += entry_bytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                old_key, old_vector = self._entries.popitem(last=False)
+                self._bytes -= _entry_bytes(old_key, old_vector)
+                self._evictions += 1
+                evicted += 1
+        for _ in range(evicted):
+            _record_event("evict")
+
+    def cache_stats(self) -> QueryEmbeddingCacheStats:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return QueryEmbeddingCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def clear_cache(self) -> None:
+        """Drop every cached query vector (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def runtime_log_attrs(self) -> dict[str, Any]:
+        attrs = self.provider.runtime_log_attrs()
+        attrs.update(
+            {
+                "query_cache_max_entries": self.max_entries,
+                "query_cache_max_bytes": self.max_bytes,
+            }
+        )
+        return attrs
+
+    def identity_key(self) -> str:
+        """Return the wrapped provider's identity; caching never changes vectors."""
+        return embedding_provider_identity(self.provider)
+
+
+def _entry_bytes(key: tuple[str, str], vector: array[float]) -> int:
+    return (
+        vector.itemsize * len(vector)
+        + len(key[0].encode("utf-8"))
+        + len(key[1].encode("utf-8"))
+        + _ENTRY_OVERHEAD_BYTES
+    )
+
+
+def unwrap_query_cache(provider: EmbeddingProvider) -> EmbeddingProvider:
+    """Return the provider behind a query cache, for type-based identity strings."""
+    if isinstance(provider, QueryCachingEmbeddingProvider):
+        return provider.provider
+    return provider
@@ -43,7 +43,10 @@ class Repository[T: Base]:
             self.Model = Model
             self.mapper = inspect(self.Model).mapper
             self.primary_key: ColumnElement[Any] = self.mapper.primary_key[0]
-            self.valid_columns = [column.key for column in self.mapper.columns]
+            # Database-generated columns are read-only: writing them is an error.
+            self.valid_columns = [
+                column.key for column in self.mapper.columns if column.computed is None
+            ]
             # Check if this model has a project_id column
             self.has_project_id = "project_id" in self.valid_columns
 
@@ -6,8 +6,12 @@ FTS ranking left just below the top-k cutoff. Mirrors ``embedding_provider`` so
 the same provider families and config shape apply to a different pipeline stage.
 """
 
+import hashlib
 import math
+from collections import OrderedDict
 from collections.abc import Sequence
+from dataclasses import dataclass
+from threading import Lock
 from typing import Any, Protocol
 
 from basic_memory.repository.semantic_errors import RerankProviderContractError
@@ -84,3 +88,78 @@ class RerankProvider(Protocol):
     def runtime_log_attrs(self) -> dict[str, Any]:
         """Return provider-specific runtime settings suitable for startup logs."""
         ...
+
+
+type RerankScoreKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRerankScores:
+    """Scores aligned to the input documents, plus how many came from the cache."""
+
+    scores: list[float]
+    hits: int
+    misses: int
+
+
+class RerankScoreCache:
+    """Bounded LRU of cross-encoder scores keyed by (model, query, document hash).
+
+    Paging through one query re-ranks the same fixed candidate prefix for every
+    page, and repeated queries re-rank the same notes. A cross-encoder score is a
+    pure function of model, query, and document text, so cached scores are served
+    as-is; an edited note hashes differently and misses. Only the misses reach
+    the provider, in one batched call.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._scores: OrderedDict[RerankScoreKey, float] = OrderedDict()
+        # Providers (and therefore this cache) are process-wide singletons shared
+        # by the API and MCP server threads.
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+
+    async def rerank(
+        self, provider: RerankProvider, query: str, documents: list[str]
+    ) -> CachedRerankScores:
+        """Return validated scores for ``documents``, scoring only uncached ones."""
+        keys = [
+            (provider.model_name, query, hashlib.sha256(document.encode("utf-8")).hexdigest())
+            for document in documents
+        ]
+        with self._lock:
+            cached = [self._scores.get(key) for key in keys]
+            for key, score in zip(keys, cached):
+                if score is not None:
+                    self._scores.move_to_end(key)
+
+        missing = [index for index, score in enumerate(cached) if score is None]
+        fresh = (
+            validate_rerank_scores(
+                await provider.rerank(query, [documents[index] for index in missing]),
+                len(missing),
+            )
+            if missing
+            else []
+        )
+
+        scores = list(cached)
+        with self._lock:
+            for index, score in zip(missing, fresh):
+                scores[index] = score
+                self._scores[keys[index]] = score
+                self._scores.move_to_end(keys[index])
+            while len(self._scores) > self.max_entries:
+                self._scores.popitem(last=False)
+        return CachedRerankScores(
+            scores=[score for score in scores if score is not None],
+            hits=len(documents) - len(missing),
+            misses=len(missing),
+        )
@@ -8,6 +8,7 @@ distinct model subdirs.
 """
 
 from threading import Lock
+from weakref import WeakKeyDictionary
 
 from loguru import logger
 
@@ -17,7 +18,7 @@ from basic_memory.repository.embedding_provider_factory import (
     _resolve_fastembed_runtime_knobs,
     _sensitive_value_digest,
 )
-from basic_memory.repository.rerank_provider import RerankProvider
+from basic_memory.repository.rerank_provider import RerankProvider, RerankScoreCache
 
 # Key on the fields that change the loaded provider's identity: provider, model,
 # (for the litellm path) the endpoint/key routing and timeout, and the resolved cache
@@ -29,6 +30,10 @@ type RerankCacheKey = tuple[str, str, str | None, str | None, float | None, str]
 
 _RERANK_PROVIDER_CACHE: dict[RerankCacheKey, RerankProvider] = {}
 _RERANK_PROVIDER_CACHE_LOCK = Lock()
+# Score caches live as long as their provider. The factory's singleton provider
+# therefore gets one process-wide cache, while an injected provider (tests,
+# embedded callers) never sees scores another instance produced.
+_RERANK_SCORE_CACHES: WeakKeyDictionary[RerankProvider, RerankScoreCache] = WeakKeyDictionary()
 
 
 def _rerank_cache_key(app_config: BasicMemoryConfig) -> RerankCacheKey:
@@ -54,6 +59,28 @@ def reset_rerank_provider_cache() -> None:
     """Clear the process-level reranker provider cache (used by tests)."""
     with _RERANK_PROVIDER_CACHE_LOCK:
         _RERANK_PROVIDER_CACHE.clear()
+        _RERANK_SCORE_CACHES.clear()
+
+
+def get_rerank_score_cache(
+    provider: RerankProvider, app_config: BasicMemoryConfig
+) -> RerankScoreCache | None:
+    """Return ``provider``'s score cache, or ``None`` when score caching is disabled.
+
+    The first caller's ``reranker_score_cache_size`` sizes a provider's cache.
+    """
+    if app_config.reranker_score_cache_size <= 0:
+        return None
+    with _RERANK_PROVIDER_CACHE_LOCK:
+        try:
+            cache = _RERANK_SCORE_CACHES.get(provider)
+            if cache is None:
+                cache = RerankScoreCache(app_config.reranker_score_cache_size)
+                _RERANK_SCORE_CACHES[provider] = cache
+        except TypeError:
+            # Unhashable or non-weakref-able provider objects simply run uncached.
+            return None
+        return cache
 
 
 def create_rerank_provider(app_config: BasicMemoryConfig) -> RerankProvider | None:
@@ -0,0 +1,64 @@
+"""B-tree lookup rows that shadow the SQLite FTS5 search_index.
+
+search_index_lookup (see models.search) holds one row per FTS row, sharing its
+rowid, with the columns exact filters need. FTS5 virtual tables accept no
+triggers, so every SQLite write path that inserts into search_index calls
+mirror_search_index_inserts() in the same transaction. Readers always re-check
+their predicates against the FTS row, so a lookup row left behind by a delete
+path that does not mirror can only cost a wasted rowid probe, never a wrong
+result; purge_orphaned_lookup_rows() sweeps those during reconciliation.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+SEARCH_INDEX_LOOKUP_TABLE = "search_index_lookup"
+
+_LOOKUP_PROJECTION = """
+    INSERT OR REPLACE INTO search_index_lookup (
+        rowid, project_id, type, id, entity_id, permalink, note_type, created_at, updated_at
+    )
+    SELECT
+        rowid, project_id, type, id, entity_id, permalink,
+        CASE WHEN json_valid(metadata) THEN LOWER(json_extract(metadata, '$.note_type')) END,
+        datetime(created_at), datetime(updated_at)
+    FROM search_index
+"""
+
+BACKFILL_SEARCH_INDEX_LOOKUP_SQL = text(_LOOKUP_PROJECTION)
+
+MIRROR_SEARCH_INDEX_ROWS_SQL = text(
+    _LOOKUP_PROJECTION + "WHERE rowid BETWEEN :first_rowid AND :last_rowid"
+)
+
+PURGE_ORPHANED_LOOKUP_ROWS_SQL = text(
+    """
+    DELETE FROM search_index_lookup
+    WHERE project_id = :project_id
+      AND rowid NOT IN (SELECT rowid FROM search_index WHERE project_id = :project_id)
+    """
+)
+
+
+async def mirror_search_index_inserts(session: AsyncSession, row_count: int) -> None:
+    """Copy the ``row_count`` rows just inserted into search_index into the lookup.
+
+    Must run in the inserting transaction, right after the INSERT. The write
+    lock held since that INSERT means its rows took consecutive rowids ending
+    at last_insert_rowid(). INSERT OR REPLACE overwrites a lookup row whose
+    rowid SQLite reused after a delete that was not mirrored.
+    """
+    if row_count <= 0:
+        return
+    result = await session.execute(text("SELECT last_insert_rowid()"))
+    last_rowid = int(result.scalar_one())
+    await session.execute(
+        MIRROR_SEARCH_INDEX_ROWS_SQL,
+        {"first_rowid": last_rowid - row_count + 1, "last_rowid": last_rowid},
+    )
+
+
+async def purge_orphaned_lookup_rows(session: AsyncSession, project_id: int) -> int:
+    """Delete lookup rows whose FTS row is gone; returns the number removed."""
+    result = await session.execute(PURGE_ORPHANED_LOOKUP_ROWS_SQL, {"project_id": project_id})
+    return max(getattr(result, "rowcount", 0) or 0, 0)
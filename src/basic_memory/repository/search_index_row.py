@@ -10,6 +10,44 @@ from typing import Any, Optional
 from basic_memory.schemas.search import SearchItemType
 from basic_memory.utils import ensure_timezone_aware
 
+# Minimum body prefix used to locate a truncated body copy at the tail of content_stems.
+_STEMS_BODY_PROBE_CHARS = 32
+
+
+def sqlite_fts_content_stems(
+    content_stems: Optional[str], content_snippet: Optional[str]
+) -> Optional[str]:
+    """Drop the note body copy from content_stems for SQLite FTS5 rows.
+
+    Trigger: entity and observation stems embed the full body, which SQLite also
+    stores and tokenizes in content_snippet.
+    Why: indexing the same text in two FTS5 columns doubles the row payload and
+    the inverted-index postings for every body term.
+    Outcome: stems keep only the title, permalink, path, and tag variants; SQLite
+    text queries match across stems and snippet so recall is unchanged.
+    Postgres keeps the capped stems as-is because its tsvector is built from them.
+    """
+    if not content_stems or not content_snippet:
+        return content_stems
+
+    start = content_stems.find(content_snippet)
+    if start != -1:
+        end = start + len(content_snippet)
+    else:
+        # Trigger: stems were capped to MAX_CONTENT_STEMS_SIZE mid-body.
+        # Outcome: the stems tail is a body prefix; drop it from the first match.
+        probe = content_snippet[:_STEMS_BODY_PROBE_CHARS]
+        start = content_stems.find(probe)
+        while start != -1 and not content_snippet.startswith(content_stems[start:]):
+            start = content_stems.find(probe, start + 1)
+        if start == -1:
+            return content_stems
+        end = len(content_stems)
+
+    head = content_stems[:start].rstrip("\n")
+    tail = content_stems[end:].lstrip("\n")
+    return "\n".join(part for part in (head, tail) if part)
+
 
 @dataclass
 class SearchIndexRow:
@@ -1,5 +1,6 @@
 """Abstract base class for search repository implementations."""
 
+import asyncio
 import hashlib
 import time
 from abc import ABC, abstractmethod
@@ -25,8 +26,12 @@ from basic_memory.repository.embedding_provider import (
 from basic_memory.repository.embedding_provider_factory import (
     configured_embedding_provider_identity,
 )
+from basic_memory.repository.embedding_store_repository import EmbeddingStoreRepository
+from basic_memory.repository.query_caching_provider import unwrap_query_cache
 from basic_memory.repository.rerank_provider import (
+    CachedRerankScores,
     RerankProvider,
+    RerankScoreCache,
     build_rerank_document,
     demote_tail_scores,
     validate_rerank_scores,
@@ -35,6 +40,7 @@ from basic_memory.repository.search_index_row import SearchIndexRow
 from basic_memory.repository.search_trace import (
     BelowThreshold,
     FilteredOut,
+    HybridLegTimings,
     HydrationDropKey,
     HydrationDropped,
     MissingSearchRow,
@@ -205,6 +211,10 @@ class SearchRepositoryBase(ABC):
     # Class-level defaults: a repo with no reranker configured (or a lightweight
     # test double that bypasses __init__) safely skips reranking.
     _rerank_provider: Optional[RerankProvider] = None
+    # None reranks every pool document (score caching disabled or unavailable).
+    _rerank_score_cache: Optional[RerankScoreCache] = None
+    # None embeds every flushed chunk with the provider (store disabled).
+    _embedding_store: Optional[EmbeddingStoreRepository] = None
     _reranker_candidates: int = 20
     _reranker_max_document_chars: int = 0
     _semantic_embedding_sync_batch_size: int
@@ -973,6 +983,31 @@ class SearchRepositoryBase(ABC):
     async def purge_stale_search_rows(self) -> int:
         return await purge_stale_search_index_rows(self.session_maker, self.project_id)
 
+    def _search_row_insert_params(self, search_index_row: SearchIndexRow) -> dict[str, Any]:
+        """Build INSERT parameters for one search row scoped to this project.
+
+        Backends override this to adapt the stored column layout.
+        """
+        insert_data = search_index_row.to_insert(serialize_json=True)
+        insert_data["project_id"] = self.project_id
+        return insert_data
+
+    async def _delete_search_rows(
+        self, session: AsyncSession, predicate: str, params: dict[str, Any]
+    ) -> None:
+        """Delete this project's search_index rows matching ``predicate``.
+
+        Backends override this to keep derived lookup state in the same transaction.
+        """
+        await session.execute(
+            text(f"DELETE FROM search_index WHERE {predicate} AND project_id = :project_id"),
+            {**params, "project_id": self.project_id},
+        )
+
+    async def _record_inserted_search_rows(self, session: AsyncSession, row_count: int) -> None:
+        """Hook run right after ``row_count`` rows were inserted into search_index."""
+        return None
+
     async def index_item(self, search_index_row: SearchIndexRow) -> None:
         """Index or update a single item.
 
@@ -981,18 +1016,14 @@ class SearchRepositoryBase(ABC):
 
         async with db.scoped_session(self.session_maker) as session:
             # Delete existing record if any
-            await session.execute(
-                text(
-                    "DELETE FROM search_index WHERE permalink = :permalink AND project_id = :project_id"
-                ),
-                {"permalink": search_index_row.permalink, "project_id": self.project_id},
+            await self._delete_search_rows(
+                session, "permalink = :permalink", {"permalink": search_index_row.permalink}
             )
 
             # When using text() raw SQL, always serialize JSON to string
             # Both SQLite (TEXT) and Postgres (JSONB) accept JSON strings in raw SQL
             # The database driver/column type will handle conversion
-            insert_data = search_index_row.to_insert(serialize_json=True)
-            insert_data["project_id"] = self.project_id
+            insert_data = self._search_row_insert_params(search_index_row)
 
             # Insert new record
             await session.execute(
@@ -1013,6 +1044,7 @@ class SearchRepositoryBase(ABC):
                 """),
                 insert_data,
             )
+            await self._record_inserted_search_rows(session, 1)
             logger.debug(f"indexed row {search_index_row}")
             await session.commit()
 
@@ -1035,11 +1067,7 @@ class SearchRepositoryBase(ABC):
             # When using text() raw SQL, always serialize JSON to string
             # Both SQLite (TEXT) and Postgres (JSONB) accept JSON strings in raw SQL
             # The database driver/column type will handle conversion
-            insert_data_list = []
-            for row in search_index_rows:
-                insert_data = row.to_insert(serialize_json=True)
-                insert_data["project_id"] = self.project_id
-                insert_data_list.append(insert_data)
+            insert_data_list = [self._search_row_insert_params(row) for row in search_index_rows]
 
             # Batch insert all records using executemany
             await session.execute(
@@ -1060,6 +1088,7 @@ class SearchRepositoryBase(ABC):
                 """),
                 insert_data_list,
             )
+            await self._record_inserted_search_rows(session, len(insert_data_list))
             logger.debug(f"Bulk indexed {len(search_index_rows)} rows")
             await session.commit()
 
@@ -1121,11 +1150,8 @@ class SearchRepositoryBase(ABC):
         This implementation is shared across backends as it uses standard SQL DELETE.
         """
         async with db.scoped_session(self.session_maker) as session:
-            await session.execute(
-                text(
-                    "DELETE FROM search_index WHERE entity_id = :entity_id AND project_id = :project_id"
-                ),
-                {"entity_id": entity_id, "project_id": self.project_id},
+            await self._delete_search_rows(
+                session, "entity_id = :entity_id", {"entity_id": entity_id}
             )
             await session.commit()
 
@@ -1135,11 +1161,8 @@ class SearchRepositoryBase(ABC):
         This implementation is shared across backends as it uses standard SQL DELETE.
         """
         async with db.scoped_session(self.session_maker) as session:
-            await session.execute(
-                text(
-                    "DELETE FROM search_index WHERE permalink = :permalink AND project_id = :project_id"
-                ),
-                {"permalink": permalink, "project_id": self.project_id},
+            await self._delete_search_rows(
+                session, "permalink = :permalink", {"permalink": permalink}
             )
             await session.commit()
 
@@ -1596,7 +1619,7 @@ class SearchRepositoryBase(ABC):
         # text-prefix transforms that change stored vector meaning.
         # Outcome: reindex treats those semantic config changes as stale vectors.
         provider_identity = embedding_provider_identity(provider)
-        return f"{type(provider).__name__}:{provider_identity}"
+        return f"{type(unwrap_query_cache(provider)).__name__}:{provider_identity}"
 
     def _plan_entity_vector_shard(
         self,
@@ -2066,17 +2089,31 @@ class SearchRepositoryBase(ABC):
         # back to retrieval order. A prior page may already have returned reranked
         # order, so degrading here can duplicate one result and omit another.
         rerank_start = time.perf_counter() if trace is not None else None
-        scores = validate_rerank_scores(
-            await self._rerank_provider.rerank(query_text, documents),
-            len(pool),
-        )
+        # Every page re-ranks this same fixed prefix, so with a score cache the
+        # first page scores the whole pool in one batch and later pages (and
+        # repeated queries) are served without touching the cross-encoder.
+        if self._rerank_score_cache is not None:
+            scored = await self._rerank_score_cache.rerank(
+                self._rerank_provider, query_text, documents
+            )
+        else:
+            scored = CachedRerankScores(
+                scores=validate_rerank_scores(
+                    await self._rerank_provider.rerank(query_text, documents),
+                    len(pool),
+                ),
+                hits=0,
+                misses=len(pool),
+            )
+        scores = scored.scores
 
         order = sorted(range(len(pool)), key=lambda i: scores[i], reverse=True)
         reranked = [replace(pool[i], score=scores[i]) for i in order]
         logger.debug(
-            "Reranked candidates: pool={pool} model={model}",
+            "Reranked candidates: pool={pool} model={model} cache_hits={hits}",
             pool=len(pool),
             model=self._rerank_provider.model_name,
+            hits=scored.hits,
         )
         tail_floor = reranked[-1].score or 0.0
         demoted_tail = self._demote_tail(tail, floor=tail_floor)
@@ -2096,6 +2133,8 @@ class SearchRepositoryBase(ABC):
                 tail_floor=tail_floor,
                 stable_pool_refetched=trace.stable_pool_refetched,
                 rerank_ms=(time.perf_counter() - rerank_start) * 1000,
+                score_cache_hits=scored.hits,
+                score_cache_misses=scored.misses,
             )
         return reranked_rows[offset:page_end]
 
@@ -2471,51 +2510,72 @@ class SearchRepositoryBase(ABC):
             if _candidate_limit_override is not None
             else self._candidate_limit(limit, offset, query_text)
         )
-        fts_start = time.perf_counter()
-        # allow_relaxed: question-form queries rarely AND-match, and a dead FTS
-        # branch silently degrades hybrid to vector-only ranking. Fusion plus
-        # bm25 keep relaxed lexical candidates from dominating precision.
-        fts_results = await self.search(
-            search_text=search_text,
-            permalink=permalink,
-            permalink_match=permalink_match,
-            title=title,
-            note_types=note_types,
-            after_date=after_date,
-            search_item_types=search_item_types,
-            categories=categories,
-            metadata_filters=metadata_filters,
-            retrieval_mode=SearchRetrievalMode.FTS,
-            limit=candidate_limit,
-            offset=0,
-            allow_relaxed=True,
-            trace=trace,
-        )
-        fts_ms = (time.perf_counter() - fts_start) * 1000
-        vector_start = time.perf_counter()
-        vector_results = await self._search_vector_only(
-            search_text=search_text,
-            permalink=permalink,
-            permalink_match=permalink_match,
-            title=title,
-            note_types=note_types,
-            after_date=after_date,
-            search_item_types=search_item_types,
-            categories=categories,
-            metadata_filters=metadata_filters,
-            min_similarity=min_similarity,
-            limit=candidate_limit,
-            offset=0,
-            # Trigger: reranking owns a bounded candidate window shared by both legs.
-            # Why: the disabled path historically expands the vector leg again to
-            # preserve recall when many vector chunks collapse into a few search rows.
-            # Outcome: avoid double expansion only when reranking is actually active.
-            candidate_limit=candidate_limit if rerank_configured else None,
-            _emit_observability_log=False,
-            _apply_rerank=False,
-            trace=trace,
+
+        # Trigger: the FTS leg and the vector leg (query embedding + KNN) are
+        # independent of each other's output.
+        # Why: awaiting them back to back made hybrid latency the sum of both legs.
+        # Outcome: both legs run concurrently, each opening its own session, so
+        # hybrid latency approaches the slower leg. Each leg writes disjoint trace
+        # stages (fts vs. vector/readiness), so sharing the collector is safe.
+        async def _run_fts_leg() -> tuple[List[SearchIndexRow], float]:
+            leg_start = time.perf_counter()
+            # allow_relaxed: question-form queries rarely AND-match, and a dead FTS
+            # branch silently degrades hybrid to vector-only ranking. Fusion plus
+            # bm25 keep relaxed lexical candidates from dominating precision.
+            rows = await self.search(
+                search_text=search_text,
+                permalink=permalink,
+                permalink_match=permalink_match,
+                title=title,
+                note_types=note_types,
+                after_date=after_date,
+                search_item_types=search_item_types,
+                categories=categories,
+                metadata_filters=metadata_filters,
+                retrieval_mode=SearchRetrievalMode.FTS,
+                limit=candidate_limit,
+                offset=0,
+                allow_relaxed=True,
+                trace=trace,
+            )
+            return rows, (time.perf_counter() - leg_start) * 1000
+
+        async def _run_vector_leg() -> tuple[List[SearchIndexRow], float]:
+            leg_start = time.perf_counter()
+            rows = await self._search_vector_only(
+                search_text=search_text,
+                permalink=permalink,
+                permalink_match=permalink_match,
+                title=title,
+                note_types=note_types,
+                after_date=after_date,
+                search_item_types=search_item_types,
+                categories=categories,
+                metadata_filters=metadata_filters,
+                min_similarity=min_similarity,
+                limit=candidate_limit,
+                offset=0,
+                # Trigger: reranking owns a bounded candidate window shared by both legs.
+                # Why: the disabled path historically expands the vector leg again to
+                # preserve recall when many vector chunks collapse into a few search rows.
+                # Outcome: avoid double expansion only when reranking is actually active.
+                candidate_limit=candidate_limit if rerank_configured else None,
+                _emit_observability_log=False,
+                _apply_rerank=False,
+                trace=trace,
+            )
+            return rows, (time.perf_counter() - leg_start) * 1000
+
+        legs_start = time.perf_counter()
+        (fts_results, fts_ms), (vector_results, vector_ms) = await asyncio.gather(
+            _run_fts_leg(), _run_vector_leg()
         )
-        vector_ms = (time.perf_counter() - vector_start) * 1000
+        if trace is not None:
+            trace.hybrid_legs = HybridLegTimings(
+                fts_ms=fts_ms,
+                vector_ms=vector_ms,
+                wall_ms=(time.perf_counter() - legs_start) * 1000,
+            )
         # Trigger: with reranking disabled the vector leg expands internally and can
         # hydrate more rows than the fusion window it returns.
         # Why: rows cut here never fuse — left in the trace they would surface as
@@ -128,6 +128,15 @@ class FusionStageTrace:
     fusion_ms: float
 
 
+@dataclass(frozen=True, slots=True)
+class HybridLegTimings:
+    """Per-leg latency of one hybrid query whose FTS and vector legs ran concurrently."""
+
+    fts_ms: float
+    vector_ms: float
+    wall_ms: float
+
+
 @dataclass(frozen=True, slots=True)
 class RerankEntry:
     key: TraceKey
@@ -147,6 +156,14 @@ class RerankStageTrace:
     tail_floor: float
     stable_pool_refetched: bool
     rerank_ms: float
+    # Pool documents served from the rerank score cache vs. sent to the provider.
+    score_cache_hits: int = 0
+    score_cache_misses: int = 0
+
+    @property
+    def score_cache_hit_ratio(self) -> float:
+        scored = self.score_cache_hits + self.score_cache_misses
+        return self.score_cache_hits / scored if scored else 0.0
 
 
 @dataclass(frozen=True, slots=True)
@@ -221,6 +238,7 @@ class HybridQueryTrace:
     fusion: FusionStageTrace
     rerank: RerankStageTrace | None
     final: tuple[FinalResultEntry, ...]
+    legs: HybridLegTimings | None = None
 
 
 type QueryTrace = FtsQueryTrace | VectorQueryTrace | HybridQueryTrace
@@ -235,6 +253,7 @@ class SearchTraceCollector:
     fusion: FusionStageTrace | None = None
     rerank: RerankStageTrace | None = None
     readiness: ManifestReadiness | None = None
+    hybrid_legs: HybridLegTimings | None = None
     stable_pool_refetched: bool = False
     # Rendered from the exact prepared query the repository executed (including
     # legacy note-type expansion), so the trace never re-derives its criteria.
@@ -411,6 +430,8 @@ def build_rerank_stage(
     tail_floor: float,
     stable_pool_refetched: bool,
     rerank_ms: float,
+    score_cache_hits: int = 0,
+    score_cache_misses: int = 0,
 ) -> RerankStageTrace:
     """Freeze pre-rewrite scores and the final pool-plus-demoted-tail ordering."""
     pre_ranks = {key: rank for rank, key in enumerate(pre_rerank_scores, start=1)}
@@ -432,6 +453,8 @@ def build_rerank_stage(
         tail_floor=tail_floor,
         stable_pool_refetched=stable_pool_refetched,
         rerank_ms=rerank_ms,
+        score_cache_hits=score_cache_hits,
+        score_cache_misses=score_cache_misses,
     )
 
 
@@ -491,6 +514,7 @@ def finalize_query_trace(
                 fusion=collector.fusion,
                 rerank=collector.rerank,
                 final=final_entries,
+                legs=collector.hybrid_legs,
             )
 
 
@@ -14,6 +14,7 @@ from basic_memory.repository.embedding_provider import (
     EmbeddingProvider,
     embedding_provider_identity,
 )
+from basic_memory.repository.query_caching_provider import unwrap_query_cache
 from basic_memory.repository.semantic_errors import (
     SemanticDependenciesMissingError,
 )
@@ -35,7 +36,8 @@ def resolve_semantic_vector_index_name(
 
 def semantic_embedding_identity(provider: EmbeddingProvider) -> str:
     """Return the same model identity used by manifest invalidation."""
-    return f"{type(provider).__name__}:{embedding_provider_identity(provider)}"
+    provider_type_name = type(unwrap_query_cache(provider)).__name__
+    return f"{provider_type_name}:{embedding_provider_identity(provider)}"
 
 
 def _serialize_query_value(value: str | tuple[str, ...] | None) -> str:
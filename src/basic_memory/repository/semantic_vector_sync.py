@@ -13,6 +13,8 @@ from loguru import logger
 from sqlalchemy import text
 
 from basic_memory import db
+from basic_memory.repository.embedding_store_repository import embedding_content_hash
+from basic_memory.repository.query_caching_provider import unwrap_query_cache
 from basic_memory.repository.semantic_chunking import VectorChunkRecord
 from basic_memory.runtime.vector_sync import (
     VECTOR_SYNC_SAMPLE_ERROR_LIMIT,
@@ -1237,6 +1239,76 @@ async def upsert_scheduled_chunk_records(
     return embedding_jobs
 
 
+async def embed_chunk_texts(
+    repository: SearchRepositoryBase,
+    texts: list[str],
+) -> list[list[float]]:
+    """Return one vector per text, embedding only texts the store has not seen."""
+    provider = repository._embedding_provider
+    assert provider is not None
+    store = repository._embedding_store
+    if store is None:
+        return await provider.embed_documents(texts)
+
+    # Trigger: moved, copied, re-imported, and fully reindexed notes produce
+    # chunk text that was already embedded under the same provider identity.
+    # Why: the embedding call dominates vector sync, and identical text under an
+    # identical provider identity yields an identical vector.
+    # Outcome: only unseen texts reach the provider, each at most once per flush.
+    identity = repository._embedding_model_key()
+    hashes = [embedding_content_hash(chunk_text) for chunk_text in texts]
+    try:
+        vectors = await store.get_many(identity, hashes, dimensions=provider.dimensions)
+    except Exception as exc:
+        # Trigger: the store read failed (locked database, corrupt row, ...).
+        # Why: the store only saves provider calls; the flush can embed every
+        #   text itself.
+        # Outcome: treat every text as a miss instead of failing the flush.
+        logger.warning(
+            "Embedding store read failed; embedding every chunk: "
+            "project_id={project_id} chunks={chunks} error={error}",
+            project_id=repository.project_id,
+            chunks=len(hashes),
+            error=str(exc),
+        )
+        vectors = {}
+    missing = {
+        content_hash: chunk_text
+        for content_hash, chunk_text in zip(hashes, texts)
+        if content_hash not in vectors
+    }
+    if missing:
+        embedded = await provider.embed_documents(list(missing.values()))
+        if len(embedded) != len(missing):
+            raise RuntimeError("Embedding provider returned an unexpected number of vectors.")
+        fresh = dict(zip(missing, embedded))
+        try:
+            await store.put_many(identity, fresh)
+        except Exception as exc:
+            # Trigger: the store write failed (locked database, disk full, ...).
+            # Why: the vectors are already embedded and valid; the store only
+            #   saves future provider calls.
+            # Outcome: keep the flush going and let a later flush store them.
+            logger.warning(
+                "Embedding store write failed; continuing without caching: "
+                "project_id={project_id} vectors={vectors} error={error}",
+                project_id=repository.project_id,
+                vectors=len(fresh),
+                error=str(exc),
+            )
+        vectors.update(fresh)
+
+    logger.debug(
+        "Embedding store lookup: project_id={project_id} chunks={chunks} "
+        "reused={reused} embedded={embedded}",
+        project_id=repository.project_id,
+        chunks=len(texts),
+        reused=len(texts) - len(missing),
+        embedded=len(missing),
+    )
+    return [vectors[content_hash] for content_hash in hashes]
+
+
 async def flush_embedding_jobs(
     repository: SearchRepositoryBase,
     flush_jobs: list[PendingEmbeddingJob],
@@ -1250,7 +1322,7 @@ async def flush_embedding_jobs(
 
     embed_start = time.perf_counter()
     texts = [job.chunk_text for job in flush_jobs]
-    embeddings = await repository._embedding_provider.embed_documents(texts)
+    embeddings = await embed_chunk_texts(repository, texts)
     embed_seconds = time.perf_counter() - embed_start
     if len(embeddings) != len(flush_jobs):
         raise RuntimeError("Embedding provider returned an unexpected number of vectors.")
@@ -1366,7 +1438,7 @@ def log_vector_sync_runtime_settings(
             project_id=repository.project_id,
             backend=backend_name,
             entities_total=entities_total,
-            provider=type(provider).__name__,
+            provider=type(unwrap_query_cache(provider)).__name__,
             model_name=provider.model_name,
             dimensions=provider.dimensions,
             sync_batch_size=repository._semantic_embedding_sync_batch_size,
@@ -1381,7 +1453,7 @@ def log_vector_sync_runtime_settings(
         project_id=repository.project_id,
         backend=backend_name,
         entities_total=entities_total,
-        provider=type(provider).__name__,
+        provider=type(unwrap_query_cache(provider)).__name__,
         sync_batch_size=repository._semantic_embedding_sync_batch_size,
     )
 
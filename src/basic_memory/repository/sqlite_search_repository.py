@@ -18,22 +18,38 @@ from basic_memory import db
 from basic_memory.config import BasicMemoryConfig, ConfigManager
 from basic_memory.models.search import (
     CREATE_SEARCH_INDEX,
+    CREATE_SEARCH_INDEX_LOOKUP,
+    CREATE_SEARCH_INDEX_LOOKUP_INDEXES,
     CREATE_SQLITE_SEARCH_VECTOR_CHUNKS,
     CREATE_SQLITE_SEARCH_VECTOR_CHUNKS_PROJECT_ENTITY,
     CREATE_SQLITE_SEARCH_VECTOR_CHUNKS_UNIQUE,
 )
 from basic_memory.repository.embedding_provider import EmbeddingProvider
 from basic_memory.repository.embedding_provider_factory import create_embedding_provider
+from basic_memory.repository.embedding_store_repository import create_embedding_store
 from basic_memory.repository.rerank_provider import RerankProvider
-from basic_memory.repository.rerank_provider_factory import create_rerank_provider
-from basic_memory.repository.search_index_row import SearchIndexRow
+from basic_memory.repository.rerank_provider_factory import (
+    create_rerank_provider,
+    get_rerank_score_cache,
+)
+from basic_memory.repository.search_index_lookup import (
+    BACKFILL_SEARCH_INDEX_LOOKUP_SQL,
+    SEARCH_INDEX_LOOKUP_TABLE,
+    mirror_search_index_inserts,
+    purge_orphaned_lookup_rows,
+)
+from basic_memory.repository.search_index_row import SearchIndexRow, sqlite_fts_content_stems
 from basic_memory.repository.search_query import relaxed_query_words
 from basic_memory.repository.search_repository_base import SearchRepositoryBase
 from basic_memory.repository.search_trace import (
     SearchTraceCollector,
     build_fts_page_stage,
 )
-from basic_memory.repository.metadata_filters import parse_metadata_filters, build_sqlite_json_path
+from basic_memory.repository.metadata_filters import (
+    build_metadata_value_condition,
+    build_sqlite_json_path,
+    parse_metadata_filters,
+)
 from basic_memory.repository.semantic_errors import SemanticDependenciesMissingError
 from basic_memory.repository.semantic_vector_index import SemanticVectorIndex
 from basic_memory.repository.semantic_vector_sync import StagedVectorDeletion
@@ -89,8 +105,13 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         # create_rerank_provider returns None unless reranking is enabled.
         if self._semantic_enabled and self._rerank_provider is None:
             self._rerank_provider = create_rerank_provider(self._app_config)
+        if self._rerank_provider is not None:
+            self._rerank_score_cache = get_rerank_score_cache(
+                self._rerank_provider, self._app_config
+            )
         if self._embedding_provider is not None:
             self._vector_dimensions = self._embedding_provider.dimensions
+            self._embedding_store = create_embedding_store(session_maker, self._app_config)
             self._semantic_vector_index = vector_index or SQLiteVecIndex(
                 session_maker,
                 build_vector_index_scope(
@@ -112,14 +133,31 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         """Create FTS5 virtual table for search if it doesn't exist.
 
         Uses CREATE VIRTUAL TABLE IF NOT EXISTS to preserve existing indexed data
-        across server restarts. Also creates vector tables when semantic search
-        is enabled so missing dependencies are caught at startup, not first query.
+        across server restarts. Also creates the search_index_lookup companion
+        table, and vector tables when semantic search is enabled so missing
+        dependencies are caught at startup, not first query.
         """
         logger.debug("Initializing SQLite FTS5 search index")
         try:
             async with db.scoped_session(self.session_maker) as session:
+                result = await session.execute(
+                    text("SELECT name FROM sqlite_master WHERE name IN ('search_index', :lookup)"),
+                    {"lookup": SEARCH_INDEX_LOOKUP_TABLE},
+                )
+                existing_tables = set(result.scalars())
                 # Create FTS5 virtual table if it doesn't exist
                 await session.execute(CREATE_SEARCH_INDEX)
+                await session.execute(CREATE_SEARCH_INDEX_LOOKUP)
+                for statement in CREATE_SEARCH_INDEX_LOOKUP_INDEXES:
+                    await session.execute(statement)
+                # Trigger: the lookup table is new, or search_index was just
+                #          (re)created, e.g. dropped by a full reindex.
+                # Why: the query builder trusts the lookup to list every FTS row,
+                #      and rowids of a recreated FTS table restart from 1.
+                # Outcome: rebuild the lookup from whatever search_index holds now.
+                if existing_tables != {"search_index", SEARCH_INDEX_LOOKUP_TABLE}:
+                    await session.execute(text(f"DELETE FROM {SEARCH_INDEX_LOOKUP_TABLE}"))
+                    await session.execute(BACKFILL_SEARCH_INDEX_LOOKUP_SQL)
                 await session.commit()
         except Exception as e:  # pragma: no cover
             logger.error(f"Error initializing search index: {e}")
@@ -759,6 +797,48 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         """Index multiple rows in FTS only."""
         await super().bulk_index_items(search_index_rows)
 
+    @override
+    async def _delete_search_rows(
+        self, session: AsyncSession, predicate: str, params: dict[str, Any]
+    ) -> None:
+        """Find doomed FTS rows through the lookup indexes and delete both copies."""
+        scoped = f"{predicate} AND project_id = :project_id"
+        params = {**params, "project_id": self.project_id}
+        await session.execute(
+            text(
+                "DELETE FROM search_index WHERE rowid IN "
+                f"(SELECT rowid FROM {SEARCH_INDEX_LOOKUP_TABLE} WHERE {scoped}) AND {scoped}"
+            ),
+            params,
+        )
+        await session.execute(
+            text(f"DELETE FROM {SEARCH_INDEX_LOOKUP_TABLE} WHERE {scoped}"), params
+        )
+
+    @override
+    async def _record_inserted_search_rows(self, session: AsyncSession, row_count: int) -> None:
+        await mirror_search_index_inserts(session, row_count)
+
+    @override
+    async def purge_stale_search_rows(self) -> int:
+        """Purge stale FTS rows, then lookup rows left by deletes that bypass this repo."""
+        purged = await super().purge_stale_search_rows()
+        async with db.scoped_session(self.session_maker) as session:
+            orphaned = await purge_orphaned_lookup_rows(session, self.project_id)
+            await session.commit()
+        if orphaned:
+            logger.debug(f"Purged {orphaned} orphaned search lookup rows")
+        return purged
+
+    @override
+    def _search_row_insert_params(self, search_index_row: SearchIndexRow) -> dict[str, Any]:
+        """Store the note body once: content_snippet already holds it in FTS5."""
+        insert_data = super()._search_row_insert_params(search_index_row)
+        insert_data["content_stems"] = sqlite_fts_content_stems(
+            search_index_row.content_stems, search_index_row.content_snippet
+        )
+        return insert_data
+
     # ------------------------------------------------------------------
     # FTS search (backend-specific)
     # ------------------------------------------------------------------
@@ -782,6 +862,8 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         """Build SQLite FTS FROM/WHERE params shared by search and count."""
         conditions = []
         match_conditions = []
+        # Exact filters the search_index_lookup B-tree indexes can answer.
+        lookup_conditions = []
         params = {}
         order_by_clause = ""
         from_clause = "search_index"
@@ -797,10 +879,17 @@ class SQLiteSearchRepository(SearchRepositoryBase):
                 processed_text = self._prepare_search_term(search_text.strip())
                 params["text"] = processed_text
                 # content_stems is capped for Postgres index-row compatibility, while
-                # SQLite stores the complete note body in its FTS5 content_snippet column.
+                # SQLite stores the complete note body only in its FTS5 content_snippet
+                # column (see sqlite_fts_content_stems).
+                # Trigger: a multi-term query may hit title/path stems and body terms.
+                # Why: stems no longer carry the body, so a per-column MATCH cannot see
+                #      terms split across stems and snippet.
+                # Outcome: the column-filtered table MATCH evaluates the query over
+                #          stems and snippet together, preserving pre-dedupe recall.
                 match_conditions.append(
                     "(search_index.title MATCH :text OR search_index.content_stems MATCH :text "
-                    "OR search_index.content_snippet MATCH :text)"
+                    "OR search_index.content_snippet MATCH :text "
+                    "OR search_index MATCH ('{content_stems content_snippet} : (' || :text || ')'))"
                 )
 
         # Handle title match search
@@ -813,6 +902,7 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         if permalink:
             params["permalink"] = permalink
             conditions.append("search_index.permalink = :permalink")
+            lookup_conditions.append("permalink = :permalink")
 
         # Handle permalink match search, supports *
         if permalink_match:
@@ -822,11 +912,13 @@ class SQLiteSearchRepository(SearchRepositoryBase):
             params["permalink"] = permalink_text
             if "*" in permalink_match:
                 conditions.append("search_index.permalink GLOB :permalink")
+                lookup_conditions.append("permalink GLOB :permalink")
             else:
                 # For exact matches without *, we can use FTS5 MATCH
                 # but only prepare the term if it doesn't look like a path
                 if "/" in permalink_text:
                     conditions.append("search_index.permalink = :permalink")
+                    lookup_conditions.append("permalink = :permalink")
                 else:
                     permalink_text = self._prepare_search_term(permalink_text, is_prefix=False)
                     params["permalink"] = permalink_text
@@ -840,6 +932,7 @@ class SQLiteSearchRepository(SearchRepositoryBase):
                 params[param_name] = t.value
                 type_placeholders.append(f":{param_name}")
             conditions.append(f"search_index.type IN ({', '.join(type_placeholders)})")
+            lookup_conditions.append(f"type IN ({', '.join(type_placeholders)})")
 
         # Handle observation category filter (parameterized for defense-in-depth).
         # Trigger: caller passed `categories` to scope observation results.
@@ -872,12 +965,14 @@ class SQLiteSearchRepository(SearchRepositoryBase):
                 "LOWER(json_extract(search_index.metadata, '$.note_type')) "
                 f"IN ({', '.join(type_placeholders)})"
             )
+            lookup_conditions.append(f"note_type IN ({', '.join(type_placeholders)})")
 
         # Handle date filter using datetime() for proper comparison
         if after_date:
             params["after_date"] = after_date
             # Filter on updated_at so recently-edited notes are included even when created_at is old
             conditions.append("datetime(search_index.updated_at) > datetime(:after_date)")
+            lookup_conditions.append("updated_at > datetime(:after_date)")
 
             # order by most recent first
             order_by_clause = ", search_index.updated_at DESC"
@@ -905,6 +1000,16 @@ class SQLiteSearchRepository(SearchRepositoryBase):
                     params[path_param] = build_sqlite_json_path(filt.path_parts)
                     extract_expr = f"json_extract(entity.entity_metadata, :{path_param})"
 
+                # Trigger: the generated status/type/tags columns carry their own
+                # indexes, but json_each over tags_json cannot use them.
+                # Why: every other filter parses entity_metadata per candidate row.
+                # Outcome: entity_metadata_value narrows the lookup's entity_id
+                #          candidates; the JSON predicate below stays the exact check.
+                if filt.op == "contains" or extract_expr.startswith("json_extract("):
+                    lookup_conditions.append(
+                        build_metadata_value_condition(filt, idx, params, "entity_id")
+                    )
+
                 if filt.op == "eq":
                     value_param = f"meta_val_{idx}"
                     params[value_param] = filt.value
@@ -976,6 +1081,17 @@ class SQLiteSearchRepository(SearchRepositoryBase):
         else:
             conditions.extend(match_conditions)
 
+        # Trigger: no MATCH term narrows the FTS scan, but exact filters are present.
+        # Why: FTS5 evaluates non-MATCH predicates by reading every row.
+        # Outcome: the lookup's B-tree indexes pick candidate rowids, which FTS5
+        #          fetches directly; the predicates above still re-check each row.
+        if lookup_conditions and not match_conditions:
+            lookup_where = " AND ".join(["project_id = :project_id", *lookup_conditions])
+            conditions.append(
+                f"search_index.rowid IN "
+                f"(SELECT rowid FROM {SEARCH_INDEX_LOOKUP_TABLE} WHERE {lookup_where})"
+            )
+
         # Always filter by project_id
         params["project_id"] = self.project_id
         conditions.append("search_index.project_id = :project_id")
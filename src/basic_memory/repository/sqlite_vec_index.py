@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import sys
+from array import array
 from collections.abc import Sequence
 
 from loguru import logger
@@ -28,6 +29,18 @@ from basic_memory.repository.semantic_vector_index import (
 SQLITE_VEC_MAX_K = 4096
 
 
+def float32_blob(values: Sequence[float]) -> bytes:
+    """Pack a vector as the compact little-endian float32 blob sqlite-vec stores natively.
+
+    sqlite-vec also accepts JSON text, but that costs a float-to-decimal round trip per
+    element on the way in and a parse on the way out, and the text is ~3x larger.
+    """
+    packed = array("f", values)
+    if sys.byteorder != "little":  # pragma: no cover - every supported platform is LE
+        packed.byteswap()
+    return packed.tobytes()
+
+
 class SQLiteVecIndex:
     """Persist and query semantic vectors in SQLite with sqlite-vec."""
 
@@ -215,7 +228,7 @@ class SQLiteVecIndex:
                 [
                     {
                         "rowid": rowids_by_key[record.key],
-                        "embedding": json.dumps(record.values),
+                        "embedding": float32_blob(record.values),
                         "source_hash": record.source_hash,
                     }
                     for record in current_records
@@ -353,7 +366,7 @@ class SQLiteVecIndex:
                     "c.entity_id ASC, c.chunk_key ASC LIMIT :limit"
                 ),
                 {
-                    "query": json.dumps(list(query)),
+                    "query": float32_blob(query),
                     "vector_k": vector_k,
                     "project_id": self.scope.project_id,
                     "embedding_identity": self.scope.embedding_identity,
@@ -305,6 +305,10 @@ class InspectQueryTimings(BaseModel):
     fts: float | None
     fusion: float | None
     rerank: float | None
+    # Hybrid only: each leg's own latency and the overlapped wall time of both.
+    fts_leg: float | None = None
+    vector_leg: float | None = None
+    hybrid_legs_wall: float | None = None
 
 
 class InspectQueryResponse(BaseModel):
@@ -461,6 +465,7 @@ def query_trace_response(
     fts = trace.fts if isinstance(trace, (FtsQueryTrace, HybridQueryTrace)) else None
     vector = trace.vector if isinstance(trace, (VectorQueryTrace, HybridQueryTrace)) else None
     fusion = trace.fusion if isinstance(trace, HybridQueryTrace) else None
+    legs = trace.legs if isinstance(trace, HybridQueryTrace) else None
     rerank = trace.rerank if isinstance(trace, (VectorQueryTrace, HybridQueryTrace)) else None
     readiness = trace.readiness if isinstance(trace, (VectorQueryTrace, HybridQueryTrace)) else None
 
@@ -879,5 +884,8 @@ def query_trace_response(
             fts=fts.fts_ms if fts is not None else None,
             fusion=fusion.fusion_ms if fusion is not None else None,
             rerank=rerank.rerank_ms if rerank is not None else None,
+            fts_leg=legs.fts_ms if legs is not None else None,
+            vector_leg=legs.vector_ms if legs is not None else None,
+            hybrid_legs_wall=legs.wall_ms if legs is not None else None,
         ),
     )
@@ -246,6 +246,18 @@ class GraphContext(BaseModel):
     has_more: bool = False
 
 
+class RecentActivityByProject(BaseModel):
+    """Recent entity activity for every project, answered by a single query.
+
+    Each GraphContext holds primary entity results only; no observations or
+    related results are loaded.
+    """
+
+    projects: Dict[str, GraphContext] = Field(
+        description="Recent activity per project, keyed by project external_id"
+    )
+
+
 class ActivityStats(BaseModel):
     """Statistics about activity across all projects."""
 
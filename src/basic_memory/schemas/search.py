@@ -168,3 +168,7 @@ class SearchResponse(BaseModel):
         description="Whether total is an exact count that clients can use for pagination",
     )
     has_more: bool = False
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque token for the next page of a search across all projects",
+    )
@@ -4,7 +4,7 @@ import fnmatch
 import logging
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Sequence, assert_never
+from typing import Dict, Optional, Sequence, assert_never
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -57,71 +57,12 @@ class DirectoryService:
     async def get_directory_tree(self) -> DirectoryNode:
         """Build a hierarchical directory tree from indexed files."""
 
-        # Get all files from DB (flat list)
+        # Get all files from DB (flat list). The tree only needs entity columns, so
+        # skip eager-loading every observation and relation in the project.
         async with db.scoped_session(self.session_maker) as session:
-            entity_rows = await self.entity_repository.find_all(session)
+            entity_rows = await self.entity_repository.find_all(session, use_load_options=False)
 
-        # Create a root directory node
-        root_node = DirectoryNode(name="Root", directory_path="/", type="directory")
-
-        # Map to store directory nodes by path for easy lookup
-        dir_map: Dict[str, DirectoryNode] = {root_node.directory_path: root_node}
-
-        # First pass: create all directory nodes
-        for file in entity_rows:
-            # Process directory path components
-            parts = [p for p in file.file_path.split("/") if p]
-
-            # Create directory structure
-            current_path = "/"
-            for i, part in enumerate(parts[:-1]):  # Skip the filename
-                parent_path = current_path
-                # Build the directory path
-                current_path = (
-                    f"{current_path}{part}" if current_path == "/" else f"{current_path}/{part}"
-                )
-
-                # Create directory node if it doesn't exist
-                if current_path not in dir_map:
-                    dir_node = DirectoryNode(
-                        name=part, directory_path=current_path, type="directory"
-                    )
-                    dir_map[current_path] = dir_node
-
-                    # Add to parent's children
-                    if parent_path in dir_map:
-                        dir_map[parent_path].children.append(dir_node)
-
-        # Second pass: add file nodes to their parent directories
-        for file in entity_rows:
-            file_name = os.path.basename(file.file_path)
-            parent_dir = os.path.dirname(file.file_path)
-            directory_path = "/" if parent_dir == "" else f"/{parent_dir}"
-
-            # Create file node
-            file_node = DirectoryNode(
-                name=file_name,
-                file_path=file.file_path,  # Original path from DB (no leading slash)
-                directory_path=f"/{file.file_path}",  # Path with leading slash
-                type="file",
-                title=file.title,
-                permalink=file.permalink,
-                external_id=file.external_id,  # UUID for v2 API
-                entity_id=file.id,
-                note_type=file.note_type,
-                content_type=file.content_type,
-                updated_at=file.updated_at,
-            )
-
-            # Add to parent directory's children
-            if directory_path in dir_map:
-                dir_map[directory_path].children.append(file_node)
-            else:
-                # If parent directory doesn't exist (should be rare), add to root
-                dir_map["/"].children.append(file_node)  # pragma: no cover
-
-        # Return the root node with its children
-        return root_node
+        return self._build_directory_tree_from_entities(entity_rows, "/")
 
     async def get_directory_structure(self) -> DirectoryNode:
         """Build a hierarchical directory structure without file details.
@@ -209,29 +150,36 @@ class DirectoryService:
         if dir_name != "/" and dir_name.endswith("/"):
             dir_name = dir_name.rstrip("/")
 
-        # Optimize: Query only entities in the target directory
-        # instead of loading the entire tree
-        dir_prefix = dir_name.lstrip("/")
-        async with db.scoped_session(self.session_maker) as session:
-            entity_rows = await self.entity_repository.find_by_directory_prefix(session, dir_prefix)
-
-        # Build a partial tree from only the relevant entities
-        root_tree = self._build_directory_tree_from_entities(entity_rows, dir_name)
-
-        # Find the target directory node
-        target_node = self._find_directory_node(root_tree, dir_name)
-        if not target_node:
-            return DirectoryListResponse(  # pragma: no cover
-                nodes=[],
-                page=page,
-                page_size=page_size,
-                total=0,
-                has_more=False,
-            )
-
-        # Collect nodes with depth and glob filtering
+        # Walk only the levels being listed. Each level reads the direct files of its
+        # directories and skip-scans for their subfolders, so the cost follows the
+        # number of listed nodes rather than how many notes the project holds.
         result: list[DirectoryNode] = []
-        self._collect_nodes_recursive(target_node, result, depth, file_name_glob, 0)
+        frontier = ["" if dir_name == "/" else f"{dir_name.lstrip('/')}/"]
+        async with db.scoped_session(self.session_maker) as session:
+            for _ in range(depth):
+                next_frontier: list[str] = []
+                for directory in frontier:
+                    child_directories = await self.entity_repository.find_child_directories(
+                        session, directory
+                    )
+                    entity_rows = await self.entity_repository.find_by_directory(session, directory)
+                    for child_directory in child_directories:
+                        next_frontier.append(child_directory)
+                        child_path = child_directory.rstrip("/")
+                        child_node = DirectoryNode(
+                            name=os.path.basename(child_path),
+                            directory_path=f"/{child_path}",
+                            type="directory",
+                        )
+                        # The glob gates inclusion in the results only, never descent:
+                        # directory names rarely match file globs (e.g. "test" vs "*.md").
+                        if not file_name_glob or fnmatch.fnmatch(child_node.name, file_name_glob):
+                            result.append(child_node)
+                    for file in entity_rows:
+                        file_node = self._file_node(file)
+                        if not file_name_glob or fnmatch.fnmatch(file_node.name, file_name_glob):
+                            result.append(file_node)
+                frontier = next_frontier
 
         if sort is None:
             # Omitting sort is a compatibility contract: existing callers retain the
@@ -290,6 +238,22 @@ class DirectoryService:
             has_more=end < total,
         )
 
+    def _file_node(self, file: Entity) -> DirectoryNode:
+        """Build the file node for one indexed entity."""
+        return DirectoryNode(
+            name=os.path.basename(file.file_path),
+            file_path=file.file_path,  # Original path from DB (no leading slash)
+            directory_path=f"/{file.file_path}",  # Path with leading slash
+            type="file",
+            title=file.title,
+            permalink=file.permalink,
+            external_id=file.external_id,  # UUID for v2 API
+            entity_id=file.id,
+            note_type=file.note_type,
+            content_type=file.content_type,
+            updated_at=file.updated_at,
+        )
+
     def _build_directory_tree_from_entities(
         self, entity_rows: Sequence[Entity], root_path: str
     ) -> DirectoryNode:
@@ -335,24 +299,11 @@ class DirectoryService:
 
         # Second pass: add file nodes to their parent directories
         for file in entity_rows:
-            file_name = os.path.basename(file.file_path)
             parent_dir = os.path.dirname(file.file_path)
             directory_path = "/" if parent_dir == "" else f"/{parent_dir}"
 
             # Create file node
-            file_node = DirectoryNode(
-                name=file_name,
-                file_path=file.file_path,
-                directory_path=f"/{file.file_path}",
-                type="file",
-                title=file.title,
-                permalink=file.permalink,
-                external_id=file.external_id,  # UUID for v2 API
-                entity_id=file.id,
-                note_type=file.note_type,
-                content_type=file.content_type,
-                updated_at=file.updated_at,
-            )
+            file_node = self._file_node(file)
 
             # Add to parent directory's children
             if directory_path in dir_map:
@@ -362,43 +313,3 @@ class DirectoryService:
                 dir_map[root_path].children.append(file_node)  # pragma: no cover
 
         return root_node
-
-    def _find_directory_node(
-        self, root: DirectoryNode, target_path: str
-    ) -> Optional[DirectoryNode]:
-        """Find a directory node by path in the tree."""
-        if root.directory_path == target_path:
-            return root
-
-        for child in root.children:  # pragma: no cover
-            if child.type == "directory":  # pragma: no cover
-                found = self._find_directory_node(child, target_path)  # pragma: no cover
-                if found:  # pragma: no cover
-                    return found  # pragma: no cover
-
-        return None  # pragma: no cover
-
-    def _collect_nodes_recursive(
-        self,
-        node: DirectoryNode,
-        result: List[DirectoryNode],
-        max_depth: int,
-        file_name_glob: Optional[str],
-        current_depth: int,
-    ) -> None:
-        """Recursively collect nodes with depth and glob filtering."""
-        if current_depth >= max_depth:
-            return
-
-        for child in node.children:
-            # The glob gates inclusion in the results only. Recursion below must not
-            # be gated by it: directory names rarely match file globs (e.g. "test"
-            # vs "*.md"), and pruning here would hide every file beneath them.
-            if not file_name_glob or fnmatch.fnmatch(child.name, file_name_glob):
-                result.append(child)
-
-            # Recurse into subdirectories if we haven't reached max depth
-            if child.type == "directory" and current_depth < max_depth:
-                self._collect_nodes_recursive(
-                    child, result, max_depth, file_name_glob, current_depth + 1
-                )
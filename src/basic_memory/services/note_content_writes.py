@@ -32,6 +32,10 @@ from basic_memory.indexing.relation_persistence import (
     RelationGenerationPublication,
     RelationGenerationPublisher,
 )
+from basic_memory.repository.project_stat_repository import (
+    ProjectStatCompactionSchedule,
+    ProjectStatRepository,
+)
 from basic_memory.runtime.note_content import (
     RuntimeAcceptedNoteChange,
     RuntimeNoteContentResponsePayload,
@@ -45,6 +49,10 @@ from basic_memory.schemas.request import EditEntityRequest
 
 AcceptedNoteChange = RuntimeAcceptedNoteChange[RuntimeNoteContentResponsePayload]
 
+# Services are built per request, so the write counts behind API-path compaction
+# live for the process.
+project_stat_compaction_schedule = ProjectStatCompactionSchedule()
+
 
 class NoteContentMutationFreshener(Protocol):
     """Refresh current runtime file state before mutating an existing note."""
@@ -149,12 +157,14 @@ class NoteContentMutationService:
         content_freshener: NoteContentMutationFreshener | None = None,
         actor_resolver: NoteContentMutationActorResolver | None = None,
         read_cache: ReadCacheInvalidator | None = None,
+        compaction_schedule: ProjectStatCompactionSchedule | None = None,
     ) -> None:
         self.session_maker = session_maker
         self.mutation_dependencies = mutation_dependencies
         self.content_freshener = content_freshener
         self.actor_resolver = actor_resolver
         self.read_cache = read_cache
+        self.compaction_schedule = compaction_schedule or project_stat_compaction_schedule
 
     async def _publish_relation_generation(
         self,
@@ -184,11 +194,33 @@ class NoteContentMutationService:
             observations=publication.observations,
         )
 
+    async def _compact_project_stats_if_due(self, project_external_id: str) -> None:
+        """Fold the project's counter deltas once enough accepted writes have landed."""
+        if not self.compaction_schedule.record_write(project_external_id):
+            return
+        try:
+            async with accepted_note_transaction(self.session_maker) as session:
+                project = await self.mutation_dependencies.project_repository.get_by_external_id(
+                    session, project_external_id
+                )
+                if project is not None:
+                    await ProjectStatRepository().compact(session, project.id)
+        except Exception:
+            # Trigger: compaction fails after the accepted write committed.
+            # Why: the deltas still sum to the right counters, only more slowly.
+            # Outcome: keep the accepted change; the next due write retries.
+            logger.exception(
+                "Project stat compaction failed after accepted note commit: project={}",
+                project_external_id,
+            )
+
     async def _finish_mutation(
         self,
         result: AcceptedNoteMutationResult,
+        *,
+        project_external_id: str,
     ) -> AcceptedNoteChange:
-        """Run post-commit graph publication and expose the accepted response."""
+        """Run post-commit graph publication and counter compaction, then expose the response."""
         try:
             await self._publish_relation_generation(result.relation_publication)
         except Exception:
@@ -203,6 +235,7 @@ class NoteContentMutationService:
                 publication.entity_id if publication is not None else None,
                 publication.generation if publication is not None else None,
             )
+        await self._compact_project_stats_if_due(project_external_id)
         return result.change
 
     @asynccontextmanager
@@ -326,7 +359,9 @@ class NoteContentMutationService:
                         ),
                         dependencies=self.mutation_dependencies,
                     )
-                accepted = await self._finish_mutation(result)
+                accepted = await self._finish_mutation(
+                    result, project_external_id=project_external_id
+                )
             return accepted
         except AcceptedNoteMutationRejected as error:
             raise note_content_mutation_error_from_rejection(error.rejection) from error
@@ -386,7 +421,9 @@ class NoteContentMutationService:
                         ),
                         dependencies=self.mutation_dependencies,
                     )
-                accepted = await self._finish_mutation(result)
+                accepted = await self._finish_mutation(
+                    result, project_external_id=project_external_id
+                )
         except AcceptedNoteMutationRejected as error:
             raise note_content_mutation_error_from_rejection(error.rejection) from error
         return accepted
@@ -436,7 +473,9 @@ class NoteContentMutationService:
                         ),
                         dependencies=self.mutation_dependencies,
                     )
-                accepted = await self._finish_mutation(result)
+                accepted = await self._finish_mutation(
+                    result, project_external_id=project_external_id
+                )
         except AcceptedNoteMutationRejected as error:
             raise note_content_mutation_error_from_rejection(error.rejection) from error
         return accepted
@@ -486,7 +525,9 @@ class NoteContentMutationService:
                         ),
                         dependencies=self.mutation_dependencies,
                     )
-                accepted = await self._finish_mutation(result)
+                accepted = await self._finish_mutation(
+                    result, project_external_id=project_external_id
+                )
         except AcceptedNoteMutationRejected as error:
             raise note_content_mutation_error_from_rejection(error.rejection) from error
         return accepted
@@ -517,7 +558,9 @@ class NoteContentMutationService:
                         ),
                         dependencies=self.mutation_dependencies,
                     )
-                accepted = await self._finish_mutation(result)
+                accepted = await self._finish_mutation(
+                    result, project_external_id=project_external_id
+                )
         except AcceptedNoteMutationRejected as error:
             raise note_content_mutation_error_from_rejection(error.rejection) from error
         return accepted
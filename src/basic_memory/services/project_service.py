@@ -19,6 +19,7 @@ from sqlalchemy.sql.base import Executable
 from basic_memory import db
 from basic_memory.models import Project
 from basic_memory.repository.project_repository import ProjectRepository
+from basic_memory.repository.project_stat_repository import ProjectStatRepository
 from basic_memory.repository.search_repository import SearchRepository, create_search_repository
 from basic_memory.repository.embedding_provider_factory import (
     configured_embedding_provider_identity,
@@ -792,70 +793,17 @@ class ProjectService:
             raise ValueError("Repository is required for get_statistics")
 
         async with db.scoped_session(self.session_maker) as session:
-            # Get basic counts
-            entity_count_result = await self.repository.execute_query(
-                session,
-                text("SELECT COUNT(*) FROM entity WHERE project_id = :project_id"),
-                {"project_id": project_id},
-            )
-            total_entities = entity_count_result.scalar() or 0
-
-            observation_count_result = await self.repository.execute_query(
-                session,
-                text(
-                    "SELECT COUNT(*) FROM observation o JOIN entity e ON o.entity_id = e.id WHERE e.project_id = :project_id"
-                ),
-                {"project_id": project_id},
-            )
-            total_observations = observation_count_result.scalar() or 0
-
-            relation_count_result = await self.repository.execute_query(
-                session,
-                text(
-                    "SELECT COUNT(*) FROM relation r JOIN entity e ON r.from_id = e.id WHERE e.project_id = :project_id"
-                ),
-                {"project_id": project_id},
-            )
-            total_relations = relation_count_result.scalar() or 0
-
-            unresolved_count_result = await self.repository.execute_query(
-                session,
-                text(
-                    "SELECT COUNT(*) FROM relation r JOIN entity e ON r.from_id = e.id WHERE r.to_id IS NULL AND e.project_id = :project_id"
-                ),
-                {"project_id": project_id},
-            )
-            total_unresolved = unresolved_count_result.scalar() or 0
-
-            # Get entity counts by note type
-            note_types_result = await self.repository.execute_query(
-                session,
-                text(
-                    "SELECT note_type, COUNT(*) FROM entity WHERE project_id = :project_id GROUP BY note_type"
-                ),
-                {"project_id": project_id},
-            )
-            note_types = {row[0]: row[1] for row in note_types_result.fetchall()}
-
-            # Get observation counts by category
-            category_result = await self.repository.execute_query(
-                session,
-                text(
-                    "SELECT o.category, COUNT(*) FROM observation o JOIN entity e ON o.entity_id = e.id WHERE e.project_id = :project_id GROUP BY o.category"
-                ),
-                {"project_id": project_id},
-            )
-            observation_categories = {row[0]: row[1] for row in category_result.fetchall()}
-
-            # Get relation counts by type
-            relation_types_result = await self.repository.execute_query(
-                session,
-                text(
-                    "SELECT r.relation_type, COUNT(*) FROM relation r JOIN entity e ON r.from_id = e.id WHERE e.project_id = :project_id GROUP BY r.relation_type"
-                ),
-                {"project_id": project_id},
-            )
-            relation_types = {row[0]: row[1] for row in relation_types_result.fetchall()}
+            # Why: COUNT(*) over entity, observation, and relation grew with the
+            # knowledge base and ran on every project-info request.
+            # Outcome: triggers keep per-project counters; reads sum a few rows.
+            counts = await ProjectStatRepository().get_counts(session, project_id)
+            total_entities = counts.total("note_type")
+            total_observations = counts.total("observation_category")
+            total_relations = counts.total("relation_type")
+            total_unresolved = counts.total("unresolved_relations")
+            note_types = counts.by_key("note_type")
+            observation_categories = counts.by_key("observation_category")
+            relation_types = counts.by_key("relation_type")
 
             # Find most connected entities (most outgoing relations) - project filtered
             connected_result = await self.repository.execute_query(
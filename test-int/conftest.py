@@ -290,7 +290,11 @@ async def engine_factory(
     None,
 ]:
     """Create engine and session factory for the configured database backend."""
-    from basic_memory.models.search import CREATE_SEARCH_INDEX
+    from basic_memory.models.search import (
+        CREATE_SEARCH_INDEX,
+        CREATE_SEARCH_INDEX_LOOKUP,
+        CREATE_SEARCH_INDEX_LOOKUP_INDEXES,
+    )
     from basic_memory import db
 
     if db_backend == "postgres":
@@ -339,6 +343,9 @@ async def engine_factory(
             async with db.scoped_session(session_maker) as session:
                 await session.execute(text("DROP TABLE IF EXISTS search_index"))
                 await session.execute(CREATE_SEARCH_INDEX)
+                await session.execute(CREATE_SEARCH_INDEX_LOOKUP)
+                for statement in CREATE_SEARCH_INDEX_LOOKUP_INDEXES:
+                    await session.execute(statement)
                 await session.commit()
 
             yield engine, session_maker
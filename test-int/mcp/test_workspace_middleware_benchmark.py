@@ -0,0 +1,137 @@
+"""Per-tool latency of local MCP calls before and after the ASGI workspace middleware.
+
+"Before" reproduces the previous request path: the workspace permalink
+middleware written as ``@app.middleware("http")``. "After" is the shipped plain
+ASGI ``WorkspacePermalinkContextMiddleware``. Both go through httpx's
+ASGITransport against the same seeded project, interleaved round by round so
+warm-up and cache state favour neither.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from statistics import median
+from time import perf_counter
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastmcp import Client
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from basic_memory.api.app import WorkspacePermalinkContextMiddleware
+from basic_memory.workspace_context import (
+    WORKSPACE_SLUG_HEADER,
+    WORKSPACE_TYPE_HEADER,
+    workspace_permalink_context,
+    workspace_permalink_context_validation_error,
+)
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 15
+
+
+async def _legacy_workspace_permalink_context_middleware(request: Request, call_next):
+    """The workspace middleware as it ran before, through BaseHTTPMiddleware."""
+    workspace_slug = request.headers.get(WORKSPACE_SLUG_HEADER, "")
+    workspace_type = request.headers.get(WORKSPACE_TYPE_HEADER, "")
+
+    validation_error = workspace_permalink_context_validation_error(workspace_slug, workspace_type)
+    if validation_error is not None:
+        return JSONResponse(status_code=400, content={"detail": validation_error})
+
+    if not workspace_slug:
+        return await call_next(request)
+
+    with workspace_permalink_context(
+        workspace_slug=workspace_slug,
+        workspace_type=workspace_type,
+    ):
+        return await call_next(request)
+
+
+@contextmanager
+def _request_path(app: FastAPI, *, legacy: bool) -> Generator[None]:
+    """Route local MCP calls through the legacy or the shipped request path."""
+    previous_middleware = list(app.user_middleware)
+    if legacy:
+        app.user_middleware = [
+            Middleware(BaseHTTPMiddleware, dispatch=_legacy_workspace_permalink_context_middleware)
+            if middleware.cls == WorkspacePermalinkContextMiddleware
+            else middleware
+            for middleware in previous_middleware
+        ]
+    # Starlette builds the middleware stack lazily on the next request.
+    app.middleware_stack = None
+    try:
+        yield
+    finally:
+        app.user_middleware = previous_middleware
+        app.middleware_stack = None
+
+
+async def _timed_call(client: Client[Any], tool: str, args: dict[str, Any]) -> tuple[float, str]:
+    started = perf_counter()
+    result = await client.call_tool(tool, args)
+    elapsed = perf_counter() - started
+    return elapsed, "".join(str(getattr(block, "text", "")) for block in result.content)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_local_tool_latency_by_middleware(mcp_server, app, test_project):
+    """Report median per-tool latency for both request paths and compare outputs."""
+    project = test_project.name
+    tool_calls: dict[str, dict[str, Any]] = {
+        "search_notes": {"project": project, "query": "transport benchmark"},
+        "read_note": {"project": project, "identifier": "Transport Benchmark 0"},
+        "build_context": {"project": project, "url": "benchmark/*"},
+        "recent_activity": {"project": project, "type": "entity"},
+    }
+    # Outputs that embed a generation timestamp cannot be compared byte for byte.
+    deterministic_tools = {"search_notes", "read_note"}
+
+    async with Client(mcp_server) as client:
+        for index in range(20):
+            await client.call_tool(
+                "write_note",
+                {
+                    "project": project,
+                    "title": f"Transport Benchmark {index}",
+                    "directory": "benchmark",
+                    "content": (
+                        f"# Transport Benchmark {index}\n\n"
+                        f"- [note] transport benchmark observation {index}\n"
+                        f"- links_to [[Transport Benchmark {(index + 1) % 20}]]"
+                    ),
+                },
+            )
+
+        latencies: dict[tuple[str, bool], list[float]] = {
+            (tool, legacy): [] for tool in tool_calls for legacy in (True, False)
+        }
+        outputs: dict[tuple[str, bool], str] = {}
+        for round_index in range(ROUNDS + 1):
+            for legacy in (True, False):
+                with _request_path(app, legacy=legacy):
+                    for tool, args in tool_calls.items():
+                        elapsed, text = await _timed_call(client, tool, args)
+                        outputs[(tool, legacy)] = text
+                        # The first round only warms caches and compiled statements.
+                        if round_index:
+                            latencies[(tool, legacy)].append(elapsed)
+
+    for tool in deterministic_tools:
+        assert outputs[(tool, False)] == outputs[(tool, True)]
+
+    print("\nLocal MCP workspace middleware benchmark (median ms per call):")
+    for tool in tool_calls:
+        before_ms = median(latencies[(tool, True)]) * 1_000
+        after_ms = median(latencies[(tool, False)]) * 1_000
+        print(
+            f"  {tool}: before={before_ms:.2f} after={after_ms:.2f} "
+            f"saved={before_ms - after_ms:.2f}"
+        )
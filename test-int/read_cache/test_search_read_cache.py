@@ -13,6 +13,7 @@ from basic_memory.index.local_schedulers import LocalEntityVectorSyncScheduler
 from basic_memory.models import Project
 from basic_memory.read_cache import ReadCacheKey, ReadCacheOperation
 from basic_memory.read_cache.redis import RedisReadCache
+from basic_memory.runtime.vector_sync import VectorSyncBatchResult
 
 
 class RedisCacheHarness(Protocol):
@@ -55,6 +56,10 @@ class PartiallyFailingVectorSync:
         self.synced_entity_ids.append(entity_id)
         raise RuntimeError("vector publication failed")
 
+    async def sync_entity_vectors_batch(self, entity_ids: list[int]) -> VectorSyncBatchResult:
+        self.synced_entity_ids.extend(entity_ids)
+        raise RuntimeError("vector publication failed")
+
 
 @pytest.mark.asyncio
 async def test_post_and_query_share_canonical_real_redis_entry(
@@ -186,7 +191,7 @@ async def test_partial_vector_publication_invalidates_real_redis_generation(
     )
 
     with pytest.raises(RuntimeError, match="vector publication failed"):
-        await scheduler._run_entity_vector_sync(entity_id=42)
+        await scheduler._run_entity_vector_sync_batch([42])
 
     generation_after = (await redis_cache.cache.lookup(cache_key)).generation
     assert vector_sync.synced_entity_ids == [42]
@@ -34,6 +34,7 @@ from basic_memory.repository.embedding_provider_factory import (
     reset_embedding_provider_cache,
 )
 from basic_memory.repository.fastembed_provider import FastEmbedEmbeddingProvider
+from basic_memory.repository.query_caching_provider import QueryCachingEmbeddingProvider
 from basic_memory.repository.search_repository import create_search_repository
 from basic_memory.repository.sqlite_search_repository import SQLiteSearchRepository
 
@@ -66,7 +67,9 @@ async def test_factory_resolves_single_provider_across_repositories(
     config = _semantic_config(tmp_path)
 
     expected_provider = create_embedding_provider(config)
-    assert isinstance(expected_provider, FastEmbedEmbeddingProvider)
+    # The query-embedding cache wraps the shared FastEmbed provider by default.
+    assert isinstance(expected_provider, QueryCachingEmbeddingProvider)
+    assert isinstance(expected_provider.provider, FastEmbedEmbeddingProvider)
 
     # Two repositories, mimicking per-request / per-sync construction.
     repo_a = cast(
@@ -16,7 +16,15 @@ from sqlalchemy import text
 
 from basic_memory import db
 from basic_memory.config import DatabaseBackend
+from basic_memory.markdown.parse_stage import (
+    MarkdownParseFailure,
+    MarkdownParseRequest,
+    MarkdownParseStage,
+    resolve_parse_workers,
+    shutdown_markdown_parse_pool,
+)
 from basic_memory.repository.fastembed_provider import FastEmbedEmbeddingProvider
+from basic_memory.repository.search_repository_base import SearchRepositoryBase
 from basic_memory.repository.sqlite_search_repository import SQLiteSearchRepository
 from basic_memory.schemas.search import SearchItemType, SearchQuery, SearchRetrievalMode
 
@@ -240,11 +248,11 @@ def _first_relevant_rank(results, expected_topic: str, k: int) -> int | None:
     return None
 
 
-async def _seed_benchmark_notes(search_service, note_count: int):
+async def _seed_benchmark_notes(search_service, note_count: int, start_index: int = 0):
     entities = []
     topic_names = list(TOPIC_TERMS.keys())
 
-    for note_index in range(note_count):
+    for note_index in range(start_index, start_index + note_count):
         topic = topic_names[note_index % len(topic_names)]
         terms = TOPIC_TERMS[topic]
         permalink = f"bench/{topic}-{note_index:05d}"
@@ -315,6 +323,142 @@ async def test_benchmark_search_index_cold_start_300_notes(search_service, app_c
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_benchmark_markdown_parse_scaling_by_workers():
+    """Benchmark bulk markdown parsing throughput as parse workers are added."""
+    note_count = 1200
+    topic_names = list(TOPIC_TERMS.keys())
+    requests = []
+    for note_index in range(note_count):
+        topic = topic_names[note_index % len(topic_names)]
+        content = _build_benchmark_content(topic, TOPIC_TERMS[topic], note_index)
+        # Observations and relations exercise the markdown-it plugins as real notes do.
+        content += "".join(
+            f"- [{topic}] observation {item} for note {note_index} #benchmark\n"
+            f"- relates_to [[{topic.title()} Benchmark Note {item}]]\n"
+            for item in range(10)
+        )
+        requests.append(
+            MarkdownParseRequest(path=f"bench/{topic}-{note_index:05d}.md", content=content)
+        )
+
+    max_workers = resolve_parse_workers(0)
+    worker_counts = sorted({1, *(count for count in (2, 4, 8) if count <= max_workers)})
+    notes_per_sec_by_workers: dict[int, float] = {}
+    try:
+        for workers in worker_counts:
+            stage = MarkdownParseStage(workers=workers, min_batch_size=1)
+            # Warm the pool so worker start-up is not billed to the first measurement.
+            await stage.parse(requests[: workers * 4])
+            start = time.perf_counter()
+            results = await stage.parse(requests)
+            elapsed_seconds = time.perf_counter() - start
+            assert len(results) == note_count
+            assert not any(isinstance(result, MarkdownParseFailure) for result in results)
+            notes_per_sec_by_workers[workers] = note_count / elapsed_seconds
+    finally:
+        shutdown_markdown_parse_pool()
+
+    baseline = notes_per_sec_by_workers[1]
+    best_workers = max(notes_per_sec_by_workers, key=notes_per_sec_by_workers.__getitem__)
+    speedup = notes_per_sec_by_workers[best_workers] / baseline
+    metrics: dict[str, float | int | str] = {
+        "notes_parsed": note_count,
+        "cpu_count": os.cpu_count() or 1,
+        "best_workers": best_workers,
+        "speedup_vs_in_loop": round(speedup, 6),
+        **{
+            f"notes_per_sec_{workers}_workers": round(rate, 6)
+            for workers, rate in notes_per_sec_by_workers.items()
+        },
+    }
+    benchmark_name = f"markdown parse scaling ({note_count} notes)"
+    print(f"\nBENCHMARK: {benchmark_name}")
+    for workers, rate in notes_per_sec_by_workers.items():
+        print(f"{workers} worker(s): {rate:.2f} notes/sec")
+    print(f"speedup vs in-loop: {speedup:.2f}x")
+    _write_benchmark_artifact(benchmark_name, metrics)
+    _enforce_min_threshold(
+        metric_name="parse.speedup_vs_in_loop",
+        actual=speedup,
+        env_var="BASIC_MEMORY_BENCH_MIN_PARSE_SPEEDUP",
+    )
+
+
+async def _search_index_stored_chars(search_service, entities) -> int:
+    async with db.scoped_session(search_service.repository.session_maker) as session:
+        result = await session.execute(
+            text(
+                "SELECT COALESCE(SUM(LENGTH(content_stems)), 0) "
+                "+ COALESCE(SUM(LENGTH(content_snippet)), 0) "
+                "FROM search_index WHERE entity_id >= :first_id AND entity_id <= :last_id"
+            ),
+            {"first_id": entities[0].id, "last_id": entities[-1].id},
+        )
+        return int(result.scalar_one())
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+async def test_benchmark_search_index_body_layout_300_notes(
+    search_service, app_config, monkeypatch
+):
+    """Benchmark FTS5 size and write throughput with and without the duplicate body copy."""
+    _skip_if_not_sqlite(app_config)
+
+    note_count = 300
+    repository = search_service.repository
+    layouts: dict[str, dict[str, float | int | str]] = {}
+
+    for layout, start_index in (("legacy", 0), ("deduped", note_count)):
+        with monkeypatch.context() as patch:
+            if layout == "legacy":
+                # Pre-dedupe layout: stems keep the full body alongside content_snippet.
+                patch.setattr(
+                    repository,
+                    "_search_row_insert_params",
+                    lambda row: SearchRepositoryBase._search_row_insert_params(repository, row),
+                )
+            size_before = await _sqlite_size_bytes(search_service)
+            start = time.perf_counter()
+            entities = await _seed_benchmark_notes(
+                search_service, note_count=note_count, start_index=start_index
+            )
+            elapsed_seconds = time.perf_counter() - start
+            size_growth = await _sqlite_size_bytes(search_service) - size_before
+
+        benchmark_name = f"fts body layout ({layout}, {note_count} notes)"
+        metrics = _print_index_metrics(
+            name=benchmark_name,
+            note_count=note_count,
+            elapsed_seconds=elapsed_seconds,
+            db_size_bytes=size_growth,
+        )
+        metrics["search_index_chars"] = await _search_index_stored_chars(search_service, entities)
+        print(f"search_index stored chars: {metrics['search_index_chars']}")
+        _write_benchmark_artifact(benchmark_name, metrics)
+        layouts[layout] = metrics
+
+    legacy_chars = int(layouts["legacy"]["search_index_chars"])
+    deduped_chars = int(layouts["deduped"]["search_index_chars"])
+    assert deduped_chars < legacy_chars
+
+    # Deduped stems must not cost recall for queries mixing title and body terms.
+    results = await search_service.search(
+        SearchQuery(text="benchmark oauth", entity_types=[SearchItemType.ENTITY]),
+        limit=10,
+    )
+    assert any((row.permalink or "").startswith("bench/auth-") for row in results)
+
+    _enforce_max_threshold(
+        metric_name="layout.deduped_size_ratio",
+        actual=float(layouts["deduped"]["sqlite_size_bytes"])
+        / max(float(layouts["legacy"]["sqlite_size_bytes"]), 1.0),
+        env_var="BASIC_MEMORY_BENCH_MAX_DEDUPED_SIZE_RATIO",
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.benchmark
 async def test_benchmark_search_query_latency_by_mode(search_service, app_config):
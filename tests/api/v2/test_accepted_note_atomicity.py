@@ -65,7 +65,7 @@ async def _load_persisted_snapshot(
         search_content = (
             await session.execute(
                 text("""
-                    SELECT content_stems
+                    SELECT content_snippet
                     FROM search_index
                     WHERE project_id = :project_id
                       AND entity_id = :entity_id
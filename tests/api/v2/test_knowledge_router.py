@@ -7,6 +7,7 @@ import uuid
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 
 from basic_memory import db
 from basic_memory.api.v2.routers.knowledge_router import _canonical_file_path
@@ -16,15 +17,17 @@ from basic_memory.index.local_project import (
     LocalProjectIndexRuntimeFactory,
     run_local_project_index_for_project,
 )
-from basic_memory.models import Entity as EntityModel, Project
+from basic_memory.models import Entity as EntityModel, Project, ProjectStat
 from basic_memory.repository.entity_repository import EntityRepository
 from basic_memory.repository.note_content_repository import NoteContentRepository
 from basic_memory.repository.project_repository import ProjectRepository
+from basic_memory.repository.project_stat_repository import ProjectStatCompactionSchedule
 from basic_memory.runtime.vector_sync import VectorSyncBatchResult
 from basic_memory.runtime.note_content import NOTE_CONTENT_BASE_CHECKSUM_HEADER
 from basic_memory.schemas import DeleteEntitiesResponse
 from basic_memory.schemas.response import DirectoryMoveResult, DirectoryDeleteResult
 from basic_memory.schemas.v2 import EntityResponseV2, EntityResolveResponse, LinkResolveResponse
+from basic_memory.services import note_content_writes
 from basic_memory.services.search_service import SearchService
 
 
@@ -1191,6 +1194,43 @@ async def test_delete_entity_by_id(
     assert note_content is None
 
 
+@pytest.mark.asyncio
+async def test_accepted_writes_compact_project_stat_deltas(
+    client: AsyncClient, session_maker, test_project: Project, v2_project_url, monkeypatch
+):
+    """API writes alone fold the project's counter deltas without the indexer."""
+    monkeypatch.setattr(
+        note_content_writes,
+        "project_stat_compaction_schedule",
+        ProjectStatCompactionSchedule(every=2),
+    )
+    create_data = {
+        "title": "Compacted Note",
+        "directory": "test",
+        "note_type": "compacted",
+        "content": "Counted, then deleted",
+    }
+    response = await client.post(f"{v2_project_url}/knowledge/entities", json=create_data)
+    assert response.status_code == 202
+    created_entity = EntityResponseV2.model_validate(response.json())
+
+    response = await client.delete(
+        f"{v2_project_url}/knowledge/entities/{created_entity.external_id}"
+    )
+    assert response.status_code == 202
+
+    # The +1/-1 pair for the note type folds away on the second write.
+    async with db.scoped_session(session_maker) as session:
+        rows = await session.execute(
+            select(ProjectStat.stat_count).where(
+                ProjectStat.project_id == test_project.id,
+                ProjectStat.stat_kind == "note_type",
+                ProjectStat.stat_key == "compacted",
+            )
+        )
+        assert rows.all() == []
+
+
 @pytest.mark.asyncio
 async def test_delete_entity_by_id_not_found(client: AsyncClient, v2_project_url):
     """Test deleting a non-existent entity returns deleted=False (idempotent)."""
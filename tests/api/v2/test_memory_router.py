@@ -1,5 +1,7 @@
 """Tests for v2 memory router endpoints."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from httpx import AsyncClient
 from pathlib import Path
@@ -336,3 +338,68 @@ async def test_v2_memory_endpoints_use_project_id_not_name(
 
     # FastAPI path validation should reject non-integer project_id
     assert response.status_code in [404, 422]
+
+
+@pytest.mark.asyncio
+async def test_recent_across_projects_ranks_each_project_by_updated_at(
+    client: AsyncClient,
+    test_project: Project,
+    session_maker,
+    project_repository,
+    entity_repository,
+    tmp_path,
+):
+    """The cross-project endpoint pages each project's newest entities independently."""
+    now = datetime.now(timezone.utc)
+    async with db.scoped_session(session_maker) as session:
+        quiet_project = await project_repository.create(
+            session,
+            {
+                "name": "quiet-project",
+                "path": str(tmp_path / "quiet-project"),
+                "is_active": True,
+                "is_default": False,
+            },
+        )
+        for i, age in enumerate([timedelta(hours=1), timedelta(hours=3), timedelta(hours=2)]):
+            await entity_repository.create(
+                session,
+                {
+                    "title": f"Recent {i}",
+                    "note_type": "note",
+                    "content_type": "text/markdown",
+                    "file_path": f"recent/recent_{i}.md",
+                    "created_at": now - age,
+                    "updated_at": now - age,
+                },
+            )
+        # Outside the default 7d window.
+        await entity_repository.create(
+            session,
+            {
+                "title": "Stale",
+                "note_type": "note",
+                "content_type": "text/markdown",
+                "file_path": "stale.md",
+                "created_at": now - timedelta(days=30),
+                "updated_at": now - timedelta(days=30),
+            },
+        )
+
+    response = await client.get("/v2/memory/recent", params={"page": 1, "page_size": 2})
+    assert response.status_code == 200
+    projects = response.json()["projects"]
+
+    assert projects[quiet_project.external_id]["results"] == []
+    first_page = projects[test_project.external_id]
+    assert [r["primary_result"]["title"] for r in first_page["results"]] == [
+        "Recent 0",
+        "Recent 2",
+    ]
+    assert first_page["results"][0]["primary_result"]["file_path"] == "recent/recent_0.md"
+    assert first_page["has_more"] is True
+
+    response = await client.get("/v2/memory/recent", params={"page": 2, "page_size": 2})
+    second_page = response.json()["projects"][test_project.external_id]
+    assert [r["primary_result"]["title"] for r in second_page["results"]] == ["Recent 1"]
+    assert second_page["has_more"] is False
@@ -7,6 +7,7 @@ Note types use one snake_case identity at write and query boundaries. Legacy sto
 spellings remain part of the same logical population.
 """
 
+import importlib
 from pathlib import Path
 from textwrap import dedent
 
@@ -18,6 +19,8 @@ from basic_memory.models import Entity, Project
 from basic_memory.schemas.base import Entity as EntitySchema
 from basic_memory.services.file_service import FileService
 
+schema_router_module = importlib.import_module("basic_memory.api.v2.routers.schema_router")
+
 
 # --- Helpers ---
 
@@ -525,6 +528,51 @@ async def test_validate_all_types_with_schemas(
     assert summaries["meeting"]["total_notes"] == 0
 
 
+@pytest.mark.asyncio
+async def test_validate_all_types_reads_each_schema_once_across_batches(
+    client: AsyncClient,
+    test_project: Project,
+    v2_project_url: str,
+    entity_service,
+    search_service,
+    monkeypatch,
+):
+    """Project-wide validation resolves a shared schema once, however many batches it spans."""
+    schema_entity, _ = await entity_service.create_or_update_entity(
+        EntitySchema(
+            title="Person Schema",
+            directory="schemas",
+            note_type="schema",
+            entity_metadata={"entity": "person", "schema": {"name": "string", "role": "string"}},
+            content=dedent("""\
+                ## Observations
+                - [note] Schema definition for person entities
+            """),
+        )
+    )
+    await search_service.index_entity(schema_entity)
+    await create_person_entities(entity_service, search_service)
+
+    schema_reads: list[str] = []
+    read_file_content = FileService.read_file_content
+
+    async def counting_read(self, path):
+        schema_reads.append(str(path))
+        return await read_file_content(self, path)
+
+    monkeypatch.setattr(FileService, "read_file_content", counting_read)
+    monkeypatch.setattr(schema_router_module, "_VALIDATION_BATCH_SIZE", 2)
+
+    response = await client.post(f"{v2_project_url}/schema/validate")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_entities"] == 3
+    assert data["valid_count"] == 3
+    assert sorted(r["note_identifier"] for r in data["results"]) == ["Alice", "Bob", "Carol"]
+    assert schema_reads == [schema_entity.file_path]
+
+
 @pytest.mark.asyncio
 async def test_validate_all_types_no_schemas(
     client: AsyncClient,
@@ -1,9 +1,19 @@
 """Tests for workspace permalink context headers."""
 
+from typing import Any
+
+import httpx
 import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 from httpx import AsyncClient
 
-from basic_memory.workspace_context import WORKSPACE_SLUG_HEADER, WORKSPACE_TYPE_HEADER
+from basic_memory.api.app import WorkspacePermalinkContextMiddleware
+from basic_memory.workspace_context import (
+    WORKSPACE_SLUG_HEADER,
+    WORKSPACE_TYPE_HEADER,
+    current_workspace_permalink_context,
+)
 
 
 @pytest.mark.asyncio
@@ -39,3 +49,92 @@ async def test_workspace_permalink_headers_fail_fast(
 
     assert response.status_code == 400
     assert response.json()["detail"] == expected_detail
+
+
+def _passthrough_app(*, with_middleware: bool) -> FastAPI:
+    app = FastAPI()
+    if with_middleware:
+        app.add_middleware(WorkspacePermalinkContextMiddleware)
+
+    @app.post("/echo/{name}")
+    async def echo(name: str, request: Request) -> dict[str, Any]:
+        return {
+            "name": name,
+            "query": str(request.url.query),
+            "body": (await request.json()),
+            "header": request.headers.get("x-custom"),
+        }
+
+    @app.api_route("/stream", methods=["GET", "HEAD"])
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            yield b"first,"
+            yield b"second"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_workspace_permalink_middleware_passes_requests_through_unchanged():
+    """Without workspace headers the ASGI middleware is invisible to the app."""
+
+    async def send_all(app: FastAPI) -> list[tuple[int, list[tuple[str, str]], bytes]]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = [
+                await client.post(
+                    "/echo/a%20b?x=1&y=two",
+                    json={"items": list(range(50))},
+                    headers={"X-Custom": "value"},
+                ),
+                await client.get("/stream"),
+                await client.head("/stream"),
+                await client.get("/missing"),
+            ]
+        return [
+            (response.status_code, response.headers.multi_items(), response.content)
+            for response in responses
+        ]
+
+    with_middleware = _passthrough_app(with_middleware=True)
+    actual = await send_all(with_middleware)
+
+    assert actual == await send_all(_passthrough_app(with_middleware=False))
+    assert [status for status, _, _ in actual] == [200, 200, 200, 404]
+    assert actual[1][2] == b"first,second"
+    assert actual[2][2] == b""
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=with_middleware), base_url="http://test"
+        ) as client:
+            await client.get("/boom")
+
+
+@pytest.mark.asyncio
+async def test_workspace_permalink_middleware_scopes_context_to_the_request():
+    app = FastAPI()
+    app.add_middleware(WorkspacePermalinkContextMiddleware)
+
+    @app.get("/context")
+    async def context() -> dict[str, str | None]:
+        current = current_workspace_permalink_context()
+        return {"slug": current.workspace_slug if current is not None else None}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        scoped = await client.get(
+            "/context",
+            headers={WORKSPACE_SLUG_HEADER: "team", WORKSPACE_TYPE_HEADER: "organization"},
+        )
+        unscoped = await client.get("/context")
+
+    assert scoped.json() == {"slug": "team"}
+    assert unscoped.json() == {"slug": None}
+    assert current_workspace_permalink_context() is None
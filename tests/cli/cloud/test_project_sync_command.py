@@ -687,6 +687,21 @@ def test_cloud_transfer_on_team_workspace_uses_webdav(monkeypatch, config_manage
     assert recorder["kwargs"]["strategy"] == "fail"
 
 
+@pytest.mark.parametrize("direction", ["pull", "push"])
+def test_cloud_transfer_on_team_workspace_passes_the_worker_count(
+    monkeypatch, config_manager, direction
+):
+    module = importlib.import_module("basic_memory.cli.commands.cloud.project_sync")
+    plan = TransferPlan(new=["new.md"], conflicts=[], dest_only=[], errors=[])
+    recorder: dict[str, Any] = {}
+    _stub_webdav_transfer_env(monkeypatch, module, plan=plan, recorder=recorder)
+
+    result = runner.invoke(app, ["cloud", direction, "--name", "research", "--workers", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert recorder["kwargs"]["workers"] == 3
+
+
 def test_cloud_pull_on_team_workspace_aborts_on_conflict_by_default(monkeypatch, config_manager):
     """The default conflict gate is the same on both transports."""
     module = importlib.import_module("basic_memory.cli.commands.cloud.project_sync")
@@ -5,11 +5,14 @@ surface, so every `--on-conflict` strategy is proven to behave the way it does o
 the Personal (rclone) path.
 """
 
+import asyncio
 import errno
 import hashlib
 import importlib
+import json
 import os
 import re
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -171,6 +174,73 @@ def test_plan_rejects_a_cloud_path_that_escapes_the_project(config_home, tmp_pat
         build_transfer_plan(local_root=root, remote_files=remote_files, direction="pull")
 
 
+# --- Remembered local digests ---
+
+
+def _count_hashing(monkeypatch) -> list[str]:
+    module = importlib.import_module("basic_memory.cli.commands.cloud.webdav_transfer")
+    real_hash = module._file_content_hash
+    hashed: list[str] = []
+
+    def counting_hash(path: Path) -> str:
+        hashed.append(path.name)
+        return real_hash(path)
+
+    monkeypatch.setattr(module, "_file_content_hash", counting_hash)
+    return hashed
+
+
+def test_repeat_plans_reuse_digests_of_unchanged_files(config_home, tmp_path, monkeypatch):
+    root = tmp_path / "research"
+    _write(root, "same.md", "identical")
+    _write(root, "diverged.md", "local version!")
+    remote_files = [_remote("same.md", "identical"), _remote("diverged.md", "cloud version!")]
+    hashed = _count_hashing(monkeypatch)
+
+    first = build_transfer_plan(local_root=root, remote_files=remote_files, direction="pull")
+    second = build_transfer_plan(local_root=root, remote_files=remote_files, direction="pull")
+
+    assert sorted(hashed) == ["diverged.md", "same.md"]
+    assert first.conflicts == second.conflicts == ["diverged.md"]
+
+
+def test_an_edited_file_is_hashed_again(config_home, tmp_path, monkeypatch):
+    """Same size, new bytes: the changed mtime must invalidate the remembered digest."""
+    root = tmp_path / "research"
+    note = _write(root, "a.md", "version 1", mtime=1_780_000_000)
+    remote_files = [_remote("a.md", "version 1")]
+    hashed = _count_hashing(monkeypatch)
+
+    first = build_transfer_plan(local_root=root, remote_files=remote_files, direction="pull")
+    assert first.conflicts == []
+
+    note.write_text("version 2", encoding="utf-8")
+    os.utime(note, (1_780_000_060, 1_780_000_060))
+    plan = build_transfer_plan(local_root=root, remote_files=remote_files, direction="pull")
+
+    assert hashed == ["a.md", "a.md"]
+    assert plan.conflicts == ["a.md"]
+
+
+def test_an_unreadable_hash_cache_only_costs_rehashing(config_home, tmp_path, monkeypatch):
+    from basic_memory.cli.commands.cloud.local_hash_cache import hash_cache_path
+
+    root = tmp_path / "research"
+    _write(root, "a.md", "content")
+    cache_path = hash_cache_path(root)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text("{not json", encoding="utf-8")
+    hashed = _count_hashing(monkeypatch)
+
+    plan = build_transfer_plan(
+        local_root=root, remote_files=[_remote("a.md", "content")], direction="push"
+    )
+
+    assert plan.conflicts == []
+    assert hashed == ["a.md"]
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["files"].keys() == {"a.md"}
+
+
 # --- Comparison fallback when the entity tag cannot be a content hash ---
 
 
@@ -1105,3 +1175,157 @@ async def test_push_keep_both_conflict_copies_are_conditional(config_home, tmp_p
     )
 
     assert seen == [("/webdav/research/dup.conflict-S.md", "*")]
+
+
+# --- Concurrent transfers ---
+
+
+def _stand_in_server(latency: float, files: dict[str, bytes]):
+    """A local WebDAV stand-in: every request costs one round trip of `latency`.
+
+    Records the peak number of requests in flight so tests can see the pool at work.
+    """
+    state = {"in_flight": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            await asyncio.sleep(latency)
+            if request.method == "PROPFIND":
+                return httpx.Response(207, text=_propfind_body([]))
+            rel_path = request.url.path.removeprefix("/webdav/research/")
+            if request.method == "PUT":
+                files[rel_path] = request.content
+                return httpx.Response(201)
+            return httpx.Response(200, content=files[rel_path])
+        finally:
+            state["in_flight"] -= 1
+
+    return handler, state
+
+
+async def _timed_pull(root: Path, files: dict[str, bytes], *, workers: int) -> tuple[float, int]:
+    handler, state = _stand_in_server(0.02, files)
+    start = time.perf_counter()
+    await webdav_project_transfer(
+        "research",
+        root,
+        "pull",
+        TransferPlan(new=sorted(files)),
+        workspace_id="team-tenant",
+        workers=workers,
+        client_cm_factory=_client_factory(handler),
+    )
+    return time.perf_counter() - start, state["peak"]
+
+
+@pytest.mark.asyncio
+async def test_pull_runs_files_concurrently_up_to_the_worker_count(config_home, tmp_path):
+    files = {f"notes/{index:02d}.md": f"note {index}".encode() for index in range(24)}
+
+    serial_seconds, serial_peak = await _timed_pull(tmp_path / "serial", files, workers=1)
+    parallel_seconds, parallel_peak = await _timed_pull(tmp_path / "parallel", files, workers=8)
+
+    assert serial_peak == 1
+    assert parallel_peak == 8
+    assert parallel_seconds < serial_seconds
+    for rel_path, content in files.items():
+        assert (tmp_path / "parallel" / rel_path).read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_concurrent_push_keeps_conditional_creates(config_home, tmp_path, capsys):
+    """Running side by side must not loosen the per-file If-None-Match precondition."""
+    root = tmp_path / "research"
+    for index in range(6):
+        _write(root, f"{index}.md", f"local {index}")
+
+    headers: dict[str, str | None] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PROPFIND":
+            return httpx.Response(207, text=_propfind_body([]))
+        await asyncio.sleep(0.01)
+        rel_path = request.url.path.removeprefix("/webdav/research/")
+        headers[rel_path] = request.headers.get("If-None-Match")
+        # Someone else created 3.md after the re-list.
+        return httpx.Response(412 if rel_path == "3.md" else 201)
+
+    await webdav_project_transfer(
+        "research",
+        root,
+        "push",
+        TransferPlan(new=[f"{index}.md" for index in range(6)]),
+        workspace_id="team-tenant",
+        workers=4,
+        client_cm_factory=_client_factory(handler),
+    )
+
+    assert headers == {f"{index}.md": "*" for index in range(6)}
+    output = _plain(capsys.readouterr().out)
+    assert "Transferred 5 file(s)" in output
+    assert "3.md" in output
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried_per_file(config_home, tmp_path, monkeypatch):
+    module = importlib.import_module("basic_memory.cli.commands.cloud.webdav_transfer")
+    monkeypatch.setattr(module, "_RETRY_BACKOFF_SECONDS", 0)
+    root = tmp_path / "research"
+    root.mkdir()
+
+    attempts: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        attempts[request.url.path] = attempts.get(request.url.path, 0) + 1
+        if request.url.path.endswith("flaky.md") and attempts[request.url.path] < 3:
+            return httpx.Response(503, text="try again")
+        return httpx.Response(200, content=b"ok")
+
+    await webdav_project_transfer(
+        "research",
+        root,
+        "pull",
+        TransferPlan(new=["flaky.md", "steady.md"]),
+        workspace_id="team-tenant",
+        retries=2,
+        client_cm_factory=_client_factory(handler),
+    )
+
+    assert attempts == {"/webdav/research/flaky.md": 3, "/webdav/research/steady.md": 1}
+    assert (root / "flaky.md").read_bytes() == b"ok"
+
+
+@pytest.mark.asyncio
+async def test_retries_give_up_and_stop_the_remaining_workers(config_home, tmp_path, monkeypatch):
+    module = importlib.import_module("basic_memory.cli.commands.cloud.webdav_transfer")
+    monkeypatch.setattr(module, "_RETRY_BACKOFF_SECONDS", 0)
+    root = tmp_path / "research"
+    root.mkdir()
+
+    requested: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path.endswith("broken.md"):
+            return httpx.Response(503, text="still down")
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=b"ok")
+
+    with pytest.raises(WebdavError, match="HTTP 503"):
+        await webdav_project_transfer(
+            "research",
+            root,
+            "pull",
+            TransferPlan(new=["broken.md", *[f"later-{index}.md" for index in range(20)]]),
+            workspace_id="team-tenant",
+            workers=2,
+            retries=1,
+            client_cm_factory=_client_factory(handler),
+        )
+
+    assert requested.count("/webdav/research/broken.md") == 2
+    # The queue behind the failure was never started.
+    assert len(requested) < 22
+    assert not list(root.glob("*.part"))
@@ -58,10 +58,10 @@ def test_bm_tool_help_exits_cleanly():
 def test_bm_version_does_not_import_heavy_modules():
     """Regression test: 'bm --version' must not import heavy modules.
 
-    The fast-path guard in cli/main.py skips command registration when
-    argv is exactly ['--version']. This test verifies that modules like
-    basic_memory.mcp (which pull in FastAPI, SQLAlchemy, etc.) are NOT
-    loaded during a version-only invocation.
+    Command modules load lazily when their subcommand is resolved, so a
+    version-only invocation registers none of them. This test verifies that
+    modules like basic_memory.mcp (which pull in FastAPI, SQLAlchemy, etc.)
+    are NOT loaded during a version-only invocation.
     """
     # Run a Python snippet that imports main.py the same way the entrypoint does,
     # then checks sys.modules for heavy imports
@@ -89,10 +89,10 @@ def test_bm_version_does_not_import_heavy_modules():
 def test_bm_cli_import_does_not_load_heavy_stack():
     """Regression test (#886): registering all CLI commands must stay lightweight.
 
-    Importing basic_memory.cli.main with a normal argv registers every command
-    module. None of them may pull FastAPI, the API app, SQLAlchemy/Alembic, the
-    MCP tool stack, or the markdown/services layers in at import time — those
-    must load lazily when a command actually runs.
+    Registering every command module (as `bm --help` does) must not pull
+    FastAPI, the API app, SQLAlchemy/Alembic, the MCP tool stack, or the
+    markdown/services layers in at import time — those must load lazily when a
+    command actually runs.
     """
     heavy_modules = (
         "fastapi",
@@ -110,6 +110,8 @@ def test_bm_cli_import_does_not_load_heavy_stack():
         "import sys; "
         "sys.argv = ['bm', 'tool', 'search-notes', '--help']; "
         "import basic_memory.cli.main; "
+        "from basic_memory.cli.lazy_commands import LAZY_COMMAND_MODULES; "
+        "[__import__(m) for ms in LAZY_COMMAND_MODULES.values() for m in ms]; "
         f"heavy = [m for m in {heavy_modules!r} if m in sys.modules]; "
         "print(','.join(heavy) if heavy else 'CLEAN')"
     )
@@ -0,0 +1,122 @@
+"""Import-time budgets for the bm CLI hot paths.
+
+`bm hook session-start` / `pre-compact` run on every agent turn and `bm tool`
+backs scripted MCP access, so their startup is dominated by imports. These
+tests run the entry point under `python -X importtime` and fail when a path
+starts importing a stack it does not need.
+
+The module assertions are the precise guard and run everywhere. The total
+import-time ceiling depends on the runner, so it lives in a separate
+benchmark test; set BM_CLI_IMPORT_BUDGET_SCALE to tighten or relax it.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+_BUDGET_SCALE = float(os.environ.get("BM_CLI_IMPORT_BUDGET_SCALE", "1"))
+
+
+@dataclass(frozen=True, slots=True)
+class ImportProfile:
+    modules: frozenset[str]
+    total_ms: float
+
+
+def _profile_cli_imports(args: list[str], home: Path) -> ImportProfile:
+    env = {
+        **os.environ,
+        "HOME": str(home),
+        "USERPROFILE": str(home),
+        "BASIC_MEMORY_HOME": str(home / "basic-memory"),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "basic_memory.cli.main", *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env=env,
+        cwd=Path(__file__).parent.parent.parent,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    modules: set[str] = set()
+    total_us = 0
+    for line in result.stderr.splitlines():
+        # import time: <self us> | <cumulative us> | <indented module name>
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue
+        total_us += int(self_us)
+        modules.add(module.strip())
+    return ImportProfile(modules=frozenset(modules), total_ms=total_us / 1000)
+
+
+def _loaded(profile: ImportProfile, prefixes: tuple[str, ...]) -> list[str]:
+    return sorted(
+        module
+        for module in profile.modules
+        if any(module == prefix or module.startswith(f"{prefix}.") for prefix in prefixes)
+    )
+
+
+def test_hook_path_import_budget(tmp_path):
+    """The hook front door loads only the hook module, not the API or MCP server stacks."""
+    profile = _profile_cli_imports(["hook", "--help"], tmp_path)
+
+    assert "basic_memory.cli.commands.hook" in profile.modules
+    assert (
+        _loaded(
+            profile,
+            (
+                "basic_memory.api",
+                "basic_memory.cli.commands.ci",
+                "basic_memory.cli.commands.cloud",
+                "basic_memory.cli.commands.project",
+                "basic_memory.cli.commands.tool",
+                "fastapi",
+                "fastmcp",
+            ),
+        )
+        == []
+    )
+
+
+def test_tool_path_import_budget(tmp_path):
+    """`bm tool` loads its own module without the other command groups or the MCP server."""
+    profile = _profile_cli_imports(["tool", "--help"], tmp_path)
+
+    assert "basic_memory.cli.commands.tool" in profile.modules
+    assert (
+        _loaded(
+            profile,
+            (
+                "basic_memory.api.app",
+                "basic_memory.cli.commands.ci",
+                "basic_memory.cli.commands.cloud",
+                "basic_memory.cli.commands.hook",
+                "basic_memory.cli.commands.project",
+                "basic_memory.mcp.tools",
+                "fastapi",
+                "fastmcp",
+            ),
+        )
+        == []
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("command", ["hook", "tool"])
+def test_cli_path_import_time_ceiling(tmp_path, command):
+    """Total import time of a hot path stays under a loose ceiling."""
+    profile = _profile_cli_imports([command, "--help"], tmp_path)
+
+    assert profile.total_ms < 6000 * _BUDGET_SCALE
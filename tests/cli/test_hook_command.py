@@ -200,6 +200,30 @@ def test_session_start_brief_is_fenced_and_labeled(bm_home: Path, claude_project
     assert "search the graph" in result.stdout
 
 
+def test_session_start_uses_warm_daemon_results(
+    bm_home: Path, claude_project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sent: list[Any] = []
+
+    def fake_daemon(queries, *, timeout):
+        sent.extend(queries)
+        return [_search_result("Ship login fix"), None, _search_result("Session 2026-07-14")]
+
+    monkeypatch.setattr("basic_memory.hooks.daemon.run_daemon_queries", fake_daemon)
+    with patch("basic_memory.mcp.tools.search_notes", new_callable=AsyncMock) as mock_search:
+        result = runner.invoke(
+            cli_app,
+            ["hook", "session-start", "--project-dir", str(claude_project)],
+            input=_payload(claude_project),
+        )
+
+    assert result.exit_code == 0
+    mock_search.assert_not_awaited()
+    assert sent[0] == ("demo", {"note_types": ["task"], "status": "active"})
+    assert "- Ship login fix — notes/ship-login-fix" in result.stdout
+    assert "## Recent sessions (1) — where you left off" in result.stdout
+
+
 def test_session_start_fence_outgrows_backticks_in_graph_data(
     bm_home: Path, claude_project: Path
 ) -> None:
@@ -967,14 +991,20 @@ def test_deprecated_codex_stop_is_json_noop(bm_home: Path) -> None:
     assert json.loads(result.stdout) == {"continue": True}
 
 
-def test_codex_transcript_parser_reads_response_items_only(tmp_path: Path) -> None:
+def test_codex_transcript_parser_reads_response_items_only(bm_home: Path, tmp_path: Path) -> None:
     transcript = _codex_transcript(tmp_path)
+    lines = [json.loads(line) for line in transcript.read_text().splitlines() if line.strip()]
 
-    assert hook_module._transcript_turns(str(transcript), hook_module.Harness.codex) == [
+    turns = [hook_module._transcript_turn(obj, hook_module.Harness.codex) for obj in lines]
+    assert [turn for turn in turns if turn is not None] == [
         ("user", "Fix the login bug"),
         ("assistant", "Found the null check issue"),
     ]
 
+    summary = hook_module._transcript_summary(str(transcript), hook_module.Harness.codex, None)
+    assert summary.opening == "Fix the login bug"
+    assert summary.recent_user == ["Fix the login bug"]
+
 
 def test_pre_compact_codex_malformed_project_does_not_use_user_checkpoint_route(
     bm_home: Path, tmp_path: Path
@@ -1187,6 +1217,7 @@ def test_status_defaults_when_nothing_configured(
     assert "checkpoint on compact: off" in result.stdout
     assert "capture events: on" in result.stdout
     assert "uv: (not found)" in result.stdout
+    assert "hook daemon: not running" in result.stdout
 
 
 def test_codex_status_reports_enabled_checkpoint_prompt(bm_home: Path, tmp_path: Path) -> None:
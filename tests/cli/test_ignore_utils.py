@@ -5,6 +5,7 @@ from pathlib import Path
 
 from basic_memory.ignore_utils import (
     DEFAULT_IGNORE_PATTERNS,
+    IgnoreMatcher,
     get_bmignore_path,
     load_gitignore_patterns,
     should_ignore_path,
@@ -244,6 +245,39 @@ def test_should_ignore_invalid_relative_path():
     assert result is False
 
 
+def test_ignore_matcher_matches_legacy_fnmatch_results():
+    """The compiled matcher keeps the fnmatch-era results, with and without its dir cache."""
+    base_path = Path("/tmp/project")
+    patterns = {"/build/", "/tmp/*.log", "logs/", "node_modules", ".*", "*.pyc", "docs/*.md", "a*b"}
+    matcher = IgnoreMatcher(patterns)
+
+    # Expected values were produced by the fnmatch implementation the matcher replaced.
+    # fnmatch's "*" also matches "/", hence docs/deep/guide.md and a/xb.
+    cases = [
+        ("build/app.js", True),
+        ("src/build/app.js", False),
+        ("tmp/debug.log", True),
+        ("data/tmp/app.log", False),
+        ("src/logs/app.log", True),
+        ("web/node_modules/pkg/index.js", True),
+        ("notes/.hidden.md", True),
+        ("pkg/module.pyc", True),
+        ("docs/guide.md", True),
+        ("docs/deep/guide.md", True),
+        ("a/xb", True),
+        ("notes/readme.md", False),
+        ("notes/logs.md", False),
+    ]
+    for relative_path, expected in cases:
+        assert matcher.match_file(relative_path) == expected, relative_path
+        assert matcher.match_dir(relative_path) == expected, relative_path
+        assert matcher.matches(base_path / relative_path, base_path) == expected, relative_path
+        assert should_ignore_path(base_path / relative_path, base_path, patterns) == expected
+
+    assert matcher.match_dir("web/node_modules")
+    assert not matcher.match_dir("notes")
+
+
 def test_filter_files_with_patterns():
     """Test filtering files with given patterns."""
     with tempfile.TemporaryDirectory() as temp_dir:
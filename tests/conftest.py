@@ -368,6 +368,8 @@ async def engine_factory(
     """
     from basic_memory.models.search import (
         CREATE_SEARCH_INDEX,
+        CREATE_SEARCH_INDEX_LOOKUP,
+        CREATE_SEARCH_INDEX_LOOKUP_INDEXES,
         CREATE_SQLITE_SEARCH_VECTOR_CHUNKS,
         CREATE_SQLITE_SEARCH_VECTOR_CHUNKS_PROJECT_ENTITY,
         CREATE_SQLITE_SEARCH_VECTOR_CHUNKS_UNIQUE,
@@ -418,6 +420,9 @@ async def engine_factory(
             async with engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
                 await conn.execute(CREATE_SEARCH_INDEX)
+                await conn.execute(CREATE_SEARCH_INDEX_LOOKUP)
+                for statement in CREATE_SEARCH_INDEX_LOOKUP_INDEXES:
+                    await conn.execute(statement)
                 await conn.execute(CREATE_SQLITE_SEARCH_VECTOR_CHUNKS)
                 await conn.execute(CREATE_SQLITE_SEARCH_VECTOR_CHUNKS_PROJECT_ENTITY)
                 await conn.execute(CREATE_SQLITE_SEARCH_VECTOR_CHUNKS_UNIQUE)
@@ -0,0 +1,111 @@
+"""Tests for the opt-in warm hook query daemon."""
+
+import asyncio
+import tempfile
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_asyncio
+
+from basic_memory.hooks.daemon import (
+    HookDaemonRunningError,
+    HookQuery,
+    daemon_socket_path,
+    ping_daemon,
+    run_daemon_queries,
+    serve_hook_daemon,
+    stop_daemon,
+)
+
+
+@pytest.fixture
+def socket_path() -> Path:
+    # AF_UNIX paths are capped near 100 bytes; pytest's tmp_path can exceed that.
+    return Path(tempfile.mkdtemp(prefix="bm-hd-", dir="/tmp")) / "hook.sock"
+
+
+async def _echo_queries(queries: Sequence[HookQuery]) -> list[dict[str, Any] | None]:
+    return [
+        None if filters.get("empty") else {"project": project, "filters": filters}
+        for project, filters in queries
+    ]
+
+
+async def _wait_for_socket(path: Path) -> None:
+    for _ in range(200):
+        if path.exists():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"daemon never bound {path}")
+
+
+@pytest_asyncio.fixture
+async def running_daemon(socket_path: Path) -> AsyncIterator[asyncio.Task[None]]:
+    task = asyncio.create_task(serve_hook_daemon(_echo_queries, path=socket_path))
+    await _wait_for_socket(socket_path)
+    yield task
+    if not task.done():
+        await asyncio.to_thread(stop_daemon, path=socket_path)
+        await asyncio.wait_for(task, timeout=5)
+
+
+def test_daemon_socket_lives_in_data_dir(bm_home: Path) -> None:
+    assert daemon_socket_path() == bm_home / "hook-daemon.sock"
+
+
+def test_client_falls_back_when_no_daemon(socket_path: Path) -> None:
+    assert run_daemon_queries([("demo", {})], timeout=1, path=socket_path) is None
+    assert ping_daemon(path=socket_path) is None
+    assert stop_daemon(path=socket_path) is False
+
+
+@pytest.mark.asyncio
+async def test_daemon_answers_query_batches_in_order(
+    running_daemon: asyncio.Task[None], socket_path: Path
+) -> None:
+    queries: list[HookQuery] = [
+        ("demo", {"note_types": ["task"], "status": "active"}),
+        (None, {"empty": True}),
+    ]
+
+    results = await asyncio.to_thread(run_daemon_queries, queries, timeout=5, path=socket_path)
+
+    assert results == [
+        {"project": "demo", "filters": {"note_types": ["task"], "status": "active"}},
+        None,
+    ]
+    assert await asyncio.to_thread(ping_daemon, path=socket_path) is not None
+    assert socket_path.stat().st_mode & 0o077 == 0
+
+
+@pytest.mark.asyncio
+async def test_daemon_stop_removes_socket(
+    running_daemon: asyncio.Task[None], socket_path: Path
+) -> None:
+    assert await asyncio.to_thread(stop_daemon, path=socket_path) is True
+    await asyncio.wait_for(running_daemon, timeout=5)
+
+    assert not socket_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_second_daemon_refuses_to_take_over_socket(
+    running_daemon: asyncio.Task[None], socket_path: Path
+) -> None:
+    with pytest.raises(HookDaemonRunningError):
+        await serve_hook_daemon(_echo_queries, path=socket_path)
+
+    assert socket_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_daemon_replaces_stale_socket_and_exits_when_idle(socket_path: Path) -> None:
+    socket_path.write_text("left behind by a crashed daemon")
+
+    await asyncio.wait_for(
+        serve_hook_daemon(_echo_queries, idle_timeout=0.05, path=socket_path), timeout=5
+    )
+
+    assert not socket_path.exists()
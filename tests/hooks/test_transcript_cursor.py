@@ -0,0 +1,126 @@
+"""Tests for incremental transcript reading with persisted cursors."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from basic_memory.hooks.transcript_cursor import cursor_dir, read_transcript_summary
+
+
+class CountingParser:
+    """Parse ``{"role": ..., "text": ...}`` lines and count how many were seen."""
+
+    def __init__(self) -> None:
+        self.seen = 0
+
+    def __call__(self, obj: dict[str, Any]) -> tuple[str, str] | None:
+        self.seen += 1
+        return (obj["role"], obj["text"]) if "role" in obj else None
+
+
+def _line(role: str, text: str) -> str:
+    return json.dumps({"role": role, "text": text}) + "\n"
+
+
+def _write(path: Path, *lines: str, mode: str = "w") -> None:
+    with path.open(mode, encoding="utf-8") as handle:
+        handle.write("".join(lines))
+
+
+def test_second_read_parses_only_the_appended_tail(bm_home: Path, tmp_path: Path) -> None:
+    transcript = tmp_path / "t.jsonl"
+    _write(transcript, _line("user", "Fix the login bug"), _line("assistant", "On it"))
+    parser = CountingParser()
+
+    first = read_transcript_summary(str(transcript), "s-1", parser)
+    assert first.opening == "Fix the login bug"
+    assert parser.seen == 2
+
+    _write(
+        transcript,
+        *[_line("user", f"step {n}") for n in range(4)],
+        mode="a",
+    )
+    parser.seen = 0
+    second = read_transcript_summary(str(transcript), "s-1", parser)
+
+    assert parser.seen == 4
+    assert second.opening == "Fix the login bug"
+    assert second.recent_user == ["step 1", "step 2", "step 3"]
+    cursor_files = list(cursor_dir().glob("*.json"))
+    assert len(cursor_files) == 1
+    assert cursor_files[0].stat().st_mode & 0o077 == 0
+
+
+def test_unterminated_last_line_counts_but_is_reread(bm_home: Path, tmp_path: Path) -> None:
+    transcript = tmp_path / "t.jsonl"
+    _write(transcript, _line("user", "Fix the login bug"), _line("user", "half").rstrip("\n"))
+    parser = CountingParser()
+
+    assert read_transcript_summary(str(transcript), "s-1", parser).recent_user == [
+        "Fix the login bug",
+        "half",
+    ]
+
+    _write(transcript, "\n", _line("user", "done"), mode="a")
+    parser.seen = 0
+    summary = read_transcript_summary(str(transcript), "s-1", parser)
+
+    # The formerly partial line is parsed again now that it is complete.
+    assert parser.seen == 2
+    assert summary.recent_user == ["Fix the login bug", "half", "done"]
+
+
+def test_truncated_transcript_is_reparsed_from_the_start(bm_home: Path, tmp_path: Path) -> None:
+    transcript = tmp_path / "t.jsonl"
+    _write(transcript, _line("user", "old opening"), _line("user", "old follow-up"))
+    read_transcript_summary(str(transcript), "s-1", CountingParser())
+
+    # Same inode, shorter content: the stored offset is past the end of the file.
+    _write(transcript, _line("user", "new"))
+    summary = read_transcript_summary(str(transcript), "s-1", CountingParser())
+
+    assert summary.opening == "new"
+    assert summary.recent_user == ["new"]
+
+
+def test_rewritten_prefix_invalidates_the_cursor(bm_home: Path, tmp_path: Path) -> None:
+    transcript = tmp_path / "t.jsonl"
+    _write(transcript, _line("user", "aaaa"))
+    read_transcript_summary(str(transcript), "s-1", CountingParser())
+
+    # Same inode and at least as long, but the covered bytes changed.
+    _write(transcript, _line("user", "bbbb"), _line("user", "cccc"))
+    summary = read_transcript_summary(str(transcript), "s-1", CountingParser())
+
+    assert summary.opening == "bbbb"
+    assert summary.recent_user == ["bbbb", "cccc"]
+
+
+def test_rotated_transcript_starts_a_fresh_cursor(bm_home: Path, tmp_path: Path) -> None:
+    transcript = tmp_path / "t.jsonl"
+    _write(transcript, _line("user", "first file"))
+    read_transcript_summary(str(transcript), "s-1", CountingParser())
+
+    replacement = tmp_path / "t.jsonl.new"
+    _write(replacement, _line("user", "second file"), _line("user", "more"))
+    os.replace(replacement, transcript)
+    summary = read_transcript_summary(str(transcript), "s-1", CountingParser())
+
+    assert summary.opening == "second file"
+    assert summary.recent_user == ["second file", "more"]
+
+
+def test_corrupt_cursor_and_missing_transcript_fail_soft(bm_home: Path, tmp_path: Path) -> None:
+    transcript = tmp_path / "t.jsonl"
+    _write(transcript, _line("user", "hello"))
+    read_transcript_summary(str(transcript), "s-1", CountingParser())
+    for cursor_file in cursor_dir().glob("*.json"):
+        cursor_file.write_text("{not json", encoding="utf-8")
+
+    assert read_transcript_summary(str(transcript), "s-1", CountingParser()).opening == "hello"
+    assert (
+        read_transcript_summary(str(tmp_path / "missing.jsonl"), "s-1", CountingParser()).opening
+        is None
+    )
@@ -0,0 +1,153 @@
+"""Tests for the streaming conversation import pipeline."""
+
+import asyncio
+import io
+import json
+from typing import Any
+
+import pytest
+
+from basic_memory.importers.claude_conversations_importer import ClaudeConversationsImporter
+from basic_memory.importers.streaming import ImportCheckpoint, iter_json_array
+from basic_memory.markdown.entity_parser import EntityParser
+from basic_memory.markdown.markdown_processor import MarkdownProcessor
+from basic_memory.services.file_service import FileService
+
+
+def _conversation(index: int, name: str | None = None) -> dict[str, Any]:
+    return {
+        "uuid": f"conv-{index}",
+        "name": name or f"Conversation {index}",
+        "created_at": "2025-01-15T10:00:00Z",
+        "updated_at": "2025-01-15T11:00:00Z",
+        "chat_messages": [
+            {
+                "uuid": f"msg-{index}",
+                "sender": "human",
+                "created_at": "2025-01-15T10:00:00Z",
+                "text": f"Message {index}",
+                "content": [{"type": "text", "text": f"Message {index}"}],
+                "attachments": [],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def importer(tmp_path):
+    entity_parser = EntityParser(base_path=tmp_path)
+    markdown_processor = MarkdownProcessor(entity_parser=entity_parser)
+    file_service = FileService(base_path=tmp_path, markdown_processor=markdown_processor)
+    return ClaudeConversationsImporter(tmp_path, markdown_processor, file_service)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+def test_iter_json_array_matches_json_load_across_chunk_boundaries(chunk_size):
+    document = [
+        {"title": 'a ] tricky, "string"', "nested": [1, {"b": None}]},
+        12345678901234567890,
+        -0.25e-3,
+        True,
+        [],
+    ]
+    text = "  " + json.dumps(document, indent=2) + "\n"
+
+    assert list(iter_json_array(io.StringIO(text), chunk_size=chunk_size)) == document
+
+
+@pytest.mark.parametrize("text", ["not json", '{"a": 1}', "[1, 2", "[1 2]", "[1] extra"])
+def test_iter_json_array_rejects_malformed_input(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO(text), chunk_size=2))
+
+
+@pytest.mark.asyncio
+async def test_import_stream_writes_concurrently_and_keeps_last_duplicate(importer, tmp_path):
+    conversations = [_conversation(index) for index in range(20)]
+    # Same name and date as conversation 0: the later conversation must win, as it
+    # did when conversations were written one at a time.
+    conversations.append(_conversation(99, name="Conversation 0"))
+    progress: list[int] = []
+
+    result = await importer.import_stream(
+        iter(conversations), "chats", max_concurrent=4, on_progress=progress.append
+    )
+
+    assert result.success
+    assert result.conversations == 21
+    assert result.messages == 21
+    assert progress[-1] == 21
+    assert progress == sorted(progress)
+    assert len(list((tmp_path / "chats").glob("*.md"))) == 20
+    assert "Message 99" in (tmp_path / "chats" / "20250115-Conversation_0.md").read_text()
+
+
+@pytest.mark.asyncio
+async def test_import_stream_resumes_after_interruption(importer, tmp_path, monkeypatch):
+    monkeypatch.setenv("BASIC_MEMORY_CONFIG_DIR", str(tmp_path / "state"))
+    source = tmp_path / "conversations.json"
+    source.write_text(json.dumps([_conversation(index) for index in range(6)]))
+
+    def interrupted():
+        with source.open(encoding="utf-8") as stream:
+            for index, conversation in enumerate(iter_json_array(stream)):
+                if index == 4:
+                    raise RuntimeError("export read failed")
+                yield conversation
+
+    checkpoint = ImportCheckpoint.open(source, destination_folder="chats", project_name=None)
+    failed = await importer.import_stream(
+        interrupted(), "chats", max_concurrent=1, checkpoint=checkpoint
+    )
+    assert not failed.success
+    assert checkpoint.completed == 4
+
+    written: list[str] = []
+    write_entity = importer.write_entity
+
+    async def record_write(entity, file_path):
+        written.append(str(file_path))
+        await asyncio.sleep(0)
+        return await write_entity(entity, file_path)
+
+    monkeypatch.setattr(importer, "write_entity", record_write)
+    resumed = ImportCheckpoint.open(source, destination_folder="chats", project_name=None)
+    assert resumed.completed == 4
+    with source.open(encoding="utf-8") as stream:
+        result = await importer.import_stream(iter_json_array(stream), "chats", checkpoint=resumed)
+
+    assert result.success
+    assert result.conversations == 6
+    assert result.messages == 6
+    assert written == ["chats/20250115-Conversation_4.md", "chats/20250115-Conversation_5.md"]
+    assert not resumed.path.exists()
+
+
+def test_checkpoint_is_ignored_when_the_export_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("BASIC_MEMORY_CONFIG_DIR", str(tmp_path / "state"))
+    source = tmp_path / "conversations.json"
+    source.write_text("[]")
+    checkpoint = ImportCheckpoint.open(source, destination_folder="chats", project_name="main")
+    checkpoint.record(completed=3, conversations=3, messages=9)
+
+    assert (
+        ImportCheckpoint.open(source, destination_folder="chats", project_name="main").completed
+        == 3
+    )
+    assert (
+        ImportCheckpoint.open(source, destination_folder="other", project_name="main").completed
+        == 0
+    )
+    assert (
+        ImportCheckpoint.open(
+            source, destination_folder="chats", project_name="main", resume=False
+        ).completed
+        == 0
+    )
+
+    checkpoint.record(completed=3, conversations=3, messages=9)
+    source.write_text("[ ]")
+    assert (
+        ImportCheckpoint.open(source, destination_folder="chats", project_name="main").completed
+        == 0
+    )
@@ -178,15 +178,15 @@ async def test_local_project_index_observed_file_source_drops_confirmed_missing_
     ghost.write_bytes(b"# Ghost\n")
 
     file_service = FileService(tmp_path)
-    original_get_file_metadata = file_service.get_file_metadata
+    original_compute_checksum = file_service.compute_checksum
 
-    async def vanishing_metadata(path):
+    async def vanishing_checksum(path):
         if str(path).endswith("ghost.md"):
             ghost.unlink(missing_ok=True)
             raise FileNotFoundError(str(path))
-        return await original_get_file_metadata(path)
+        return await original_compute_checksum(path)
 
-    monkeypatch.setattr(file_service, "get_file_metadata", vanishing_metadata)
+    monkeypatch.setattr(file_service, "compute_checksum", vanishing_checksum)
 
     observed = await LocalProjectIndexObservedFileSource(
         file_service,
@@ -206,13 +206,13 @@ async def test_local_project_index_observed_file_source_carries_files_when_probe
 
     file_service = FileService(tmp_path)
 
-    async def failing_metadata(path):
+    async def failing_checksum(path):
         raise FileOperationError("mount error")
 
     async def failing_exists(path):
         raise FileOperationError("mount error")
 
-    monkeypatch.setattr(file_service, "get_file_metadata", failing_metadata)
+    monkeypatch.setattr(file_service, "compute_checksum", failing_checksum)
     monkeypatch.setattr(file_service, "exists", failing_exists)
 
     observed = await LocalProjectIndexObservedFileSource(
@@ -2780,7 +2780,11 @@ async def test_local_project_index_observed_source_reuses_checksum_when_stat_mat
         hashed_paths.append(str(path))
         return await original_compute_checksum(path)
 
+    async def unexpected_metadata(path):
+        raise AssertionError(f"scan stats should cover {path}")
+
     monkeypatch.setattr(file_service, "compute_checksum", tracking_checksum)
+    monkeypatch.setattr(file_service, "get_file_metadata", unexpected_metadata)
 
     observed = await LocalProjectIndexObservedFileSource(
         file_service,
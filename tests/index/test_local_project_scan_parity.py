@@ -7,6 +7,7 @@ import pytest
 
 import basic_memory.index.local_project as local_project
 from basic_memory.index.local_project import (
+    LocalProjectFileStat,
     LocalProjectIndexObservedFileSource,
     LocalProjectIndexScan,
     local_project_index_file_paths,
@@ -16,6 +17,49 @@ from basic_memory.index.local_project import (
 from basic_memory.services import FileService
 
 
+class _UnstatableEntry:
+    """Directory entry whose stat fails, as for a file the scanner may not read."""
+
+    def __init__(self, entry: os.DirEntry[str]) -> None:
+        self._entry = entry
+        self.name = entry.name
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        raise PermissionError("permission denied")
+
+
+class _Listing:
+    """Context-managed directory listing that can fail after yielding some entries."""
+
+    def __init__(
+        self,
+        path: Path,
+        entries: list[os.DirEntry[str] | _UnstatableEntry],
+        *,
+        fail_after: bool = False,
+    ) -> None:
+        self._path = path
+        self._entries = entries
+        self._fail_after = fail_after
+
+    def __enter__(self):
+        return self._iterate()
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+    def _iterate(self):
+        yield from self._entries
+        if self._fail_after:
+            raise PermissionError(13, "Permission denied", str(self._path))
+
+
 def test_local_project_index_file_paths_skips_unreadable_entries(
     monkeypatch,
     tmp_path: Path,
@@ -26,34 +70,47 @@ def test_local_project_index_file_paths_skips_unreadable_entries(
     accessible_path.write_text("# Accessible\n", encoding="utf-8")
     unreadable_path.write_text("# Restricted\n", encoding="utf-8")
 
-    original_is_file = Path.is_file
+    real_scandir = os.scandir
 
-    def is_file_or_permission_error(path: Path) -> bool:
-        if path == unreadable_path:
-            raise PermissionError("permission denied")
-        return original_is_file(path)
+    def scandir_with_unreadable_entry(path):
+        with real_scandir(path) as entries:
+            listing = [
+                _UnstatableEntry(entry) if entry.name == unreadable_path.name else entry
+                for entry in entries
+            ]
+        return _Listing(Path(path), listing)
 
-    monkeypatch.setattr(Path, "is_file", is_file_or_permission_error)
+    monkeypatch.setattr(local_project.os, "scandir", scandir_with_unreadable_entry)
 
     assert local_project_index_file_paths(tmp_path, ignore_patterns=set()) == ("accessible.md",)
 
 
-def test_local_project_index_file_paths_keeps_discovered_files_when_walk_fails(
+def test_scan_local_project_index_files_discards_partially_listed_directory(
     monkeypatch,
     tmp_path: Path,
 ) -> None:
-    """A traversal error should not discard files discovered before the error."""
+    """A listing that fails partway is recorded as unreadable, not half-observed."""
     project_root = tmp_path.resolve()
-    accessible_path = project_root / "accessible.md"
-    accessible_path.write_text("# Accessible\n", encoding="utf-8")
+    (project_root / "accessible.md").write_text("# Accessible\n", encoding="utf-8")
+    flaky_dir = project_root / "flaky"
+    flaky_dir.mkdir()
+    (flaky_dir / "seen.md").write_text("# Seen\n", encoding="utf-8")
 
-    def walk_then_permission_error(top, *args, **kwargs):
-        yield (str(project_root), [], ["accessible.md"])
-        raise PermissionError("permission denied")
+    real_scandir = os.scandir
 
-    monkeypatch.setattr(local_project.os, "walk", walk_then_permission_error)
+    def scandir_failing_mid_listing(path):
+        with real_scandir(path) as entries:
+            listing = list(entries)
+        return _Listing(Path(path), listing, fail_after=Path(path) == flaky_dir)
+
+    monkeypatch.setattr(local_project.os, "scandir", scandir_failing_mid_listing)
+
+    scan = scan_local_project_index_files(project_root, ignore_patterns=set())
 
-    assert local_project_index_file_paths(project_root, ignore_patterns=set()) == ("accessible.md",)
+    # Files listed before the failure are dropped with the rest of the directory;
+    # the observed source carries its indexed rows instead of deleting them.
+    assert scan.file_paths == ("accessible.md",)
+    assert scan.unreadable_directories == ("flaky",)
 
 
 def test_local_project_index_file_paths_prunes_ignored_directories(
@@ -71,18 +128,18 @@ def test_local_project_index_file_paths_prunes_ignored_directories(
     (hidden / "secret.md").write_text("# secret\n", encoding="utf-8")
 
     visited: list[str] = []
-    original_is_file = Path.is_file
+    real_scandir = os.scandir
 
-    def recording_is_file(path: Path) -> bool:
+    def recording_scandir(path):
         visited.append(str(path))
-        return original_is_file(path)
+        return real_scandir(path)
 
-    monkeypatch.setattr(Path, "is_file", recording_is_file)
+    monkeypatch.setattr(local_project.os, "scandir", recording_scandir)
 
     result = local_project_index_file_paths(project_root, ignore_patterns={"node_modules"})
 
     assert result == ("keep.md",)
-    # Pruning means the walker never descended into (or stat'd) the ignored dirs.
+    # Pruning means the walker never listed the ignored directories.
     assert not any("node_modules" in path for path in visited)
     assert not any(".hidden" in path for path in visited)
 
@@ -98,20 +155,14 @@ def test_scan_local_project_index_files_records_unreadable_subdirectory(
     locked_dir.mkdir()
     (locked_dir / "note.md").write_text("# locked\n", encoding="utf-8")
 
-    real_walk = os.walk
+    real_scandir = os.scandir
 
-    def walk_with_locked_scandir_error(top, *, followlinks, onerror):
-        # Emulate exactly what os.walk does when scandir(locked) fails: report
-        # the directory through onerror and never yield its listing.
-        for dirpath, dirnames, filenames in real_walk(
-            top, followlinks=followlinks, onerror=onerror
-        ):
-            if Path(dirpath) == locked_dir:
-                onerror(PermissionError(13, "Permission denied", str(locked_dir)))
-                continue
-            yield dirpath, dirnames, filenames
+    def scandir_with_locked_directory(path):
+        if Path(path) == locked_dir:
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
 
-    monkeypatch.setattr(local_project.os, "walk", walk_with_locked_scandir_error)
+    monkeypatch.setattr(local_project.os, "scandir", scandir_with_locked_directory)
 
     scan = scan_local_project_index_files(project_root, ignore_patterns=set())
 
@@ -119,6 +170,22 @@ def test_scan_local_project_index_files_records_unreadable_subdirectory(
     assert scan.unreadable_directories == ("locked",)
 
 
+def test_scan_local_project_index_files_collects_stats_in_the_same_pass(tmp_path: Path) -> None:
+    """Each listed file carries the size and mtime observation would otherwise stat for."""
+    project_root = tmp_path.resolve()
+    (project_root / "notes").mkdir()
+    note = project_root / "notes" / "a.md"
+    note.write_text("# A\n", encoding="utf-8")
+
+    scan = scan_local_project_index_files(project_root, ignore_patterns=set())
+
+    note_stat = os.stat(note)
+    assert scan.file_paths == ("notes/a.md",)
+    assert scan.file_stats == {
+        "notes/a.md": LocalProjectFileStat(size=note_stat.st_size, mtime_ns=note_stat.st_mtime_ns)
+    }
+
+
 def test_record_local_project_scan_walk_error_classifies_root_none_and_subtree(
     tmp_path: Path,
 ) -> None:
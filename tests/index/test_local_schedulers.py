@@ -12,8 +12,10 @@ from basic_memory.index.local_schedulers import (
     LocalRelationResolutionScheduler,
     LocalSearchReindexScheduler,
     drain_background_tasks,
+    entity_vector_sync_queue_depth,
 )
 from basic_memory.read_cache import ReadCacheInvalidationStatus
+from basic_memory.runtime.vector_sync import VectorSyncBatchResult
 
 PROJECT_EXTERNAL_ID = "00000000-0000-0000-0000-000000000013"
 
@@ -35,11 +37,21 @@ class StubProjectIndexRunner:
 class StubSearchService:
     def __init__(self) -> None:
         self.vector_synced: list[int] = []
+        self.vector_batches: list[list[int]] = []
         self.reindexed_project = False
 
     async def sync_entity_vectors(self, entity_id: int) -> None:
         self.vector_synced.append(entity_id)
 
+    async def sync_entity_vectors_batch(self, entity_ids: list[int]) -> VectorSyncBatchResult:
+        self.vector_batches.append(list(entity_ids))
+        self.vector_synced.extend(entity_ids)
+        return VectorSyncBatchResult(
+            entities_total=len(entity_ids),
+            entities_synced=len(entity_ids),
+            entities_failed=0,
+        )
+
     async def reindex_all(self) -> None:
         self.reindexed_project = True
 
@@ -66,20 +78,100 @@ async def test_entity_vector_scheduler_maps_to_search_service():
         test_mode=False,
     )
     scheduler.schedule_entity_vector_sync(entity_id=7, project_id=13)
-    await asyncio.sleep(0.05)
+    await drain_background_tasks()
 
     assert search_service.vector_synced == [7]
     assert read_cache.invalidated_project_ids == [PROJECT_EXTERNAL_ID]
 
 
+@pytest.mark.asyncio
+async def test_entity_vector_scheduler_coalesces_a_burst_into_batches():
+    """A burst of writes should sync deduplicated ids in batches, one invalidation each."""
+    search_service = StubSearchService()
+    read_cache = RecordingReadCache()
+    scheduler = LocalEntityVectorSyncScheduler(
+        search_service=search_service,
+        project_external_id=PROJECT_EXTERNAL_ID,
+        read_cache=read_cache,
+        test_mode=False,
+        debounce_seconds=10.0,
+        max_batch_size=3,
+    )
+
+    for entity_id in [1, 2, 1, 3, 4, 2]:
+        scheduler.schedule_entity_vector_sync(entity_id=entity_id, project_id=13)
+    assert entity_vector_sync_queue_depth(13) == 4
+
+    # The full batch wakes the flush well before the 10s debounce would.
+    await asyncio.wait_for(drain_background_tasks(), timeout=5)
+
+    assert search_service.vector_batches == [[1, 2, 3], [4]]
+    assert read_cache.invalidated_project_ids == [PROJECT_EXTERNAL_ID, PROJECT_EXTERNAL_ID]
+    assert entity_vector_sync_queue_depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_entity_vector_scheduler_runs_batches_with_the_latest_enqueuer():
+    """Schedulers are built per request; the batch should use the newest one's services."""
+    first_service = StubSearchService()
+    latest_service = StubSearchService()
+    for search_service, entity_id in [(first_service, 1), (latest_service, 2)]:
+        LocalEntityVectorSyncScheduler(
+            search_service=search_service,
+            project_external_id=PROJECT_EXTERNAL_ID,
+            read_cache=None,
+            test_mode=False,
+        ).schedule_entity_vector_sync(entity_id=entity_id, project_id=13)
+
+    await asyncio.wait_for(drain_background_tasks(), timeout=5)
+
+    assert first_service.vector_batches == []
+    assert latest_service.vector_batches == [[1, 2]]
+
+
+def test_entity_vector_scheduler_does_not_strand_writes_after_its_loop_closes():
+    """A flush cancelled with its loop must not block or re-arm onto the next loop."""
+    closed_loop_service = StubSearchService()
+    search_service = StubSearchService()
+
+    async def enqueue_then_close() -> None:
+        LocalEntityVectorSyncScheduler(
+            search_service=closed_loop_service,
+            project_external_id=PROJECT_EXTERNAL_ID,
+            read_cache=None,
+            test_mode=False,
+            debounce_seconds=10.0,
+        ).schedule_entity_vector_sync(entity_id=1, project_id=13)
+
+    async def enqueue_and_drain() -> None:
+        LocalEntityVectorSyncScheduler(
+            search_service=search_service,
+            project_external_id=PROJECT_EXTERNAL_ID,
+            read_cache=None,
+            test_mode=False,
+        ).schedule_entity_vector_sync(entity_id=2, project_id=13)
+        await asyncio.wait_for(drain_background_tasks(), timeout=5)
+
+    # Each phase gets its own loop. Closing the first Runner cancels the
+    # debouncing flush; asyncio.run is not used because nest_asyncio (applied by
+    # the alembic env on first migration) makes it reuse one loop.
+    with asyncio.Runner() as runner:
+        runner.run(enqueue_then_close())
+    with asyncio.Runner() as runner:
+        runner.run(enqueue_and_drain())
+
+    assert closed_loop_service.vector_batches == []
+    assert search_service.vector_batches == [[2]]
+
+
 @pytest.mark.asyncio
 async def test_entity_vector_scheduler_invalidates_after_partial_failure():
     """A failed vector publication may still have changed derived search state."""
 
     class FailingSearchService(StubSearchService):
         @override
-        async def sync_entity_vectors(self, entity_id: int) -> None:
-            self.vector_synced.append(entity_id)
+        async def sync_entity_vectors_batch(self, entity_ids: list[int]) -> VectorSyncBatchResult:
+            self.vector_batches.append(list(entity_ids))
             raise RuntimeError("vector publication failed")
 
     search_service = FailingSearchService()
@@ -92,7 +184,7 @@ async def test_entity_vector_scheduler_invalidates_after_partial_failure():
     )
 
     with pytest.raises(RuntimeError, match="vector publication failed"):
-        await scheduler._run_entity_vector_sync(7)
+        await scheduler._run_entity_vector_sync_batch([7])
 
     assert read_cache.invalidated_project_ids == [PROJECT_EXTERNAL_ID]
 
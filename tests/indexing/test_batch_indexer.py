@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from datetime import UTC, datetime
 import os
 from pathlib import Path
@@ -22,6 +21,7 @@ from basic_memory.indexing.models import (
     StorageIndexFileWriter,
 )
 from basic_memory.indexing.note_content_reconciler import NoteContentReconciler
+from basic_memory.markdown.parse_stage import MarkdownParseStage, shutdown_markdown_parse_pool
 from basic_memory.repository import NoteContentRepository
 from basic_memory.repository.semantic_errors import SemanticDependenciesMissingError
 from basic_memory.schemas import Entity as EntitySchema
@@ -163,21 +163,10 @@ async def test_batch_indexer_parses_markdown_with_parallel_path(
         file_service,
     )
 
-    original_parse = entity_service.entity_parser.parse_markdown_content
-    in_flight = 0
-    max_in_flight = 0
-
-    async def spy_parse(*args, **kwargs):
-        nonlocal in_flight, max_in_flight
-        in_flight += 1
-        max_in_flight = max(max_in_flight, in_flight)
-        await asyncio.sleep(0.05)
-        try:
-            return await original_parse(*args, **kwargs)
-        finally:
-            in_flight -= 1
-
-    entity_service.entity_parser.parse_markdown_content = spy_parse
+    # Send even this two-file batch to worker processes.
+    batch_indexer.markdown_parse_stage = MarkdownParseStage(workers=2, min_batch_size=2)
+    in_loop_parses = AsyncMock(side_effect=entity_service.entity_parser.parse_markdown_content)
+    entity_service.entity_parser.parse_markdown_content = in_loop_parses
     try:
         result = await batch_indexer.index_files(
             files,
@@ -185,11 +174,14 @@ async def test_batch_indexer_parses_markdown_with_parallel_path(
             parse_max_concurrent=2,
         )
     finally:
-        entity_service.entity_parser.parse_markdown_content = original_parse
+        del entity_service.entity_parser.parse_markdown_content
+        shutdown_markdown_parse_pool()
 
-    assert max_in_flight >= 2
+    assert in_loop_parses.await_count == 0
     assert len(result.indexed) == 2
     assert result.errors == []
+    by_path = {indexed.path: indexed for indexed in result.indexed}
+    assert by_path[path_one].permalink == "test-project/notes/one"
 
 
 @pytest.mark.asyncio
@@ -261,6 +253,51 @@ async def test_batch_indexer_creates_entities_with_real_db_session(
     assert beta.title == "Beta"
 
 
+@pytest.mark.asyncio
+async def test_batch_indexer_folds_project_stat_deltas_after_each_batch(
+    app_config,
+    entity_service,
+    entity_repository,
+    relation_repository,
+    search_service,
+    file_service,
+    project_config,
+):
+    paths = ["notes/gamma.md", "notes/delta.md"]
+    for path in paths:
+        title = Path(path).stem.title()
+        await _create_file(
+            project_config.home / path,
+            f"---\ntitle: {title}\ntype: note\n---\n# {title}\n\n- [idea] one\n- [idea] two\n",
+        )
+    batch_indexer = _make_batch_indexer(
+        app_config,
+        entity_service,
+        entity_repository,
+        relation_repository,
+        search_service,
+        file_service,
+    )
+
+    result = await batch_indexer.index_files(
+        {path: await _load_input(file_service, path) for path in paths},
+        max_concurrent=2,
+    )
+
+    assert result.errors == []
+    async with db.scoped_session(search_service.session_maker) as session:
+        rows = (
+            await session.execute(
+                text(
+                    "SELECT stat_kind, stat_key, stat_count FROM project_stat "
+                    "WHERE project_id = :project_id"
+                ),
+                {"project_id": relation_repository.project_id},
+            )
+        ).all()
+    assert sorted(rows) == [("note_type", "note", 2), ("observation_category", "idea", 4)]
+
+
 @pytest.mark.asyncio
 async def test_batch_indexer_preserves_markdown_semantic_timestamps_on_reindex(
     app_config,
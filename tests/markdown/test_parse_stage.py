@@ -0,0 +1,105 @@
+"""Tests for the process-pool markdown parse stage."""
+
+import threading
+from textwrap import dedent
+
+import pytest
+
+import basic_memory.markdown.parse_stage as parse_stage
+from basic_memory.config import BasicMemoryConfig
+from basic_memory.markdown.parse_stage import (
+    MarkdownParseFailure,
+    MarkdownParseRequest,
+    MarkdownParseStage,
+    parse_markdown_requests,
+    resolve_parse_workers,
+    shutdown_markdown_parse_pool,
+)
+from basic_memory.markdown.schemas import EntityMarkdown
+
+
+def _request(index: int) -> MarkdownParseRequest:
+    return MarkdownParseRequest(
+        path=f"notes/note-{index}.md",
+        content=dedent(f"""\
+            ---
+            title: Note {index}
+            type: note
+            tags: [alpha, beta]
+            ---
+            # Note {index}
+
+            - [fact] Observation {index} #tagged
+            - links_to [[Note {index + 1}]]
+            """),
+        mtime=1_700_000_000.0,
+        ctime=1_700_000_000.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pooled_parse_matches_in_loop_parse():
+    requests = [_request(index) for index in range(6)]
+    requests.insert(3, MarkdownParseRequest(path="bad.md", content="---\ncreated: nope\n---\n"))
+
+    try:
+        pooled = await MarkdownParseStage(workers=2, min_batch_size=2).parse(requests)
+    finally:
+        shutdown_markdown_parse_pool()
+
+    in_loop = parse_markdown_requests(requests)
+    assert pooled == in_loop
+    assert isinstance(pooled[3], MarkdownParseFailure)
+    assert "created" in pooled[3].message
+    first = pooled[0]
+    assert isinstance(first, EntityMarkdown)
+    assert first.frontmatter.title == "Note 0"
+    assert [relation.target for relation in first.relations] == ["Note 1"]
+
+
+@pytest.mark.asyncio
+async def test_small_batches_parse_off_the_event_loop(monkeypatch):
+    def no_pool(workers: int):
+        raise AssertionError("small batches must not start the parse pool")
+
+    parse_threads: list[int] = []
+
+    def recording_parse(requests):
+        parse_threads.append(threading.get_ident())
+        return parse_markdown_requests(requests)
+
+    monkeypatch.setattr(parse_stage, "_shared_pool", no_pool)
+    monkeypatch.setattr(parse_stage, "parse_markdown_requests", recording_parse)
+
+    results = await MarkdownParseStage(workers=4, min_batch_size=16).parse(
+        [_request(index) for index in range(3)]
+    )
+    single_worker = await MarkdownParseStage(workers=1, min_batch_size=1).parse(
+        [_request(index) for index in range(3)]
+    )
+
+    titles = []
+    for result in results:
+        assert isinstance(result, EntityMarkdown)
+        titles.append(result.frontmatter.title)
+    assert titles == ["Note 0", "Note 1", "Note 2"]
+    assert single_worker == results
+    assert len(parse_threads) == 2
+    assert threading.get_ident() not in parse_threads
+
+
+def test_resolve_parse_workers(monkeypatch):
+    monkeypatch.setattr(parse_stage.os, "cpu_count", lambda: 4)
+    assert resolve_parse_workers(0) == 3
+    assert resolve_parse_workers(2) == 2
+
+    monkeypatch.setattr(parse_stage.os, "cpu_count", lambda: 64)
+    assert resolve_parse_workers(0) == 8
+
+    monkeypatch.setattr(parse_stage.os, "cpu_count", lambda: None)
+    assert resolve_parse_workers(0) == 1
+
+
+def test_parse_pool_is_opt_in():
+    # The default never spawns worker processes; 0 (auto) or >1 must be configured.
+    assert resolve_parse_workers(BasicMemoryConfig().index_parse_workers) == 1
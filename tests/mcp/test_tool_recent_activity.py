@@ -243,6 +243,136 @@ async def test_recent_activity_get_project_activity_timezone_normalization(monke
     assert proj_activity.last_activity is not None
 
 
+def _project_item(index: int) -> Any:
+    class P:
+        id = index
+        external_id = f"project-{index}"
+        name = f"p{index}"
+        path = f"/tmp/p{index}"
+
+    return cast(Any, P())
+
+
+def _activity_payload(title: str) -> dict[str, Any]:
+    return {
+        "results": [
+            {
+                "primary_result": {
+                    "type": "entity",
+                    "external_id": f"{title}-id",
+                    "permalink": f"notes/{title}",
+                    "title": title,
+                    "file_path": f"notes/{title}.md",
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                }
+            }
+        ],
+        "metadata": {"depth": 1},
+    }
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+@pytest.mark.asyncio
+async def test_recent_activity_collects_projects_concurrently_with_timeouts(monkeypatch):
+    """Per-project requests overlap up to the limit, and a hung project comes back empty."""
+    import asyncio
+    import importlib
+
+    recent_activity_module = importlib.import_module("basic_memory.mcp.tools.recent_activity")
+    monkeypatch.setattr(recent_activity_module, "_DISCOVERY_CONCURRENCY", 3)
+    monkeypatch.setattr(recent_activity_module, "_DISCOVERY_PROJECT_TIMEOUT", 0.2)
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_call_get(client, url, params=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            if "project-2" in str(url):
+                await asyncio.sleep(10)
+            await asyncio.sleep(0.01)
+            return _FakeResponse(_activity_payload(str(url).split("/")[3]))
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(recent_activity_module, "call_get", fake_call_get)
+
+    projects = [_project_item(i) for i in range(6)]
+    collected = await recent_activity_module._collect_projects_activity(
+        None, projects, {"type": ["observation"], "page": 1, "page_size": 10}, depth=1
+    )
+
+    assert peak == 3
+    assert [activity.project_name for activity in collected] == [p.name for p in projects]
+    assert collected[2].item_count == 0
+    assert collected[2].activity.metadata.depth == 1
+    assert [
+        a.activity.results[0].primary_result.title for i, a in enumerate(collected) if i != 2
+    ] == [f"project-{i}" for i in (0, 1, 3, 4, 5)]
+
+
+@pytest.mark.asyncio
+async def test_recent_activity_entity_discovery_uses_cross_project_endpoint(monkeypatch):
+    """Entity-only discovery makes one cross-project request, falling back per project on 404."""
+    import importlib
+
+    from httpx import HTTPStatusError, Request, Response
+
+    recent_activity_module = importlib.import_module("basic_memory.mcp.tools.recent_activity")
+    projects = [_project_item(i) for i in range(3)]
+    params = {"type": ["entity"], "timeframe": "7d", "page": 1, "page_size": 10, "depth": 1}
+    urls: list[str] = []
+
+    async def cross_project_call_get(client, url, params=None):
+        urls.append(str(url))
+        assert params == {"timeframe": "7d", "page": 1, "page_size": 10}
+        return _FakeResponse(
+            {
+                "projects": {
+                    "project-0": _activity_payload("zero"),
+                    "project-2": _activity_payload("two"),
+                }
+            }
+        )
+
+    monkeypatch.setattr(recent_activity_module, "call_get", cross_project_call_get)
+    collected = await recent_activity_module._collect_projects_activity(
+        None, projects, params, depth=1
+    )
+
+    assert urls == ["/v2/memory/recent"]
+    assert [activity.item_count for activity in collected] == [1, 0, 1]
+    assert collected[2].active_folders == ["notes"]
+
+    async def legacy_call_get(client, url, params=None):
+        urls.append(str(url))
+        if str(url) == "/v2/memory/recent":
+            response = Response(404, request=Request("GET", "http://test/v2/memory/recent"))
+            raise ToolError("not found") from HTTPStatusError(
+                "not found", request=response.request, response=response
+            )
+        return _FakeResponse(_activity_payload("legacy"))
+
+    urls.clear()
+    monkeypatch.setattr(recent_activity_module, "call_get", legacy_call_get)
+    collected = await recent_activity_module._collect_projects_activity(
+        None, projects, params, depth=1
+    )
+
+    assert urls[0] == "/v2/memory/recent"
+    assert sorted(urls[1:]) == [f"/v2/projects/project-{i}/memory/recent" for i in range(3)]
+    assert [activity.item_count for activity in collected] == [1, 1, 1]
+
+
 def test_recent_activity_format_project_output_no_results():
     import importlib
 
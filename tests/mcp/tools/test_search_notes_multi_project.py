@@ -1,5 +1,6 @@
 """Tests for optional multi-project search_notes behavior."""
 
+import asyncio
 from contextlib import asynccontextmanager
 import importlib
 
@@ -450,3 +451,134 @@ async def test_search_notes_search_all_projects_local_omits_project_id(monkeypat
     )
     assert result["total"] == 2
     assert result["total_is_exact"] is True
+
+
+def test_covering_page_finds_smallest_window_holding_offset_range():
+    search_mod = importlib.import_module("basic_memory.mcp.tools.search")
+
+    assert search_mod._covering_page(0, 10) == (1, 10)
+    assert search_mod._covering_page(20, 10) == (3, 10)
+    assert search_mod._covering_page(25, 10) == (3, 12)
+    assert search_mod._covering_page(9, 10) == (1, 19)
+    for offset in range(0, 60):
+        page, page_size = search_mod._covering_page(offset, 7)
+        start = (page - 1) * page_size
+        assert start <= offset and offset + 7 <= start + page_size
+
+
+@pytest.mark.asyncio
+async def test_search_notes_search_all_projects_pages_with_cursor(monkeypatch, cloud_routing):
+    """Projects are searched concurrently, merged by score, and continued by cursor."""
+    clients_mod = importlib.import_module("basic_memory.mcp.clients")
+    search_mod = importlib.import_module("basic_memory.mcp.tools.search")
+
+    scores = {
+        "11111111-1111-1111-1111-111111111111": [0.95, 0.9, 0.5, 0.4, 0.3],
+        "22222222-2222-2222-2222-222222222222": [0.85, 0.8, 0.75, 0.2],
+    }
+    project_refs = [
+        {"project": f"workspace/{name}", "project_id": project_id}
+        for name, project_id in zip(("alpha", "beta"), scores)
+    ]
+    requests: list[tuple[str, int, int]] = []
+    started = asyncio.Event()
+    in_flight = 0
+
+    async def fake_load_search_project_refs(context=None):
+        return project_refs
+
+    class StubProject:
+        def __init__(self, name: str | None, external_id: str | None):
+            self.name = name or "main"
+            self.external_id = external_id or "local-main"
+
+    @asynccontextmanager
+    async def fake_get_project_client(project=None, context=None, project_id=None):
+        yield object(), StubProject(project, project_id)
+
+    async def fake_resolve_project_and_path(client, identifier, project=None, context=None):
+        return StubProject(project, None), identifier, False
+
+    class MockSearchClient:
+        def __init__(self, client, project_id):
+            self.project_id = project_id
+
+        async def search(self, payload, page, page_size):
+            nonlocal in_flight
+            requests.append((self.project_id, page, page_size))
+            # Both project searches must be in flight together to get past this.
+            in_flight += 1
+            if in_flight == len(project_refs):
+                started.set()
+            await asyncio.wait_for(started.wait(), timeout=5)
+
+            project_scores = scores[self.project_id]
+            start = (page - 1) * page_size
+            window = project_scores[start : start + page_size]
+            return SearchResponse(
+                results=[
+                    SearchResult(
+                        title=f"{self.project_id[:1]}-{score}",
+                        permalink=f"notes/{score}",
+                        content="",
+                        type=SearchItemType.ENTITY,
+                        score=score,
+                        file_path=f"/notes/{score}.md",
+                    )
+                    for score in window
+                ],
+                current_page=page,
+                page_size=page_size,
+                total=len(project_scores),
+                has_more=start + page_size < len(project_scores),
+            )
+
+    monkeypatch.setattr(search_mod, "_load_search_project_refs", fake_load_search_project_refs)
+    monkeypatch.setattr(search_mod, "get_project_client", fake_get_project_client)
+    monkeypatch.setattr(search_mod, "resolve_project_and_path", fake_resolve_project_and_path)
+    monkeypatch.setattr(clients_mod, "SearchClient", MockSearchClient)
+
+    first = await search_mod.search_notes(
+        query="notes", search_all_projects=True, page_size=3, output_format="json"
+    )
+    assert isinstance(first, dict)
+    assert [item["score"] for item in first["results"]] == [0.95, 0.9, 0.85]
+    assert first["has_more"] is True
+    assert first["total"] == 9
+
+    requests.clear()
+    started.clear()
+    in_flight = 0
+    second = await search_mod.search_notes(
+        query="notes",
+        search_all_projects=True,
+        page_size=3,
+        cursor=first["next_cursor"],
+        output_format="json",
+    )
+    assert isinstance(second, dict)
+    assert second["current_page"] == 2
+    assert [item["score"] for item in second["results"]] == [0.8, 0.75, 0.5]
+    # Alpha had two rows consumed and beta one; each is asked for three rows from there.
+    assert sorted(requests) == [
+        ("11111111-1111-1111-1111-111111111111", 1, 5),
+        ("22222222-2222-2222-2222-222222222222", 1, 4),
+    ]
+
+    # The cursor-free page 2 merges from the top and agrees with the cursor page.
+    started.clear()
+    in_flight = 0
+    by_page = await search_mod.search_notes(
+        query="notes", search_all_projects=True, page=2, page_size=3, output_format="json"
+    )
+    assert isinstance(by_page, dict)
+    assert by_page["results"] == second["results"]
+
+    with pytest.raises(ValueError, match="different search"):
+        await search_mod.search_notes(
+            query="other",
+            search_all_projects=True,
+            page_size=3,
+            cursor=first["next_cursor"],
+            output_format="json",
+        )
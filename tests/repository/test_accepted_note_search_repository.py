@@ -22,6 +22,11 @@ class _Bind:
         self.dialect = _Dialect(dialect_name)
 
 
+class _Result:
+    def scalar_one(self) -> int:
+        return 99
+
+
 class _RecordingSession:
     def __init__(self, *, dialect_name: str = "postgresql") -> None:
         self.executed: list[tuple[str, dict[str, Any]]] = []
@@ -30,8 +35,9 @@ class _RecordingSession:
     def get_bind(self) -> _Bind:
         return self._bind
 
-    async def execute(self, statement: Any, params: dict[str, Any]) -> None:
-        self.executed.append((str(statement), params))
+    async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> _Result:
+        self.executed.append((str(statement), params or {}))
+        return _Result()
 
 
 @pytest.mark.asyncio
@@ -98,10 +104,16 @@ async def test_refresh_entity_uses_plain_insert_for_sqlite_virtual_table() -> No
 
     await repository.refresh_entity(cast(AsyncSession, session), row)
 
-    insert_sql, _ = session.executed[1]
+    statements = [sql for sql, _ in session.executed]
+    assert "DELETE FROM search_index\n" in statements[0]
+    assert "DELETE FROM search_index_lookup" in statements[1]
+    insert_sql = statements[2]
     assert "ON CONFLICT" not in insert_sql
     assert "CAST(:metadata AS jsonb)" not in insert_sql
     assert ":metadata" in insert_sql
+    # The new FTS row is mirrored into the B-tree lookup by its rowid.
+    assert "INSERT OR REPLACE INTO search_index_lookup" in statements[4]
+    assert session.executed[4][1] == {"first_rowid": 99, "last_rowid": 99}
 
 
 @pytest.mark.asyncio
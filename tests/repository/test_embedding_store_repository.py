@@ -0,0 +1,116 @@
+"""Tests for the content-addressed embedding store."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, update
+
+from basic_memory import db
+from basic_memory.models import EmbeddingStoreEntry
+from basic_memory.repository.embedding_store_repository import (
+    EmbeddingStoreRepository,
+    embedding_content_hash,
+)
+
+# Each 2-dimensional float64 vector packs to 16 bytes.
+VECTOR_BYTES = 16
+
+
+async def _age_entries(session_maker, *content_hashes: str, days: int) -> None:
+    async with db.scoped_session(session_maker) as session:
+        await session.execute(
+            update(EmbeddingStoreEntry)
+            .where(EmbeddingStoreEntry.content_hash.in_(content_hashes))
+            .values(last_used_at=datetime.now(timezone.utc) - timedelta(days=days))
+        )
+
+
+@pytest.mark.asyncio
+async def test_store_round_trips_vectors_per_provider_identity(session_maker):
+    store = EmbeddingStoreRepository(session_maker)
+    alpha = embedding_content_hash("alpha chunk")
+    beta = embedding_content_hash("beta chunk")
+    vector = [0.1 + 0.2, -1e-300]
+
+    await store.put_many("provider-a", {alpha: vector, beta: [1.0, 2.0]})
+
+    found = await store.get_many("provider-a", [alpha, beta, alpha], dimensions=2)
+    assert found == {alpha: vector, beta: [1.0, 2.0]}
+    assert await store.get_many("provider-b", [alpha], dimensions=2) == {}
+    # A dimension change under the same identity must not serve stale vectors.
+    assert await store.get_many("provider-a", [alpha], dimensions=3) == {}
+
+    await store.put_many("provider-a", {alpha: [0.5, 0.5, 0.5]})
+    assert await store.get_many("provider-a", [alpha], dimensions=3) == {alpha: [0.5, 0.5, 0.5]}
+
+    stats = await store.stats()
+    assert stats.entries == 2
+    assert stats.bytes == VECTOR_BYTES + 24
+    assert [provider.provider_identity for provider in stats.providers] == ["provider-a"]
+
+
+@pytest.mark.asyncio
+async def test_store_evicts_least_recently_used_entries_over_budget(session_maker):
+    store = EmbeddingStoreRepository(session_maker, max_bytes=2 * VECTOR_BYTES)
+    first, second, third = (embedding_content_hash(text) for text in ("one", "two", "three"))
+
+    await store.put_many("provider", {first: [1.0, 1.0], second: [2.0, 2.0]})
+    await _age_entries(session_maker, first, days=2)
+    await _age_entries(session_maker, second, days=1)
+    # Reading the older entry makes it the most recently used one.
+    assert await store.get_many("provider", [first], dimensions=2) == {first: [1.0, 1.0]}
+
+    await store.put_many("provider", {third: [3.0, 3.0]})
+
+    remaining = await store.get_many("provider", [first, second, third], dimensions=2)
+    assert set(remaining) == {first, third}
+    assert (await store.stats()).bytes == 2 * VECTOR_BYTES
+
+
+@pytest.mark.asyncio
+async def test_store_prune_by_age_provider_budget_and_all(session_maker):
+    store = EmbeddingStoreRepository(session_maker)
+    stale, fresh, other, extra = (
+        embedding_content_hash(text) for text in ("stale", "fresh", "other", "extra")
+    )
+    await store.put_many("provider-a", {stale: [1.0, 0.0], fresh: [0.0, 1.0]})
+    await store.put_many("provider-b", {other: [1.0, 1.0], extra: [2.0, 2.0]})
+    await _age_entries(session_maker, stale, days=40)
+
+    assert await store.prune(unused_since=datetime.now(timezone.utc) - timedelta(days=30)) == 1
+    assert await store.prune(provider_identity="provider-a") == 1
+    assert await store.prune(max_bytes=VECTOR_BYTES) == 1
+    assert (await store.stats()).entries == 1
+    assert await store.prune() == 1
+    assert (await store.stats()).entries == 0
+
+
+@pytest.mark.asyncio
+async def test_store_warm_reads_and_writes_skip_recency_updates_and_full_scans(engine_factory):
+    engine, session_maker = engine_factory
+    store = EmbeddingStoreRepository(session_maker, max_bytes=1024 * VECTOR_BYTES)
+    hashes = [embedding_content_hash(f"chunk {index}") for index in range(4)]
+    await store.put_many("provider", {content_hash: [1.0, 2.0] for content_hash in hashes[:2]})
+
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(" ".join(statement.split()))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        assert len(await store.get_many("provider", hashes[:2], dimensions=2)) == 2
+        await store.put_many("provider", {hashes[2]: [3.0, 3.0]})
+        await store.put_many("provider", {hashes[3]: [4.0, 4.0]})
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    # Entries used within the last hour keep their timestamp.
+    assert not [statement for statement in statements if statement.upper().startswith("UPDATE")]
+    # The budget check reuses the running total instead of summing the table.
+    assert not [
+        statement
+        for statement in statements
+        if "sum(embedding_store.byte_size)" in statement and "WHERE" not in statement
+    ]
+    assert (await store.stats()).bytes == 4 * VECTOR_BYTES
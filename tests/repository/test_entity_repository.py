@@ -791,6 +791,69 @@ async def test_find_by_directory_prefix_basic_fields_only(
         assert entity.updated_at is not None
 
 
+@pytest.mark.asyncio
+async def test_find_child_directories_and_direct_files(
+    entity_repository: EntityRepository, session_maker
+):
+    """Directory listings read one level through the generated directory column."""
+    file_paths = [
+        "root.md",
+        "docs/file1.md",
+        "docs/guides/file2.md",
+        "docs/guides/deep/file3.md",
+        "docs/api/file4.md",
+        "docs-archive/file5.md",
+        "docs0/file6.md",
+        "specs/file7.md",
+    ]
+    async with db.scoped_session(session_maker) as session:
+        session.add_all(
+            [
+                Entity(
+                    project_id=entity_repository.project_id,
+                    title=file_path,
+                    note_type="test",
+                    permalink=file_path.removesuffix(".md"),
+                    file_path=file_path,
+                    content_type="text/markdown",
+                    created_at=datetime.now(timezone.utc),
+                    updated_at=datetime.now(timezone.utc),
+                )
+                for file_path in file_paths
+            ]
+        )
+        await session.flush()
+
+    async with db.scoped_session(session_maker) as session:
+        assert await entity_repository.find_child_directories(session, "") == [
+            "docs-archive/",
+            "docs/",
+            "docs0/",
+            "specs/",
+        ]
+        assert await entity_repository.find_child_directories(session, "docs/") == [
+            "docs/api/",
+            "docs/guides/",
+        ]
+        assert await entity_repository.find_child_directories(session, "docs/api/") == []
+        assert await entity_repository.find_child_directories(session, "missing/") == []
+
+        root_files = await entity_repository.find_by_directory(session, "")
+        assert [entity.file_path for entity in root_files] == ["root.md"]
+        guides = await entity_repository.find_by_directory(session, "docs/guides/")
+        assert [entity.file_path for entity in guides] == ["docs/guides/file2.md"]
+
+        # The database re-derives the directory when a note moves.
+        moved = guides[0]
+        await entity_repository.update(session, moved.id, {"file_path": "specs/archive/file2.md"})
+
+    async with db.scoped_session(session_maker) as session:
+        assert await entity_repository.find_by_directory(session, "docs/guides/") == []
+        assert await entity_repository.find_child_directories(session, "specs/") == [
+            "specs/archive/"
+        ]
+
+
 @pytest.mark.asyncio
 async def test_get_all_file_paths(entity_repository: EntityRepository, session_maker):
     """Test getting all file paths for deletion detection during sync."""
@@ -19,6 +19,12 @@ class _StubVector:
     def tolist(self):
         return self._values
 
+    def __array__(self, dtype=None, copy=None):
+        # FastEmbed yields numpy arrays; the stub converts the same way.
+        import numpy as np
+
+        return np.asarray(self._values, dtype=dtype)
+
 
 class _StubTextEmbedding:
     init_count = 0
@@ -195,6 +201,12 @@ class _UnormalizedVector:
     def tolist(self):
         return self._values
 
+    def __array__(self, dtype=None, copy=None):
+        # FastEmbed yields numpy arrays; the stub converts the same way.
+        import numpy as np
+
+        return np.asarray(self._values, dtype=dtype)
+
 
 class _UnnormalizedTextEmbedding:
     def __init__(self, model_name: str, **_kwargs):
@@ -248,6 +260,28 @@ async def test_fastembed_provider_zero_vector_does_not_raise(monkeypatch):
     assert result == [[0.0, 0.0, 0.0, 0.0]]
 
 
+@pytest.mark.asyncio
+async def test_fastembed_provider_accepts_plain_list_vectors(monkeypatch):
+    """Backends that yield plain Python lists convert like numpy rows."""
+
+    class _ListEmbedding:
+        def __init__(self, model_name: str, **_kwargs):
+            pass
+
+        def embed(self, texts: list[str], **_kwargs):
+            for _ in texts:
+                yield [0.0, 3.0, 0.0, 4.0]
+
+    module = type(sys)("fastembed")
+    setattr(module, "TextEmbedding", _ListEmbedding)
+    monkeypatch.setitem(sys.modules, "fastembed", module)
+
+    provider = FastEmbedEmbeddingProvider(model_name="stub-list", dimensions=4)
+    result = await provider.embed_documents(["plain list"])
+
+    assert result == [pytest.approx([0.0, 0.6, 0.0, 0.8])]
+
+
 # --- Self-heal of corrupt/partial model cache (#895) ---
 #
 # A real interrupted FastEmbed download is non-deterministic and offline-unfriendly, so we
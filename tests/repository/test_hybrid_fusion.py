@@ -6,6 +6,7 @@ Verifies that the fusion formula (max + FUSION_BONUS * min):
 3. Produces zero fused score when the source score is zero
 """
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import override, Any, Optional, cast
@@ -363,3 +364,35 @@ async def test_dual_source_result_keeps_vector_matched_chunk():
     assert len(results) == 1
     # Vector result overwrites the FTS row in rows_by_id, so matched_chunk_text is preserved
     assert results[0].matched_chunk_text == vector_chunk
+
+
+@pytest.mark.asyncio
+async def test_hybrid_legs_run_concurrently_and_report_leg_timings():
+    """Both legs must be in flight together, and the trace records each leg's latency."""
+    repo = ConcreteSearchRepo()
+    fts_started = asyncio.Event()
+    vector_started = asyncio.Event()
+
+    async def fake_fts(**_kwargs):
+        fts_started.set()
+        # Deadlocks (and times out) if the vector leg only starts after FTS returns.
+        await asyncio.wait_for(vector_started.wait(), timeout=1)
+        return [FakeRow(id=1, score=5.0, title="fts-hit")]
+
+    async def fake_vector(**_kwargs):
+        vector_started.set()
+        await asyncio.wait_for(fts_started.wait(), timeout=1)
+        return [FakeRow(id=2, score=0.8, title="vector-hit")]
+
+    trace = SearchTraceCollector()
+    with (
+        patch.object(repo, "search", side_effect=fake_fts),
+        patch.object(repo, "_search_vector_only", side_effect=fake_vector),
+    ):
+        results = await repo._search_hybrid(**HYBRID_KWARGS, trace=trace)
+
+    assert {row.id for row in results} == {1, 2}
+    assert trace.hybrid_legs is not None
+    assert trace.hybrid_legs.fts_ms >= 0
+    assert trace.hybrid_legs.vector_ms >= 0
+    assert trace.hybrid_legs.wall_ms >= max(trace.hybrid_legs.fts_ms, trace.hybrid_legs.vector_ms)
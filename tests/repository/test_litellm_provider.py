@@ -14,6 +14,7 @@ from basic_memory.repository.embedding_provider_factory import (
     create_embedding_provider,
     reset_embedding_provider_cache,
 )
+from basic_memory.repository.query_caching_provider import unwrap_query_cache
 from basic_memory.repository.litellm_provider import LiteLLMEmbeddingProvider
 from basic_memory.repository.semantic_errors import SemanticDependenciesMissingError
 from typing import Any
@@ -358,7 +359,7 @@ def test_factory_selects_litellm_provider():
         semantic_embedding_provider="litellm",
         semantic_embedding_model="openai/text-embedding-3-small",
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, LiteLLMEmbeddingProvider)
     assert provider.model_name == "openai/text-embedding-3-small"
 
@@ -373,7 +374,7 @@ def test_factory_maps_default_model_for_litellm():
         semantic_embedding_provider="litellm",
         semantic_embedding_model="bge-small-en-v1.5",
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, LiteLLMEmbeddingProvider)
     assert provider.model_name == "openai/text-embedding-3-small"
 
@@ -393,7 +394,7 @@ async def test_factory_forwards_litellm_api_base(monkeypatch):
         semantic_embedding_dimensions=3,
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, LiteLLMEmbeddingProvider)
     await provider.embed_query("test")
 
@@ -416,7 +417,7 @@ async def test_factory_forwards_litellm_api_key(monkeypatch):
         semantic_embedding_dimensions=3,
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, LiteLLMEmbeddingProvider)
     await provider.embed_query("test")
 
@@ -438,7 +439,7 @@ async def test_factory_omits_litellm_api_key_when_unset(monkeypatch):
         semantic_embedding_dimensions=3,
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, LiteLLMEmbeddingProvider)
     await provider.embed_query("test")
 
@@ -513,7 +514,7 @@ def test_factory_forwards_litellm_document_and_query_input_types():
         semantic_embedding_document_input_type="passage",
         semantic_embedding_query_input_type="query",
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
 
     assert isinstance(provider, LiteLLMEmbeddingProvider)
     assert provider.dimensions == 1024
@@ -533,7 +534,7 @@ def test_factory_forwards_litellm_dimension_forwarding_flag():
         semantic_embedding_dimensions=768,
         semantic_embedding_forward_dimensions=True,
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
 
     assert isinstance(provider, LiteLLMEmbeddingProvider)
     assert provider.forward_dimensions is True
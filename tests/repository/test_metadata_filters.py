@@ -2,12 +2,15 @@
 
 from datetime import date
 
+from typing import Any
+
 import pytest
 
 from basic_memory.repository.metadata_filters import (
     ParsedMetadataFilter,
     _is_numeric_collection,
     _is_numeric_value,
+    build_metadata_value_condition,
     build_postgres_json_path,
     build_sqlite_json_path,
     parse_metadata_filters,
@@ -80,3 +83,24 @@ def test_numeric_helpers():
 def test_build_json_paths():
     assert build_sqlite_json_path(["schema", "confidence"]) == '$."schema"."confidence"'
     assert build_postgres_json_path(["schema", "confidence"]) == "{schema,confidence}"
+
+
+def test_metadata_value_condition_binds_path_and_value_columns():
+    params: dict[str, Any] = {}
+    (numeric,) = parse_metadata_filters({"schema.confidence": {"$gt": 0.7}})
+    sql = build_metadata_value_condition(numeric, 0, params, "entity_id")
+    assert sql.startswith("entity_id IN (SELECT entity_id FROM entity_metadata_value")
+    assert "value_num > :meta_index_val_0" in sql
+    assert params["meta_index_path_0"] == "schema.confidence"
+    assert params["meta_index_element_0_0"] is False
+
+    (before,) = parse_metadata_filters({"due": {"$lt": "2026-01-01"}})
+    assert "value_text IS NULL OR value_text < :meta_index_val_1" in (
+        build_metadata_value_condition(before, 1, params)
+    )
+
+    (tags,) = parse_metadata_filters({"tags": ["oauth"]})
+    sql = build_metadata_value_condition(tags, 2, params)
+    assert params["meta_index_element_2_1"] is True
+    assert params["meta_index_val_2_0_like"] == '%"oauth"%'
+    assert sql.count("entity.id IN (SELECT") == 2
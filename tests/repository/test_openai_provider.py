@@ -13,6 +13,7 @@ from basic_memory.repository.embedding_provider_factory import (
     create_embedding_provider,
     reset_embedding_provider_cache,
 )
+from basic_memory.repository.query_caching_provider import unwrap_query_cache
 from basic_memory.repository.fastembed_provider import FastEmbedEmbeddingProvider
 from basic_memory.repository.openai_provider import OpenAIEmbeddingProvider
 from basic_memory.repository.prefixing_provider import PrefixingEmbeddingProvider
@@ -160,7 +161,7 @@ def test_embedding_provider_factory_selects_fastembed_by_default():
         semantic_search_enabled=True,
         semantic_embedding_provider="fastembed",
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, FastEmbedEmbeddingProvider)
 
 
@@ -174,7 +175,7 @@ def test_embedding_provider_factory_selects_openai_and_applies_default_model():
         semantic_embedding_provider="openai",
         semantic_embedding_model="bge-small-en-v1.5",
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, OpenAIEmbeddingProvider)
     assert provider.model_name == "text-embedding-3-small"
 
@@ -202,7 +203,7 @@ def test_embedding_provider_factory_passes_custom_dimensions_to_fastembed():
         semantic_embedding_provider="fastembed",
         semantic_embedding_dimensions=768,
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, FastEmbedEmbeddingProvider)
     assert provider.dimensions == 768
 
@@ -217,7 +218,7 @@ def test_embedding_provider_factory_passes_custom_dimensions_to_openai():
         semantic_embedding_provider="openai",
         semantic_embedding_dimensions=3072,
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, OpenAIEmbeddingProvider)
     assert provider.dimensions == 3072
 
@@ -231,7 +232,7 @@ def test_embedding_provider_factory_uses_provider_defaults_when_dimensions_not_s
         semantic_search_enabled=True,
         semantic_embedding_provider="fastembed",
     )
-    fastembed_provider = create_embedding_provider(fastembed_config)
+    fastembed_provider = unwrap_query_cache(create_embedding_provider(fastembed_config))
     assert isinstance(fastembed_provider, FastEmbedEmbeddingProvider)
     assert fastembed_provider.dimensions == 384
 
@@ -242,7 +243,7 @@ def test_embedding_provider_factory_uses_provider_defaults_when_dimensions_not_s
         semantic_search_enabled=True,
         semantic_embedding_provider="openai",
     )
-    openai_provider = create_embedding_provider(openai_config)
+    openai_provider = unwrap_query_cache(create_embedding_provider(openai_config))
     assert isinstance(openai_provider, OpenAIEmbeddingProvider)
     assert openai_provider.dimensions == 1536
 
@@ -260,7 +261,7 @@ def test_embedding_provider_factory_forwards_fastembed_runtime_knobs():
         semantic_embedding_threads=3,
         semantic_embedding_parallel=2,
     )
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, FastEmbedEmbeddingProvider)
     assert provider.cache_dir == "/tmp/fastembed-cache"
     assert provider.threads == 3
@@ -287,7 +288,7 @@ def test_embedding_provider_factory_uses_default_cache_dir_when_unset(config_hom
         semantic_embedding_cache_dir=None,
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, FastEmbedEmbeddingProvider)
     expected = str(config_home / ".basic-memory" / "fastembed_cache")
     assert provider.cache_dir == expected
@@ -315,11 +316,11 @@ def test_embedding_provider_factory_cache_key_reflects_resolved_cache_dir(
         semantic_embedding_cache_dir=None,
     )
 
-    provider_a = create_embedding_provider(BasicMemoryConfig(**base_kwargs))
+    provider_a = unwrap_query_cache(create_embedding_provider(BasicMemoryConfig(**base_kwargs)))
     assert isinstance(provider_a, FastEmbedEmbeddingProvider)
 
     monkeypatch.setenv("FASTEMBED_CACHE_PATH", str(tmp_path / "alt-cache"))
-    provider_b = create_embedding_provider(BasicMemoryConfig(**base_kwargs))
+    provider_b = unwrap_query_cache(create_embedding_provider(BasicMemoryConfig(**base_kwargs)))
 
     assert isinstance(provider_b, FastEmbedEmbeddingProvider)
     assert provider_b is not provider_a
@@ -364,7 +365,7 @@ def test_embedding_provider_factory_auto_tunes_fastembed_runtime_knobs_from_cpu_
         semantic_embedding_parallel=None,
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
 
     assert isinstance(provider, FastEmbedEmbeddingProvider)
     assert provider.threads == 6
@@ -386,7 +387,7 @@ def test_embedding_provider_factory_auto_tuning_caps_large_cpu_budgets(monkeypat
         semantic_embedding_parallel=None,
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
 
     assert isinstance(provider, FastEmbedEmbeddingProvider)
     assert provider.threads == 8
@@ -410,7 +411,7 @@ def test_embedding_provider_factory_auto_tuning_stays_conservative_on_small_cpu_
         semantic_embedding_parallel=None,
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
 
     assert isinstance(provider, FastEmbedEmbeddingProvider)
     assert provider.threads == 2
@@ -560,7 +561,7 @@ def test_embedding_provider_factory_wraps_provider_when_prefixes_are_configured(
         semantic_embedding_query_prefix="task: search result | query: ",
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
 
     assert isinstance(provider, PrefixingEmbeddingProvider)
     assert isinstance(provider.provider, FastEmbedEmbeddingProvider)
@@ -683,7 +684,7 @@ def test_embedding_provider_factory_forwards_openai_request_concurrency():
         semantic_embedding_request_concurrency=6,
     )
 
-    provider = create_embedding_provider(config)
+    provider = unwrap_query_cache(create_embedding_provider(config))
     assert isinstance(provider, OpenAIEmbeddingProvider)
     assert provider.request_concurrency == 6
 
@@ -6,6 +6,7 @@ are difficult to reach in integration tests.
 """
 
 import hashlib
+from array import array
 from contextlib import asynccontextmanager
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -99,9 +100,11 @@ class TestFormatPgvectorLiteral:
         assert len(parts) == 3
 
     def test_high_precision(self):
-        """Verify that 12-significant-digit formatting is used."""
-        result = PgVectorIndex._format_vector([1.23456789012345])
-        assert "1.23456789012" in result
+        """Values are rounded through float32 and keep every digit pgvector's float4 stores."""
+        value = 1.23456789012345
+        result = PgVectorIndex._format_vector([value])
+        assert result == "[1.23456788]"
+        assert array("f", [float(result.strip("[]"))]) == array("f", [value])
 
     def test_integers_formatted_without_trailing_zeros(self):
         result = PgVectorIndex._format_vector([1.0, 2.0, 3.0])
@@ -0,0 +1,182 @@
+"""Tests for the trigger-maintained project statistics."""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import delete, func, select, update
+
+from basic_memory import db
+from basic_memory.models import Entity, Observation, Project, ProjectStat, Relation
+from basic_memory.repository import ProjectRepository
+from basic_memory.repository.project_stat_repository import (
+    ProjectStatCompactionSchedule,
+    ProjectStatRepository,
+)
+
+
+def _entity(project_id: int, name: str, note_type: str) -> Entity:
+    now = datetime.now(timezone.utc)
+    return Entity(
+        project_id=project_id,
+        title=name,
+        note_type=note_type,
+        permalink=f"stats/{name}",
+        file_path=f"stats/{name}.md",
+        content_type="text/markdown",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def _seed_graph(session_maker, project_id: int) -> tuple[Entity, Entity]:
+    async with db.scoped_session(session_maker) as session:
+        alpha = _entity(project_id, "alpha", "note")
+        beta = _entity(project_id, "beta", "person")
+        session.add_all([alpha, beta])
+        await session.flush()
+        session.add_all(
+            [
+                Observation(
+                    project_id=project_id, entity_id=alpha.id, category="idea", content="one"
+                ),
+                Observation(
+                    project_id=project_id, entity_id=alpha.id, category="idea", content="two"
+                ),
+                Observation(
+                    project_id=project_id, entity_id=beta.id, category="fact", content="three"
+                ),
+                Relation(
+                    project_id=project_id,
+                    from_id=alpha.id,
+                    to_id=beta.id,
+                    to_name="beta",
+                    relation_type="knows",
+                ),
+                Relation(
+                    project_id=project_id,
+                    from_id=beta.id,
+                    to_id=None,
+                    to_name="missing",
+                    relation_type="links_to",
+                ),
+            ]
+        )
+    return alpha, beta
+
+
+async def _counts(session_maker, project_id: int):
+    async with db.scoped_session(session_maker) as session:
+        return await ProjectStatRepository().get_counts(session, project_id)
+
+
+@pytest.mark.asyncio
+async def test_triggers_track_inserts_updates_and_deletes(session_maker, test_project: Project):
+    alpha, beta = await _seed_graph(session_maker, test_project.id)
+
+    counts = await _counts(session_maker, test_project.id)
+    assert counts.by_key("note_type") == {"note": 1, "person": 1}
+    assert counts.by_key("observation_category") == {"idea": 2, "fact": 1}
+    assert counts.by_key("relation_type") == {"knows": 1, "links_to": 1}
+    assert counts.total("unresolved_relations") == 1
+
+    async with db.scoped_session(session_maker) as session:
+        await session.execute(
+            update(Entity).where(Entity.id == beta.id).values(note_type="note", title="Beta")
+        )
+        await session.execute(
+            update(Relation).where(Relation.to_name == "missing").values(to_id=alpha.id)
+        )
+        await session.execute(delete(Observation).where(Observation.content == "one"))
+
+    counts = await _counts(session_maker, test_project.id)
+    assert counts.by_key("note_type") == {"note": 2}
+    assert counts.by_key("observation_category") == {"idea": 1, "fact": 1}
+    assert counts.total("unresolved_relations") == 0
+
+    # Deleting an entity cascades to its observations and relations.
+    async with db.scoped_session(session_maker) as session:
+        await session.execute(delete(Entity).where(Entity.id == alpha.id))
+
+    counts = await _counts(session_maker, test_project.id)
+    assert counts.by_key("note_type") == {"note": 1}
+    assert counts.by_key("observation_category") == {"fact": 1}
+    assert counts.by_key("relation_type") == {}
+    async with db.scoped_session(session_maker) as session:
+        assert await ProjectStatRepository().total_entities(session) == 1
+
+
+async def _stat_rows(session_maker, project_id: int) -> int:
+    async with db.scoped_session(session_maker) as session:
+        result = await session.execute(
+            select(func.count()).where(ProjectStat.project_id == project_id)
+        )
+        return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_reads_leave_delta_rows_alone(session_maker, test_project: Project):
+    await _seed_graph(session_maker, test_project.id)
+    rows = await _stat_rows(session_maker, test_project.id)
+
+    await _counts(session_maker, test_project.id)
+
+    assert await _stat_rows(session_maker, test_project.id) == rows
+
+
+@pytest.mark.asyncio
+async def test_compact_folds_delta_rows_into_one_row_per_key(session_maker, test_project: Project):
+    alpha, _ = await _seed_graph(session_maker, test_project.id)
+    async with db.scoped_session(session_maker) as session:
+        # A delete leaves a +1/-1 pair that must fold away entirely.
+        await session.execute(
+            delete(Observation).where(
+                Observation.entity_id == alpha.id, Observation.content == "two"
+            )
+        )
+    before = await _counts(session_maker, test_project.id)
+
+    async with db.scoped_session(session_maker) as session:
+        await ProjectStatRepository().compact(session, test_project.id)
+
+    # One row per non-zero key: two note types, two categories, two relation
+    # types, and the unresolved counter; the observation deltas fold together.
+    assert await _stat_rows(session_maker, test_project.id) == 7
+    assert await _counts(session_maker, test_project.id) == before
+    async with db.scoped_session(session_maker) as session:
+        await ProjectStatRepository().compact(session, test_project.id)
+    assert await _stat_rows(session_maker, test_project.id) == 7
+
+
+def test_compaction_schedule_fires_every_n_writes_per_project():
+    schedule = ProjectStatCompactionSchedule(every=3)
+    fired = [schedule.record_write("a") for _ in range(7)]
+    assert fired == [False, False, True, False, False, True, False]
+    # Other projects keep their own count.
+    assert schedule.record_write("b") is False
+
+
+@pytest.mark.asyncio
+async def test_recompute_repairs_drifted_counters(session_maker, test_project: Project):
+    await _seed_graph(session_maker, test_project.id)
+    expected = await _counts(session_maker, test_project.id)
+
+    async with db.scoped_session(session_maker) as session:
+        await session.execute(delete(ProjectStat).where(ProjectStat.stat_kind == "note_type"))
+    assert (await _counts(session_maker, test_project.id)).by_key("note_type") == {}
+
+    async with db.scoped_session(session_maker) as session:
+        await ProjectStatRepository().recompute(session, test_project.id)
+
+    assert await _counts(session_maker, test_project.id) == expected
+
+
+@pytest.mark.asyncio
+async def test_project_delete_removes_its_counters(session_maker, test_project: Project):
+    await _seed_graph(session_maker, test_project.id)
+
+    async with db.scoped_session(session_maker) as session:
+        assert await ProjectRepository().delete(session, test_project.id)
+
+    async with db.scoped_session(session_maker) as session:
+        result = await session.execute(select(func.count()).select_from(ProjectStat))
+        assert result.scalar_one() == 0
@@ -0,0 +1,147 @@
+"""Tests for the LRU query-embedding cache wrapper."""
+
+from typing import override, Any
+
+import pytest
+
+from basic_memory.config import BasicMemoryConfig
+from basic_memory.repository.embedding_provider import (
+    EmbeddingProvider,
+    embedding_provider_identity,
+)
+from basic_memory.repository.embedding_provider_factory import (
+    create_embedding_provider,
+    reset_embedding_provider_cache,
+)
+from basic_memory.repository.prefixing_provider import PrefixingEmbeddingProvider
+from basic_memory.repository.query_caching_provider import (
+    QueryCachingEmbeddingProvider,
+    unwrap_query_cache,
+)
+from basic_memory.repository.semantic_vector_index_factory import semantic_embedding_identity
+
+
+class _CountingEmbeddingProvider(EmbeddingProvider):
+    model_name = "stub-model"
+    dimensions = 3
+
+    def __init__(self) -> None:
+        self.query_calls: list[str] = []
+        self.document_calls: list[list[str]] = []
+
+    @override
+    async def embed_query(self, text: str) -> list[float]:
+        self.query_calls.append(text)
+        return [float(len(self.query_calls)), 0.5, 0.25]
+
+    @override
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.document_calls.append(texts)
+        return [[0.0, 1.0, 0.0] for _ in texts]
+
+    @override
+    def runtime_log_attrs(self) -> dict[str, Any]:
+        return {"provider_batch_size": 7}
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_cache():
+    inner = _CountingEmbeddingProvider()
+    provider = QueryCachingEmbeddingProvider(inner, max_entries=8, max_bytes=1 << 20)
+
+    first = await provider.embed_query("release plan")
+    second = await provider.embed_query("  release plan ")
+
+    assert first == second == [1.0, 0.5, 0.25]
+    assert inner.query_calls == ["release plan"]
+    stats = provider.cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cached_vector_is_copied_per_caller():
+    provider = QueryCachingEmbeddingProvider(
+        _CountingEmbeddingProvider(), max_entries=8, max_bytes=1 << 20
+    )
+
+    first = await provider.embed_query("q")
+    first[0] = 99.0
+
+    assert await provider.embed_query("q") == [1.0, 0.5, 0.25]
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_entry():
+    inner = _CountingEmbeddingProvider()
+    provider = QueryCachingEmbeddingProvider(inner, max_entries=2, max_bytes=1 << 20)
+
+    await provider.embed_query("a")
+    await provider.embed_query("b")
+    await provider.embed_query("a")  # refresh "a"; "b" is now least recent
+    await provider.embed_query("c")
+    await provider.embed_query("a")
+    await provider.embed_query("b")
+
+    assert inner.query_calls == ["a", "b", "c", "b"]
+    stats = provider.cache_stats()
+    assert stats.evictions == 2
+    assert stats.entries == 2
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_bounds_cache_memory():
+    inner = _CountingEmbeddingProvider()
+    # Room for one 3-dim entry plus bookkeeping, but not two.
+    provider = QueryCachingEmbeddingProvider(inner, max_entries=100, max_bytes=300)
+
+    await provider.embed_query("a")
+    await provider.embed_query("b")
+
+    stats = provider.cache_stats()
+    assert stats.entries == 1
+    assert stats.bytes <= 300
+    assert stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_documents_pass_through_uncached():
+    inner = _CountingEmbeddingProvider()
+    provider = QueryCachingEmbeddingProvider(inner, max_entries=8, max_bytes=1 << 20)
+
+    await provider.embed_documents(["chunk"])
+    await provider.embed_documents(["chunk"])
+
+    assert inner.document_calls == [["chunk"], ["chunk"]]
+
+
+def test_cache_is_identity_transparent():
+    """Wrapping must not change the persisted model identity of stored vectors."""
+    inner = PrefixingEmbeddingProvider(_CountingEmbeddingProvider(), query_prefix="query: ")
+    provider = QueryCachingEmbeddingProvider(inner, max_entries=8, max_bytes=1 << 20)
+
+    assert embedding_provider_identity(provider) == embedding_provider_identity(inner)
+    assert semantic_embedding_identity(provider) == semantic_embedding_identity(inner)
+    assert unwrap_query_cache(provider) is inner
+    assert provider.runtime_log_attrs()["query_cache_max_entries"] == 8
+
+
+def test_factory_wraps_outermost_provider_unless_disabled():
+    reset_embedding_provider_cache()
+    base_kwargs: dict[str, Any] = dict(
+        env="test",
+        projects={"test-project": "/tmp/basic-memory-test"},
+        default_project="test-project",
+        semantic_search_enabled=True,
+        semantic_embedding_provider="openai",
+        semantic_embedding_query_prefix="query: ",
+    )
+    provider = create_embedding_provider(BasicMemoryConfig(**base_kwargs))
+    assert isinstance(provider, QueryCachingEmbeddingProvider)
+    assert isinstance(provider.provider, PrefixingEmbeddingProvider)
+
+    reset_embedding_provider_cache()
+    uncached = create_embedding_provider(
+        BasicMemoryConfig(**base_kwargs, semantic_query_embedding_cache_size=0)
+    )
+    assert isinstance(uncached, PrefixingEmbeddingProvider)
+    reset_embedding_provider_cache()
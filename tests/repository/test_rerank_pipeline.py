@@ -13,12 +13,14 @@ from basic_memory.config import BasicMemoryConfig, DatabaseBackend
 from basic_memory.repository.postgres_search_repository import PostgresSearchRepository
 from basic_memory.repository.search_index_row import SearchIndexRow
 from basic_memory.repository.rerank_provider import (
+    RerankScoreCache,
     build_rerank_document,
     demote_tail_scores,
     validate_rerank_scores,
 )
 from basic_memory.repository.search_repository import create_search_repository
 from basic_memory.repository.search_repository_base import RERANK_POOL_CHUNK_FANOUT
+from basic_memory.repository.search_trace import SearchTraceCollector
 from basic_memory.repository.semantic_errors import (
     RerankProviderContractError,
     RerankTransientError,
@@ -447,6 +449,62 @@ async def test_rerank_paginate_keeps_expanded_candidates_out_of_stable_prefix():
     assert reranker.calls == 2
 
 
+@pytest.mark.asyncio
+async def test_rerank_score_cache_serves_later_pages_without_rescoring():
+    """The first page scores the whole pool once; later pages read the score cache."""
+    repo = _unit_repo()
+    reranker = _FakeReranker({"Alpha": 0.1, "Bravo": 0.9, "Charlie": 0.5})
+    repo._rerank_provider = reranker
+    repo._rerank_score_cache = RerankScoreCache(max_entries=100)
+    repo._reranker_candidates = 3
+    rows = [
+        _row(id=1, title="Alpha"),
+        _row(id=2, title="Bravo"),
+        _row(id=3, title="Charlie"),
+        _row(id=4, title="Delta"),
+    ]
+
+    first_trace = SearchTraceCollector()
+    first_page = await repo._rerank_and_paginate("auth", rows, offset=0, limit=2, trace=first_trace)
+    second_trace = SearchTraceCollector()
+    second_page = await repo._rerank_and_paginate(
+        "auth", rows, offset=2, limit=2, trace=second_trace
+    )
+
+    assert [row.title for row in first_page] == ["Bravo", "Charlie"]
+    assert [row.title for row in second_page] == ["Alpha", "Delta"]
+    assert reranker.calls == 1
+    assert first_trace.rerank is not None and second_trace.rerank is not None
+    assert (first_trace.rerank.score_cache_hits, first_trace.rerank.score_cache_misses) == (0, 3)
+    assert second_trace.rerank.score_cache_hit_ratio == 1.0
+
+
+@pytest.mark.asyncio
+async def test_rerank_score_cache_scores_only_misses_and_stays_bounded():
+    cache = RerankScoreCache(max_entries=2)
+    reranker = _FakeReranker({"Alpha": 0.1, "Bravo": 0.9, "Charlie": 0.5})
+
+    first = await cache.rerank(reranker, "auth", ["Alpha", "Bravo"])
+    second = await cache.rerank(reranker, "auth", ["Bravo", "Charlie"])
+    other_query = await cache.rerank(reranker, "login", ["Bravo"])
+
+    assert (first.scores, first.hits, first.misses) == ([0.1, 0.9], 0, 2)
+    assert (second.scores, second.hits, second.misses) == ([0.9, 0.5], 1, 1)
+    # Only the miss reached the provider, and the query is part of the key.
+    assert reranker.document_batches == [["Alpha", "Bravo"], ["Charlie"], ["Bravo"]]
+    assert other_query.misses == 1
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_rerank_score_cache_rejects_misaligned_provider_output():
+    cache = RerankScoreCache(max_entries=10)
+
+    with pytest.raises(RerankProviderContractError):
+        await cache.rerank(_BadReranker(), "auth", ["Alpha"])
+    assert len(cache) == 0
+
+
 @pytest.mark.asyncio
 async def test_rerank_paginate_surfaces_transient_provider_error():
     """Transient failures must not silently replace reranked order with retrieval order."""
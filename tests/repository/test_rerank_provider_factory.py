@@ -11,6 +11,7 @@ from basic_memory.repository.litellm_rerank_provider import LiteLLMRerankProvide
 import basic_memory.repository.rerank_provider_factory as factory
 from basic_memory.repository.rerank_provider_factory import (
     create_rerank_provider,
+    get_rerank_score_cache,
     reset_rerank_provider_cache,
 )
 from typing import Any, override
@@ -255,3 +256,25 @@ def test_concurrent_race_returns_winning_provider(monkeypatch):
     monkeypatch.setattr(factory, "_RERANK_PROVIDER_CACHE", _RacyCache())
     result = create_rerank_provider(_config(reranker_enabled=True, reranker_provider="fastembed"))
     assert result is winner
+
+
+def test_score_cache_is_scoped_to_the_provider_instance():
+    config = _config(reranker_enabled=True, reranker_provider="fastembed")
+    provider = create_rerank_provider(config)
+    assert provider is not None
+
+    cache = get_rerank_score_cache(provider, config)
+    assert cache is not None
+    assert cache.max_entries == config.reranker_score_cache_size
+    assert get_rerank_score_cache(provider, config) is cache
+    other = FastEmbedRerankProvider(model_name=config.reranker_model)
+    assert get_rerank_score_cache(other, config) is not cache
+
+
+def test_score_cache_disabled_when_sized_zero():
+    config = _config(
+        reranker_enabled=True, reranker_provider="fastembed", reranker_score_cache_size=0
+    )
+    provider = create_rerank_provider(config)
+    assert provider is not None
+    assert get_rerank_score_cache(provider, config) is None
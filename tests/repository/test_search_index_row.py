@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from basic_memory.repository.search_index_row import SearchIndexRow
+from basic_memory.repository.search_index_row import SearchIndexRow, sqlite_fts_content_stems
 
 
 def test_from_mapping_normalizes_database_values():
@@ -64,3 +64,26 @@ def test_content_returns_full_snippet_when_under_limit():
         content_snippet=short_text,
     )
     assert row.content == short_text
+
+
+def test_sqlite_fts_content_stems_drops_embedded_body():
+    """The body copy is removed while title and path variants remain."""
+    body = "# Plan\n\nShip the release"
+    stems = "\n".join(["Plan", "plan", body, "notes/plan", "notes", "release-tag"])
+
+    assert sqlite_fts_content_stems(stems, body) == "Plan\nplan\nnotes/plan\nnotes\nrelease-tag"
+
+
+def test_sqlite_fts_content_stems_drops_capped_body_tail():
+    """Stems capped mid-body lose the truncated body prefix at their tail."""
+    body = "body words " * 20
+    stems = "Plan\nplan\n" + body[:120]
+
+    assert sqlite_fts_content_stems(stems, body) == "Plan\nplan"
+
+
+def test_sqlite_fts_content_stems_keeps_rows_without_body_copy():
+    """Relations and hand-built rows without an embedded body are unchanged."""
+    assert sqlite_fts_content_stems("a -> b\na", None) == "a -> b\na"
+    assert sqlite_fts_content_stems("prefix content only", "x" * 100) == "prefix content only"
+    assert sqlite_fts_content_stems(None, "body") is None
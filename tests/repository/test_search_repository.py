@@ -4,10 +4,10 @@ from datetime import datetime, timezone
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import text
+from sqlalchemy import delete, select, text, update
 
 from basic_memory import db
-from basic_memory.models import Entity
+from basic_memory.models import Entity, EntityMetadataValue
 from basic_memory.models.project import Project
 from basic_memory.repository.search_repository import SearchIndexRow
 from basic_memory.repository.postgres_search_repository import PostgresSearchRepository
@@ -282,6 +282,162 @@ async def test_sqlite_text_search_matches_full_content_snippet(search_repository
     assert await search_repository.count(search_text=marker) == 1
 
 
+@pytest.mark.asyncio
+async def test_sqlite_stores_note_body_once(search_repository, search_entity):
+    """SQLite keeps the body in content_snippet only and still matches across columns."""
+    if is_postgres_backend(search_repository):
+        pytest.skip("Body dedupe applies to the SQLite FTS5 layout only")
+
+    body = "Quarterly roadmap covers the zeppelin launch"
+    search_row = SearchIndexRow(
+        id=search_entity.id,
+        type=SearchItemType.ENTITY.value,
+        title=search_entity.title,
+        content_stems="\n".join([search_entity.title, body, search_entity.permalink]),
+        content_snippet=body,
+        permalink=search_entity.permalink,
+        file_path=search_entity.file_path,
+        entity_id=search_entity.id,
+        metadata={"note_type": search_entity.note_type},
+        created_at=search_entity.created_at,
+        updated_at=search_entity.updated_at,
+        project_id=search_repository.project_id,
+    )
+    await search_repository.bulk_index_items([search_row])
+
+    async with db.scoped_session(search_repository.session_maker) as session:
+        stored = (
+            await session.execute(
+                text("SELECT content_stems, content_snippet FROM search_index WHERE id = :id"),
+                {"id": search_entity.id},
+            )
+        ).one()
+    assert stored.content_stems == f"{search_entity.title}\n{search_entity.permalink}"
+    assert stored.content_snippet == body
+
+    # "entity" lives only in the stems/title, "zeppelin" only in the body.
+    results = await search_repository.search(search_text="entity zeppelin")
+    assert [result.id for result in results] == [search_entity.id]
+
+
+def _lookup_test_row(search_repository, row_id: int, permalink: str, row_type: str, note_type):
+    now = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+    return SearchIndexRow(
+        id=row_id,
+        type=row_type,
+        title=f"Lookup {row_id}",
+        content_stems=f"lookup row {row_id}",
+        content_snippet=f"lookup row {row_id}",
+        permalink=permalink,
+        file_path=f"{permalink}.md",
+        entity_id=row_id,
+        metadata={"note_type": note_type},
+        created_at=now,
+        updated_at=now,
+        project_id=search_repository.project_id,
+    )
+
+
+async def _lookup_rows(search_repository) -> list[tuple[int, str, str, str | None, str]]:
+    async with db.scoped_session(search_repository.session_maker) as session:
+        result = await session.execute(
+            text(
+                "SELECT l.rowid, l.permalink, l.type, l.note_type, l.updated_at "
+                "FROM search_index_lookup l ORDER BY l.rowid"
+            )
+        )
+        return [tuple(row) for row in result.fetchall()]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_lookup_mirrors_writes_and_serves_exact_filters(search_repository):
+    """Exact filters go through the B-tree lookup, which tracks every FTS write."""
+    if is_postgres_backend(search_repository):
+        pytest.skip("search_index_lookup shadows the SQLite FTS5 table only")
+
+    await search_repository.bulk_index_items(
+        [
+            _lookup_test_row(search_repository, 1, "notes/alpha", "entity", "Chapter"),
+            _lookup_test_row(search_repository, 2, "notes/beta", "entity", "task"),
+        ]
+    )
+    await search_repository.index_item(
+        _lookup_test_row(search_repository, 3, "specs/gamma", "observation", None)
+    )
+
+    async with db.scoped_session(search_repository.session_maker) as session:
+        fts_rowids = (
+            await session.execute(text("SELECT rowid FROM search_index ORDER BY rowid"))
+        ).scalars()
+        fts_rowids = list(fts_rowids)
+    assert [row[0] for row in await _lookup_rows(search_repository)] == fts_rowids
+    assert [row[1:4] for row in await _lookup_rows(search_repository)] == [
+        ("notes/alpha", "entity", "chapter"),
+        ("notes/beta", "entity", "task"),
+        ("specs/gamma", "observation", None),
+    ]
+
+    _, where_clause, _, _ = await search_repository._build_fts_query_parts(permalink="notes/alpha")
+    assert "search_index_lookup" in where_clause
+    _, where_clause, _, _ = await search_repository._build_fts_query_parts(
+        search_text="lookup", permalink="notes/alpha"
+    )
+    assert "search_index_lookup" not in where_clause
+
+    assert [r.id for r in await search_repository.search(permalink="notes/alpha")] == [1]
+    found = await search_repository.search(permalink_match="notes/*")
+    assert sorted(r.id for r in found) == [1, 2]
+    assert [r.id for r in await search_repository.search(note_types=["CHAPTER"])] == [1]
+    found = await search_repository.search(search_item_types=[SearchItemType.OBSERVATION])
+    assert [r.id for r in found] == [3]
+    found = await search_repository.search(after_date=datetime(2026, 10, 16, tzinfo=timezone.utc))
+    assert len(found) == 3
+    assert await search_repository.count(permalink_match="notes/*") == 2
+
+    await search_repository.delete_by_permalink("notes/alpha")
+    await search_repository.delete_by_entity_id(2)
+    assert [row[1] for row in await _lookup_rows(search_repository)] == ["specs/gamma"]
+    assert await search_repository.search(permalink_match="notes/*") == []
+
+
+@pytest.mark.asyncio
+async def test_sqlite_lookup_tolerates_unmirrored_deletes_and_rebuilds(search_repository):
+    """Stale lookup rows never leak into results; sweeps and init converge them."""
+    if is_postgres_backend(search_repository):
+        pytest.skip("search_index_lookup shadows the SQLite FTS5 table only")
+
+    await search_repository.bulk_index_items(
+        [_lookup_test_row(search_repository, 1, "notes/old", "entity", "note")]
+    )
+    # Delete paths outside the repository (directory deletes, index maintenance)
+    # only touch the FTS table; the next insert then reuses the freed rowid.
+    await search_repository.execute_query(
+        text("DELETE FROM search_index WHERE permalink = 'notes/old'"), params={}
+    )
+    assert await search_repository.search(permalink="notes/old") == []
+    await search_repository.index_item(
+        _lookup_test_row(search_repository, 2, "notes/new", "entity", "note")
+    )
+    assert await search_repository.search(permalink="notes/old") == []
+    assert [r.id for r in await search_repository.search(permalink="notes/new")] == [2]
+
+    await search_repository.execute_query(
+        text("DELETE FROM search_index WHERE permalink = 'notes/new'"), params={}
+    )
+    assert len(await _lookup_rows(search_repository)) == 1
+    await search_repository.purge_stale_search_rows()
+    assert await _lookup_rows(search_repository) == []
+
+    # A lookup table created next to an already populated FTS table is backfilled.
+    await search_repository.bulk_index_items(
+        [_lookup_test_row(search_repository, 3, "notes/kept", "entity", "note")]
+    )
+    await search_repository.execute_query(text("DROP TABLE search_index_lookup"), params={})
+    await search_repository.init_search_index()
+    assert [row[1] for row in await _lookup_rows(search_repository)] == ["notes/kept"]
+    assert [r.id for r in await search_repository.search(permalink="notes/kept")] == [3]
+
+
 @pytest.mark.asyncio
 async def test_index_item_upsert_on_duplicate_permalink(search_repository, search_entity):
     """Test that indexing the same permalink twice uses upsert instead of failing.
@@ -1045,6 +1201,60 @@ async def test_search_metadata_filters_numeric_comparisons(search_repository, se
     assert {result.id for result in results} == {entity_low.id}
 
 
+@pytest.mark.asyncio
+async def test_metadata_value_index_follows_entity_writes(search_repository, session_maker):
+    """Triggers keep entity_metadata_value in step with inserts, updates, and deletes."""
+    entity = await _index_entity_with_metadata(
+        search_repository,
+        session_maker,
+        "Indexed Values",
+        {"status": "draft", "tags": ["alpha", "beta"], "schema": {"confidence": 0.9}},
+    )
+
+    async def indexed_values() -> dict[tuple[str, bool], set[str | float | None]]:
+        async with db.scoped_session(session_maker) as session:
+            rows = await session.execute(
+                select(
+                    EntityMetadataValue.path,
+                    EntityMetadataValue.is_element,
+                    EntityMetadataValue.value_text,
+                    EntityMetadataValue.value_num,
+                ).where(EntityMetadataValue.entity_id == entity.id)
+            )
+            values: dict[tuple[str, bool], set[str | float | None]] = {}
+            for path, is_element, text_value, num in rows:
+                # Numbers are compared through value_num; their text is backend-specific.
+                values.setdefault((path, is_element), set()).add(
+                    num if path == "schema.confidence" else text_value
+                )
+            return values
+
+    values = await indexed_values()
+    assert values[("tags", True)] == {"alpha", "beta"}
+    assert values[("status", False)] == {"draft"}
+    assert values[("schema.confidence", False)] == {0.9}
+
+    async with db.scoped_session(session_maker) as session:
+        await session.execute(
+            update(Entity)
+            .where(Entity.id == entity.id)
+            .values(entity_metadata={"status": "published", "tags": ["gamma"]})
+        )
+
+    values = await indexed_values()
+    assert values[("tags", True)] == {"gamma"}
+    assert values[("status", False)] == {"published"}
+    assert ("schema.confidence", False) not in values
+    results = await search_repository.search(metadata_filters={"tags": ["gamma"]})
+    assert {result.id for result in results} == {entity.id}
+    assert await search_repository.search(metadata_filters={"status": "draft"}) == []
+
+    async with db.scoped_session(session_maker) as session:
+        await session.execute(delete(Entity).where(Entity.id == entity.id))
+
+    assert await indexed_values() == {}
+
+
 # --- SQL injection safety tests ---
 # These tests verify that user-supplied filter values are parameterized and cannot
 # alter query structure. Each test passes a malicious payload and asserts the query
@@ -679,6 +679,96 @@ async def test_flush_embedding_jobs_handles_empty_mismatch_and_missing_runtime(m
     assert write_seconds >= 0
 
 
+class _InMemoryEmbeddingStore:
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, str], list[float]] = {}
+
+    async def get_many(self, provider_identity, content_hashes, *, dimensions):
+        return {
+            content_hash: self.entries[(provider_identity, content_hash)]
+            for content_hash in content_hashes
+            if (provider_identity, content_hash) in self.entries
+        }
+
+    async def put_many(self, provider_identity, vectors):
+        for content_hash, vector in vectors.items():
+            self.entries[(provider_identity, content_hash)] = vector
+
+
+@pytest.mark.asyncio
+async def test_embed_chunk_texts_only_embeds_texts_missing_from_the_store(monkeypatch) -> None:
+    repository = _TestRepository()
+    embedding_provider = SimpleNamespace(
+        dimensions=1,
+        embed_documents=AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts]),
+    )
+    monkeypatch.setattr(repository, "_embedding_provider", embedding_provider)
+    monkeypatch.setattr(repository, "_embedding_store", _InMemoryEmbeddingStore())
+    monkeypatch.setattr(repository, "_embedding_model_key", lambda: "provider:1")
+
+    first = await semantic_vector_sync.embed_chunk_texts(repository, ["a", "bb", "a"])
+    second = await semantic_vector_sync.embed_chunk_texts(repository, ["bb", "ccc", "a"])
+
+    assert first == [[1.0], [2.0], [1.0]]
+    assert second == [[2.0], [3.0], [1.0]]
+    assert [call.args[0] for call in embedding_provider.embed_documents.await_args_list] == [
+        ["a", "bb"],
+        ["ccc"],
+    ]
+
+    monkeypatch.setattr(repository, "_embedding_model_key", lambda: "other:1")
+    await semantic_vector_sync.embed_chunk_texts(repository, ["a"])
+    assert embedding_provider.embed_documents.await_args.args[0] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_embed_chunk_texts_survives_a_failed_store_write(monkeypatch) -> None:
+    class _FailingStore(_InMemoryEmbeddingStore):
+        @override
+        async def put_many(self, provider_identity, vectors):
+            raise RuntimeError("database is locked")
+
+    repository = _TestRepository()
+    embedding_provider = SimpleNamespace(
+        dimensions=1,
+        embed_documents=AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts]),
+    )
+    monkeypatch.setattr(repository, "_embedding_provider", embedding_provider)
+    monkeypatch.setattr(repository, "_embedding_store", _FailingStore())
+    monkeypatch.setattr(repository, "_embedding_model_key", lambda: "provider:1")
+
+    assert await semantic_vector_sync.embed_chunk_texts(repository, ["a", "bb"]) == [
+        [1.0],
+        [2.0],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_embed_chunk_texts_embeds_everything_when_the_store_read_fails(
+    monkeypatch,
+) -> None:
+    class _UnreadableStore(_InMemoryEmbeddingStore):
+        @override
+        async def get_many(self, provider_identity, content_hashes, *, dimensions):
+            raise RuntimeError("database is locked")
+
+    repository = _TestRepository()
+    embedding_provider = SimpleNamespace(
+        dimensions=1,
+        embed_documents=AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts]),
+    )
+    monkeypatch.setattr(repository, "_embedding_provider", embedding_provider)
+    monkeypatch.setattr(repository, "_embedding_store", _UnreadableStore())
+    monkeypatch.setattr(repository, "_embedding_model_key", lambda: "provider:1")
+
+    assert await semantic_vector_sync.embed_chunk_texts(repository, ["a", "bb", "a"]) == [
+        [1.0],
+        [2.0],
+        [1.0],
+    ]
+    assert embedding_provider.embed_documents.await_args.args[0] == ["a", "bb"]
+
+
 def test_finalize_completed_entity_syncs_defers_incomplete_entities(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
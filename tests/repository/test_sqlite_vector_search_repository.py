@@ -33,7 +33,11 @@ from basic_memory.repository.semantic_vector_sync import (
 )
 from basic_memory.repository.sqlite_search_repository import SQLiteSearchRepository
 from basic_memory.repository import sqlite_vec_index as sqlite_vec_index_module
-from basic_memory.repository.sqlite_vec_index import SQLITE_VEC_MAX_K, SQLiteVecIndex
+from basic_memory.repository.sqlite_vec_index import (
+    SQLITE_VEC_MAX_K,
+    SQLiteVecIndex,
+    float32_blob,
+)
 from basic_memory.schemas.search import SearchItemType, SearchRetrievalMode
 
 
@@ -1449,7 +1453,7 @@ async def test_run_vector_query_caps_k_at_sqlite_vec_limit(search_repository, mo
 
     assert captured_params == [
         {
-            "query": "[0.1, 0.1, 0.1, 0.1]",
+            "query": float32_blob(query_embedding),
             "vector_k": SQLITE_VEC_MAX_K,
             "project_id": search_repository.project_id,
             "embedding_identity": search_repository._embedding_model_key(),
@@ -1461,3 +1465,14 @@ async def test_run_vector_query_caps_k_at_sqlite_vec_limit(search_repository, mo
     await index.search(query_embedding, limit=500)
     assert captured_params[0]["vector_k"] == 500
     assert captured_params[0]["limit"] == 500
+
+
+def test_float32_blob_matches_sqlite_vec_wire_format():
+    """Vectors travel to sqlite-vec as 4-byte little-endian floats, not JSON text."""
+    sqlite_vec = pytest.importorskip("sqlite_vec")
+    values = [0.5, -0.25, 1.0, 0.1]
+
+    blob = float32_blob(values)
+
+    assert len(blob) == 4 * len(values)
+    assert blob == sqlite_vec.serialize_float32(values)
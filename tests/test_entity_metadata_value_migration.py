@@ -0,0 +1,111 @@
+"""Migration tests for the entity_metadata_value index."""
+
+import json
+import sqlite3
+
+from alembic import command
+
+from tests.test_note_content_migration import sqlite_alembic_config
+
+
+def _element_values(connection: sqlite3.Connection, path: str) -> set[str]:
+    rows = connection.execute(
+        "SELECT value_text FROM entity_metadata_value WHERE path = ? AND is_element",
+        (path,),
+    ).fetchall()
+    return {value for (value,) in rows}
+
+
+def test_entity_metadata_value_migration_backfills_and_installs_triggers(tmp_path, monkeypatch):
+    """Upgrading indexes existing frontmatter, and later writes keep it current."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("BASIC_MEMORY_HOME", str(tmp_path / "basic-memory"))
+
+    database_path = tmp_path / "entity-metadata-value-migration.db"
+    config = sqlite_alembic_config(database_path)
+    command.upgrade(config, "v5q6r7s8t9u0")
+
+    connection = sqlite3.connect(database_path)
+    try:
+        timestamp = "2026-10-01 00:00:00"
+        connection.execute(
+            """
+            INSERT INTO project (
+                id, name, permalink, path, is_active, is_default,
+                created_at, updated_at, external_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (1, "test", "test", "/test", True, True, timestamp, timestamp, "project-1"),
+        )
+        connection.executemany(
+            """
+            INSERT INTO entity (
+                id, title, note_type, content_type, file_path, entity_metadata,
+                created_at, updated_at, project_id, external_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    1,
+                    "One",
+                    "note",
+                    "text/markdown",
+                    "one.md",
+                    json.dumps({"tags": ["a", "b"], "due-date": "2026-11-01"}),
+                    timestamp,
+                    timestamp,
+                    1,
+                    "e-1",
+                ),
+                (
+                    2,
+                    "Two",
+                    "note",
+                    "text/markdown",
+                    "two.md",
+                    None,
+                    timestamp,
+                    timestamp,
+                    1,
+                    "e-2",
+                ),
+            ],
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    command.upgrade(config, "w6r7s8t9u0v1")
+
+    connection = sqlite3.connect(database_path)
+    try:
+        assert _element_values(connection, "tags") == {"a", "b"}
+        assert connection.execute(
+            "SELECT value_text FROM entity_metadata_value WHERE path = 'due-date'"
+        ).fetchall() == [("2026-11-01",)]
+        assert connection.execute(
+            "SELECT COUNT(*) FROM entity_metadata_value WHERE entity_id = 2"
+        ).fetchone() == (0,)
+
+        connection.execute(
+            "UPDATE entity SET entity_metadata = ? WHERE id = 1", (json.dumps({"tags": ["c"]}),)
+        )
+        connection.commit()
+        assert _element_values(connection, "tags") == {"c"}
+
+        connection.execute("DELETE FROM entity WHERE id = 1")
+        connection.commit()
+        assert connection.execute("SELECT COUNT(*) FROM entity_metadata_value").fetchone() == (0,)
+    finally:
+        connection.close()
+
+    command.downgrade(config, "v5q6r7s8t9u0")
+
+    connection = sqlite3.connect(database_path)
+    try:
+        objects = connection.execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE 'entity_metadata_value%'"
+        ).fetchall()
+        assert objects == []
+    finally:
+        connection.close()
@@ -0,0 +1,141 @@
+"""Migration tests for the project_stat counters."""
+
+import sqlite3
+
+from alembic import command
+
+from basic_memory.models.project_stat import project_stat_trigger_statements
+
+from tests.test_note_content_migration import sqlite_alembic_config
+
+
+def _stat_sums(connection: sqlite3.Connection) -> dict[tuple[str, str], int]:
+    rows = connection.execute(
+        "SELECT stat_kind, stat_key, SUM(stat_count) FROM project_stat "
+        "GROUP BY stat_kind, stat_key HAVING SUM(stat_count) != 0"
+    ).fetchall()
+    return {(kind, key): total for kind, key, total in rows}
+
+
+def test_project_stat_migration_backfills_and_installs_triggers(tmp_path, monkeypatch):
+    """Upgrading counts existing rows, and later writes keep the counters current."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("BASIC_MEMORY_HOME", str(tmp_path / "basic-memory"))
+
+    database_path = tmp_path / "project-stat-migration.db"
+    config = sqlite_alembic_config(database_path)
+    command.upgrade(config, "u4p5q6r7s8t9")
+
+    connection = sqlite3.connect(database_path)
+    try:
+        timestamp = "2026-10-01 00:00:00"
+        connection.execute(
+            """
+            INSERT INTO project (
+                id, name, permalink, path, is_active, is_default,
+                created_at, updated_at, external_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (1, "test", "test", "/test", True, True, timestamp, timestamp, "project-1"),
+        )
+        connection.executemany(
+            """
+            INSERT INTO entity (
+                id, title, note_type, content_type, file_path,
+                created_at, updated_at, project_id, external_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (1, "One", "note", "text/markdown", "one.md", timestamp, timestamp, 1, "e-1"),
+                (2, "Two", "person", "text/markdown", "two.md", timestamp, timestamp, 1, "e-2"),
+            ],
+        )
+        connection.execute(
+            "INSERT INTO relation (id, from_id, to_name, relation_type, project_id) "
+            "VALUES (1, 1, 'Nowhere', 'links_to', 1)"
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    command.upgrade(config, "v5q6r7s8t9u0")
+
+    connection = sqlite3.connect(database_path)
+    try:
+        assert _stat_sums(connection) == {
+            ("note_type", "note"): 1,
+            ("note_type", "person"): 1,
+            ("relation_type", "links_to"): 1,
+            ("unresolved_relations", ""): 1,
+        }
+
+        # Match the app's connections so deleting an entity cascades to its relations.
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("UPDATE relation SET to_id = 2 WHERE id = 1")
+        connection.execute("DELETE FROM entity WHERE id = 1")
+        connection.commit()
+        assert _stat_sums(connection) == {("note_type", "person"): 1}
+    finally:
+        connection.close()
+
+    command.downgrade(config, "u4p5q6r7s8t9")
+
+    connection = sqlite3.connect(database_path)
+    try:
+        objects = connection.execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE 'project_stat%'"
+        ).fetchall()
+        assert objects == []
+    finally:
+        connection.close()
+
+
+def test_project_stat_triggers_let_a_raw_project_delete_cascade():
+    """Cascaded child deletes must not append deltas for the project being deleted.
+
+    Postgres schemas cascade entity, observation, and relation rows from
+    project; the cascaded delete triggers run after the project row is gone, so
+    an unguarded delta would violate project_stat's foreign key.
+    """
+    connection = sqlite3.connect(":memory:")
+    try:
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(
+            """
+            CREATE TABLE project (id INTEGER PRIMARY KEY);
+            CREATE TABLE entity (
+                id INTEGER PRIMARY KEY, note_type TEXT,
+                project_id INTEGER NOT NULL REFERENCES project (id) ON DELETE CASCADE
+            );
+            CREATE TABLE observation (
+                id INTEGER PRIMARY KEY, category TEXT,
+                project_id INTEGER NOT NULL REFERENCES project (id) ON DELETE CASCADE
+            );
+            CREATE TABLE relation (
+                id INTEGER PRIMARY KEY, relation_type TEXT, to_id INTEGER,
+                project_id INTEGER NOT NULL REFERENCES project (id) ON DELETE CASCADE
+            );
+            CREATE TABLE project_stat (
+                id INTEGER PRIMARY KEY, stat_kind TEXT NOT NULL, stat_key TEXT,
+                stat_count INTEGER NOT NULL,
+                project_id INTEGER NOT NULL REFERENCES project (id) ON DELETE CASCADE
+            );
+            """
+        )
+        for statement in project_stat_trigger_statements("sqlite"):
+            connection.execute(statement)
+        connection.executescript(
+            """
+            INSERT INTO project (id) VALUES (1), (2);
+            INSERT INTO entity (id, note_type, project_id) VALUES (1, 'note', 1), (2, 'note', 2);
+            INSERT INTO observation (category, project_id) VALUES ('idea', 1);
+            INSERT INTO relation (relation_type, to_id, project_id) VALUES ('links_to', NULL, 1);
+            """
+        )
+
+        connection.execute("DELETE FROM project WHERE id = 1")
+
+        assert connection.execute("SELECT COUNT(*) FROM entity").fetchone() == (1,)
+        assert _stat_sums(connection) == {("note_type", "note"): 1}
+    finally:
+        connection.close()
@@ -0,0 +1,256 @@
+"""Tests for the in-process semantic read cache."""
+
+from dataclasses import dataclass, field
+
+import logfire
+import pytest
+from pydantic import BaseModel
+
+from basic_memory.read_cache import (
+    InMemoryReadCache,
+    ModelReadCache,
+    ReadCacheInvalidationStatus,
+    ReadCacheKey,
+    ReadCacheLookup,
+    ReadCacheOperation,
+    ReadCacheStoreStatus,
+    read_cache_request_digest,
+)
+from basic_memory.read_cache.lifecycle import layer_memory_read_cache
+
+PROJECT_ID = "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa"
+OTHER_PROJECT_ID = "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb"
+UPSTREAM_GENERATION = "1" * 32
+
+
+def _key(name: str = "entity-1", project_id: str = PROJECT_ID) -> ReadCacheKey:
+    return ReadCacheKey(
+        project_id=project_id,
+        operation=ReadCacheOperation.entity,
+        request_digest=read_cache_request_digest(name),
+    )
+
+
+@dataclass(slots=True)
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass(slots=True)
+class UpstreamCache:
+    payloads: dict[ReadCacheKey, bytes] = field(default_factory=dict)
+    lookups: list[ReadCacheKey] = field(default_factory=list)
+    stored_generations: list[str] = field(default_factory=list)
+    invalidated: list[str] = field(default_factory=list)
+
+    async def lookup(self, key: ReadCacheKey) -> ReadCacheLookup:
+        self.lookups.append(key)
+        payload = self.payloads.get(key)
+        return ReadCacheLookup(
+            generation=UPSTREAM_GENERATION,
+            payload=payload,
+            remaining_ttl_seconds=None if payload is None else 120.0,
+        )
+
+    async def store(
+        self,
+        key: ReadCacheKey,
+        lookup: ReadCacheLookup,
+        payload: bytes,
+        *,
+        ttl_seconds: int,
+    ) -> ReadCacheStoreStatus:
+        del ttl_seconds
+        self.stored_generations.append(lookup.generation)
+        self.payloads[key] = payload
+        return ReadCacheStoreStatus.stored
+
+    async def invalidate_project(self, project_id: str) -> ReadCacheInvalidationStatus:
+        self.invalidated.append(project_id)
+        self.payloads.clear()
+        return ReadCacheInvalidationStatus.invalidated
+
+
+def _capture_events(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    events: list[str] = []
+
+    class Counter:
+        def add(self, amount: int, *, attributes: dict[str, str]) -> None:
+            assert amount == 1
+            events.append(attributes["event"])
+
+    monkeypatch.setattr(logfire, "metric_counter", lambda name: Counter())
+    return events
+
+
+@pytest.mark.asyncio
+async def test_standalone_cache_round_trips_and_reports_hits(monkeypatch) -> None:
+    events = _capture_events(monkeypatch)
+    cache = InMemoryReadCache(clock=FakeClock())
+
+    miss = await cache.lookup(_key())
+    assert not miss.is_hit
+    status = await cache.store(_key(), miss, b"payload", ttl_seconds=30)
+    hit = await cache.lookup(_key())
+
+    assert status == ReadCacheStoreStatus.stored
+    assert hit.payload == b"payload"
+    assert hit.generation == miss.generation
+    assert hit.remaining_ttl_seconds == 30
+    assert events == ["l1_miss", "l1_hit"]
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = InMemoryReadCache(clock=clock)
+    miss = await cache.lookup(_key())
+    await cache.store(_key(), miss, b"payload", ttl_seconds=30)
+
+    clock.now = 30.0
+
+    assert not (await cache.lookup(_key())).is_hit
+
+
+@pytest.mark.asyncio
+async def test_invalidation_hides_entries_and_supersedes_in_flight_stores() -> None:
+    cache = InMemoryReadCache()
+    miss = await cache.lookup(_key())
+    other_miss = await cache.lookup(_key(project_id=OTHER_PROJECT_ID))
+    await cache.store(_key(), miss, b"payload", ttl_seconds=30)
+    in_flight = await cache.lookup(_key("entity-2"))
+
+    status = await cache.invalidate_project(PROJECT_ID.upper())
+
+    assert status == ReadCacheInvalidationStatus.invalidated
+    assert not (await cache.lookup(_key())).is_hit
+    assert (
+        await cache.store(_key("entity-2"), in_flight, b"stale", ttl_seconds=30)
+        == ReadCacheStoreStatus.superseded
+    )
+    assert (
+        await cache.store(_key(project_id=OTHER_PROJECT_ID), other_miss, b"other", ttl_seconds=30)
+        == ReadCacheStoreStatus.stored
+    )
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_respects_entry_and_byte_bounds(monkeypatch) -> None:
+    events = _capture_events(monkeypatch)
+    cache = InMemoryReadCache(max_entries=2, max_bytes=8)
+
+    for name in ("a", "b"):
+        await cache.store(_key(name), await cache.lookup(_key(name)), b"1234", ttl_seconds=30)
+    # Touch "a" so "b" is the least recently used entry.
+    assert (await cache.lookup(_key("a"))).is_hit
+    await cache.store(_key("c"), await cache.lookup(_key("c")), b"1234", ttl_seconds=30)
+
+    assert events.count("l1_evict") == 1
+    assert (await cache.lookup(_key("a"))).is_hit
+    assert not (await cache.lookup(_key("b"))).is_hit
+    assert (await cache.lookup(_key("c"))).is_hit
+
+    # Payloads larger than the byte bound are never held locally.
+    oversize = await cache.lookup(_key("d"))
+    await cache.store(_key("d"), oversize, b"123456789", ttl_seconds=30)
+    assert not (await cache.lookup(_key("d"))).is_hit
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_serves_hits_without_upstream_round_trip() -> None:
+    upstream = UpstreamCache()
+    clock = FakeClock()
+    cache = InMemoryReadCache(upstream=upstream, max_ttl_seconds=5, clock=clock)
+
+    miss = await cache.lookup(_key())
+    await cache.store(_key(), miss, b"payload", ttl_seconds=30)
+    hit = await cache.lookup(_key())
+
+    assert upstream.stored_generations == [UPSTREAM_GENERATION]
+    assert upstream.lookups == [_key()]
+    assert hit.payload == b"payload"
+    assert hit.remaining_ttl_seconds == 5
+
+    # Past the layered bound the upstream generation is consulted again.
+    clock.now = 5.0
+    assert (await cache.lookup(_key())).payload == b"payload"
+    assert upstream.lookups == [_key(), _key()]
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_populates_from_upstream_hits_and_invalidates_both_tiers() -> None:
+    upstream = UpstreamCache(payloads={_key(): b"shared"})
+    cache = InMemoryReadCache(upstream=upstream, max_ttl_seconds=5)
+
+    assert (await cache.lookup(_key())).payload == b"shared"
+    assert (await cache.lookup(_key())).payload == b"shared"
+    assert len(upstream.lookups) == 1
+
+    await cache.invalidate_project(PROJECT_ID)
+
+    assert upstream.invalidated == [PROJECT_ID]
+    assert not (await cache.lookup(_key())).is_hit
+
+
+class CachedNote(BaseModel):
+    title: str
+
+
+@pytest.mark.asyncio
+async def test_model_cache_hits_reuse_the_validated_model(monkeypatch) -> None:
+    events = _capture_events(monkeypatch)
+    model_cache = ModelReadCache(
+        backend=InMemoryReadCache(),
+        model_type=CachedNote,
+        ttl_seconds=30,
+        max_payload_bytes=1024,
+    )
+    stored = CachedNote(title="first")
+
+    async with model_cache.read(key=_key()) as scope:
+        assert scope.value is None
+        scope.value = stored
+    async with model_cache.read(key=_key()) as scope:
+        first_hit = scope.value
+    async with model_cache.read(key=_key()) as scope:
+        second_hit = scope.value
+
+    assert first_hit is stored
+    assert second_hit is stored
+    assert events.count("hit") == 2
+
+
+@pytest.mark.asyncio
+async def test_model_cache_validates_upstream_payload_once() -> None:
+    upstream = UpstreamCache(payloads={_key(): b'{"title": "shared"}'})
+    model_cache = ModelReadCache(
+        backend=InMemoryReadCache(upstream=upstream, max_ttl_seconds=5),
+        model_type=CachedNote,
+        ttl_seconds=30,
+        max_payload_bytes=1024,
+    )
+
+    async with model_cache.read(key=_key()) as scope:
+        first_hit = scope.value
+    async with model_cache.read(key=_key()) as scope:
+        second_hit = scope.value
+
+    assert first_hit == CachedNote(title="shared")
+    assert second_hit is first_hit
+    assert len(upstream.lookups) == 1
+
+
+def test_layer_memory_read_cache_is_disabled_without_entries() -> None:
+    upstream = UpstreamCache()
+
+    assert (
+        layer_memory_read_cache(upstream, max_entries=0, max_bytes=1, layered_ttl_seconds=5)
+        is upstream
+    )
+    assert isinstance(
+        layer_memory_read_cache(None, max_entries=8, max_bytes=1, layered_ttl_seconds=5),
+        InMemoryReadCache,
+    )